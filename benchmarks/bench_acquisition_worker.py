@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark mainloop stalls: synchronous acquisition vs background worker.
+
+Simulates GUI ticks against a window query that blocks for --delay seconds
+(like an xdotool or PowerShell call near its timeout) and reports the worst
+and mean time each tick blocks the loop.
+
+Usage:
+    python benchmarks/bench_acquisition_worker.py [--iterations N] [--delay SECONDS]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from acquisition_worker import AcquisitionWorker, StallMeter  # noqa: E402
+from window_snapshot import WindowSnapshot  # noqa: E402
+
+
+class SlowMonitor:
+    """WindowMonitor stand-in whose sample() blocks for a fixed delay."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def sample(self, include_process=False, debug=False, window_title=None):
+        time.sleep(self.delay)
+        return WindowSnapshot("Editor")
+
+
+def measure(tick, iterations, tick_interval):
+    """Run ticks and measure how long each blocks.
+
+    Args:
+        tick: Callable run once per tick
+        iterations: Number of ticks
+        tick_interval: Seconds between ticks
+
+    Returns:
+        StallMeter: Recorded tick durations
+    """
+    meter = StallMeter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        tick()
+        meter.record(time.perf_counter() - start)
+        time.sleep(tick_interval)
+    return meter
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="simulated query latency in seconds")
+    parser.add_argument("--tick-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    monitor = SlowMonitor(args.delay)
+
+    print(f"sync   {measure(monitor.sample, args.iterations, args.tick_interval).format_summary()}")
+
+    worker = AcquisitionWorker(monitor, interval_seconds=args.tick_interval)
+    worker.start()
+    try:
+        print(f"thread {measure(worker.get_latest, args.iterations, args.tick_interval).format_summary()}")
+    finally:
+        worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark rebuilding window patterns on a configuration reload.
+
+A PatternSet built from the previous one reuses the compiled regexes, merged
+runs and prefilter literals of unchanged patterns. Measures a full rebuild
+against reloads that change one score, edit one regex and insert a pattern
+at the top, for each match engine. Also measures a whole ConfigLoader.load,
+which includes parsing the TOML file.
+
+Usage:
+    python benchmarks/bench_config_reload.py [--patterns N] [--repeat N]
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config_loader import ConfigLoader  # noqa: E402
+from pattern_set import MATCH_ENGINES, PatternSet  # noqa: E402
+
+
+def make_patterns(count):
+    """Build a realistic mix of literal, alternation and anchored patterns.
+
+    Args:
+        count: Number of patterns
+
+    Returns:
+        list: Pattern dictionaries
+    """
+    patterns = []
+    for i in range(count):
+        if i % 3 == 0:
+            regex = f"site{i}\\.example\\.com"
+        elif i % 3 == 1:
+            regex = f"project-{i}|repo{i}"
+        else:
+            regex = f"^Editor {i} - (draft|final)\\b"
+        patterns.append({"regex": regex, "score": i % 7 - 3, "description": f"Pattern {i}"})
+    return patterns
+
+
+def time_build(build, repeat):
+    """Measure the median time of a build function.
+
+    Args:
+        build: Callable building a PatternSet
+        repeat: Number of measurements
+
+    Returns:
+        float: Median milliseconds
+    """
+    samples = []
+    for _ in range(repeat):
+        # re caches up to 512 compiled patterns; purge so a full rebuild really compiles
+        re.purge()
+        start = time.perf_counter()
+        build()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def to_toml(patterns, engine):
+    """Write patterns as a configuration file body.
+
+    Args:
+        patterns: Pattern dictionaries
+        engine: Pattern match engine
+
+    Returns:
+        str: TOML text
+    """
+    lines = [f'pattern_match_engine = "{engine}"\n']
+    for pattern in patterns:
+        regex = pattern["regex"].replace("\\", "\\\\")
+        lines.append(
+            f'[[window_patterns]]\nregex = "{regex}"\nscore = {pattern["score"]}\n'
+            f'description = "{pattern["description"]}"\n'
+        )
+    return "".join(lines)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patterns", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    patterns = make_patterns(args.patterns)
+    middle = args.patterns // 2
+    rescored = list(patterns)
+    rescored[middle] = dict(patterns[middle], score=99)
+    edited = list(patterns)
+    edited[middle] = dict(patterns[middle], regex="edited-pattern")
+    inserted = [{"regex": "new-pattern", "score": 1, "description": "New"}] + patterns
+    changes = (("score changed", rescored), ("regex edited", edited), ("pattern inserted", inserted))
+
+    for engine in MATCH_ENGINES:
+        previous = PatternSet(patterns, engine)
+        full_ms = time_build(lambda: PatternSet(rescored, engine), args.repeat)
+        results = [f"full rebuild={full_ms:.0f}ms"]
+        for name, changed in changes:
+            reload_ms = time_build(lambda changed=changed: PatternSet(changed, engine, previous=previous), args.repeat)
+            results.append(f"{name}={reload_ms:.1f}ms")
+        print(f"{args.patterns} patterns, {engine:10}: " + "  ".join(results))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = Path(temp_dir) / "config.toml"
+        config_path.write_text(to_toml(patterns, "combined"), encoding="utf-8")
+        loader = ConfigLoader(config_path)
+        first_ms = time_build(lambda: ConfigLoader(config_path).load(exit_on_error=False), args.repeat)
+        loader.load(exit_on_error=False)
+        config_path.write_text(to_toml(rescored, "combined"), encoding="utf-8")
+        reload_ms = time_build(lambda: loader.load(exit_on_error=False), args.repeat)
+    print(
+        f"{args.patterns} patterns, ConfigLoader.load (combined, TOML included): "
+        f"first load={first_ms:.0f}ms  reload after a score change={reload_ms:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark a long-lived helper coprocess against per-call subprocess.run.
+
+Usage:
+    python benchmarks/bench_coprocess.py [--iterations N]
+
+Both paths run the same trivial Python helper, so the difference is the
+per-call process startup that the coprocess avoids.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from coprocess import Coprocess  # noqa: E402
+
+HELPER = (
+    "import sys\n"
+    "for line in sys.stdin.buffer:\n"
+    "    data = line.strip().upper()\n"
+    "    sys.stdout.buffer.write(str(len(data)).encode() + b'\\n' + data)\n"
+    "    sys.stdout.buffer.flush()\n"
+)
+ONE_SHOT = "print('TITLE')"
+
+
+def measure(func, iterations):
+    """Measure mean per-call latency of func in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.mean(samples)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    def one_shot():
+        subprocess.run([sys.executable, "-c", ONE_SHOT], capture_output=True, text=True, check=True, timeout=5)
+
+    coprocess = Coprocess([sys.executable, "-c", HELPER])
+    coprocess.request("warmup")
+    try:
+        print(f"{'subprocess.run per call':<28} {measure(one_shot, args.iterations):10.1f}us")
+        print(f"{'coprocess request':<28} {measure(lambda: coprocess.request('title'), args.iterations):10.1f}us")
+        print(f"health: {coprocess.get_health()}")
+    finally:
+        coprocess.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark loading and matching large domain lists with DomainTrie.
+
+Measures load time and memory of a generated hosts-file list, and the
+per-title match latency of a domain_list pattern compared with the same
+domains as one regex per domain.
+
+Usage:
+    python benchmarks/bench_domain_trie.py [--domains N] [--iterations N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domain_trie import DomainTrie  # noqa: E402
+from pattern_set import PatternSet  # noqa: E402
+
+
+def measure(func, items):
+    """Measure per-call latency of func.
+
+    Args:
+        func: Callable to measure
+        items: Arguments, one call per item
+
+    Returns:
+        list: Per-call latencies in microseconds
+    """
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def make_domains(count, rng):
+    """Build a realistic mix of registrable domains and subdomains.
+
+    Args:
+        count: Number of domains
+        rng: random.Random instance
+
+    Returns:
+        list: Domain strings
+    """
+    tlds = ["com", "net", "org", "io", "co.uk", "de", "jp", "tv"]
+    letters = "abcdefghijklmnopqrstuvwxyz0123456789"
+    domains = []
+    for i in range(count):
+        name = "".join(rng.choice(letters) for _ in range(rng.randint(4, 12))) + str(i)
+        domain = f"{name}.{rng.choice(tlds)}"
+        if i % 4 == 0:
+            domain = f"{rng.choice(['www', 'm', 'ads', 'cdn'])}.{domain}"
+        domains.append(domain)
+    return domains
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--domains", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    domains = make_domains(args.domains, rng)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "hosts"
+        path.write_text("".join(f"0.0.0.0 {domain}\n" for domain in domains), encoding="utf-8")
+        size_kib = path.stat().st_size / 1024
+
+        load_times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            DomainTrie.from_file(path)
+            load_times.append((time.perf_counter() - start) * 1000)
+
+        tracemalloc.start()
+        trie = DomainTrie.from_file(path)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(
+        f"{args.domains} domains ({size_kib:.0f} KiB file): load median={statistics.median(load_times):.0f}ms  "
+        f"memory={current / 1024 / 1024:.1f}MiB (peak {peak / 1024 / 1024:.1f}MiB)  entries={len(trie)}"
+    )
+
+    # Half the titles contain a listed host, half an unlisted one
+    titles = []
+    for i in range(args.iterations):
+        host = rng.choice(domains) if i % 2 == 0 else f"unlisted{i}.example"
+        titles.append(f"Some page title {i} - https://{host}/path - Browser")
+
+    pattern_set = PatternSet([{"domain_list": str(path), "domain_trie": trie, "score": -3}])
+    trie_us = statistics.median(measure(pattern_set.match, titles))
+    print(f"{args.domains} domains: domain_list match median={trie_us:.2f}us")
+
+    # The regex alternative, with as many domains as is practical to compile
+    regex_count = min(args.domains, 2000)
+    regex_set = PatternSet(
+        [{"regex": "(^|[/.\\s])" + domain.replace(".", "\\.") + "\\b"} for domain in domains[:regex_count]],
+        "prefilter",
+    )
+    regex_us = statistics.median(measure(regex_set.match, titles[:200]))
+    print(f"{regex_count} domains: one regex per domain (prefilter) median={regex_us:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
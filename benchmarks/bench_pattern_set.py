@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark window pattern matching: re.search per tick vs a precompiled PatternSet.
+
+The PatternSet is measured with every match engine ("sequential", "combined"
+and "prefilter"), and domain rules are compared with equivalent regexes.
+
+Usage:
+    python benchmarks/bench_pattern_set.py [--iterations N]
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pattern_set import MATCH_ENGINES, PatternSet  # noqa: E402
+
+
+def measure(func, items):
+    """Measure per-call latency of func.
+
+    Args:
+        func: Callable to measure
+        items: Arguments, one call per item
+
+    Returns:
+        list: Per-call latencies in microseconds
+    """
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def make_patterns(count):
+    """Build a realistic mix of literal and alternation patterns.
+
+    Args:
+        count: Number of patterns
+
+    Returns:
+        list: Pattern dictionaries
+    """
+    patterns = []
+    for i in range(count):
+        if i % 3 == 0:
+            regex = f"site{i}\\.example\\.com"
+        elif i % 3 == 1:
+            regex = f"project-{i}|repo{i}"
+        else:
+            regex = f"^Editor {i} - "
+        patterns.append({"regex": regex, "score": i % 7 - 3, "description": f"Pattern {i}"})
+    return patterns
+
+
+def match_uncompiled(window_patterns, window_title):
+    """Match the way ScoreCalculator did before PatternSet (re.search per pattern)."""
+    for pattern in window_patterns:
+        regex = pattern.get("regex", "")
+        if regex and re.search(regex, window_title, re.IGNORECASE):
+            return pattern
+    return None
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for count in (10, 500, 5000, 10000):
+        patterns = make_patterns(count)
+        # Mostly unmatched titles: the common worst case where every pattern is tried
+        titles = [f"Unrelated window {i}" for i in range(args.iterations)]
+
+        # Beyond re's compile cache every search recompiles, so fewer titles suffice
+        uncompiled_titles = titles if count <= 500 else titles[:10]
+        uncompiled = statistics.median(measure(lambda title: match_uncompiled(patterns, title), uncompiled_titles))
+        print(f"{count:5d} patterns: re.search            median={uncompiled:9.1f}us")
+        for engine in MATCH_ENGINES:
+            build_start = time.perf_counter()
+            pattern_set = PatternSet(patterns, engine)
+            build_ms = (time.perf_counter() - build_start) * 1000
+
+            compiled = statistics.median(measure(pattern_set.match, titles))
+            print(
+                f"{count:5d} patterns: PatternSet {engine:10s} median={compiled:9.1f}us  "
+                f"speedup={uncompiled / compiled:6.1f}x  build={build_ms:.1f}ms"
+            )
+
+    # Domain rules are dictionary lookups, so their cost does not grow with their number
+    for count in (10, 500, 5000, 10000):
+        titles = [f"Page {i} - www.site{i * 7 % (2 * count)}.example.com" for i in range(args.iterations)]
+        regex_set = PatternSet([{"regex": f"(^|\\.)site{i}\\.example\\.com"} for i in range(count)], "prefilter")
+        domain_set = PatternSet([{"domain": f"site{i}.example.com"} for i in range(count)])
+        regex = statistics.median(measure(regex_set.match, titles))
+        domain = statistics.median(measure(domain_set.match, titles))
+        print(
+            f"{count:5d} domains:  regex prefilter median={regex:9.1f}us  "
+            f"domain rules median={domain:9.1f}us  speedup={regex / domain:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
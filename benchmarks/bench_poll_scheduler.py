@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Simulate polling schedules and report wakeups per hour.
+
+Replays per-second window title timelines through fixed 1-second polling and
+through the adaptive scheduler, and reports wakeups per hour plus the score
+difference caused by sampling less often.
+
+Usage:
+    python benchmarks/bench_poll_scheduler.py [--session FILE] [--max-interval SECONDS]
+
+A session file is CSV with one "start_second,title" row per focus change.
+Without --session, synthetic idle, mixed and busy sessions are simulated.
+"""
+
+import argparse
+import csv
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from poll_scheduler import PollScheduler, StabilityBackoffPolicy  # noqa: E402
+from window_snapshot import WindowSnapshot  # noqa: E402
+
+BASE_INTERVAL_MS = 1000
+
+SESSION_SECONDS = 3600
+
+
+def synthetic_session(mean_dwell_seconds, seed=0):
+    """Build a one-hour per-second title timeline.
+
+    Args:
+        mean_dwell_seconds: Average time spent on one window
+        seed: Random seed
+
+    Returns:
+        list: Window title for every second
+    """
+    rng = random.Random(seed)
+    titles = ["Editor", "Browser - GitHub", "Terminal", "Chat", "Browser - News"]
+    timeline = []
+    while len(timeline) < SESSION_SECONDS:
+        dwell = max(1, int(rng.expovariate(1 / mean_dwell_seconds)))
+        timeline.extend([rng.choice(titles)] * dwell)
+    return timeline[:SESSION_SECONDS]
+
+
+def load_session(path):
+    """Load a per-second title timeline from a CSV of focus changes.
+
+    Args:
+        path: CSV file with "start_second,title" rows
+
+    Returns:
+        list: Window title for every second
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        changes = [(int(row[0]), row[1]) for row in csv.reader(f) if row]
+    timeline = []
+    for (start, title), (end, _) in zip(changes, changes[1:] + [(changes[-1][0] + 1, "")]):
+        timeline.extend([title] * (end - start))
+    return timeline
+
+
+def measure(timeline, scheduler, scores):
+    """Replay a timeline through a scheduler.
+
+    Args:
+        timeline: Window title for every second
+        scheduler: PollScheduler, or None for fixed base-interval polling
+        scores: Dict of title to per-tick score delta
+
+    Returns:
+        tuple: (wakeups, total_score)
+    """
+    second = 0
+    interval_ms = BASE_INTERVAL_MS
+    wakeups = 0
+    total = 0
+    while second < len(timeline):
+        title = timeline[second]
+        ticks = scheduler.elapsed_ticks(interval_ms) if scheduler is not None and wakeups else 1
+        total += scores.get(title, 0) * ticks
+        wakeups += 1
+        if scheduler is not None:
+            interval_ms = scheduler.next_interval(WindowSnapshot(title))
+        second += max(1, interval_ms // 1000)
+    return wakeups, total
+
+
+def main():
+    """Run the simulation."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session", action="append", help="CSV session file (may be repeated)")
+    parser.add_argument("--max-interval", type=int, default=60)
+    parser.add_argument("--backoff-factor", type=float, default=2.0)
+    args = parser.parse_args()
+
+    if args.session:
+        sessions = {Path(path).name: load_session(path) for path in args.session}
+    else:
+        sessions = {
+            "idle (1 window/hour)": ["Editor"] * SESSION_SECONDS,
+            "mixed (~5 min dwell)": synthetic_session(300, seed=1),
+            "busy (~20 s dwell)": synthetic_session(20, seed=2),
+        }
+
+    scores = {"Editor": 2, "Browser - GitHub": 1, "Terminal": 2, "Chat": -1, "Browser - News": -3}
+
+    for name, timeline in sessions.items():
+        hours = len(timeline) / 3600
+        fixed_wakeups, fixed_score = measure(timeline, None, scores)
+        scheduler = PollScheduler(
+            BASE_INTERVAL_MS,
+            [StabilityBackoffPolicy(BASE_INTERVAL_MS, args.max_interval * 1000, args.backoff_factor)],
+            BASE_INTERVAL_MS,
+            args.max_interval * 1000,
+        )
+        adaptive_wakeups, adaptive_score = measure(timeline, scheduler, scores)
+        print(
+            f"{name:<24} fixed={fixed_wakeups / hours:7.0f}/h  adaptive={adaptive_wakeups / hours:7.0f}/h  "
+            f"reduction={fixed_wakeups / adaptive_wakeups:5.1f}x  score {fixed_score} -> {adaptive_score}"
+        )
+
+
+if __name__ == "__main__":
+    main()
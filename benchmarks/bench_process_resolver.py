@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Microbenchmark: /proc-based process name resolver vs the xdotool/xdotool/ps subprocess chain.
+
+Usage:
+    python benchmarks/bench_process_resolver.py [--iterations N]
+
+The subprocess chain needs xdotool and an X server; without them only the
+``ps`` fork is measured and the three-fork cost is estimated as three times that.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from process_resolver import ProcessNameResolver  # noqa: E402
+from window_monitor import WindowMonitor  # noqa: E402
+
+
+def measure(func, iterations):
+    """Measure mean per-call latency of func in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.mean(samples)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    pid = os.getpid()
+
+    def ps_fork():
+        subprocess.run(["ps", "-p", str(pid), "-o", "comm="], capture_output=True, text=True, check=True, timeout=1)
+
+    if shutil.which("xdotool") and os.environ.get("DISPLAY"):
+        WindowMonitor._process_resolver = ProcessNameResolver(proc_root="/nonexistent")  # Force the ps fallback
+        WindowMonitor._get_x11_connection = classmethod(lambda cls: None)
+
+        def legacy():
+            WindowMonitor._process_resolver.clear()
+            WindowMonitor._get_active_window_process_name_linux()
+
+        print(f"{'subprocess chain (3 forks)':<32} {measure(legacy, args.iterations):10.1f}us")
+    else:
+        ps_mean = measure(ps_fork, args.iterations)
+        print(f"{'ps fork (1 of 3)':<32} {ps_mean:10.1f}us")
+        print(f"{'subprocess chain (3x estimate)':<32} {ps_mean * 3:10.1f}us")
+
+    resolver = ProcessNameResolver()
+    if not resolver.is_available():
+        print("/proc resolver: unavailable on this platform")
+        return
+
+    def cold():
+        resolver.clear()
+        resolver.resolve(pid)
+
+    print(f"{'/proc resolver (cold cache)':<32} {measure(cold, args.iterations):10.1f}us")
+    resolver.resolve(pid)
+    print(f"{'/proc resolver (warm cache)':<32} {measure(lambda: resolver.resolve(pid), args.iterations):10.1f}us")
+    print(
+        f"{'window pid cache hit':<32} "
+        f"{measure(lambda: resolver.get_window_pid('0x1', lambda: pid), args.iterations):10.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
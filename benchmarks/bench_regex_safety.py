@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Fuzz benchmark for ReDoS-safe matching: tick latency with catastrophic patterns.
+
+Feeds random and adversarial window titles through ScoreTracker.update with a
+config containing patterns that backtrack catastrophically, and reports the
+tick latency distribution with safe mode. Without safe mode the same patterns
+are timed on short adversarial titles only, to show the exponential growth.
+
+Usage:
+    python benchmarks/bench_regex_safety.py [--ticks N] [--budget-ms MS]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from regex_safety import RegexGuard  # noqa: E402
+from score_tracker import ScoreTracker  # noqa: E402
+
+CATASTROPHIC_PATTERNS = [
+    {"regex": "^(a+)+$", "score": 1, "description": "nested plus"},
+    {"regex": "^(\\w+\\s?)*$", "score": 1, "description": "words"},
+    {"regex": "^(x|xx)+y", "score": 1, "description": "alternation"},
+]
+
+
+def fuzz_titles(count, rng):
+    """Generate random and adversarial window titles.
+
+    Args:
+        count: Number of titles
+        rng: random.Random instance
+
+    Returns:
+        list: Titles
+    """
+    titles = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.05:
+            titles.append("a" * rng.randint(20, 60) + "!")
+        elif kind < 0.1:
+            titles.append("x" * rng.randint(30, 80))
+        else:
+            titles.append("".join(rng.choice("abcdefgh xyz-|.:") for _ in range(rng.randint(0, 120))))
+    return titles
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--budget-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    print("Without safe mode (in-process, one evaluation of '^(a+)+$'):")
+    for length in (16, 18, 20, 22):
+        start = time.perf_counter()
+        re.search("^(a+)+$", "a" * length + "!", re.IGNORECASE)
+        print(f"  {length} chars: {(time.perf_counter() - start) * 1000:9.1f}ms")
+
+    patterns = [{"regex": f"keyword{i}", "score": 1, "description": f"K{i}"} for i in range(50)]
+    patterns.extend(CATASTROPHIC_PATTERNS)
+    guard = RegexGuard(args.budget_ms / 1000)
+    tracker = ScoreTracker(patterns, regex_guard=guard)
+    titles = fuzz_titles(args.ticks, random.Random(19))
+
+    samples = []
+    for title in titles:
+        start = time.perf_counter()
+        tracker.update(title)
+        samples.append((time.perf_counter() - start) * 1000)
+    guard.close()
+
+    samples.sort()
+    print(f"With safe mode ({args.ticks} fuzzed ticks, {args.budget_ms}ms budget):")
+    print(
+        f"  median={statistics.median(samples):.3f}ms  p99={samples[int(len(samples) * 0.99)]:.3f}ms  "
+        f"max={samples[-1]:.1f}ms"
+    )
+    print(f"  quarantined: {[description for description, _, _ in tracker.get_quarantined_patterns()]}")
+
+
+if __name__ == "__main__":
+    main()
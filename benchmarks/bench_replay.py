@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark replaying a long session through the scoring pipeline.
+
+Usage:
+    python benchmarks/bench_replay.py [--hours N] [--config config.toml.example]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import Config  # noqa: E402
+from replay import replay_session  # noqa: E402
+from window_snapshot import WindowSnapshot  # noqa: E402
+
+
+def synthetic_session(hours, seed=0):
+    """Build a per-second trace with random focus changes.
+
+    Args:
+        hours: Session length in hours
+        seed: Random seed
+
+    Returns:
+        list: WindowSnapshot per second
+    """
+    rng = random.Random(seed)
+    titles = ["GitHub - Pull Requests", "Visual Studio Code", "Twitter / X", "YouTube - Music", "Slack", ""]
+    start = datetime(2024, 1, 1, 9, 0, 0)
+    snapshots = []
+    title = titles[0]
+    for second in range(int(hours * 3600)):
+        if rng.random() < 1 / 60:
+            title = rng.choice(titles)
+        snapshots.append(WindowSnapshot(title, "", None, title == "", start + timedelta(seconds=second)))
+    return snapshots
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=10)
+    parser.add_argument("--config", default=str(Path(__file__).parent.parent / "config.toml.example"))
+    args = parser.parse_args()
+
+    config = Config(args.config)
+    snapshots = synthetic_session(args.hours)
+
+    start = time.perf_counter()
+    timeline = replay_session(snapshots, config)
+    elapsed = time.perf_counter() - start
+    print(
+        f"replayed {len(timeline)} ticks ({args.hours:g} hours) in {elapsed:.3f}s "
+        f"({elapsed / len(timeline) * 1_000_000:.2f}us/tick), final score {timeline[-1][1]}"
+    )
+
+
+if __name__ == "__main__":
+    main()
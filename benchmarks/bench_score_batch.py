@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark batch scoring throughput against per-tick scoring.
+
+Usage:
+    python benchmarks/bench_score_batch.py [--samples N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import score_calculator  # noqa: E402
+from score_calculator import ScoreCalculator  # noqa: E402
+
+
+def make_history(count):
+    """Build a history of repeating titles with one sample per second.
+
+    Args:
+        count: Number of samples
+
+    Returns:
+        tuple: (titles, timestamps)
+    """
+    rng = random.Random(0)
+    titles = [f"Window {i} - Application" for i in range(200)]
+    start = datetime(2024, 1, 1)
+    return [rng.choice(titles) for _ in range(count)], [start + timedelta(seconds=i) for i in range(count)]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    patterns = [{"regex": f"Window {i} ", "score": i % 5 - 2, "description": f"W{i}"} for i in range(0, 200, 3)]
+    calculator = ScoreCalculator(patterns, mild_penalty_mode=True, match_cache_size=0)
+    titles, timestamps = make_history(args.samples)
+
+    per_tick_count = min(args.samples, 100_000)
+    start = time.perf_counter()
+    for title, timestamp in zip(titles[:per_tick_count], timestamps[:per_tick_count]):
+        calculator.calculate_score_delta(title, datetime_now=timestamp)
+    per_tick_rate = per_tick_count / (time.perf_counter() - start)
+    print(f"per-tick:  {per_tick_rate:12,.0f} samples/s")
+
+    backend = "NumPy" if score_calculator.np is not None else "pure Python"
+    start = time.perf_counter()
+    calculator.score_batch(titles, timestamps, reset_score_every_30_minutes=True)
+    batch_rate = args.samples / (time.perf_counter() - start)
+    print(f"batch ({backend}, datetimes): {batch_rate:12,.0f} samples/s  ({batch_rate / per_tick_rate:.1f}x)")
+
+    if score_calculator.np is not None:
+        times = score_calculator.np.array(timestamps, dtype="datetime64[s]")
+        start = time.perf_counter()
+        calculator.score_batch(titles, times, reset_score_every_30_minutes=True)
+        batch_rate = args.samples / (time.perf_counter() - start)
+        print(f"batch (NumPy, datetime64): {batch_rate:12,.0f} samples/s  ({batch_rate / per_tick_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark session recording overhead and log size.
+
+Usage:
+    python benchmarks/bench_session_recorder.py [--iterations N]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from session_recorder import SessionRecorder, read_session_log  # noqa: E402
+from window_snapshot import WindowSnapshot  # noqa: E402
+
+
+def measure(func, items):
+    """Measure per-call latency of func.
+
+    Args:
+        func: Callable to measure
+        items: Arguments, one call per item
+
+    Returns:
+        list: Per-call latencies in microseconds
+    """
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    titles = [f"Window {i} - Some Application" for i in range(50)]
+    start = datetime.now()
+    snapshots = [
+        WindowSnapshot(titles[(i // 30) % len(titles)], "app", None, False, start + timedelta(seconds=i))
+        for i in range(args.iterations)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "session.cwwlog"
+        recorder = SessionRecorder(path)
+        samples = measure(recorder.record, snapshots)
+        recorder.close()
+
+        size = path.stat().st_size
+        print(
+            f"record: mean={statistics.mean(samples):.2f}us  median={statistics.median(samples):.2f}us  "
+            f"max={max(samples):.1f}us"
+        )
+        print(f"log size: {size} bytes ({size / args.iterations:.2f} bytes/sample)")
+
+        read_start = time.perf_counter()
+        count = sum(1 for _ in read_session_log(path))
+        read_seconds = time.perf_counter() - read_start
+        print(f"read: {count} samples in {read_seconds:.2f}s ({read_seconds / count * 1_000_000:.2f}us/sample)")
+
+
+if __name__ == "__main__":
+    main()
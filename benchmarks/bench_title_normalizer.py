@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark matching raw titles case-insensitively vs normalized titles.
+
+Every title is distinct, so each measurement includes normalizing the title
+(NFKC, casefold, suffix stripping, length cap) once. Short browser titles and
+multi-kilobyte titles are measured with each match engine.
+
+Usage:
+    python benchmarks/bench_title_normalizer.py [--patterns N] [--iterations N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pattern_set import MATCH_ENGINES, PatternSet  # noqa: E402
+from title_normalizer import TitleNormalizer  # noqa: E402
+
+
+def measure(func, items):
+    """Measure per-call latency of func.
+
+    Args:
+        func: Callable to measure
+        items: Arguments, one call per item
+
+    Returns:
+        list: Per-call latencies in microseconds
+    """
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def make_patterns(count):
+    """Build keyword, alternation and class patterns with mixed case.
+
+    Args:
+        count: Number of patterns
+
+    Returns:
+        list: Pattern dictionaries
+    """
+    patterns = []
+    for i in range(count):
+        if i % 3 == 0:
+            regex = f"Site{i}\\.Example\\.com"
+        elif i % 3 == 1:
+            regex = f"Project-{i}|Repo{i}"
+        else:
+            regex = f"[A-Z]+Tube{i}\\b"
+        patterns.append({"regex": regex, "score": i % 7 - 3, "description": f"Pattern {i}"})
+    return patterns
+
+
+def make_titles(count, length):
+    """Build distinct browser titles that match none of the patterns.
+
+    Args:
+        count: Number of titles
+        length: Approximate title length in characters
+
+    Returns:
+        list: Window titles
+    """
+    body = "Some Page About Things "
+    return [f"{i} " + (body * (length // len(body) + 1))[:length] + " - Google Chrome" for i in range(count)]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patterns", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    patterns = make_patterns(args.patterns)
+    for length in (100, 4000):
+        titles = make_titles(args.iterations, length)
+        for engine in MATCH_ENGINES:
+            raw_set = PatternSet(patterns, engine)
+            normalized_set = PatternSet(
+                patterns, engine, normalizer=TitleNormalizer([" - Google Chrome"], max_length=0)
+            )
+            raw_us = statistics.median(measure(raw_set.match_index, titles))
+            normalized_us = statistics.median(measure(normalized_set.match_index, titles))
+            print(
+                f"{args.patterns} patterns, {length}-char titles, {engine:10}: "
+                f"raw IGNORECASE median={raw_us:.1f}us  normalized median={normalized_us:.1f}us  "
+                f"speedup={raw_us / normalized_us:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark active window title acquisition: persistent X11 connection vs subprocess.
+
+Usage:
+    python benchmarks/bench_window_monitor.py [--iterations N]
+
+Requires a running X server ($DISPLAY). The X11 path additionally requires python-xlib.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from window_monitor import WindowMonitor  # noqa: E402
+from x11_connection import X11Connection, X11ConnectionError  # noqa: E402
+
+
+def measure(func, iterations):
+    """Measure per-call latency of func.
+
+    Args:
+        func: Callable to measure
+        iterations: Number of calls
+
+    Returns:
+        list: Per-call latencies in microseconds
+    """
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(name, samples):
+    """Print latency statistics."""
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{name:<28} mean={statistics.mean(samples):10.1f}us  "
+        f"median={statistics.median(samples):10.1f}us  p95={p95:10.1f}us"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    if X11Connection.is_supported():
+        connection = X11Connection()
+        try:
+            connection.get_active_window_title()  # Warm up (opens the connection)
+            report("x11 (persistent)", measure(connection.get_active_window_title, args.iterations))
+        except X11ConnectionError as e:
+            print(f"x11 (persistent): unavailable ({e})")
+    else:
+        print("x11 (persistent): unavailable (python-xlib not installed or $DISPLAY not set)")
+
+    # Force the subprocess path (xdotool, then xprop fallback)
+    WindowMonitor._get_x11_connection = classmethod(lambda cls: None)
+    report("subprocess (xdotool/xprop)", measure(WindowMonitor._get_active_window_linux, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Background window acquisition module for cat-window-watcher.
+
+Window queries can block (subprocess timeouts of 1-2 seconds). Running them on
+the Tk thread freezes the GUI and delays the next tick, so a worker thread
+acquires snapshots and publishes the latest one into a single-slot mailbox that
+the GUI tick reads without waiting.
+"""
+
+import threading
+
+
+class SnapshotMailbox:
+    """Single-slot, lock-protected holder for the latest WindowSnapshot.
+
+    Publishing overwrites the previous value; readers always see the newest
+    snapshot and never block on the producer.
+    """
+
+    def __init__(self):
+        """Initialize an empty mailbox."""
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._sequence = 0
+
+    def put(self, snapshot):
+        """Publish a snapshot, replacing any unread one.
+
+        Args:
+            snapshot: WindowSnapshot to publish
+        """
+        with self._lock:
+            self._snapshot = snapshot
+            self._sequence += 1
+
+    def get(self):
+        """Read the latest snapshot without consuming it.
+
+        Returns:
+            tuple: (snapshot, sequence) where snapshot is None before the first put
+                   and sequence increases on every put
+        """
+        with self._lock:
+            return self._snapshot, self._sequence
+
+
+class AcquisitionWorker:
+    """Acquire window snapshots on a background thread."""
+
+    def __init__(self, window_monitor, interval_seconds=1.0, title_source=None):
+        """Initialize acquisition worker.
+
+        Args:
+            window_monitor: WindowMonitor used for acquisition (only touched by the worker thread)
+            interval_seconds: Seconds between acquisitions
+            title_source: Optional callable returning a title pushed by an event source,
+                          or None to query the title
+        """
+        self.window_monitor = window_monitor
+        self.interval_seconds = interval_seconds
+        self.title_source = title_source
+        self.include_process = False
+        self.debug = False
+        self.mailbox = SnapshotMailbox()
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+
+    def start(self):
+        """Start the worker thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="AcquisitionWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Stop the worker thread.
+
+        Args:
+            timeout: Seconds to wait for an in-flight acquisition to finish
+        """
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def is_running(self):
+        """Check if the worker thread is alive.
+
+        Returns:
+            bool: True if the worker is acquiring snapshots
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def configure(self, interval_seconds, include_process, debug=False):
+        """Update acquisition parameters from the GUI thread.
+
+        A shorter interval takes effect immediately instead of after the current wait.
+
+        Args:
+            interval_seconds: Seconds between acquisitions
+            include_process: If True, also acquire the process name
+            debug: If True, print screensaver detection debug output
+        """
+        self.include_process = include_process
+        self.debug = debug
+        if interval_seconds != self.interval_seconds:
+            shorter = interval_seconds < self.interval_seconds
+            self.interval_seconds = interval_seconds
+            if shorter:
+                self._wakeup.set()
+
+    def get_latest(self):
+        """Get the latest published snapshot.
+
+        Returns:
+            WindowSnapshot: Latest snapshot, or None if none has been acquired yet
+        """
+        return self.mailbox.get()[0]
+
+    def acquire_once(self):
+        """Acquire one snapshot and publish it.
+
+        Returns:
+            WindowSnapshot: The published snapshot
+        """
+        window_title = self.title_source() if self.title_source is not None else None
+        snapshot = self.window_monitor.sample(
+            include_process=self.include_process, debug=self.debug, window_title=window_title
+        )
+        self.mailbox.put(snapshot)
+        return snapshot
+
+    def _run(self):
+        """Worker loop acquiring a snapshot every interval."""
+        while not self._stop_event.is_set():
+            # Clear before acquiring, so a wakeup set meanwhile (e.g. by configure) is not lost
+            self._wakeup.clear()
+            try:
+                self.acquire_once()
+            except Exception as e:
+                print(f"Warning: Window acquisition failed: {e}")
+            self._wakeup.wait(self.interval_seconds)
+
+
+class StallMeter:
+    """Track how long GUI ticks block the Tk mainloop."""
+
+    def __init__(self):
+        """Initialize an empty stall meter."""
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds):
+        """Record the duration of one tick.
+
+        Args:
+            seconds: Time the tick blocked the mainloop
+        """
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def format_summary(self):
+        """Format the stall statistics for console output.
+
+        Returns:
+            str: Summary line with worst and mean tick duration
+        """
+        mean_ms = self.total_seconds / self.count * 1000 if self.count else 0.0
+        return f"Mainloop stall: worst {self.max_seconds * 1000:.1f}ms, mean {mean_ms:.2f}ms over {self.count} ticks"
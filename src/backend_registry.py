@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Window query backend registry module for cat-window-watcher.
+
+Probes the available acquisition mechanisms once, orders them by measured
+latency, remembers which tools are missing (never retried), and puts backends
+that keep failing behind a circuit breaker with exponential retry.
+"""
+
+import time
+
+# Consecutive failures before a backend's circuit opens
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# First retry delay after the circuit opens, doubled on each further failure
+DEFAULT_INITIAL_RETRY_SECONDS = 5.0
+
+# Upper bound for the retry delay
+DEFAULT_MAX_RETRY_SECONDS = 300.0
+
+
+class BackendUnavailableError(Exception):
+    """Raised by a backend operation when its mechanism does not exist on this system."""
+
+
+class AllBackendsFailedError(Exception):
+    """Raised when no backend could serve an operation."""
+
+
+def is_missing_error(error):
+    """Check if an exception means the mechanism is absent (not just failing).
+
+    Args:
+        error: Exception raised by a backend operation
+
+    Returns:
+        bool: True if the tool/module is missing and should never be retried
+    """
+    while error is not None:
+        if isinstance(error, (BackendUnavailableError, FileNotFoundError, ImportError)):
+            return True
+        error = error.__cause__
+    return False
+
+
+class Backend:
+    """A named acquisition mechanism with its health state."""
+
+    def __init__(self, name, operations):
+        """Initialize backend.
+
+        Args:
+            name: Backend name shown in verbose output (e.g. "xdotool")
+            operations: Dict mapping operation names ("title", "process", ...) to callables
+        """
+        self.name = name
+        self.operations = operations
+        self.missing = False
+        self.probe_seconds = None
+        self.consecutive_failures = 0
+        self.retry_delay = None
+        self.open_until = 0.0
+        self.last_error = None
+
+
+class BackendRegistry:
+    """Select and supervise window query backends."""
+
+    def __init__(
+        self,
+        backends,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        initial_retry_seconds=DEFAULT_INITIAL_RETRY_SECONDS,
+        max_retry_seconds=DEFAULT_MAX_RETRY_SECONDS,
+        clock=time.monotonic,
+    ):
+        """Initialize backend registry.
+
+        Args:
+            backends: List of Backend objects in preferred order
+            failure_threshold: Consecutive failures before a backend's circuit opens
+            initial_retry_seconds: First retry delay once the circuit is open
+            max_retry_seconds: Maximum retry delay
+            clock: Monotonic clock function (for testing)
+        """
+        self.backends = list(backends)
+        self.failure_threshold = failure_threshold
+        self.initial_retry_seconds = initial_retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.clock = clock
+        self._all_failed_warned = set()
+
+    def probe(self, operation="title"):
+        """Probe every backend once and order working ones by latency.
+
+        Args:
+            operation: Operation used for probing
+        """
+        for backend in self.backends:
+            func = backend.operations.get(operation)
+            if func is None:
+                continue
+            start = time.perf_counter()
+            try:
+                func()
+            except Exception as e:
+                self._record_failure(backend, e, warn=False)
+            else:
+                self._record_success(backend)
+            backend.probe_seconds = time.perf_counter() - start
+
+        # Working backends first (fastest first), then failing ones, then missing ones
+        def sort_key(backend):
+            if backend.missing:
+                return (2, 0.0)
+            if backend.consecutive_failures:
+                return (1, 0.0)
+            return (0, backend.probe_seconds if backend.probe_seconds is not None else float("inf"))
+
+        self.backends.sort(key=sort_key)
+
+    def call(self, operation, *args):
+        """Run an operation on the first available backend that succeeds.
+
+        Args:
+            operation: Operation name
+            *args: Arguments passed to the operation
+
+        Returns:
+            Result of the first successful backend
+
+        Raises:
+            AllBackendsFailedError: If no backend could serve the operation
+        """
+        now = self.clock()
+        for backend in self.backends:
+            func = backend.operations.get(operation)
+            if func is None or backend.missing or now < backend.open_until:
+                continue
+            try:
+                result = func(*args)
+            except Exception as e:
+                self._record_failure(backend, e)
+                continue
+            self._record_success(backend)
+            self._all_failed_warned.discard(operation)
+            return result
+
+        if operation not in self._all_failed_warned:
+            # Warn once per failure streak instead of once per tick
+            self._all_failed_warned.add(operation)
+            print(f"Warning: No window backend could serve '{operation}'")
+        raise AllBackendsFailedError(operation)
+
+    def _record_success(self, backend):
+        """Reset a backend's failure state."""
+        backend.consecutive_failures = 0
+        backend.retry_delay = None
+        backend.open_until = 0.0
+        backend.last_error = None
+
+    def _record_failure(self, backend, error, warn=True):
+        """Record a failure, marking missing tools or opening the circuit.
+
+        Args:
+            backend: Backend that failed
+            error: Exception raised
+            warn: Whether to print state change warnings
+        """
+        backend.last_error = error
+        if is_missing_error(error):
+            backend.missing = True
+            if warn:
+                print(f"Warning: Window backend '{backend.name}' is unavailable ({error}); disabling it")
+            return
+
+        backend.consecutive_failures += 1
+        if backend.consecutive_failures >= self.failure_threshold:
+            if backend.retry_delay is None:
+                backend.retry_delay = self.initial_retry_seconds
+            else:
+                backend.retry_delay = min(backend.retry_delay * 2, self.max_retry_seconds)
+            backend.open_until = self.clock() + backend.retry_delay
+            if warn:
+                print(
+                    f"Warning: Window backend '{backend.name}' failed {backend.consecutive_failures} times "
+                    f"({error}); retrying in {backend.retry_delay:g}s"
+                )
+
+    def get_active_backend_name(self):
+        """Get the name of the backend currently preferred for queries.
+
+        Returns:
+            str: Backend name, or None if every backend is missing or open
+        """
+        now = self.clock()
+        for backend in self.backends:
+            if not backend.missing and now >= backend.open_until:
+                return backend.name
+        return None
+
+    def describe(self):
+        """Describe backends and probe timings for verbose output.
+
+        Returns:
+            list: Lines describing each backend's state
+        """
+        lines = []
+        for backend in self.backends:
+            timing = f"{backend.probe_seconds * 1000:.2f}ms" if backend.probe_seconds is not None else "-"
+            if backend.missing:
+                state = "missing"
+            elif backend.consecutive_failures:
+                state = f"failing ({backend.last_error})"
+            else:
+                state = "ok"
+            lines.append(f"{backend.name}: {state}, probe {timing}")
+        return lines
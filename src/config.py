@@ -6,8 +6,10 @@ from pathlib import Path
 
 try:
     from .config_loader import ConfigLoader
+    from .pattern_set import PatternSet
 except ImportError:
     from config_loader import ConfigLoader
+    from pattern_set import PatternSet
 
 # ANSI color codes for console output
 ANSI_GREEN = "\033[32m"
@@ -38,7 +40,14 @@ class Config:
         # Initialize default values
         self.verbose = False
         self.debug_screensaver_detection = False
+        self.profile_patterns = False
+        self.regex_safe_mode = False
+        self.regex_time_budget_ms = 100
         self.window_patterns = []
+        self.pattern_match_engine = "sequential"
+        self.shadowed_pattern_mode = "off"
+        self.shadow_probe_corpus = ""
+        self.pattern_set = PatternSet()
         self.default_score = -1
         self.apply_default_score_mode = True
         self.self_window_score = 0
@@ -58,11 +67,26 @@ class Config:
         self.default_transparency = 1.0
         self.window_x = None
         self.window_y = None
+        self.focus_tracking_mode = "poll"
+        self.acquisition_mode = "sync"
+        self.idle_threshold_seconds = 0
+        self.session_log_path = ""
         self.game_playing_detection = {
             "enabled": False,
             "process_names": [],
             "check_interval_seconds": 60,
         }
+        self.adaptive_polling = {
+            "enabled": False,
+            "min_interval_seconds": 1,
+            "max_interval_seconds": 60,
+            "backoff_factor": 2.0,
+        }
+        self.title_normalization = {
+            "enabled": False,
+            "strip_suffixes": [],
+            "max_length": 1024,
+        }
 
         # Load configuration and print initial success message
         self.load_config(print_success=True)
@@ -83,6 +107,9 @@ class Config:
         # Update instance attributes with loaded settings
         self.verbose = settings["verbose"]
         self.debug_screensaver_detection = settings["debug_screensaver_detection"]
+        self.profile_patterns = settings["profile_patterns"]
+        self.regex_safe_mode = settings["regex_safe_mode"]
+        self.regex_time_budget_ms = settings["regex_time_budget_ms"]
         self.default_score = settings["default_score"]
         self.apply_default_score_mode = settings["apply_default_score_mode"]
         self.self_window_score = settings["self_window_score"]
@@ -102,8 +129,18 @@ class Config:
         self.default_transparency = settings["default_transparency"]
         self.window_x = settings["window_x"]
         self.window_y = settings["window_y"]
+        self.focus_tracking_mode = settings["focus_tracking_mode"]
+        self.acquisition_mode = settings["acquisition_mode"]
+        self.idle_threshold_seconds = settings["idle_threshold_seconds"]
+        self.session_log_path = settings["session_log_path"]
         self.window_patterns = settings["window_patterns"]
+        self.pattern_match_engine = settings["pattern_match_engine"]
+        self.shadowed_pattern_mode = settings["shadowed_pattern_mode"]
+        self.shadow_probe_corpus = settings["shadow_probe_corpus"]
+        self.pattern_set = settings["pattern_set"]
         self.game_playing_detection = settings["game_playing_detection"]
+        self.adaptive_polling = settings["adaptive_polling"]
+        self.title_normalization = settings["title_normalization"]
         self._last_modified = settings["_last_modified"]
 
         # Print configuration values to console if verbose mode is enabled
@@ -148,10 +185,47 @@ class Config:
         """Get list of window patterns.
 
         Returns:
-            list: List of pattern dictionaries with regex, score, and description
+            list: List of pattern dictionaries with score, description and a regex, process, title or domain rule
         """
         return self.window_patterns
 
+    def get_pattern_set(self):
+        """Get window patterns compiled at load time.
+
+        Returns:
+            PatternSet: Precompiled window patterns
+        """
+        return self.pattern_set
+
+    def get_pattern_match_engine(self):
+        """Get pattern_match_engine setting.
+
+        Returns:
+            str: "sequential" to search each pattern in order,
+                 "combined" to check runs of patterns with one merged regex,
+                 "prefilter" to search only patterns whose required literals occur
+        """
+        return self.pattern_match_engine
+
+    def get_shadowed_pattern_mode(self):
+        """Get shadowed_pattern_mode setting.
+
+        Returns:
+            str: "off" to skip the analysis, "warn" to report window patterns that
+                 an earlier pattern shadows, "drop" to also leave the provably
+                 shadowed ones out of the pattern set
+        """
+        return self.shadowed_pattern_mode
+
+    def get_shadow_probe_corpus(self):
+        """Get shadow_probe_corpus setting.
+
+        Returns:
+            str: Session log or title list probed by the shadowed pattern analysis,
+                 or "" for the static analysis only
+        """
+        return self.shadow_probe_corpus
+
     def get_default_score(self):
         """Get default score for non-matching windows.
 
@@ -304,6 +378,41 @@ class Config:
         """
         return self.window_y
 
+    def get_focus_tracking_mode(self):
+        """Get focus_tracking_mode setting.
+
+        Returns:
+            str: "poll" to query the active window every tick, "event" to use X11 focus events
+        """
+        return self.focus_tracking_mode
+
+    def get_acquisition_mode(self):
+        """Get acquisition_mode setting.
+
+        Returns:
+            str: "thread" to acquire the active window on a background thread,
+                 "sync" to acquire it on the GUI thread
+        """
+        return self.acquisition_mode
+
+    def get_idle_threshold_seconds(self):
+        """Get idle_threshold_seconds setting.
+
+        Returns:
+            int: Seconds without keyboard/mouse input after which scoring is frozen
+                 (0 = disabled, empty window title is treated as screensaver instead)
+        """
+        return self.idle_threshold_seconds
+
+    def get_session_log_path(self):
+        """Get session_log_path setting.
+
+        Returns:
+            str: Path of the binary session log to record window snapshots to
+                 (empty string = recording disabled)
+        """
+        return self.session_log_path
+
     def get_verbose(self):
         """Get verbose mode setting.
 
@@ -320,6 +429,31 @@ class Config:
         """
         return self.debug_screensaver_detection
 
+    def get_profile_patterns(self):
+        """Get profile_patterns setting.
+
+        Returns:
+            bool: True if per-pattern match cost and hit statistics are collected
+        """
+        return self.profile_patterns
+
+    def get_regex_safe_mode(self):
+        """Get regex_safe_mode setting.
+
+        Returns:
+            bool: True if risky window patterns are evaluated in an isolated worker
+                  under a time budget
+        """
+        return self.regex_safe_mode
+
+    def get_regex_time_budget_ms(self):
+        """Get regex_time_budget_ms setting.
+
+        Returns:
+            int: Milliseconds one evaluation of a risky pattern may take in safe mode
+        """
+        return self.regex_time_budget_ms
+
     def get_game_playing_detection(self):
         """Get game_playing_detection settings.
 
@@ -331,6 +465,29 @@ class Config:
         """
         return self.game_playing_detection
 
+    def get_adaptive_polling(self):
+        """Get adaptive_polling settings.
+
+        Returns:
+            dict: Adaptive polling settings with keys:
+                  - enabled (bool): Whether the interval adapts to window stability
+                  - min_interval_seconds (int): Interval right after the window changes
+                  - max_interval_seconds (int): Longest interval while the window is stable
+                  - backoff_factor (float): Interval multiplier per stable check
+        """
+        return self.adaptive_polling
+
+    def get_title_normalization(self):
+        """Get title_normalization settings.
+
+        Returns:
+            dict: Title normalization settings with keys:
+                  - enabled (bool): Whether titles are normalized before pattern matching
+                  - strip_suffixes (list): Title suffixes to remove (e.g. " - Google Chrome")
+                  - max_length (int): Maximum length of a normalized title (0 = unlimited)
+        """
+        return self.title_normalization
+
     def print_config(self, context: str = ""):
         """Print all configuration values to console.
 
@@ -351,6 +508,9 @@ class Config:
         print("--- デバッグ設定 (Debug Settings) ---")
         print(f"verbose: {self.verbose}")
         print(f"debug_screensaver_detection: {self.debug_screensaver_detection}")
+        print(f"profile_patterns: {self.profile_patterns}")
+        print(f"regex_safe_mode: {self.regex_safe_mode}")
+        print(f"regex_time_budget_ms: {self.regex_time_budget_ms}")
         print()
         print("--- スコア設定 (Score Settings) ---")
         print(f"default_score: {self.default_score}")
@@ -383,6 +543,17 @@ class Config:
         print(f"flow_mode_delay_seconds: {self.flow_mode_delay_seconds}")
         print(f"flow_mode_fade_rate_percent_per_second: {self.flow_mode_fade_rate_percent_per_second}")
         print()
+        print("--- ウィンドウ監視設定 (Window Monitoring Settings) ---")
+        print(f"focus_tracking_mode: {self.focus_tracking_mode}")
+        print(f"acquisition_mode: {self.acquisition_mode}")
+        print(f"idle_threshold_seconds: {self.idle_threshold_seconds}")
+        print(f"session_log_path: {self.session_log_path}")
+        print(f"adaptive_polling: {self.adaptive_polling}")
+        print(f"pattern_match_engine: {self.pattern_match_engine}")
+        print(f"shadowed_pattern_mode: {self.shadowed_pattern_mode}")
+        print(f"shadow_probe_corpus: {self.shadow_probe_corpus}")
+        print(f"title_normalization: {self.title_normalization}")
+        print()
         print("--- ウィンドウパターン (Window Patterns) ---")
         if self.window_patterns:
             for i, pattern in enumerate(self.window_patterns, 1):
@@ -11,8 +11,16 @@ except ImportError:
 
 try:
     from .config_validator import ConfigValidator
+    from .domain_trie import DomainTrie
+    from .pattern_set import MATCH_ENGINES, RULE_KINDS, PatternSet
+    from .pattern_shadowing import find_shadowed_patterns, format_finding, read_title_corpus
+    from .title_normalizer import DEFAULT_MAX_LENGTH, TitleNormalizer
 except ImportError:
     from config_validator import ConfigValidator
+    from domain_trie import DomainTrie
+    from pattern_set import MATCH_ENGINES, RULE_KINDS, PatternSet
+    from pattern_shadowing import find_shadowed_patterns, format_finding, read_title_corpus
+    from title_normalizer import DEFAULT_MAX_LENGTH, TitleNormalizer
 
 
 class ConfigLoader:
@@ -26,6 +34,9 @@ class ConfigLoader:
         """
         self.config_path = Path(config_path)
         self.validator = ConfigValidator()
+        # Kept across reloads so unchanged patterns and domain lists are not compiled or read again
+        self._pattern_set = None
+        self._domain_lists = {}
 
     def load(self, exit_on_error=True):
         """Load configuration from TOML file.
@@ -87,6 +98,22 @@ class ConfigLoader:
         self.validator.validate_boolean(debug_screensaver_detection, "debug_screensaver_detection")
         settings["debug_screensaver_detection"] = debug_screensaver_detection
 
+        # Pattern profiling
+        profile_patterns = config_data.get("profile_patterns", False)
+        self.validator.validate_boolean(profile_patterns, "profile_patterns")
+        settings["profile_patterns"] = profile_patterns
+
+        # ReDoS-safe matching
+        regex_safe_mode = config_data.get("regex_safe_mode", False)
+        self.validator.validate_boolean(regex_safe_mode, "regex_safe_mode")
+        settings["regex_safe_mode"] = regex_safe_mode
+
+        regex_time_budget_ms = config_data.get("regex_time_budget_ms", 100)
+        self.validator.validate_non_negative_integer(regex_time_budget_ms, "regex_time_budget_ms")
+        if regex_time_budget_ms <= 0:
+            raise ValueError("regex_time_budget_ms must be greater than 0")
+        settings["regex_time_budget_ms"] = regex_time_budget_ms
+
         # Default score
         default_score = config_data.get("default_score", -1)
         self.validator.validate_integer(default_score, "default_score")
@@ -180,17 +207,95 @@ class ConfigLoader:
         self.validator.validate_transparency(default_transparency, "default_transparency")
         settings["default_transparency"] = default_transparency
 
+        # Focus tracking mode
+        focus_tracking_mode = config_data.get("focus_tracking_mode", "poll")
+        self.validator.validate_choice(focus_tracking_mode, "focus_tracking_mode", ("poll", "event"))
+        settings["focus_tracking_mode"] = focus_tracking_mode
+
+        # Acquisition mode
+        acquisition_mode = config_data.get("acquisition_mode", "sync")
+        self.validator.validate_choice(acquisition_mode, "acquisition_mode", ("thread", "sync"))
+        settings["acquisition_mode"] = acquisition_mode
+
+        # Idle threshold
+        idle_threshold_seconds = config_data.get("idle_threshold_seconds", 0)
+        self.validator.validate_non_negative_integer(idle_threshold_seconds, "idle_threshold_seconds")
+        settings["idle_threshold_seconds"] = idle_threshold_seconds
+
+        # Session log path
+        session_log_path = config_data.get("session_log_path", "")
+        if not isinstance(session_log_path, str):
+            raise ValueError("session_log_path must be a string")
+        settings["session_log_path"] = session_log_path
+
         # Window patterns
         window_patterns = []
+        domain_lists = {}
         for pattern in config_data.get("window_patterns", []):
-            window_patterns.append(
-                {
-                    "regex": pattern.get("regex", ""),
-                    "score": pattern.get("score", 1),
-                    "description": pattern.get("description", ""),
-                }
-            )
+            entry = {
+                "regex": pattern.get("regex", ""),
+                "score": pattern.get("score", 1),
+                "description": pattern.get("description", ""),
+            }
+            # Exact-match rules (process name, whole title, domain suffix, domain list file)
+            for kind in RULE_KINDS[1:]:
+                if kind in pattern:
+                    entry[kind] = pattern[kind]
+            if entry.get("domain_list") and isinstance(entry["domain_list"], str):
+                # Load the list once here; relative paths are relative to the config file
+                list_path = self.config_path.parent / entry["domain_list"]
+                try:
+                    entry["domain_trie"] = self._load_domain_list(list_path, domain_lists)
+                except OSError as e:
+                    raise ValueError(f"Cannot read domain_list '{list_path}': {e}") from e
+            window_patterns.append(entry)
         settings["window_patterns"] = window_patterns
+        self._domain_lists = domain_lists
+
+        # Pattern match engine
+        pattern_match_engine = config_data.get("pattern_match_engine", "sequential")
+        self.validator.validate_choice(pattern_match_engine, "pattern_match_engine", MATCH_ENGINES)
+        settings["pattern_match_engine"] = pattern_match_engine
+
+        # Shadowed pattern analysis
+        shadowed_pattern_mode = config_data.get("shadowed_pattern_mode", "off")
+        self.validator.validate_choice(shadowed_pattern_mode, "shadowed_pattern_mode", ("off", "warn", "drop"))
+        settings["shadowed_pattern_mode"] = shadowed_pattern_mode
+        shadow_probe_corpus = config_data.get("shadow_probe_corpus", "")
+        if not isinstance(shadow_probe_corpus, str):
+            raise ValueError("shadow_probe_corpus must be a string")
+        settings["shadow_probe_corpus"] = shadow_probe_corpus
+
+        # Title normalization
+        title_normalization = config_data.get("title_normalization", {})
+        enabled = title_normalization.get("enabled", False)
+        self.validator.validate_boolean(enabled, "title_normalization.enabled")
+        strip_suffixes = title_normalization.get("strip_suffixes", [])
+        if not isinstance(strip_suffixes, list) or not all(isinstance(suffix, str) for suffix in strip_suffixes):
+            raise ValueError("title_normalization.strip_suffixes must be a list of strings")
+        max_length = title_normalization.get("max_length", DEFAULT_MAX_LENGTH)
+        self.validator.validate_non_negative_integer(max_length, "title_normalization.max_length")
+        settings["title_normalization"] = {
+            "enabled": enabled,
+            "strip_suffixes": strip_suffixes,
+            "max_length": max_length,
+        }
+        normalizer = TitleNormalizer(strip_suffixes, max_length) if enabled else None
+
+        # Compile window patterns once (invalid regexes are reported here, not mid-tick)
+        pattern_set = PatternSet(
+            window_patterns, pattern_match_engine, normalizer=normalizer, previous=self._pattern_set
+        )
+        if shadowed_pattern_mode != "off":
+            kept_patterns = self._check_shadowed_patterns(
+                window_patterns, shadow_probe_corpus, normalizer, drop=shadowed_pattern_mode == "drop"
+            )
+            if len(kept_patterns) != len(window_patterns):
+                pattern_set = PatternSet(
+                    kept_patterns, pattern_match_engine, normalizer=normalizer, previous=pattern_set
+                )
+        self._pattern_set = pattern_set
+        settings["pattern_set"] = pattern_set
 
         # Game playing detection
         game_playing_detection = config_data.get("game_playing_detection", {})
@@ -214,4 +319,85 @@ class ConfigLoader:
             "check_interval_seconds": check_interval_seconds,
         }
 
+        # Adaptive polling
+        adaptive_polling = config_data.get("adaptive_polling", {})
+        enabled = adaptive_polling.get("enabled", False)
+        self.validator.validate_boolean(enabled, "adaptive_polling.enabled")
+        min_interval_seconds = adaptive_polling.get("min_interval_seconds", 1)
+        self.validator.validate_non_negative_integer(min_interval_seconds, "adaptive_polling.min_interval_seconds")
+        if min_interval_seconds <= 0:
+            raise ValueError("adaptive_polling.min_interval_seconds must be greater than 0")
+        max_interval_seconds = adaptive_polling.get("max_interval_seconds", 60)
+        self.validator.validate_non_negative_integer(max_interval_seconds, "adaptive_polling.max_interval_seconds")
+        if max_interval_seconds < min_interval_seconds:
+            raise ValueError("adaptive_polling.max_interval_seconds must be >= adaptive_polling.min_interval_seconds")
+        backoff_factor = adaptive_polling.get("backoff_factor", 2.0)
+        if isinstance(backoff_factor, bool) or not isinstance(backoff_factor, (int, float)):
+            raise ValueError(f"adaptive_polling.backoff_factor must be a number, got {type(backoff_factor).__name__}")
+        if backoff_factor <= 1:
+            raise ValueError("adaptive_polling.backoff_factor must be greater than 1")
+
+        settings["adaptive_polling"] = {
+            "enabled": enabled,
+            "min_interval_seconds": min_interval_seconds,
+            "max_interval_seconds": max_interval_seconds,
+            "backoff_factor": backoff_factor,
+        }
+
         return settings
+
+    def _load_domain_list(self, path, loaded):
+        """Load a domain_list file, reusing the previous load's trie if the file is unchanged.
+
+        Args:
+            path: Path of the list file
+            loaded: Dictionary collecting path -> ((mtime, size), DomainTrie) for this load
+
+        Returns:
+            DomainTrie: Listed domains
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = loaded.get(path) or self._domain_lists.get(path)
+        if cached is not None and cached[0] == version:
+            trie = cached[1]
+        else:
+            trie = DomainTrie.from_file(path)
+        loaded[path] = (version, trie)
+        return trie
+
+    def _check_shadowed_patterns(self, window_patterns, corpus_path, normalizer, drop):
+        """Warn about window patterns that can never win against an earlier pattern.
+
+        Args:
+            window_patterns: List of pattern dictionaries
+            corpus_path: Session log or title list to probe the patterns with, or "" for
+                         the static analysis only
+            normalizer: TitleNormalizer the patterns are matched with, or None
+            drop: If True, leave patterns that provably can never win out of the result
+
+        Returns:
+            list: Pattern dictionaries to compile
+        """
+        corpus = None
+        if corpus_path:
+            # Relative paths are relative to the config file, like domain_list
+            corpus_path = self.config_path.parent / corpus_path
+            try:
+                corpus = read_title_corpus(corpus_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: could not read shadow_probe_corpus '{corpus_path}': {e}")
+
+        findings = find_shadowed_patterns(window_patterns, corpus, normalizer)
+        for finding in findings:
+            print(f"Warning: {format_finding(finding, window_patterns)}")
+        if not drop:
+            return window_patterns
+
+        dropped = {finding.index for finding in findings if finding.proven}
+        if dropped:
+            print(f"Dropped {len(dropped)} shadowed window pattern(s) from matching")
+        return [pattern for index, pattern in enumerate(window_patterns) if index not in dropped]
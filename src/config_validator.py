@@ -131,3 +131,19 @@ class ConfigValidator:
         """
         if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
             raise ValueError(f"Invalid '{setting_name}' value: {value!r}. Must be an integer or null.")
+
+    @staticmethod
+    def validate_choice(value, setting_name, choices):
+        """Validate that a value is one of the allowed choices.
+
+        Args:
+            value: Value to validate
+            setting_name: Name of the setting (for error messages)
+            choices: Sequence of allowed values
+
+        Raises:
+            ValueError: If value is not one of the choices
+        """
+        if value not in choices:
+            allowed = ", ".join(repr(choice) for choice in choices)
+            raise ValueError(f"Invalid '{setting_name}' value: {value!r}. Must be one of: {allowed}.")
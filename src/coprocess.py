@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Long-lived helper coprocess module for cat-window-watcher.
+
+Some window queries need an external tool (e.g. PowerShell with ``Add-Type``).
+Starting that tool on every tick pays the full process startup (and, for
+PowerShell, a C# compile) each time. A coprocess is started once and then
+queried over its stdin/stdout.
+
+Protocol:
+    - Request: one UTF-8 line (the query) terminated by ``\\n``
+    - Reply: a header line with the payload length in bytes, followed by
+      exactly that many bytes of UTF-8 payload
+
+A helper can be given a handshake query. It is sent right after the helper
+starts and its reply awaited under a separate startup timeout, so interpreter
+startup never counts against a request deadline.
+"""
+
+import io
+import queue
+import subprocess
+import threading
+import time
+
+# Default per-request deadline in seconds
+DEFAULT_DEADLINE = 1.0
+
+# Default time a helper may take to start and answer the handshake, in seconds
+DEFAULT_STARTUP_TIMEOUT = 10.0
+
+# Marker placed in the reply queue when the helper's stdout closes
+_EOF = object()
+
+
+class CoprocessError(Exception):
+    """Raised when a coprocess request fails, times out, or the helper dies."""
+
+
+class CoprocessTimeout(CoprocessError):
+    """Raised when a running helper misses the deadline of a request."""
+
+
+def write_frame(stream, payload):
+    """Write a length-prefixed reply frame.
+
+    This is the helper side of the protocol, for helpers written in Python.
+
+    Args:
+        stream: Binary output stream (e.g. sys.stdout.buffer)
+        payload: Reply text
+    """
+    data = payload.encode("utf-8")
+    stream.write(f"{len(data)}\n".encode("ascii") + data)
+    stream.flush()
+
+
+def read_frame(stream):
+    """Read a length-prefixed reply frame.
+
+    Args:
+        stream: Binary input stream (a raw stream may return a payload in several reads)
+
+    Returns:
+        str: Reply payload, or None at end of stream (including a truncated payload)
+
+    Raises:
+        CoprocessError: If the frame header is malformed
+    """
+    header = stream.readline()
+    if not header:
+        return None
+    try:
+        length = int(header.strip())
+    except ValueError:
+        raise CoprocessError(f"Malformed frame header: {header!r}") from None
+    data = stream.read(length)
+    while len(data) < length:
+        chunk = stream.read(length - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data.decode("utf-8", "replace")
+
+
+class Coprocess:
+    """A helper process started once and queried repeatedly over pipes."""
+
+    def __init__(self, command, deadline=DEFAULT_DEADLINE, handshake=None, startup_timeout=DEFAULT_STARTUP_TIMEOUT):
+        """Initialize coprocess.
+
+        The helper is started by start() or lazily on the first request, and
+        restarted automatically if it dies or misses a deadline.
+
+        Args:
+            command: Command line list used to start the helper
+            deadline: Per-request deadline in seconds
+            handshake: Query whose reply shows the helper is ready, or None to
+                       send requests right after the process is created
+            startup_timeout: Seconds the helper may take to answer the handshake
+        """
+        self.command = command
+        self.deadline = deadline
+        self.handshake = handshake
+        self.startup_timeout = startup_timeout
+        self._process = None
+        self._replies = None
+        self._lock = threading.Lock()
+        self._health = {
+            "requests": 0,
+            "successes": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "starts": 0,
+            "restarts": 0,
+        }
+
+    def _start(self):
+        """Start the helper and its stdout reader thread, and wait for the handshake.
+
+        Raises:
+            CoprocessError: If the helper cannot be started or does not answer the
+                            handshake within the startup timeout
+        """
+        try:
+            self._process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except OSError as e:
+            self._process = None
+            raise CoprocessError(f"Failed to start helper {self.command[0]!r}: {e}") from e
+
+        if self._health["starts"] > 0:
+            self._health["restarts"] += 1
+        self._health["starts"] += 1
+
+        # A fresh queue per process so late replies from a killed helper are never read
+        self._replies = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_replies,
+            # stdout is unbuffered (bufsize=0); buffer it so headers are not read byte by byte
+            args=(io.BufferedReader(self._process.stdout), self._replies),
+            name="CoprocessReader",
+            daemon=True,
+        )
+        reader.start()
+
+        if self.handshake is not None:
+            try:
+                self._exchange(self.handshake, self.startup_timeout)
+            except CoprocessTimeout:
+                self._kill()
+                raise CoprocessError(f"Helper did not start within {self.startup_timeout}s") from None
+            except CoprocessError:
+                self._kill()
+                raise
+
+    def _exchange(self, query, timeout):
+        """Send a query to the running helper and wait for its reply.
+
+        Args:
+            query: Single-line query string
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            str: Reply payload
+
+        Raises:
+            CoprocessTimeout: If the reply does not arrive in time
+            CoprocessError: If the helper's pipes are closed or it exits
+        """
+        deadline_at = time.monotonic() + timeout
+        try:
+            self._process.stdin.write(query.encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+        except OSError as e:
+            raise CoprocessError(f"Helper stdin closed: {e}") from e
+
+        try:
+            reply = self._replies.get(timeout=max(0.0, deadline_at - time.monotonic()))
+        except queue.Empty:
+            raise CoprocessTimeout(f"Helper did not reply within {timeout}s") from None
+
+        if reply is _EOF:
+            raise CoprocessError("Helper exited unexpectedly")
+        return reply
+
+    @staticmethod
+    def _read_replies(stream, replies):
+        """Read reply frames from the helper until its stdout closes.
+
+        Args:
+            stream: Helper stdout
+            replies: Queue receiving reply payloads
+        """
+        try:
+            while True:
+                payload = read_frame(stream)
+                if payload is None:
+                    break
+                replies.put(payload)
+        except (OSError, ValueError, CoprocessError):
+            pass
+        replies.put(_EOF)
+
+    def _kill(self):
+        """Terminate the helper (if running)."""
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait(timeout=1)
+            except Exception:
+                pass
+            for pipe in (self._process.stdin, self._process.stdout):
+                try:
+                    pipe.close()
+                except Exception:
+                    pass
+        self._process = None
+        self._replies = None
+
+    def is_running(self):
+        """Check if the helper process is alive.
+
+        Returns:
+            bool: True if the helper is running
+        """
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Start the helper now unless it is already running.
+
+        Raises:
+            CoprocessError: If the helper cannot be started
+        """
+        with self._lock:
+            if not self.is_running():
+                self._kill()
+                self._start()
+
+    def request(self, query):
+        """Send a query and wait for its reply.
+
+        A helper that is not running is (re)started first; the deadline only
+        starts once it is ready.
+
+        Args:
+            query: Single-line query string
+
+        Returns:
+            str: Reply payload
+
+        Raises:
+            CoprocessTimeout: If the running helper misses the deadline
+            CoprocessError: If the helper cannot be started or dies
+        """
+        with self._lock:
+            self._health["requests"] += 1
+            if not self.is_running():
+                self._kill()
+                try:
+                    self._start()
+                except CoprocessError:
+                    self._health["failures"] += 1
+                    raise
+
+            try:
+                reply = self._exchange(query, self.deadline)
+            except CoprocessTimeout:
+                # The helper is stuck; its reply stream can no longer be trusted
+                self._health["timeouts"] += 1
+                self._kill()
+                raise
+            except CoprocessError:
+                self._health["failures"] += 1
+                self._kill()
+                raise
+
+            self._health["successes"] += 1
+            return reply
+
+    def close(self):
+        """Stop the helper process."""
+        with self._lock:
+            self._kill()
+
+    def get_health(self):
+        """Get health counters.
+
+        Returns:
+            dict: Counters (requests, successes, timeouts, failures, starts, restarts)
+                  plus a 'running' flag
+        """
+        health = dict(self._health)
+        health["running"] = self.is_running()
+        return health
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Domain list matching module for cat-window-watcher.
+
+Shared distraction lists contain tens of thousands of domains, far too many
+for window_patterns regexes. A DomainTrie stores such a list as a trie keyed
+by domain labels from right to left (``com`` -> ``example`` -> ``www``), so a
+host name found in the window title is checked with one dictionary lookup
+per label, independent of the size of the list.
+
+A listed domain also covers its subdomains. Its node is therefore stored as
+a leaf (``True``) and any subtree below it is dropped, so only domains that
+share a parent with others need a dictionary of their own.
+"""
+
+import re
+
+try:
+    from .literal_prefilter import fold_title
+except ImportError:
+    from literal_prefilter import fold_title
+
+# Host names in a (case-folded) window title, e.g. "github.com" in "github.com/user - Firefox"
+_HOST_NAME = re.compile(r"(?<![\w.-])(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z][a-z0-9-]*[a-z0-9]")
+
+# Host names that hosts files map to the local machine rather than block
+_HOSTS_FILE_NAMES = frozenset({"localhost", "localhost.localdomain", "broadcasthost", "local", "ip6-localhost"})
+
+
+def normalize_domain(domain):
+    """Normalize a domain for lookup.
+
+    Args:
+        domain: Domain such as "example.com", ".example.com" or "*.example.com"
+
+    Returns:
+        str: Case-folded domain without leading wildcard, dots or trailing dot
+    """
+    domain = domain.strip()
+    # fold_title only differs from lower() for a few non-ASCII characters
+    domain = domain.lower() if domain.isascii() else fold_title(domain)
+    if domain.startswith("*."):
+        domain = domain[2:]
+    return domain.strip(".")
+
+
+def find_host_names(window_title):
+    """Find the domain-like substrings of a window title.
+
+    Args:
+        window_title: Window title
+
+    Returns:
+        list: Case-folded host names (e.g. "www.youtube.com")
+    """
+    return _HOST_NAME.findall(fold_title(window_title))
+
+
+def parse_domain_list(lines):
+    """Parse a domain list in hosts-file or one-domain-per-line format.
+
+    Comments start with '#'. In hosts-file lines ("0.0.0.0 example.com"), the
+    address is skipped and every following name is a domain. Names without a
+    dot (e.g. "localhost") and IPv4 addresses are ignored.
+
+    Args:
+        lines: Iterable of text lines
+
+    Yields:
+        str: Normalized domains
+    """
+    for line in lines:
+        fields = line.split("#", 1)[0].split()
+        if len(fields) > 1 and (":" in fields[0] or fields[0].replace(".", "").isdigit()):
+            fields = fields[1:]
+        for field in fields:
+            domain = normalize_domain(field)
+            if "." in domain and domain not in _HOSTS_FILE_NAMES and not domain.replace(".", "").isdigit():
+                yield domain
+
+
+class DomainTrie:
+    """Reversed-label trie of domains, each matching itself and its subdomains."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, domains=()):
+        """Build the trie.
+
+        Args:
+            domains: Iterable of domains (normalized with normalize_domain)
+        """
+        self._root = {}
+        self._size = 0
+        for domain in domains:
+            self.add(domain)
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a domain list file (see parse_domain_list).
+
+        Args:
+            path: Path of a UTF-8 text file
+
+        Returns:
+            DomainTrie: Trie of the listed domains
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        trie = cls()
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for domain in parse_domain_list(f):
+                trie._insert(domain)
+        return trie
+
+    def add(self, domain):
+        """Add a domain.
+
+        Args:
+            domain: Domain such as "example.com"
+        """
+        domain = normalize_domain(domain)
+        if domain:
+            self._insert(domain)
+
+    def _insert(self, domain):
+        """Add a normalized, non-empty domain.
+
+        Args:
+            domain: Domain as returned by normalize_domain
+        """
+        labels = domain.split(".")
+        node = self._root
+        for label in reversed(labels[1:]):
+            child = node.get(label)
+            if child is True:
+                # A parent domain is listed, which already covers this one
+                return
+            if child is None:
+                child = node[label] = {}
+            node = child
+        existing = node.get(labels[0])
+        if existing is True:
+            return
+        if existing is not None:
+            # Listed subdomains are now covered by this domain
+            self._size -= _count_leaves(existing)
+        node[labels[0]] = True
+        self._size += 1
+
+    def __len__(self):
+        """Get the number of listed domains (excluding subdomains of listed domains)."""
+        return self._size
+
+    def __contains__(self, host):
+        """Check whether a host name is a listed domain or one of its subdomains.
+
+        Args:
+            host: Case-folded host name such as "www.example.com"
+
+        Returns:
+            bool: True if the host is covered by the list
+        """
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if node is True:
+                return True
+        return False
+
+    def match_hosts(self, hosts):
+        """Check whether any of several host names is covered by the list.
+
+        Args:
+            hosts: Iterable of case-folded host names (see find_host_names)
+
+        Returns:
+            bool: True if at least one host is covered
+        """
+        return any(host in self for host in hosts)
+
+
+def _count_leaves(node):
+    """Count the domains stored below a trie node.
+
+    Args:
+        node: Trie node dictionary
+
+    Returns:
+        int: Number of leaves
+    """
+    return sum(1 if child is True else _count_leaves(child) for child in node.values())
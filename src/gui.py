@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 """GUI module for cat-window-watcher using tkinter."""
 
+import time
 import tkinter as tk
 
 try:
+    from .acquisition_worker import AcquisitionWorker, StallMeter
     from .constants import APP_WINDOW_TITLE
+    from .poll_scheduler import GameModePolicy, PollScheduler, StabilityBackoffPolicy
     from .status_formatter import StatusFormatter
     from .window_behavior import WindowBehaviorManager
+    from .window_monitor import FocusEventWatcher
+    from .x11_connection import X11ConnectionError
 except ImportError:
+    from acquisition_worker import AcquisitionWorker, StallMeter
     from constants import APP_WINDOW_TITLE
+    from poll_scheduler import GameModePolicy, PollScheduler, StabilityBackoffPolicy
     from status_formatter import StatusFormatter
     from window_behavior import WindowBehaviorManager
+    from window_monitor import FocusEventWatcher
+    from x11_connection import X11ConnectionError
 
 
 # Conversion constant for time units
@@ -34,7 +43,9 @@ class ScoreDisplay:
         self.config = config
         self.update_interval = update_interval
         self.default_update_interval = update_interval  # Store original interval
-        self.is_game_playing = False  # Track game playing state
+
+        # Decide the interval until the next tick (game mode, adaptive polling)
+        self.poll_scheduler = self._create_poll_scheduler()
 
         # Track previous score for color changes
         self._previous_score = score_tracker.get_score()
@@ -91,6 +102,73 @@ class ScoreDisplay:
         )
         self.status_label.pack(pady=10)
 
+        # Start event-driven focus tracking if requested (polling remains the fallback)
+        self.focus_watcher = None
+        if config.get_focus_tracking_mode() == "event":
+            self._start_focus_watcher()
+
+        # Acquire window state off the Tk thread unless synchronous mode is requested
+        self.acquisition_worker = None
+        if config.get_acquisition_mode() == "thread":
+            self.acquisition_worker = AcquisitionWorker(
+                window_monitor, update_interval / SECONDS_TO_MILLISECONDS, title_source=self._get_pushed_title
+            )
+            self.acquisition_worker.start()
+
+        # Track how long each tick blocks the mainloop
+        self.stall_meter = StallMeter()
+
+    def _start_focus_watcher(self):
+        """Start pushing focus changes to the score tracker via X11 events."""
+        if not FocusEventWatcher.is_supported():
+            print("Warning: focus_tracking_mode = 'event' requires Linux with python-xlib; falling back to polling")
+            return
+        watcher = FocusEventWatcher(self.score_tracker.record_focus_event)
+        try:
+            watcher.start()
+        except X11ConnectionError as e:
+            print(f"Warning: Failed to start focus event watcher, falling back to polling: {e}")
+            return
+        self.focus_watcher = watcher
+
+    def _create_poll_scheduler(self):
+        """Create the poll scheduler from the current configuration.
+
+        Returns:
+            PollScheduler: Scheduler with the configured policies
+        """
+        policies = []
+        min_interval = None
+        max_interval = None
+
+        adaptive_polling = self.config.get_adaptive_polling()
+        if adaptive_polling["enabled"]:
+            min_interval = adaptive_polling["min_interval_seconds"] * SECONDS_TO_MILLISECONDS
+            max_interval = adaptive_polling["max_interval_seconds"] * SECONDS_TO_MILLISECONDS
+            policies.append(StabilityBackoffPolicy(min_interval, max_interval, adaptive_polling["backoff_factor"]))
+
+        game_detection = self.config.get_game_playing_detection()
+        if game_detection["enabled"] and game_detection["process_names"]:
+            policies.append(
+                GameModePolicy(
+                    game_detection["process_names"],
+                    game_detection["check_interval_seconds"] * SECONDS_TO_MILLISECONDS,
+                    self.default_update_interval,
+                )
+            )
+
+        return PollScheduler(self.default_update_interval, policies, min_interval, max_interval)
+
+    def _get_pushed_title(self):
+        """Get the title pushed by the focus watcher.
+
+        Returns:
+            str: Latest pushed title, or None if the watcher is not running (poll instead)
+        """
+        if self.focus_watcher is not None and self.focus_watcher.is_running():
+            return self.focus_watcher.get_latest_title() or ""
+        return None
+
     def _on_ctrl_c(self, event):
         """Handle CTRL+C key press to copy previous window title to clipboard.
 
@@ -113,12 +191,21 @@ class ScoreDisplay:
                 print(f"Warning: Failed to copy to clipboard: {e}")
 
     def update_display(self):
-        """Update the display with current score and window info."""
+        """Update the display with current score and window info, then schedule the next tick."""
+        start = time.perf_counter()
+        self._update_tick()
+        self.stall_meter.record(time.perf_counter() - start)
+
+        # Schedule next update
+        self.root.after(self.update_interval, self.update_display)
+
+    def _update_tick(self):
+        """Apply the latest window state to the score and labels."""
         # Check if config file has been modified and reload if necessary
         if self.config.reload_if_modified():
             # Update score tracker with new configuration
             self.score_tracker.update_config(
-                self.config.get_window_patterns(),
+                self.config.get_pattern_set(),
                 self.config.get_default_score(),
                 self.config.get_apply_default_score_mode(),
                 self.config.get_mild_penalty_mode(),
@@ -132,45 +219,61 @@ class ScoreDisplay:
             # Update always_on_top setting if it changed
             self.behavior_manager.apply_always_on_top()
 
-        # Check for game playing detection
-        game_detection = self.config.get_game_playing_detection()
+            # Rebuild polling policies from the new settings, keeping whether the
+            # running interval is a game interval so it still counts as one tick
+            fixed_interval = self.poll_scheduler.fixed_interval
+            self.poll_scheduler = self._create_poll_scheduler()
+            self.poll_scheduler.fixed_interval = fixed_interval
 
-        if game_detection["enabled"] and game_detection["process_names"]:
-            # Get active process name only when we have processes to match against
-            process_name = self.window_monitor.get_active_window_process_name()
-
-            # Check if the current process matches any configured game process
-            is_game_playing_now = process_name in game_detection["process_names"]
-
-            # Handle transition into game playing mode
-            if is_game_playing_now and not self.is_game_playing:
-                # Entering game playing mode - switch to longer interval
-                self.is_game_playing = True
-                self.update_interval = game_detection["check_interval_seconds"] * SECONDS_TO_MILLISECONDS
-                print(
-                    f"Game detected ({process_name}), switching to {game_detection['check_interval_seconds']} second check interval"
-                )
-            # Handle transition out of game playing mode
-            elif not is_game_playing_now and self.is_game_playing:
-                # Exiting game playing mode - switch back to normal interval
-                self.is_game_playing = False
-                self.update_interval = self.default_update_interval
-                print(f"Game ended, switching back to {self.default_update_interval // 1000} second check interval")
+            # Apply the new idle threshold
+            self.window_monitor.idle_threshold_seconds = self.config.get_idle_threshold_seconds()
 
-        # Get current window title
-        window_title = self.window_monitor.get_active_window_title()
-
-        # Check if screensaver is active
+        # Acquire the active window state once for this tick
+        game_detection = self.config.get_game_playing_detection()
+        detect_game = game_detection["enabled"] and bool(game_detection["process_names"])
+        # The process name is also needed for process rules in window_patterns
+        include_process = detect_game or self.config.get_pattern_set().needs_process_name
         debug_screensaver = self.config.get_debug_screensaver_detection()
-        if debug_screensaver:
-            print("=" * 60)
-            print("[DEBUG] Screensaver detection check:")
-            print(f"[DEBUG]   - Current window title: '{window_title}'")
 
-        is_screensaver = self.window_monitor.is_screensaver_active(debug=debug_screensaver)
+        if self.acquisition_worker is not None:
+            # Only read the worker's mailbox; never wait for a query on the Tk thread
+            self.acquisition_worker.configure(
+                self.update_interval / SECONDS_TO_MILLISECONDS, include_process, debug_screensaver
+            )
+            snapshot = self.acquisition_worker.get_latest()
+            if snapshot is None:
+                # Nothing acquired yet - try again next tick
+                return
+        else:
+            if debug_screensaver:
+                print("=" * 60)
+                print("[DEBUG] Screensaver detection check:")
+
+            # In event mode, the title is pushed by the focus watcher instead of polled
+            # Get active process name only when we have processes to match against
+            snapshot = self.window_monitor.sample(
+                include_process=include_process, debug=debug_screensaver, window_title=self._get_pushed_title()
+            )
+
+            if debug_screensaver:
+                print("=" * 60)
+
+        # With adaptive polling, this update covers every base tick since the previous one
+        # (a game mode interval counts as one tick)
+        elapsed_ticks = 1
+        if self.config.get_adaptive_polling()["enabled"]:
+            elapsed_ticks = self.poll_scheduler.elapsed_ticks(self.update_interval)
+
+        # Choose the next interval (game playing detection, window stability)
+        self.update_interval = self.poll_scheduler.next_interval(snapshot)
+        if self.acquisition_worker is not None:
+            # Apply the new interval to the worker now rather than at the next tick,
+            # so e.g. game mode does not keep acquiring at the previous cadence
+            self.acquisition_worker.configure(
+                self.update_interval / SECONDS_TO_MILLISECONDS, include_process, debug_screensaver
+            )
 
-        if debug_screensaver:
-            print("=" * 60)
+        window_title = snapshot.title
 
         # Store previous window title before updating to current
         # This is used for clipboard operations (CTRL+C)
@@ -183,7 +286,7 @@ class ScoreDisplay:
         self._current_window_title = window_title
 
         # Update score
-        score_changed, matched_pattern = self.score_tracker.update(window_title, is_screensaver=is_screensaver)
+        score_changed, match_result = self.score_tracker.update_from_snapshot(snapshot, elapsed_ticks)
 
         # Update score-decreasing-based topmost behavior (after score update)
         # This has highest priority - if it takes control, skip other topmost updates
@@ -214,13 +317,10 @@ class ScoreDisplay:
         elapsed_seconds = self.score_tracker.get_current_window_elapsed_seconds()
         flow_mode_seconds = self.score_tracker.get_flow_mode_elapsed_seconds()
         status_text = StatusFormatter.format_status_text(
-            matched_pattern, window_title, self.score_tracker.default_score, elapsed_seconds, flow_mode_seconds
+            match_result, window_title, self.score_tracker.default_score, elapsed_seconds, flow_mode_seconds
         )
         self.status_label.config(text=status_text)
 
-        # Schedule next update
-        self.root.after(self.update_interval, self.update_display)
-
     def run(self):
         """Run the GUI main loop."""
         # Start the update cycle
@@ -228,3 +328,15 @@ class ScoreDisplay:
 
         # Start tkinter main loop
         self.root.mainloop()
+
+        if self.acquisition_worker is not None:
+            self.acquisition_worker.stop()
+        if self.focus_watcher is not None:
+            self.focus_watcher.stop()
+
+        if self.config.get_verbose():
+            print(self.stall_meter.format_summary())
+            stats = self.score_tracker.get_match_cache_stats()
+            print(f"Title match cache: {stats['hits']} hits, {stats['misses']} misses, {stats['size']} entries")
+            for description, regex, reason in self.score_tracker.get_quarantined_patterns():
+                print(f"Quarantined window pattern {description!r} ({regex!r}): {reason}")
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""Required-literal prefilter module for cat-window-watcher.
+
+Most window patterns are plain keywords (``github``, ``youtube``, ``x\\.com``).
+For each regex, the literal substrings that every match must contain are
+extracted, and a single Aho-Corasick pass over the case-folded window title
+finds which of those literals occur. Only the patterns whose literals were
+found (plus patterns with no extractable literal) need their regex evaluated,
+so the cost per title grows with the title length and the number of
+candidates instead of with the total number of patterns.
+
+Literal extraction is deliberately conservative: anything it does not fully
+understand (groups, classes, escapes such as ``\\d``, inline flags) ends the
+current literal run, and a pattern without a usable literal is always a
+candidate. A missed literal therefore only costs speed, never a match.
+"""
+
+# Non-ASCII characters that re.IGNORECASE matches with an ASCII letter but
+# str.lower() does not map to it (found by checking every code point)
+_IGNORECASE_FOLD = str.maketrans("\u0130\u0131\u017f\u212a", "iisk")
+
+# Characters that are literal when escaped with a backslash
+_ESCAPED_LITERALS = frozenset("\\.^$*+?{}[]()|-/ #&~\"'!,:;<=>@%`")
+
+# Number of digits after \x, \u and \U escapes
+_CODE_ESCAPE_LENGTHS = {"x": 2, "u": 4, "U": 8}
+
+# Characters with a special meaning outside character classes
+_SPECIAL = frozenset(".^$*+?{}[]()|\\")
+
+
+def fold_title(window_title):
+    """Case-fold a window title the way re.IGNORECASE compares ASCII letters.
+
+    Args:
+        window_title: Window title
+
+    Returns:
+        str: Lowercased title with the extra IGNORECASE equivalences applied
+    """
+    return window_title.translate(_IGNORECASE_FOLD).lower()
+
+
+def _skip_class(regex, index):
+    """Find the end of a character class.
+
+    Args:
+        regex: Regular expression string
+        index: Index of the opening '['
+
+    Returns:
+        int: Index just after the closing ']' (or the end of the string)
+    """
+    index += 1
+    if index < len(regex) and regex[index] == "^":
+        index += 1
+    if index < len(regex) and regex[index] == "]":
+        index += 1
+    while index < len(regex) and regex[index] != "]":
+        index += 2 if regex[index] == "\\" else 1
+    return index + 1
+
+
+def _skip_group(regex, index):
+    """Find the end of a group, including nested groups and classes.
+
+    Args:
+        regex: Regular expression string
+        index: Index of the opening '('
+
+    Returns:
+        int: Index just after the matching ')' (or the end of the string)
+    """
+    depth = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            index = _skip_class(regex, index)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return index
+
+
+def _escape_end(regex, index):
+    """Find the end of an escape sequence.
+
+    Args:
+        regex: Regular expression string
+        index: Index of the backslash
+
+    Returns:
+        int: Index just after the escape (e.g. after all of \\x41, \\u00e9 or \\N{...})
+    """
+    escaped = regex[index + 1 : index + 2]
+    if escaped in _CODE_ESCAPE_LENGTHS:
+        return index + 2 + _CODE_ESCAPE_LENGTHS[escaped]
+    if escaped == "N" and regex[index + 2 : index + 3] == "{":
+        end = regex.find("}", index)
+        return end + 1 if end != -1 else len(regex)
+    if escaped.isdigit():
+        # Octal escapes and group references have up to three digits
+        end = index + 2
+        while end < len(regex) and end < index + 4 and regex[end].isdigit():
+            end += 1
+        return end
+    return index + 2
+
+
+def _branch_literal(regex, start, end):
+    """Find the longest literal run that every match of a branch contains.
+
+    Args:
+        regex: Regular expression string
+        start: Start index of the top-level branch
+        end: End index of the top-level branch
+
+    Returns:
+        str: Longest required literal (case-folded), or "" if none was found
+    """
+    best = ""
+    run = []
+
+    def close_run():
+        nonlocal best
+        literal = "".join(run)
+        if len(literal) > len(best):
+            best = literal
+        run.clear()
+
+    index = start
+    while index < end:
+        char = regex[index]
+        if char in "*?{":
+            # The preceding atom may be absent, so it is not part of the literal
+            if run:
+                run.pop()
+            close_run()
+            index = regex.find("}", index) + 1 if char == "{" and "}" in regex[index:end] else index + 1
+            continue
+        if char == "+":
+            close_run()
+            index += 1
+            continue
+        if char == "\\":
+            escaped = regex[index + 1 : index + 2]
+            if escaped and escaped in _ESCAPED_LITERALS:
+                run.append(escaped)
+            else:
+                # Character classes (\d, \w), anchors (\b, \A) and numeric escapes
+                close_run()
+            index = _escape_end(regex, index)
+            continue
+        if char == "[":
+            close_run()
+            index = _skip_class(regex, index)
+            continue
+        if char == "(":
+            close_run()
+            index = _skip_group(regex, index)
+            continue
+        if char in _SPECIAL or not char.isascii():
+            close_run()
+        else:
+            run.append(char)
+        index += 1
+    close_run()
+    return best.lower()
+
+
+def extract_required_literals(regex):
+    """Extract literal substrings that any match of a regex must contain.
+
+    Args:
+        regex: Regular expression string (matched with re.IGNORECASE)
+
+    Returns:
+        list: One case-folded literal per top-level alternation branch (a
+              match contains at least one of them), or None if some branch
+              has no extractable literal
+    """
+    if regex.startswith("(?") and regex[2:3].isalpha():
+        # Inline global flags such as (?x) change how the rest is parsed
+        return None
+
+    branches = []
+    start = 0
+    index = 0
+    while index <= len(regex):
+        if index == len(regex) or regex[index] == "|":
+            branches.append((start, index))
+            start = index + 1
+            index += 1
+            continue
+        char = regex[index]
+        if char == "\\":
+            index += 2
+        elif char == "[":
+            index = _skip_class(regex, index)
+        elif char == "(":
+            index = _skip_group(regex, index)
+        else:
+            index += 1
+
+    literals = []
+    for branch_start, branch_end in branches:
+        literal = _branch_literal(regex, branch_start, branch_end)
+        if not literal:
+            return None
+        literals.append(literal)
+    return literals
+
+
+def literal_alternatives(regex):
+    """Get the alternatives of a regex that is nothing but an alternation of literals.
+
+    Such a regex (e.g. ``github|gitlab`` or ``x\\.com``) matches a title exactly
+    when the case-folded title contains one of the alternatives.
+
+    Args:
+        regex: Regular expression string (matched with re.IGNORECASE)
+
+    Returns:
+        list: Case-folded ASCII literals, or None if the regex uses any other syntax
+    """
+    literals = []
+    run = []
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "|":
+            literals.append("".join(run).lower())
+            run.clear()
+            index += 1
+            continue
+        if char == "\\":
+            escaped = regex[index + 1 : index + 2]
+            if not escaped or escaped not in _ESCAPED_LITERALS:
+                return None
+            char = escaped
+            index += 1
+        elif char in _SPECIAL:
+            return None
+        if not char.isascii():
+            return None
+        run.append(char)
+        index += 1
+    literals.append("".join(run).lower())
+    return literals
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton mapping keywords to the values registered for them."""
+
+    def __init__(self, keywords):
+        """Build the automaton.
+
+        Args:
+            keywords: Iterable of (keyword, value) pairs; a keyword may have several values
+        """
+        self._goto = [{}]
+        outputs = [set()]
+        for keyword, value in keywords:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    outputs.append(set())
+                node = next_node
+            outputs[node].add(value)
+
+        # Breadth-first failure links; each node also reports the outputs of its failure chain
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child] |= outputs[self._fail[child]]
+        self._outputs = [frozenset(output) for output in outputs]
+
+    def find(self, text):
+        """Find the values of all keywords occurring in a text.
+
+        Args:
+            text: Text to scan (already case-folded)
+
+        Returns:
+            set: Values of every keyword found
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found |= outputs[node]
+        return found
+
+
+class LiteralPrefilter:
+    """Select candidate patterns for a window title by their required literals."""
+
+    def __init__(self, regexes, previous=None):
+        """Extract literals and build the automaton.
+
+        Args:
+            regexes: Regular expression strings in priority order
+            previous: LiteralPrefilter whose extracted literals are reused for the same
+                      regexes (e.g. before a configuration reload), or None (default)
+        """
+        reusable = previous._literals if previous is not None else {}
+        # Regex -> extracted literals (or None)
+        self._literals = {}
+        keywords = []
+        always = []
+        for index, regex in enumerate(regexes):
+            if regex in reusable:
+                literals = reusable[regex]
+            else:
+                literals = extract_required_literals(regex)
+            self._literals[regex] = literals
+            if literals is None:
+                always.append(index)
+            else:
+                keywords.extend((literal, index) for literal in literals)
+        self._keywords = tuple(keywords)
+        if previous is not None and previous._keywords == self._keywords:
+            # Only scores or non-literal patterns changed
+            self._automaton = previous._automaton
+        else:
+            self._automaton = AhoCorasick(keywords)
+        self._always = frozenset(always)
+
+    @property
+    def always_candidates(self):
+        """Get indexes of patterns without an extractable literal.
+
+        Returns:
+            frozenset: Pattern indexes that are evaluated for every title
+        """
+        return self._always
+
+    def candidates(self, window_title):
+        """Get the patterns that may match a window title.
+
+        Args:
+            window_title: Window title
+
+        Returns:
+            list: Candidate pattern indexes in priority order
+        """
+        found = self._automaton.find(fold_title(window_title))
+        return sorted(found | self._always)
@@ -9,13 +9,19 @@ try:
     from .config import Config
     from .constants import APP_WINDOW_TITLE
     from .gui import ScoreDisplay
+    from .pattern_profiler import PatternProfiler
+    from .regex_safety import RegexGuard
     from .score_tracker import ScoreTracker
+    from .session_recorder import RecordingWindowMonitor, SessionRecorder
     from .window_monitor import WindowMonitor
 except ImportError:
     from config import Config
     from constants import APP_WINDOW_TITLE
     from gui import ScoreDisplay
+    from pattern_profiler import PatternProfiler
+    from regex_safety import RegexGuard
     from score_tracker import ScoreTracker
+    from session_recorder import RecordingWindowMonitor, SessionRecorder
     from window_monitor import WindowMonitor
 
 
@@ -46,11 +52,28 @@ def main():
         config = Config(args.config)
 
         # Create window monitor
-        window_monitor = WindowMonitor()
+        if config.get_session_log_path():
+            # Tee every sampled snapshot to the session log
+            recorder = SessionRecorder(config.get_session_log_path())
+            window_monitor = RecordingWindowMonitor(recorder, config.get_idle_threshold_seconds())
+        else:
+            window_monitor = WindowMonitor(config.get_idle_threshold_seconds())
+        window_monitor.probe_backends(verbose=config.get_verbose())
+
+        # Create pattern profiler (dumped on exit and on SIGUSR1)
+        pattern_profiler = None
+        if config.get_profile_patterns():
+            pattern_profiler = PatternProfiler()
+            pattern_profiler.install()
+
+        # Create regex guard for ReDoS-safe matching
+        regex_guard = None
+        if config.get_regex_safe_mode():
+            regex_guard = RegexGuard(config.get_regex_time_budget_ms() / 1000)
 
         # Create score tracker
         score_tracker = ScoreTracker(
-            config.get_window_patterns(),
+            config.get_pattern_set(),
             config.get_default_score(),
             config.get_apply_default_score_mode(),
             config.get_mild_penalty_mode(),
@@ -59,6 +82,8 @@ def main():
             config.get_reset_score_every_30_minutes(),
             config.get_self_window_score(),
             APP_WINDOW_TITLE,
+            pattern_profiler=pattern_profiler,
+            regex_guard=regex_guard,
         )
 
         # Create and run GUI
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Match result module for cat-window-watcher.
+
+ScoreCalculator reports which rule decided the score of a tick as a
+MatchResult. Results are immutable and created ahead of time: one per window
+pattern when a PatternSet is built, plus shared sentinels for the screensaver,
+the app's own window and no match. Scoring a tick therefore never allocates a
+result.
+
+For code written against the former pattern dictionaries, a MatchResult also
+supports ``result["description"]`` and ``result.get("score", 0)``.
+"""
+
+# Pattern ids of results that do not come from a window pattern
+NO_MATCH_PATTERN_ID = -1
+SELF_WINDOW_PATTERN_ID = -2
+SCREENSAVER_PATTERN_ID = -3
+
+
+class MatchResult:
+    """Immutable result of matching one tick: pattern id, base score and description."""
+
+    __slots__ = ("pattern_id", "score", "description", "regex")
+
+    def __init__(self, pattern_id, score, description, regex=""):
+        """Initialize match result.
+
+        Args:
+            pattern_id: Index of the window pattern, or one of NO_MATCH_PATTERN_ID,
+                        SELF_WINDOW_PATTERN_ID and SCREENSAVER_PATTERN_ID
+            score: Score of the rule before time-based adjustments
+            description: Description shown in the status label
+            regex: Regex of the window pattern (default: "")
+        """
+        object.__setattr__(self, "pattern_id", pattern_id)
+        object.__setattr__(self, "score", score)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "regex", regex)
+
+    @classmethod
+    def from_pattern(cls, pattern_id, pattern):
+        """Create the result of a window pattern.
+
+        Args:
+            pattern_id: Index of the pattern in the configuration
+            pattern: Pattern dictionary with score, description and regex
+
+        Returns:
+            MatchResult: Result reported when the pattern matches
+        """
+        return cls(pattern_id, pattern.get("score", 0), pattern.get("description", ""), pattern.get("regex", ""))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"MatchResult is immutable (cannot set {name!r})")
+
+    def __bool__(self):
+        """Get whether a rule matched, so ``if result:`` skips NO_MATCH."""
+        return self.pattern_id != NO_MATCH_PATTERN_ID
+
+    def __getitem__(self, key):
+        """Get a field by its pattern dictionary key ("score", "description" or "regex")."""
+        if key not in self.__slots__ or key == "pattern_id":
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """Get a field by its pattern dictionary key, or default for other keys."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return f"MatchResult({self.pattern_id!r}, {self.score!r}, {self.description!r}, {self.regex!r})"
+
+
+NO_MATCH = MatchResult(NO_MATCH_PATTERN_ID, 0, "")
+SCREENSAVER_MATCH = MatchResult(SCREENSAVER_PATTERN_ID, 0, "スクリーンセーバー")
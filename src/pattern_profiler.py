@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Window pattern profiler module for cat-window-watcher.
+
+Opt-in instrumentation of window pattern matching: per pattern, the number of
+regex evaluations, the cumulative and worst evaluation time, and the number of
+ticks it was the matching pattern. Expensive (possibly catastrophic) and dead
+patterns stand out in the table printed on exit or on SIGUSR1.
+
+When profiling is disabled nothing is instrumented; PatternSet searches the
+plain compiled regexes.
+"""
+
+import atexit
+import signal
+import sys
+import time
+
+
+class PatternStats:
+    """Match statistics of one window pattern."""
+
+    __slots__ = ("label", "evaluations", "total_seconds", "max_seconds", "hits")
+
+    def __init__(self, label):
+        """Initialize pattern statistics.
+
+        Args:
+            label: Text shown in the table (description and regex)
+        """
+        self.label = label
+        self.evaluations = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.hits = 0
+
+
+class TimedRegex:
+    """Compiled regex stand-in that times every search into a PatternStats."""
+
+    __slots__ = ("_compiled", "_stats", "_timer", "pattern", "flags", "groups", "groupindex")
+
+    def __init__(self, compiled, stats, timer):
+        """Initialize timed regex.
+
+        Args:
+            compiled: Compiled regular expression
+            stats: PatternStats to record into
+            timer: Callable returning seconds (e.g. time.perf_counter)
+        """
+        self._compiled = compiled
+        self._stats = stats
+        self._timer = timer
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+        self.groups = compiled.groups
+        self.groupindex = compiled.groupindex
+
+    def search(self, string):
+        """Search the string, recording the evaluation time.
+
+        Args:
+            string: String to search
+
+        Returns:
+            re.Match: Match object, or None
+        """
+        start = self._timer()
+        result = self._compiled.search(string)
+        elapsed = self._timer() - start
+        stats = self._stats
+        stats.evaluations += 1
+        stats.total_seconds += elapsed
+        if elapsed > stats.max_seconds:
+            stats.max_seconds = elapsed
+        return result
+
+
+class PatternProfiler:
+    """Collect per-pattern match cost and hit statistics."""
+
+    def __init__(self, timer=time.perf_counter):
+        """Initialize pattern profiler.
+
+        Args:
+            timer: Callable returning seconds (default: time.perf_counter)
+        """
+        self.timer = timer
+        self._stats = {}  # (description, regex) -> PatternStats; survives config reloads
+
+    def stats_for(self, pattern):
+        """Get the statistics of a window pattern, creating them on first use.
+
+        Args:
+            pattern: Pattern dictionary with regex and description
+
+        Returns:
+            PatternStats: Statistics of the pattern
+        """
+        key = (pattern.get("description", ""), pattern.get("regex", ""))
+        stats = self._stats.get(key)
+        if stats is None:
+            label = f"{key[0] or '(no description)'}: {key[1]}"
+            stats = self._stats[key] = PatternStats(label)
+        return stats
+
+    def wrap_regex(self, compiled, pattern):
+        """Wrap a compiled regex so its searches are recorded.
+
+        Args:
+            compiled: Compiled regular expression
+            pattern: Pattern dictionary the regex belongs to, or a label string
+                     for merged regexes that cover several patterns
+
+        Returns:
+            TimedRegex: Instrumented regex
+        """
+        if isinstance(pattern, str):
+            pattern = {"description": pattern, "regex": ""}
+        return TimedRegex(compiled, self.stats_for(pattern), self.timer)
+
+    def record_hit(self, pattern):
+        """Record that a pattern was the match result of a tick.
+
+        Args:
+            pattern: Matched pattern dictionary
+        """
+        self.stats_for(pattern).hits += 1
+
+    def format_table(self):
+        """Format the statistics as a table, most expensive patterns first.
+
+        Returns:
+            str: Table text
+        """
+        rows = sorted(self._stats.values(), key=lambda stats: stats.total_seconds, reverse=True)
+        lines = [f"{'evals':>10} {'hits':>8} {'total ms':>10} {'mean us':>9} {'max us':>9}  pattern"]
+        for stats in rows:
+            mean_us = stats.total_seconds / stats.evaluations * 1_000_000 if stats.evaluations else 0.0
+            lines.append(
+                f"{stats.evaluations:>10} {stats.hits:>8} {stats.total_seconds * 1000:>10.2f} "
+                f"{mean_us:>9.2f} {stats.max_seconds * 1_000_000:>9.1f}  {stats.label}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, file=None):
+        """Print the statistics table.
+
+        Args:
+            file: Output stream (default: sys.stdout)
+        """
+        print("--- パターンプロファイル (Pattern Profile) ---", file=file or sys.stdout)
+        print(self.format_table(), file=file or sys.stdout)
+
+    def install(self):
+        """Dump the table on exit, and on SIGUSR1 where the platform supports it."""
+        atexit.register(self.dump)
+        signal_number = getattr(signal, "SIGUSR1", None)
+        if signal_number is not None:
+            signal.signal(signal_number, lambda signum, frame: self.dump())
@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""Precompiled window pattern module for cat-window-watcher.
+
+Window patterns are compiled once when the configuration is loaded, so
+matching a title never goes through ``re``'s bounded internal compile cache
+and a broken regex is reported at load time instead of mid-tick.
+
+Three match engines are available:
+    - "sequential": search each pattern in configuration order
+    - "combined": merge runs of patterns into one alternation
+      ``(?:regex0)()|(?:regex1)()|...`` so a title that matches nothing costs a
+      single regex search per run. When the alternation matches, the empty
+      marker group after the branch tells which pattern k matched
+      (``match.lastindex``); only patterns before k in configuration order can
+      still win, so those are checked individually to keep first-match
+      priority. Patterns that cannot be embedded (backreferences, inline
+      global flags, conditional groups) are evaluated on their own.
+    - "prefilter": find the required literals of all patterns with one
+      Aho-Corasick pass over the title (see literal_prefilter) and search only
+      the candidate patterns, in configuration order.
+
+Besides regexes, a pattern can be an exact-match rule: ``process`` (process
+name of the active window), ``title`` (whole window title) or ``domain``
+(a host name in the title equal to or ending with ``.domain``). These are
+compared case-insensitively through dictionary lookups, so they cost the same
+however many there are. A ``domain_list`` pattern applies one score to every
+domain in a list file (hosts-file or one domain per line), stored in a
+DomainTrie. All kinds share one configuration order: a regex pattern listed
+before an exact-match rule still wins over it.
+
+With a TitleNormalizer, the title is normalized once per match and every
+rule sees the normalized text; regexes are then compiled in folded form
+without re.IGNORECASE where possible (see title_normalizer). Title rules are
+stored and looked up normalized, and merged runs never mix folded and
+re.IGNORECASE patterns.
+
+When the configuration is reloaded, the new PatternSet is built from the
+previous one: compiled regexes, merged runs and prefilter literals of
+unchanged patterns are reused, so a reload costs in proportion to what
+changed. unchanged_prefix tells callers which memoized match results are
+still valid.
+"""
+
+import re
+import zlib
+
+try:
+    from .domain_trie import DomainTrie, find_host_names, normalize_domain
+    from .literal_prefilter import LiteralPrefilter, fold_title
+    from .match_result import MatchResult
+    from .title_normalizer import fold_regex
+except ImportError:
+    from domain_trie import DomainTrie, find_host_names, normalize_domain
+    from literal_prefilter import LiteralPrefilter, fold_title
+    from match_result import MatchResult
+    from title_normalizer import fold_regex
+
+MATCH_ENGINES = ("sequential", "combined", "prefilter")
+
+# Exact-match rule kinds (pattern keys other than regex)
+EXACT_RULE_KINDS = ("process", "title", "domain")
+
+# Every rule kind a pattern can have (exactly one per pattern)
+RULE_KINDS = ("regex",) + EXACT_RULE_KINDS + ("domain_list",)
+
+# Numbered/named backreferences and conditional groups refer to group numbers
+# that change once the pattern is embedded in a larger regex, and inline global
+# flags such as (?i) are only allowed at the very start of a regex
+_UNMERGEABLE_SYNTAX = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+# Flags of a pattern without inline global flags such as (?x) or (?s)
+_DEFAULT_FLAGS = re.compile("", re.IGNORECASE).flags
+
+# Flags of a pattern folded for normalized titles (see title_normalizer)
+_FOLDED_FLAGS = re.compile("").flags
+
+# Merged runs end after a pattern whose checksum is divisible by this, so run
+# boundaries depend on the patterns themselves rather than on their positions and
+# inserting or editing one pattern only recompiles the run containing it
+_RUN_BOUNDARY_MODULUS = 128
+
+# Longest merged run; longer alternations are not faster to search
+_MAX_RUN_LENGTH = 512
+
+
+class CompiledPattern:
+    """A window pattern with its precompiled regex."""
+
+    __slots__ = ("compiled", "pattern", "index")
+
+    def __init__(self, compiled, pattern, index):
+        """Initialize compiled pattern.
+
+        Args:
+            compiled: Compiled regular expression
+            pattern: Original pattern dictionary (regex, score, description)
+            index: Position of the pattern in the configuration
+        """
+        self.compiled = compiled
+        self.pattern = pattern
+        self.index = index
+
+
+class PatternSet:
+    """Immutable, ordered set of precompiled window patterns.
+
+    Matching follows the configuration order: the first pattern whose regex
+    (or exact-match rule) matches wins. Patterns without a rule never match.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_patterns",
+        "_results",
+        "_segments",
+        "_prefilter",
+        "_exact",
+        "_domain_lists",
+        "_normalizer",
+        "_rule_keys",
+        "_compiled",
+        "_merged",
+        "engine",
+    )
+
+    def __init__(
+        self, window_patterns=(), engine="sequential", profiler=None, regex_guard=None, normalizer=None, previous=None
+    ):
+        """Compile window patterns.
+
+        Args:
+            window_patterns: List of pattern dictionaries with score, description and one
+                             rule: regex, process, title or domain
+            engine: Match engine, "sequential", "combined" or "prefilter" (default: "sequential")
+            profiler: PatternProfiler recording every regex evaluation, or None (default)
+            regex_guard: RegexGuard evaluating risky patterns under a time budget, or None (default)
+            normalizer: TitleNormalizer applied to titles before matching, or None to match
+                        raw titles case-insensitively (default)
+            previous: PatternSet of the previous configuration whose compiled regexes,
+                      merged runs and prefilter literals are reused, or None (default)
+
+        Raises:
+            ValueError: If a regex is not a string or fails to compile, a pattern has more
+                        than one rule, or engine is unknown
+        """
+        if engine not in MATCH_ENGINES:
+            raise ValueError(f"Unknown pattern match engine: {engine!r} (expected one of {MATCH_ENGINES})")
+        self._normalizer = normalizer
+        # (regex, folded) -> compiled regex before instrumentation, shared with the next PatternSet
+        reusable = previous._compiled if previous is not None else {}
+        self._compiled = {}
+        # (kind, value, domain trie) of each pattern, compared by unchanged_prefix
+        rule_keys = []
+        entries = []
+        # Rule kind -> {case-folded value: lowest pattern index}
+        self._exact = {kind: {} for kind in EXACT_RULE_KINDS}
+        # (pattern index, DomainTrie) in configuration order
+        self._domain_lists = []
+        for index, pattern in enumerate(window_patterns):
+            regex = pattern.get("regex", "")
+            kinds = [kind for kind in RULE_KINDS[1:] if pattern.get(kind)]
+            if kinds:
+                if regex or len(kinds) > 1:
+                    raise ValueError(
+                        f"Invalid rule in window_patterns[{index}] ({pattern.get('description', '')!r}): "
+                        f"only one of {', '.join(RULE_KINDS)} may be set"
+                    )
+                kind = kinds[0]
+                value = pattern[kind]
+                if kind == "domain_list":
+                    trie = _load_domain_list(pattern, index)
+                    self._domain_lists.append((index, trie))
+                    # A reloaded list is a different rule even if its path is the same
+                    rule_keys.append((kind, value, trie))
+                    continue
+                rule_keys.append((kind, value, None))
+                if not isinstance(value, str):
+                    raise ValueError(
+                        f"Invalid {kind} in window_patterns[{index}] ({pattern.get('description', '')!r}): "
+                        f"must be a string, got {type(value).__name__}"
+                    )
+                if kind == "domain":
+                    key = normalize_domain(value)
+                elif kind == "title" and normalizer is not None:
+                    key = normalizer.normalize(value)
+                else:
+                    key = fold_title(value)
+                self._exact[kind].setdefault(key, index)
+                continue
+            rule_keys.append(("regex", regex, None))
+            if not regex:
+                continue
+            if not isinstance(regex, str):
+                raise ValueError(
+                    f"Invalid regex in window_patterns[{index}] ({pattern.get('description', '')!r}): "
+                    f"must be a string, got {type(regex).__name__}"
+                )
+            compile_key = (regex, normalizer is not None)
+            compiled = reusable.get(compile_key) or self._compiled.get(compile_key)
+            if compiled is None:
+                compiled = _compile_folded(regex) if normalizer is not None else None
+            try:
+                if compiled is None:
+                    compiled = re.compile(regex, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(
+                    f"Invalid regex in window_patterns[{index}] ({pattern.get('description', '')!r}): {regex!r}: {e}"
+                ) from e
+            self._compiled[compile_key] = compiled
+            entries.append(CompiledPattern(compiled, pattern, index))
+        self._entries = tuple(entries)
+        self._rule_keys = tuple(rule_keys)
+        self._patterns = tuple(window_patterns)
+        self._results = tuple(MatchResult.from_pattern(index, pattern) for index, pattern in enumerate(self._patterns))
+        self.engine = engine
+
+        # Risky patterns must never run in-process, so they are kept out of merged regexes
+        guarded = set()
+        if regex_guard is not None:
+            guarded = {entry.index for entry in self._entries if regex_guard.check(entry.pattern)}
+
+        # Joined branches and flags -> merged regex, shared with the next PatternSet like _compiled
+        self._merged = {}
+        self._segments = None
+        if engine == "combined":
+            reusable_merged = previous._merged if previous is not None else {}
+            self._segments = _build_segments(self._entries, guarded, reusable_merged, self._merged)
+        self._prefilter = None
+        if engine == "prefilter":
+            self._prefilter = LiteralPrefilter(
+                [entry.compiled.pattern for entry in self._entries],
+                previous._prefilter if previous is not None else None,
+            )
+        for entry in self._entries:
+            if entry.index in guarded:
+                entry.compiled = regex_guard.wrap(entry.compiled, entry.pattern)
+        if profiler is not None:
+            # Entries are shared with the segments, so wrapping them instruments every engine
+            for entry in self._entries:
+                entry.compiled = profiler.wrap_regex(entry.compiled, entry.pattern)
+            if self._segments is not None:
+                self._segments = [
+                    (
+                        profiler.wrap_regex(combined, f"(combined: {len(run)} patterns from #{run[0].index + 1})"),
+                        markers,
+                        run,
+                    )
+                    if combined is not None
+                    else (combined, markers, run)
+                    for combined, markers, run in self._segments
+                ]
+
+    def instrumented(self, profiler=None, regex_guard=None):
+        """Get a copy of this PatternSet with profiling and/or time-budgeted evaluation.
+
+        Args:
+            profiler: PatternProfiler recording every regex evaluation, or None
+            regex_guard: RegexGuard evaluating risky patterns under a time budget, or None
+
+        Returns:
+            PatternSet: Instrumented pattern set with the same patterns and engine
+        """
+        return PatternSet(self._patterns, self.engine, profiler, regex_guard, self._normalizer, previous=self)
+
+    @classmethod
+    def from_patterns(cls, window_patterns, previous=None):
+        """Get a PatternSet for a pattern list, reusing an existing PatternSet as is.
+
+        Args:
+            window_patterns: PatternSet or list of pattern dictionaries
+            previous: PatternSet whose compiled regexes are reused when compiling a
+                      pattern list, or None (default)
+
+        Returns:
+            PatternSet: Compiled patterns
+        """
+        if isinstance(window_patterns, cls):
+            return window_patterns
+        return cls(window_patterns, previous=previous)
+
+    @property
+    def patterns(self):
+        """Get the original pattern dictionaries in configuration order.
+
+        Returns:
+            tuple: Pattern dictionaries (including ones with an empty regex)
+        """
+        return self._patterns
+
+    @property
+    def results(self):
+        """Get the match result of each pattern, created once with the set.
+
+        Returns:
+            tuple: MatchResult per pattern, indexed like patterns
+        """
+        return self._results
+
+    def __len__(self):
+        """Get the number of matchable patterns (regexes and distinct exact-match rules)."""
+        return len(self._entries) + sum(len(index) for index in self._exact.values()) + len(self._domain_lists)
+
+    def __iter__(self):
+        """Iterate over compiled regex patterns in match order."""
+        return iter(self._entries)
+
+    def unchanged_prefix(self, previous):
+        """Count the leading patterns whose rules are the same as in a previous PatternSet.
+
+        A window whose first match in previous is one of these patterns has the same
+        first match here, so a memoized result for it stays valid. If the rule lists
+        are identical, a memoized "no match" stays valid too.
+
+        Args:
+            previous: PatternSet of the previous configuration
+
+        Returns:
+            int: Number of leading patterns with unchanged rules (scores and
+                 descriptions may differ)
+        """
+        if (
+            _normalizer_settings(self._normalizer) != _normalizer_settings(previous._normalizer)
+            or self.needs_process_name != previous.needs_process_name
+        ):
+            return 0
+        count = 0
+        for key, previous_key in zip(self._rule_keys, previous._rule_keys):
+            if key != previous_key:
+                break
+            count += 1
+        return count
+
+    @property
+    def needs_process_name(self):
+        """Check whether matching depends on the process name of the active window.
+
+        Returns:
+            bool: True if there is at least one process rule
+        """
+        return bool(self._exact["process"])
+
+    def match(self, window_title, process_name=""):
+        """Find the first pattern matching a window.
+
+        Args:
+            window_title: Window title to match
+            process_name: Process name of the window, or "" if unknown (default: "")
+
+        Returns:
+            dict: Matched pattern dictionary, or None if no pattern matches
+        """
+        index = self.match_index(window_title, process_name)
+        return self._patterns[index] if index is not None else None
+
+    def match_index(self, window_title, process_name=""):
+        """Find the position of the first pattern matching a window.
+
+        Args:
+            window_title: Window title to match
+            process_name: Process name of the window, or "" if unknown (default: "")
+
+        Returns:
+            int: Index into patterns, or None if no pattern matches
+        """
+        if self._normalizer is not None:
+            window_title = self._normalizer.normalize(window_title)
+        limit = self._match_exact(window_title, process_name)
+        entry = self._match_entry(window_title, limit)
+        if entry is not None:
+            return entry.index
+        return limit
+
+    def match_all(self, window_title, process_name=""):
+        """Find every pattern matching a window, not just the first one.
+
+        Args:
+            window_title: Window title to match
+            process_name: Process name of the window, or "" if unknown (default: "")
+
+        Returns:
+            list: Indexes into patterns in configuration order (the first one wins)
+        """
+        if self._normalizer is not None:
+            window_title = self._normalizer.normalize(window_title)
+        found = {index for index in self._exact_matches(window_title, process_name, True) if index is not None}
+        found.update(entry.index for entry in self._entries if entry.compiled.search(window_title))
+        return sorted(found)
+
+    def _match_exact(self, window_title, process_name):
+        """Find the first exact-match rule matching a window.
+
+        Args:
+            window_title: Window title
+            process_name: Process name of the window, or ""
+
+        Returns:
+            int: Lowest index of a matching rule, or None if no rule matches
+        """
+        return min(
+            (index for index in self._exact_matches(window_title, process_name) if index is not None), default=None
+        )
+
+    def _exact_matches(self, window_title, process_name, every_list=False):
+        """Look up the exact-match rules of a window.
+
+        Args:
+            window_title: Window title
+            process_name: Process name of the window, or ""
+            every_list: If True, check every domain list instead of stopping at the
+                        first one that matches (default: False)
+
+        Returns:
+            list: Index of the rule found by each lookup, or None where nothing was found
+        """
+        process_index = self._exact["process"]
+        title_index = self._exact["title"]
+        domain_index = self._exact["domain"]
+        found = []
+        if process_name and process_index:
+            found.append(process_index.get(fold_title(process_name)))
+        if title_index:
+            # A normalized title is folded the same way as the title rules were
+            key = window_title if self._normalizer is not None else fold_title(window_title)
+            found.append(title_index.get(key))
+        if domain_index or self._domain_lists:
+            hosts = find_host_names(window_title)
+            for host in hosts:
+                labels = host.split(".")
+                found.extend(domain_index.get(".".join(labels[start:])) for start in range(len(labels)))
+            for index, trie in self._domain_lists:
+                if trie.match_hosts(hosts):
+                    found.append(index)
+                    if not every_list:
+                        # Later lists cannot win over this one
+                        break
+        return found
+
+    def _match_entry(self, window_title, limit=None):
+        """Find the first compiled pattern matching a window title with the configured engine.
+
+        Args:
+            window_title: Window title to match
+            limit: Index of an already matched exact-match rule; only patterns before it
+                   are evaluated (default: None, evaluate all)
+
+        Returns:
+            CompiledPattern: Matched entry, or None if no pattern before limit matches
+        """
+        if limit is None:
+            limit = len(self._patterns)
+
+        if self._prefilter is not None:
+            entries = self._entries
+            for index in self._prefilter.candidates(window_title):
+                entry = entries[index]
+                if entry.index >= limit:
+                    return None
+                if entry.compiled.search(window_title):
+                    return entry
+            return None
+
+        if self._segments is None:
+            for entry in self._entries:
+                if entry.index >= limit:
+                    return None
+                if entry.compiled.search(window_title):
+                    return entry
+            return None
+
+        for combined, markers, run in self._segments:
+            if combined is None:
+                # Unmergeable pattern, evaluated on its own
+                if run.index >= limit:
+                    return None
+                if run.compiled.search(window_title):
+                    return run
+                continue
+            if run[0].index >= limit:
+                return None
+            match = combined.search(window_title)
+            if match:
+                # The leftmost match is not necessarily the first pattern in order
+                position = markers[match.lastindex]
+                for entry in run[:position]:
+                    if entry.compiled.search(window_title):
+                        return entry if entry.index < limit else None
+                return run[position] if run[position].index < limit else None
+        return None
+
+
+def is_mergeable(compiled):
+    """Check whether a compiled pattern can be embedded in a combined regex.
+
+    Args:
+        compiled: Pattern compiled with re.IGNORECASE, or folded without it
+
+    Returns:
+        bool: False for inline global flags, backreferences and conditional groups
+    """
+    if compiled.flags not in (_DEFAULT_FLAGS, _FOLDED_FLAGS):
+        return False
+    return not _UNMERGEABLE_SYNTAX.search(compiled.pattern)
+
+
+def _compile_folded(regex):
+    """Compile the folded form of a regex for matching normalized titles.
+
+    Args:
+        regex: Regular expression string
+
+    Returns:
+        re.Pattern: Case-sensitive pattern, or None if the regex cannot be folded
+                    (it is then compiled with re.IGNORECASE)
+    """
+    folded = fold_regex(regex)
+    if folded is None:
+        return None
+    try:
+        return re.compile(folded)
+    except re.error:
+        # e.g. inline flags or group names that differ only in case
+        return None
+
+
+def _normalizer_settings(normalizer):
+    """Get the settings that decide how a TitleNormalizer changes titles.
+
+    Args:
+        normalizer: TitleNormalizer or None
+
+    Returns:
+        tuple: Comparable settings, or None without a normalizer
+    """
+    if normalizer is None:
+        return None
+    return normalizer.strip_suffixes, normalizer.max_length
+
+
+def _load_domain_list(pattern, index):
+    """Get the DomainTrie of a domain_list pattern.
+
+    Args:
+        pattern: Pattern dictionary with domain_list (a file path) and optionally a
+                 preloaded domain_trie
+        index: Position of the pattern in the configuration
+
+    Returns:
+        DomainTrie: Listed domains
+
+    Raises:
+        ValueError: If the path is not a string or the file cannot be read
+    """
+    trie = pattern.get("domain_trie")
+    if trie is not None:
+        return trie
+    path = pattern["domain_list"]
+    if not isinstance(path, str):
+        raise ValueError(
+            f"Invalid domain_list in window_patterns[{index}] ({pattern.get('description', '')!r}): "
+            f"must be a string, got {type(path).__name__}"
+        )
+    try:
+        return DomainTrie.from_file(path)
+    except OSError as e:
+        raise ValueError(
+            f"Cannot read domain_list in window_patterns[{index}] ({pattern.get('description', '')!r}): {e}"
+        ) from e
+
+
+def _compile_run(run, reusable, merged):
+    """Merge a run of mergeable patterns into one regex.
+
+    Args:
+        run: List of CompiledPattern
+        reusable: Merged regexes of the previous PatternSet, by joined branches and flags
+        merged: Dictionary collecting the merged regexes of this PatternSet
+
+    Returns:
+        tuple: (combined regex, {marker group index: position in run}, run), or
+               None if the merged regex does not compile
+    """
+    branches = []
+    markers = {}
+    group_count = 0
+    # Runs never mix folded (case-sensitive) and IGNORECASE patterns (see _build_segments)
+    flags = run[0].compiled.flags & re.IGNORECASE
+    for position, entry in enumerate(run):
+        group_count += entry.compiled.groups + 1
+        markers[group_count] = position
+        branches.append(f"(?:{entry.compiled.pattern})()")
+    key = ("|".join(branches), flags)
+    combined = reusable.get(key)
+    if combined is None:
+        try:
+            combined = re.compile(key[0], flags)
+        except re.error:
+            return None
+    merged[key] = combined
+    return combined, markers, tuple(run)
+
+
+def _build_segments(entries, unmergeable=frozenset(), reusable=None, merged=None):
+    """Split patterns into combined runs and individually evaluated patterns.
+
+    Args:
+        entries: Tuple of CompiledPattern in configuration order
+        unmergeable: Pattern indexes to evaluate individually regardless of their syntax
+        reusable: Merged regexes of the previous PatternSet to reuse, or None (default)
+        merged: Dictionary collecting the merged regexes by joined branches and flags,
+                or None (default)
+
+    Returns:
+        list: (combined regex, markers, run) for merged runs and
+              (None, None, CompiledPattern) for individually evaluated patterns,
+              in configuration order
+    """
+    if reusable is None:
+        reusable = {}
+    if merged is None:
+        merged = {}
+    segments = []
+    run = []
+    run_group_names = set()
+
+    def close_run():
+        if not run:
+            return
+        segment = _compile_run(run, reusable, merged) if len(run) > 1 else None
+        if segment is None:
+            segments.extend((None, None, entry) for entry in run)
+        else:
+            segments.append(segment)
+        run.clear()
+        run_group_names.clear()
+
+    for entry in entries:
+        if entry.index not in unmergeable and is_mergeable(entry.compiled):
+            # Group names must be unique within one combined regex, and a folded pattern
+            # must not be searched with the IGNORECASE of its neighbours (or vice versa)
+            if run_group_names.intersection(entry.compiled.groupindex) or (
+                run and run[0].compiled.flags != entry.compiled.flags
+            ):
+                close_run()
+            run.append(entry)
+            run_group_names.update(entry.compiled.groupindex)
+            checksum = zlib.crc32(entry.compiled.pattern.encode("utf-8", "surrogatepass"))
+            if len(run) >= _MAX_RUN_LENGTH or checksum % _RUN_BOUNDARY_MODULUS == 0:
+                close_run()
+        else:
+            close_run()
+            segments.append((None, None, entry))
+    close_run()
+    return segments
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Shadowed window pattern analysis module for cat-window-watcher.
+
+The first matching window pattern wins, so a broad early pattern such as
+``terminal|bash`` silently shadows later, more specific ones like
+``bash - deploy``. A shadowed pattern can never change the score but still
+costs a regex evaluation on every tick where nothing earlier matched.
+
+Two analyses are available:
+    - Static (proven): an earlier pattern that is a plain alternation of
+      literals shadows a later pattern if every match of the later one must
+      contain one of those literals (see literal_prefilter). Duplicate
+      process/title/domain rules, subdomains of an earlier domain rule and
+      title rules that an earlier pattern matches are found as well.
+    - Corpus probing (evidence): recorded window titles are matched against
+      all patterns, and patterns that matched some titles but never won are
+      reported. This finds shadowing the static check cannot prove, but a
+      title outside the corpus could still reach the pattern.
+
+With title normalization, both analyses match the normalized title, as the
+compiled PatternSet does; literal proofs then only use ASCII literals, whose
+folding is the same for regexes and normalized titles.
+
+Only proven shadowing is safe to drop from the compiled set.
+"""
+
+import re
+
+try:
+    from .domain_trie import normalize_domain
+    from .literal_prefilter import AhoCorasick, extract_required_literals, fold_title, literal_alternatives
+    from .pattern_set import EXACT_RULE_KINDS, RULE_KINDS, PatternSet
+    from .session_recorder import MAGIC, read_session_log
+except ImportError:
+    from domain_trie import normalize_domain
+    from literal_prefilter import AhoCorasick, extract_required_literals, fold_title, literal_alternatives
+    from pattern_set import EXACT_RULE_KINDS, RULE_KINDS, PatternSet
+    from session_recorder import MAGIC, read_session_log
+
+
+# Inline flag groups such as (?-i:...) or (?s), which make matching one title say
+# nothing about its case variants
+_INLINE_FLAGS = re.compile(r"\(\?(?:[aiLmsux]+(?:-[imsx]*)?|-[imsx]+)[:)]")
+
+
+class ShadowedPattern:
+    """A window pattern that cannot (or did not) win against an earlier pattern."""
+
+    __slots__ = ("index", "shadowed_by", "reason", "proven")
+
+    def __init__(self, index, shadowed_by, reason, proven):
+        """Initialize finding.
+
+        Args:
+            index: Position of the shadowed pattern in the configuration
+            shadowed_by: Position of the earlier pattern that wins instead
+            reason: Human-readable explanation
+            proven: True if the pattern can never win, False if it only never won
+                    in the probed corpus
+        """
+        self.index = index
+        self.shadowed_by = shadowed_by
+        self.reason = reason
+        self.proven = proven
+
+
+def _rule_kind(pattern):
+    """Get the rule kind of a pattern.
+
+    Args:
+        pattern: Pattern dictionary
+
+    Returns:
+        str: One of RULE_KINDS, or None if the pattern has no rule
+    """
+    for kind in RULE_KINDS:
+        if pattern.get(kind):
+            return kind
+    return None
+
+
+def _required_literals(pattern, kind, normalizer=None):
+    """Get literals one of which every window matching a pattern must contain.
+
+    Args:
+        pattern: Pattern dictionary
+        kind: Rule kind of the pattern
+        normalizer: TitleNormalizer the patterns are matched with, or None
+
+    Returns:
+        list: Case-folded literals, or None if unknown
+    """
+    if kind == "regex":
+        literals = extract_required_literals(pattern["regex"])
+    elif kind == "domain":
+        literals = [normalize_domain(pattern["domain"])]
+    elif kind == "title" and normalizer is not None:
+        # A title rule matches exactly the windows whose normalized title is this one
+        literals = [normalizer.normalize(pattern["title"])]
+    elif kind == "title" and pattern["title"].isascii():
+        return [fold_title(pattern["title"])]
+    else:
+        return None
+    if normalizer is not None and literals and not all(literal and literal.isascii() for literal in literals):
+        return None
+    return literals
+
+
+def find_shadowed_patterns(window_patterns, corpus=None, normalizer=None):
+    """Find window patterns that can never win, or never won in a corpus.
+
+    Args:
+        window_patterns: List of pattern dictionaries in configuration order
+        corpus: Iterable of (window title, process name) pairs to probe, or None
+                to run the static analysis only
+        normalizer: TitleNormalizer the patterns are matched with, or None
+
+    Returns:
+        list: ShadowedPattern findings ordered by pattern index, at most one per pattern
+              (proven findings take precedence)
+    """
+    window_patterns = list(window_patterns)
+    kinds = [_rule_kind(pattern) for pattern in window_patterns]
+    findings = {}
+
+    # Earlier literal-alternation regexes, found by the literals they contain
+    automaton = AhoCorasick(
+        (literal, index)
+        for index, (pattern, kind) in enumerate(zip(window_patterns, kinds))
+        if kind == "regex"
+        for literal in (literal_alternatives(pattern["regex"]) or ())
+    )
+    first_rule = {kind: {} for kind in EXACT_RULE_KINDS}
+    probe_set = None
+
+    for index, (pattern, kind) in enumerate(zip(window_patterns, kinds)):
+        if kind is None:
+            continue
+
+        literals = _required_literals(pattern, kind, normalizer)
+        if literals:
+            # One earlier pattern must cover every branch of this one
+            covering = set.intersection(*(automaton.find(literal) for literal in literals))
+            earlier = min((other for other in covering if other < index), default=None)
+            if earlier is not None:
+                findings[index] = ShadowedPattern(
+                    index, earlier, "every title it matches contains a literal of the earlier pattern", True
+                )
+                continue
+
+        if kind not in first_rule:
+            continue
+        value = pattern[kind]
+        if kind == "domain":
+            key = normalize_domain(value)
+        elif kind == "title" and normalizer is not None:
+            key = normalizer.normalize(value)
+        else:
+            key = fold_title(value)
+        rules = first_rule[kind]
+        if kind == "domain":
+            labels = key.split(".")
+            parents = [
+                rules[".".join(labels[start:])] for start in range(len(labels)) if ".".join(labels[start:]) in rules
+            ]
+            if parents:
+                findings[index] = ShadowedPattern(index, min(parents), "same or parent domain listed earlier", True)
+        elif key in rules:
+            findings[index] = ShadowedPattern(index, rules[key], f"duplicate {kind} rule", True)
+        elif kind == "title" and (normalizer is not None or value.isascii()):
+            # Every window this rule matches has the same normalized title as the value
+            if probe_set is None:
+                probe_set = PatternSet(window_patterns, normalizer=normalizer)
+            winner = probe_set.match_index(value)
+            if (
+                winner is not None
+                and winner < index
+                and not _INLINE_FLAGS.search(window_patterns[winner].get("regex") or "")
+            ):
+                findings[index] = ShadowedPattern(index, winner, "the earlier pattern matches this title", True)
+        rules.setdefault(key, index)
+
+    if corpus is not None:
+        if probe_set is None:
+            probe_set = PatternSet(window_patterns, normalizer=normalizer)
+        won = set()
+        lost = {}  # index -> (earliest winner seen, number of titles)
+        for window_title, process_name in set(corpus):
+            matched = probe_set.match_all(window_title, process_name)
+            if not matched:
+                continue
+            won.add(matched[0])
+            for index in matched[1:]:
+                winner, count = lost.get(index, (matched[0], 0))
+                lost[index] = (min(winner, matched[0]), count + 1)
+        for index, (winner, count) in lost.items():
+            if index not in won and index not in findings:
+                findings[index] = ShadowedPattern(
+                    index, winner, f"matched {count} corpus title(s) but never won", False
+                )
+
+    return [findings[index] for index in sorted(findings)]
+
+
+def read_title_corpus(path):
+    """Read window titles (and process names) to probe patterns with.
+
+    Args:
+        path: Session log written by session_recorder, or a UTF-8 text file with
+              one window title per line
+
+    Returns:
+        list: (window title, process name) pairs; process names are "" for text files
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If a session log is corrupt
+    """
+    with open(path, "rb") as f:
+        is_session_log = f.read(len(MAGIC)) == MAGIC
+    if is_session_log:
+        return [(snapshot.title, snapshot.process_name) for snapshot in read_session_log(path)]
+    with open(path, encoding="utf-8") as f:
+        return [(line.rstrip("\r\n"), "") for line in f if line.strip()]
+
+
+def format_finding(finding, window_patterns):
+    """Describe a finding for a warning message.
+
+    Args:
+        finding: ShadowedPattern
+        window_patterns: Pattern dictionaries the finding refers to
+
+    Returns:
+        str: One-line description
+    """
+
+    def label(index):
+        pattern = window_patterns[index]
+        kind = _rule_kind(pattern)
+        return f"#{index + 1} {pattern.get('description', '')!r} ({kind} {pattern.get(kind, '')!r})"
+
+    certainty = "can never win" if finding.proven else "never won"
+    return f"window pattern {label(finding.index)} {certainty}: {finding.reason} ({label(finding.shadowed_by)})"
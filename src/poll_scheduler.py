@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Adaptive polling scheduler module for cat-window-watcher.
+
+Decides how long to wait before the next sample. Each policy looks at the
+latest snapshot and may propose an interval; the longest proposal wins and is
+clamped to the configured bounds. Without any proposal the base interval is used.
+A fixed policy (game mode) overrides the others and is not clamped.
+"""
+
+
+class StabilityBackoffPolicy:
+    """Lengthen the interval while the active window stays the same.
+
+    Every tick with an unchanged title (and idle state) multiplies the interval by
+    the backoff factor; any change snaps back to the minimum interval.
+    """
+
+    fixed = False
+
+    def __init__(self, min_interval_ms, max_interval_ms, backoff_factor=2.0):
+        """Initialize stability backoff policy.
+
+        Args:
+            min_interval_ms: Interval used right after a change
+            max_interval_ms: Longest interval proposed while stable
+            backoff_factor: Multiplier applied per stable tick (> 1)
+        """
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.backoff_factor = backoff_factor
+        self._interval_ms = min_interval_ms
+        self._last_state = None
+
+    def propose(self, snapshot):
+        """Propose the next interval.
+
+        Args:
+            snapshot: WindowSnapshot acquired this tick
+
+        Returns:
+            int: Proposed interval in milliseconds
+        """
+        state = (snapshot.title, snapshot.is_idle)
+        if state != self._last_state:
+            self._interval_ms = self.min_interval_ms
+        else:
+            self._interval_ms = min(int(self._interval_ms * self.backoff_factor), self.max_interval_ms)
+        self._last_state = state
+        return self._interval_ms
+
+
+class GameModePolicy:
+    """Use a long fixed interval while a configured game process is in the foreground.
+
+    Score deltas in game mode apply once per check, as without adaptive polling,
+    so its interval is neither clamped nor converted into elapsed ticks.
+    """
+
+    fixed = True
+
+    def __init__(self, process_names, interval_ms, default_interval_ms):
+        """Initialize game mode policy.
+
+        Args:
+            process_names: Process names that indicate a game is being played
+            interval_ms: Interval used while a game is detected
+            default_interval_ms: Interval announced when the game ends
+        """
+        self.process_names = process_names
+        self.interval_ms = interval_ms
+        self.default_interval_ms = default_interval_ms
+        self.is_game_playing = False
+
+    def propose(self, snapshot):
+        """Propose the next interval.
+
+        Args:
+            snapshot: WindowSnapshot acquired this tick (with process name)
+
+        Returns:
+            int: Game interval in milliseconds while a game is detected, otherwise None
+        """
+        is_game_playing_now = snapshot.process_name in self.process_names
+
+        if is_game_playing_now and not self.is_game_playing:
+            # Entering game playing mode - switch to longer interval
+            self.is_game_playing = True
+            print(
+                f"Game detected ({snapshot.process_name}), switching to {self.interval_ms // 1000} second check interval"
+            )
+        elif not is_game_playing_now and self.is_game_playing:
+            # Exiting game playing mode - switch back to normal interval
+            self.is_game_playing = False
+            print(f"Game ended, switching back to {self.default_interval_ms // 1000} second check interval")
+
+        return self.interval_ms if self.is_game_playing else None
+
+
+class PollScheduler:
+    """Combine polling policies into the next sampling interval."""
+
+    def __init__(self, base_interval_ms, policies=None, min_interval_ms=None, max_interval_ms=None):
+        """Initialize poll scheduler.
+
+        Args:
+            base_interval_ms: Interval used when no policy proposes one
+            policies: List of policies with a propose(snapshot) method
+            min_interval_ms: Lower bound for the interval, or None for no bound
+            max_interval_ms: Upper bound for the interval, or None for no bound
+        """
+        self.base_interval_ms = base_interval_ms
+        self.policies = list(policies) if policies else []
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        # Whether the latest interval came from a fixed policy
+        self.fixed_interval = False
+
+    def next_interval(self, snapshot):
+        """Compute the interval until the next sample.
+
+        Args:
+            snapshot: WindowSnapshot acquired this tick
+
+        Returns:
+            int: Interval in milliseconds
+        """
+        interval_ms = self.base_interval_ms
+        # Every policy sees every snapshot, so backoff state stays current in game mode
+        proposals = [(policy, policy.propose(snapshot)) for policy in self.policies]
+        fixed = [proposal for policy, proposal in proposals if proposal is not None and policy.fixed]
+        self.fixed_interval = bool(fixed)
+        if fixed:
+            return fixed[0]
+
+        proposals = [proposal for _, proposal in proposals if proposal is not None]
+        if proposals:
+            interval_ms = max(proposals)
+
+        if self.min_interval_ms is not None:
+            interval_ms = max(interval_ms, self.min_interval_ms)
+        if self.max_interval_ms is not None:
+            interval_ms = min(interval_ms, self.max_interval_ms)
+        return interval_ms
+
+    def elapsed_ticks(self, interval_ms):
+        """Convert an interval into the number of base ticks it covers.
+
+        Score deltas are defined per base tick, so a longer interval must apply
+        the delta that many times. An interval chosen by a fixed policy counts as
+        one tick.
+
+        Args:
+            interval_ms: Interval that elapsed since the previous sample
+
+        Returns:
+            int: Number of base ticks (at least 1)
+        """
+        if self.fixed_interval:
+            return 1
+        return max(1, round(interval_ms / self.base_interval_ms))
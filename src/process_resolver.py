@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Process name resolution module for cat-window-watcher.
+
+Resolves pids to process names by reading /proc directly instead of spawning
+``ps``, and caches window-id to pid lookups so external tools are only consulted
+when the focused window changes.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+
+# Default bound for each cache
+DEFAULT_MAX_CACHE_ENTRIES = 256
+
+# Index of the starttime field in /proc/<pid>/stat, counted from the field after "(comm)"
+# (starttime is field 22 overall; fields 1 and 2 are pid and comm)
+_STAT_STARTTIME_INDEX = 22 - 3
+
+
+class ProcessNameResolver:
+    """Resolve pids to process names via /proc with PID-reuse-safe caching."""
+
+    def __init__(self, proc_root="/proc", max_entries=DEFAULT_MAX_CACHE_ENTRIES):
+        """Initialize process name resolver.
+
+        Args:
+            proc_root: Path of the proc filesystem (default: /proc)
+            max_entries: Maximum number of entries kept in each cache
+        """
+        self.proc_root = Path(proc_root)
+        self.max_entries = max_entries
+        self._name_cache = OrderedDict()  # (pid, start_time) -> process name
+        self._window_pid_cache = OrderedDict()  # window id -> pid
+        self._active_window_id = None
+
+    def is_available(self):
+        """Check if the proc filesystem can be used.
+
+        Returns:
+            bool: True if /proc/self/stat is readable
+        """
+        return (self.proc_root / "self" / "stat").exists()
+
+    def _read_start_time(self, pid):
+        """Read the start time of a process from /proc/<pid>/stat.
+
+        The start time distinguishes a reused pid from the original process.
+
+        Args:
+            pid: Process id
+
+        Returns:
+            int: Start time in clock ticks since boot, or None if the process does not exist
+        """
+        try:
+            stat = (self.proc_root / str(pid) / "stat").read_bytes()
+        except OSError:
+            return None
+        # comm may contain spaces or parentheses, so split after the last ")"
+        fields = stat[stat.rfind(b")") + 2 :].split()
+        try:
+            return int(fields[_STAT_STARTTIME_INDEX])
+        except (IndexError, ValueError):
+            return None
+
+    def resolve(self, pid):
+        """Resolve a pid to its process name.
+
+        Args:
+            pid: Process id
+
+        Returns:
+            str: Process name, or empty string if the process does not exist
+        """
+        start_time = self._read_start_time(pid)
+        if start_time is None:
+            return ""
+
+        key = (pid, start_time)
+        name = self._name_cache.get(key)
+        if name is not None:
+            self._name_cache.move_to_end(key)
+            return name
+
+        try:
+            name = (self.proc_root / str(pid) / "comm").read_text(encoding="utf-8", errors="replace").strip()
+        except OSError:
+            return ""
+
+        self._name_cache[key] = name
+        if len(self._name_cache) > self.max_entries:
+            self._name_cache.popitem(last=False)
+        return name
+
+    def get_window_pid(self, window_id, lookup):
+        """Get the pid owning a window, consulting lookup only on cache misses.
+
+        Args:
+            window_id: Window id (any hashable identifier)
+            lookup: Callable returning the pid for window_id (e.g. via xdotool)
+
+        Returns:
+            int: Pid owning the window, or None if lookup failed
+        """
+        pid = self._window_pid_cache.get(window_id)
+        if pid is not None:
+            self._window_pid_cache.move_to_end(window_id)
+            return pid
+
+        pid = lookup()
+        if pid is None:
+            return None
+
+        self._window_pid_cache[window_id] = pid
+        if len(self._window_pid_cache) > self.max_entries:
+            self._window_pid_cache.popitem(last=False)
+        return pid
+
+    def note_active_window(self, window_id):
+        """Record the focused window, dropping its cached pid if focus just moved to it.
+
+        While a window stays focused its cached pid is reused. When focus returns to a
+        window id, the id may have been reused by another client or the client may have
+        re-executed in the meantime, so its pid is looked up again.
+
+        Args:
+            window_id: Id of the focused window
+        """
+        if window_id != self._active_window_id:
+            self._active_window_id = window_id
+            self._window_pid_cache.pop(window_id, None)
+
+    def forget_window(self, window_id):
+        """Drop a cached window-id to pid mapping (e.g. after the process exited).
+
+        Args:
+            window_id: Window id
+        """
+        self._window_pid_cache.pop(window_id, None)
+
+    def clear(self):
+        """Clear all caches."""
+        self._name_cache.clear()
+        self._window_pid_cache.clear()
+        self._active_window_id = None
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""ReDoS-safe window pattern matching module for cat-window-watcher.
+
+Window patterns are user-supplied regexes evaluated on the Tk thread. A
+pattern with heavy backtracking (e.g. ``(a+)+$``) can take seconds or more on
+a long browser title and freeze the GUI.
+
+In safe mode:
+    - At load time, each regex gets a static check for risky constructs
+      (nested quantifiers, quantified alternations, several unbounded
+      wildcards).
+    - At runtime, risky patterns are evaluated in an isolated worker process
+      (see coprocess) with a time budget. A pattern that exceeds the budget is
+      quarantined: it is treated as never matching, with a warning.
+    - The worker is started when the guard is created and (re)starts are not
+      counted against the budget. If the worker crashes or cannot start, the
+      evaluation fails open with a warning and no pattern is quarantined.
+
+Patterns without risks are evaluated in-process as usual.
+"""
+
+import json
+import re
+import sys
+
+try:
+    from .coprocess import Coprocess, CoprocessError, CoprocessTimeout
+except ImportError:
+    from coprocess import Coprocess, CoprocessError, CoprocessTimeout
+
+# Default time budget for one evaluation of a risky pattern, in seconds
+DEFAULT_TIME_BUDGET = 0.1
+
+# Worker answering [regex, title] JSON queries with "1" (match) or "0" over the coprocess protocol
+REGEX_WORKER_SCRIPT = """
+import json
+import re
+import sys
+
+cache = {}
+out = sys.stdout.buffer
+for line in iter(sys.stdin.buffer.readline, b""):
+    regex, title = json.loads(line)
+    compiled = cache.get(regex)
+    if compiled is None:
+        compiled = cache[regex] = re.compile(regex, re.IGNORECASE)
+    data = b"1" if compiled.search(title) else b"0"
+    out.write(str(len(data)).encode("ascii") + b"\\n" + data)
+    out.flush()
+"""
+
+# Query the worker answers once it is ready (an empty regex matches)
+_WORKER_HANDSHAKE = json.dumps(["", ""])
+
+# {m}, {m,}, {m,n} and {,n} quantifiers
+_BRACE_QUANTIFIER = re.compile(r"\{(\d*)(,?)(\d*)\}")
+
+# Unbounded wildcards: .* and .+
+_UNBOUNDED_WILDCARD = re.compile(r"(?<!\\)\.[*+]")
+
+# Number of unbounded wildcards from which polynomial backtracking is reported
+_MAX_UNBOUNDED_WILDCARDS = 3
+
+
+def _read_quantifier(regex, index):
+    """Read a quantifier at a position.
+
+    Args:
+        regex: Regular expression string
+        index: Position right after an atom
+
+    Returns:
+        tuple: (repeats, end) where repeats tells whether the quantifier allows more
+               than one repetition and end is the position after the quantifier
+               (including a lazy or possessive suffix), or (False, index) if there
+               is no quantifier
+    """
+    if index >= len(regex):
+        return False, index
+    char = regex[index]
+    if char in "*+":
+        repeats, end = True, index + 1
+    elif char == "?":
+        repeats, end = False, index + 1
+    elif char == "{":
+        match = _BRACE_QUANTIFIER.match(regex, index)
+        if match is None or not (match.group(1) or match.group(3)):
+            return False, index
+        low, comma, high = match.groups()
+        if comma:
+            repeats = not high or int(high) > 1
+        else:
+            repeats = int(low) > 1
+        end = match.end()
+    else:
+        return False, index
+    if end < len(regex) and regex[end] in "?+":
+        end += 1
+    return repeats, end
+
+
+def find_redos_risks(regex):
+    """Statically check a regex for constructs prone to catastrophic backtracking.
+
+    The check is heuristic and errs on the side of reporting: a reported
+    pattern is merely evaluated under a time budget.
+
+    Args:
+        regex: Regular expression string
+
+    Returns:
+        list: Descriptions of the risks found (empty if none)
+    """
+    risks = []
+    # One frame per open group: [contains a repeating quantifier, contains alternation]
+    stack = [[False, False]]
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        group = None
+        if char == "\\":
+            index += 2
+        elif char == "[":
+            index += 1
+            if index < len(regex) and regex[index] == "^":
+                index += 1
+            if index < len(regex) and regex[index] == "]":
+                index += 1
+            while index < len(regex) and regex[index] != "]":
+                index += 2 if regex[index] == "\\" else 1
+            index += 1
+        elif char == "(":
+            stack.append([False, False])
+            index += 1
+            continue
+        elif char == ")":
+            group = stack.pop() if len(stack) > 1 else [False, False]
+            index += 1
+        elif char == "|":
+            stack[-1][1] = True
+            index += 1
+            continue
+        else:
+            index += 1
+
+        repeats, index = _read_quantifier(regex, index)
+        if group is not None:
+            if repeats and group[0]:
+                risks.append(f"nested quantifier before position {index}")
+            if repeats and group[1]:
+                risks.append(f"quantified alternation before position {index}")
+            stack[-1][0] = stack[-1][0] or group[0]
+        if repeats:
+            stack[-1][0] = True
+
+    if len(_UNBOUNDED_WILDCARD.findall(regex)) >= _MAX_UNBOUNDED_WILDCARDS:
+        risks.append("several unbounded wildcards (.* / .+)")
+    return risks
+
+
+class GuardedRegex:
+    """Compiled regex stand-in that evaluates a risky pattern in the guard's worker."""
+
+    __slots__ = ("_guard", "_pattern", "pattern", "flags", "groups", "groupindex")
+
+    def __init__(self, guard, compiled, pattern):
+        """Initialize guarded regex.
+
+        Args:
+            guard: RegexGuard owning the worker
+            compiled: Compiled regular expression (for its attributes)
+            pattern: Pattern dictionary the regex belongs to
+        """
+        self._guard = guard
+        self._pattern = pattern
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+        self.groups = compiled.groups
+        self.groupindex = compiled.groupindex
+
+    def search(self, string):
+        """Search the string within the time budget.
+
+        Args:
+            string: String to search
+
+        Returns:
+            bool: True if the regex matches; False if it does not, or if the
+                  pattern is (or just became) quarantined
+        """
+        return self._guard.search(self._pattern, string)
+
+
+class RegexGuard:
+    """Evaluate risky window patterns under a time budget and quarantine slow ones."""
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET, coprocess=None):
+        """Initialize regex guard.
+
+        Args:
+            time_budget: Seconds one evaluation of a risky pattern may take
+            coprocess: Worker to evaluate in, or None for a Python worker
+        """
+        self.time_budget = time_budget
+        self._worker = coprocess or Coprocess(
+            [sys.executable, "-c", REGEX_WORKER_SCRIPT], deadline=time_budget, handshake=_WORKER_HANDSHAKE
+        )
+        self._quarantined = {}  # (description, regex) -> reason
+        # Whether the worker failure was already reported (until it answers again)
+        self._worker_failed = False
+        # Start now, so the first evaluation does not wait for interpreter startup
+        try:
+            self._worker.start()
+        except CoprocessError as e:
+            self._report_worker_failure(e)
+
+    def _report_worker_failure(self, error):
+        """Warn once that the worker is unavailable.
+
+        Args:
+            error: CoprocessError raised by the worker
+        """
+        if not self._worker_failed:
+            self._worker_failed = True
+            print(f"Warning: regex safety worker unavailable ({error}); risky window patterns do not match meanwhile")
+
+    @staticmethod
+    def _key(pattern):
+        return (pattern.get("description", ""), pattern.get("regex", ""))
+
+    def check(self, pattern):
+        """Run the static check on a pattern and warn about risks.
+
+        Args:
+            pattern: Pattern dictionary with regex and description
+
+        Returns:
+            bool: True if the pattern is risky and must be evaluated under the budget
+        """
+        risks = find_redos_risks(pattern.get("regex", ""))
+        if risks:
+            print(
+                f"Warning: window pattern {pattern.get('description', '')!r} ({pattern.get('regex', '')!r}) "
+                f"may backtrack heavily ({', '.join(risks)}); "
+                f"evaluating it with a {self.time_budget * 1000:.0f}ms budget"
+            )
+        return bool(risks)
+
+    def wrap(self, compiled, pattern):
+        """Get a regex stand-in evaluated under the time budget.
+
+        Args:
+            compiled: Compiled regular expression
+            pattern: Pattern dictionary the regex belongs to
+
+        Returns:
+            GuardedRegex: Guarded regex
+        """
+        return GuardedRegex(self, compiled, pattern)
+
+    def search(self, pattern, string):
+        """Evaluate a pattern in the worker.
+
+        Only a running worker missing the budget quarantines the pattern; a
+        worker that crashed or cannot start is reported and restarted on the
+        next evaluation.
+
+        Args:
+            pattern: Pattern dictionary
+            string: String to search
+
+        Returns:
+            bool: True if the pattern matches within the budget
+        """
+        key = self._key(pattern)
+        if key in self._quarantined:
+            return False
+        try:
+            reply = self._worker.request(json.dumps([pattern.get("regex", ""), string]))
+        except CoprocessTimeout as e:
+            reason = str(e)
+            self._quarantined[key] = reason
+            print(f"Warning: quarantined window pattern {key[0]!r} ({key[1]!r}): {reason}")
+            return False
+        except CoprocessError as e:
+            self._report_worker_failure(e)
+            return False
+        self._worker_failed = False
+        return reply == "1"
+
+    def get_quarantined(self):
+        """Get the quarantined patterns.
+
+        Returns:
+            list: (description, regex, reason) tuples
+        """
+        return [(description, regex, reason) for (description, regex), reason in self._quarantined.items()]
+
+    def close(self):
+        """Stop the worker process."""
+        self._worker.close()
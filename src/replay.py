@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""Session replay module for cat-window-watcher.
+
+Replays a recorded focus trace through the scoring pipeline (ScoreTracker,
+FlowStateManager and WindowBehaviorManager) driven by a virtual clock, so a
+whole day can be scored in well under a second and compared against live runs.
+
+Supported trace formats:
+    - JSONL: one object per line with "timestamp", "title" and optional
+      "process" and "idle" keys
+    - CSV: timestamp,title[,process[,idle]] rows (an optional header row is skipped)
+    - Binary session logs written by session_recorder.SessionRecorder
+
+Timestamps are ISO 8601 strings or Unix epoch seconds.
+
+Usage:
+    python src/replay.py --config config.toml trace.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime, timedelta
+
+try:
+    from .config import Config
+    from .constants import APP_WINDOW_TITLE
+    from .score_tracker import ScoreTracker
+    from .session_recorder import MAGIC, read_session_log
+    from .window_behavior import WindowBehaviorManager
+    from .window_snapshot import WindowSnapshot
+except ImportError:
+    from config import Config
+    from constants import APP_WINDOW_TITLE
+    from score_tracker import ScoreTracker
+    from session_recorder import MAGIC, read_session_log
+    from window_behavior import WindowBehaviorManager
+    from window_snapshot import WindowSnapshot
+
+
+class VirtualClock:
+    """Clock that only moves when told to, for deterministic replays."""
+
+    def __init__(self, start=None):
+        """Initialize virtual clock.
+
+        Args:
+            start: Initial datetime (default: 2000-01-01 00:00)
+        """
+        self.current = start if start is not None else datetime(2000, 1, 1)
+
+    def __call__(self):
+        """Get the current virtual time.
+
+        Returns:
+            datetime: Current virtual time
+        """
+        return self.current
+
+    def set(self, value):
+        """Jump to a point in time.
+
+        Args:
+            value: New current datetime
+        """
+        self.current = value
+
+    def advance(self, seconds):
+        """Move the clock forward.
+
+        Args:
+            seconds: Seconds to advance
+        """
+        self.current += timedelta(seconds=seconds)
+
+
+class HeadlessRoot:
+    """Stand-in for the tkinter root window so WindowBehaviorManager runs without a display.
+
+    The mouse pointer is reported far away from the window, and window attributes
+    are remembered so the replay can report transparency and topmost state.
+    """
+
+    def __init__(self):
+        """Initialize headless root."""
+        self.window_attributes = {}
+
+    def attributes(self, name, value=None):
+        """Set or get a window attribute (like tkinter's wm attributes)."""
+        if value is None:
+            return self.window_attributes.get(name)
+        self.window_attributes[name] = value
+        return None
+
+    def winfo_pointerx(self):
+        """Report the pointer far away from the window."""
+        return -100000
+
+    def winfo_pointery(self):
+        """Report the pointer far away from the window."""
+        return -100000
+
+    def winfo_x(self):
+        """Report the window position."""
+        return 0
+
+    def winfo_y(self):
+        """Report the window position."""
+        return 0
+
+    def winfo_width(self):
+        """Report the default window size."""
+        return 400
+
+    def winfo_height(self):
+        """Report the default window size."""
+        return 200
+
+
+def _parse_timestamp(value):
+    """Parse an ISO 8601 string or epoch seconds into a datetime.
+
+    Args:
+        value: Timestamp string or number
+
+    Returns:
+        datetime: Parsed timestamp
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value)
+    try:
+        return datetime.fromtimestamp(float(value))
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+def _parse_idle(value, title):
+    """Interpret an optional idle column, defaulting to the empty-title heuristic.
+
+    Args:
+        value: Idle value from the trace (bool, string or None)
+        title: Window title of the record
+
+    Returns:
+        bool: Whether the record counts as idle
+    """
+    if value is None or value == "":
+        return title == ""
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def read_trace(path):
+    """Stream the snapshots stored in a trace file.
+
+    Args:
+        path: JSONL, CSV or binary session log path
+
+    Yields:
+        WindowSnapshot: Recorded snapshots in file order
+
+    Raises:
+        ValueError: If a record cannot be parsed
+    """
+    with open(path, "rb") as f:
+        is_session_log = f.read(len(MAGIC)) == MAGIC
+    if is_session_log:
+        yield from read_session_log(path)
+        return
+
+    with open(path, encoding="utf-8", newline="") as f:
+        if str(path).endswith(".csv"):
+            for line_number, row in enumerate(csv.reader(f), 1):
+                if not row or (line_number == 1 and row[0].strip().lower() == "timestamp"):
+                    continue
+                title = row[1] if len(row) > 1 else ""
+                process = row[2] if len(row) > 2 else ""
+                idle = row[3] if len(row) > 3 else None
+                try:
+                    timestamp = _parse_timestamp(row[0])
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid timestamp: {e}") from e
+                yield WindowSnapshot(title, process, None, _parse_idle(idle, title), timestamp)
+        else:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    timestamp = _parse_timestamp(record["timestamp"])
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ValueError(f"{path}:{line_number}: invalid record: {e}") from e
+                title = record.get("title", "")
+                yield WindowSnapshot(
+                    title, record.get("process", ""), None, _parse_idle(record.get("idle"), title), timestamp
+                )
+
+
+class ReplayWindowMonitor:
+    """WindowMonitor stand-in that returns recorded snapshots and moves a virtual clock."""
+
+    def __init__(self, snapshots, clock):
+        """Initialize replay window monitor.
+
+        Args:
+            snapshots: Iterable of WindowSnapshot in time order
+            clock: VirtualClock set to each snapshot's timestamp as it is sampled
+        """
+        self._snapshots = iter(snapshots)
+        self.clock = clock
+        self.exhausted = False
+
+    def sample(self, include_process=False, debug=False, window_title=None):
+        """Return the next recorded snapshot.
+
+        Args:
+            include_process: Ignored (recorded process names are always included)
+            debug: Ignored
+            window_title: Ignored
+
+        Returns:
+            WindowSnapshot: Next snapshot, or None when the trace is exhausted
+        """
+        snapshot = next(self._snapshots, None)
+        if snapshot is None:
+            self.exhausted = True
+            return None
+        if snapshot.timestamp is not None:
+            self.clock.set(snapshot.timestamp)
+        return snapshot
+
+
+def _fill_ticks(snapshots, tick_seconds):
+    """Repeat the latest snapshot on a fixed tick grid, like live polling would.
+
+    Args:
+        snapshots: Iterable of WindowSnapshot in time order (e.g. focus changes only)
+        tick_seconds: Seconds between live update ticks
+
+    Yields:
+        WindowSnapshot: One snapshot per tick
+    """
+    step = timedelta(seconds=tick_seconds)
+    previous = None
+    tick_time = None
+    for snapshot in snapshots:
+        if previous is not None:
+            while tick_time < snapshot.timestamp:
+                yield WindowSnapshot(previous.title, previous.process_name, None, previous.is_idle, tick_time)
+                tick_time += step
+        else:
+            tick_time = snapshot.timestamp
+        previous = snapshot
+    if previous is not None:
+        yield WindowSnapshot(previous.title, previous.process_name, None, previous.is_idle, tick_time)
+
+
+def create_score_tracker(config, clock):
+    """Create a ScoreTracker configured like main.py, driven by a clock.
+
+    Args:
+        config: Config instance
+        clock: Callable returning the current datetime
+
+    Returns:
+        ScoreTracker: Configured tracker
+    """
+    return ScoreTracker(
+        config.get_pattern_set(),
+        config.get_default_score(),
+        config.get_apply_default_score_mode(),
+        config.get_mild_penalty_mode(),
+        config.get_mild_penalty_start_hour(),
+        config.get_mild_penalty_end_hour(),
+        config.get_reset_score_every_30_minutes(),
+        config.get_self_window_score(),
+        APP_WINDOW_TITLE,
+        clock=clock,
+    )
+
+
+def replay_session(snapshots, config, update_interval=1000, tick_seconds=None):
+    """Replay snapshots through the scoring pipeline.
+
+    Each snapshot is applied the way ScoreDisplay.update_display applies a live
+    sample: score update, then score-decreasing/proximity topmost and flow mode
+    transparency.
+
+    Args:
+        snapshots: Iterable of WindowSnapshot with timestamps
+        config: Config instance
+        update_interval: Live update interval in milliseconds (used for fade steps)
+        tick_seconds: If set, fill the gaps between snapshots with one update per
+                      tick (for traces that only contain focus changes); if None,
+                      every snapshot is one update (for recorded session logs)
+
+    Returns:
+        list: (timestamp, score) tuples, one per update
+    """
+    if tick_seconds is not None:
+        snapshots = _fill_ticks(snapshots, tick_seconds)
+
+    clock = VirtualClock()
+    monitor = ReplayWindowMonitor(snapshots, clock)
+    first = monitor.sample()
+    if first is None:
+        return []
+
+    score_tracker = create_score_tracker(config, clock)
+    behavior_manager = WindowBehaviorManager(HeadlessRoot(), config, score_tracker)
+    behavior_manager.apply_always_on_top()
+
+    timeline = []
+    snapshot = first
+    while snapshot is not None:
+        score_tracker.update_from_snapshot(snapshot)
+        if not behavior_manager.update_score_decreasing_topmost():
+            behavior_manager.update_proximity_based_topmost()
+        behavior_manager.update_window_transparency(update_interval)
+        timeline.append((clock(), score_tracker.get_score()))
+        snapshot = monitor.sample()
+    return timeline
+
+
+def main():
+    """Replay a trace and print the resulting score."""
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded focus trace through the scoring rules",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("trace", help="JSONL, CSV or binary session log")
+    parser.add_argument("-c", "--config", default="config.toml", help="Path to configuration file")
+    parser.add_argument(
+        "--tick-seconds",
+        type=float,
+        default=None,
+        help="Fill gaps between records with one update per tick (for focus-change-only traces)",
+    )
+    args = parser.parse_args()
+
+    config = Config(args.config)
+    timeline = replay_session(read_trace(args.trace), config, tick_seconds=args.tick_seconds)
+    if not timeline:
+        print("Trace is empty")
+        sys.exit(1)
+
+    start, end = timeline[0][0], timeline[-1][0]
+    print(f"Replayed {len(timeline)} updates from {start} to {end}")
+    print(f"Final score: {timeline[-1][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,30 @@
 #!/usr/bin/env python3
 """Score calculation module for cat-window-watcher."""
 
-import re
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from .match_result import NO_MATCH, NO_MATCH_PATTERN_ID, SCREENSAVER_MATCH, SELF_WINDOW_PATTERN_ID, MatchResult
+    from .pattern_set import PatternSet
+    from .time_rule_schedule import HourRangeRule, TimeRuleSchedule
+except ImportError:
+    from match_result import NO_MATCH, NO_MATCH_PATTERN_ID, SCREENSAVER_MATCH, SELF_WINDOW_PATTERN_ID, MatchResult
+    from pattern_set import PatternSet
+    from time_rule_schedule import HourRangeRule, TimeRuleSchedule
+
+# Default number of distinct window titles whose match result is remembered
+DEFAULT_MATCH_CACHE_SIZE = 256
+
+# Description of the app's own window in match results
+SELF_WINDOW_DESCRIPTION = "Cat Window Watcher (self)"
+
+# Match cache value of a title that is not cached (None means "no pattern matches")
+_NOT_CACHED = object()
 
 
 class ScoreCalculator:
@@ -17,11 +40,14 @@ class ScoreCalculator:
         mild_penalty_end_hour=23,
         self_window_score=0,
         self_window_title="",
+        match_cache_size=DEFAULT_MATCH_CACHE_SIZE,
+        pattern_profiler=None,
+        regex_guard=None,
     ):
         """Initialize score calculator.
 
         Args:
-            window_patterns: List of pattern dictionaries with regex, score, and description
+            window_patterns: PatternSet, or list of pattern dictionaries with regex, score, and description
             default_score: Score to apply when no pattern matches (default: -1)
             apply_default_score_mode: Whether to apply default score when no pattern matches (default: True)
             mild_penalty_mode: Whether to apply mild penalty during specified hours (default: False)
@@ -29,8 +55,15 @@ class ScoreCalculator:
             mild_penalty_end_hour: End hour for mild penalty mode (default: 23)
             self_window_score: Score to apply when app's own window is active (default: 0)
             self_window_title: Title of app's own window (default: "")
+            match_cache_size: Maximum number of window titles whose matched pattern is
+                              remembered (default: 256, 0 disables the cache)
+            pattern_profiler: PatternProfiler recording per-pattern cost and hits, or None (default)
+            regex_guard: RegexGuard evaluating risky patterns under a time budget (safe mode),
+                         or None to evaluate every pattern in-process (default)
         """
-        self.window_patterns = window_patterns
+        self.pattern_profiler = pattern_profiler
+        self.regex_guard = regex_guard
+        self.pattern_set = self._prepare_pattern_set(window_patterns)
         self.default_score = default_score
         self.apply_default_score_mode = apply_default_score_mode
         self.mild_penalty_mode = mild_penalty_mode
@@ -38,6 +71,15 @@ class ScoreCalculator:
         self.mild_penalty_end_hour = mild_penalty_end_hour
         self.self_window_score = self_window_score
         self.self_window_title = self_window_title
+        self._self_window_match = MatchResult(SELF_WINDOW_PATTERN_ID, self_window_score, SELF_WINDOW_DESCRIPTION)
+        self._time_schedule = self._create_time_schedule()
+
+        # Title (or (title, process name)) -> matched pattern index or None; bounded LRU so titles
+        # that change every second (e.g. clocks) cannot grow it
+        self.match_cache_size = match_cache_size
+        self._match_cache = OrderedDict()
+        self.match_cache_hits = 0
+        self.match_cache_misses = 0
 
     def update_config(
         self,
@@ -53,7 +95,7 @@ class ScoreCalculator:
         """Update configuration patterns and settings.
 
         Args:
-            window_patterns: List of pattern dictionaries with regex, score, and description
+            window_patterns: PatternSet, or list of pattern dictionaries with regex, score, and description
             default_score: Score to apply when no pattern matches
             apply_default_score_mode: Whether to apply default score when no pattern matches
             mild_penalty_mode: Whether to apply mild penalty during specified hours
@@ -62,7 +104,9 @@ class ScoreCalculator:
             self_window_score: Score to apply when app's own window is active
             self_window_title: Title of app's own window
         """
-        self.window_patterns = window_patterns
+        previous_pattern_set = self.pattern_set
+        self.pattern_set = self._prepare_pattern_set(window_patterns, previous_pattern_set)
+        self._retain_cached_matches(previous_pattern_set)
         self.default_score = default_score
         self.apply_default_score_mode = apply_default_score_mode
         self.mild_penalty_mode = mild_penalty_mode
@@ -70,59 +114,265 @@ class ScoreCalculator:
         self.mild_penalty_end_hour = mild_penalty_end_hour
         self.self_window_score = self_window_score
         self.self_window_title = self_window_title
+        self._self_window_match = MatchResult(SELF_WINDOW_PATTERN_ID, self_window_score, SELF_WINDOW_DESCRIPTION)
+        self._time_schedule = self._create_time_schedule()
+
+    def _prepare_pattern_set(self, window_patterns, previous=None):
+        """Get the PatternSet used for matching, instrumented when profiling or in safe mode.
+
+        Args:
+            window_patterns: PatternSet, or list of pattern dictionaries
+            previous: Pattern set matched with before a configuration update, whose compiled
+                      regexes are reused for a pattern list, or None (default)
+
+        Returns:
+            PatternSet: Pattern set to match with
+        """
+        pattern_set = PatternSet.from_patterns(window_patterns, previous)
+        if self.pattern_profiler is not None or self.regex_guard is not None:
+            pattern_set = pattern_set.instrumented(self.pattern_profiler, self.regex_guard)
+        return pattern_set
+
+    def _retain_cached_matches(self, previous_pattern_set):
+        """Drop the cached match results that a configuration update made stale.
+
+        A cached match of a pattern before the first changed rule is still the first
+        match, and a cached "no match" stays valid only if no rule changed, so editing a
+        score or a pattern near the end keeps most of the cache.
+
+        Args:
+            previous_pattern_set: Pattern set the cached results were computed with
+        """
+        unchanged = self.pattern_set.unchanged_prefix(previous_pattern_set)
+        if unchanged == len(self.pattern_set.patterns) == len(previous_pattern_set.patterns):
+            return
+        stale = [key for key, index in self._match_cache.items() if index is None or index >= unchanged]
+        for key in stale:
+            del self._match_cache[key]
+
+    def _create_time_schedule(self):
+        """Compile the time-based rules of the current settings.
+
+        Returns:
+            TimeRuleSchedule: Schedule with the "mild_penalty" rule
+        """
+        return TimeRuleSchedule(
+            {"mild_penalty": HourRangeRule(self.mild_penalty_start_hour, self.mild_penalty_end_hour)}
+        )
 
-    def calculate_score_delta(self, window_title, is_screensaver=False, datetime_now=None):
+    def calculate_score_delta(self, window_title, is_screensaver=False, datetime_now=None, process_name=""):
         """Calculate score delta based on window title and current state.
 
         Args:
             window_title: Current active window title
             is_screensaver: Whether screensaver is currently active (default: False)
             datetime_now: Current datetime (for testing), or None to use real datetime
+            process_name: Process name of the active window for process rules,
+                          or "" if it was not acquired (default: "")
 
         Returns:
-            tuple: (score_delta, matched_pattern) where score_delta is the score change
-                   and matched_pattern is the matched pattern dict or None
+            tuple: (score_delta, match_result) where score_delta is the score change
+                   and match_result is a MatchResult (NO_MATCH if no pattern matched).
+                   Results are shared, preallocated objects.
         """
         # If screensaver is active, don't change score (score delta = 0)
         if is_screensaver:
             # Mark as matched with score 0 to prevent default_score from being applied
-            matched_pattern = {
-                "regex": "",
-                "score": 0,
-                "description": "スクリーンセーバー",
-            }
-            return 0, matched_pattern
+            return 0, SCREENSAVER_MATCH
 
         # Check if this is the app's own window
         if self.self_window_title and window_title == self.self_window_title:
             # Apply mild penalty to self window score if applicable
-            adjusted_self_window_score = self._apply_mild_penalty(self.self_window_score, datetime_now)
             # Mark as matched (even if score is 0) to prevent default_score from being applied
-            matched_pattern = {
-                "regex": "",
-                "score": self.self_window_score,
-                "description": "Cat Window Watcher (self)",
-            }
-            return adjusted_self_window_score, matched_pattern
-
-        # Check each pattern against window title
-        for pattern in self.window_patterns:
-            regex = pattern.get("regex", "")
-            score_delta = pattern.get("score", 0)
-
-            if regex and re.search(regex, window_title, re.IGNORECASE):
-                # Apply mild penalty if applicable
-                adjusted_score_delta = self._apply_mild_penalty(score_delta, datetime_now)
-                return adjusted_score_delta, pattern
+            return self._apply_mild_penalty(self.self_window_score, datetime_now), self._self_window_match
+
+        # Check each pattern against window title (first match wins)
+        result = self._match_pattern(window_title, process_name)
+        if result:
+            # Apply mild penalty after the lookup, since it depends on the current time
+            return self._apply_mild_penalty(result.score, datetime_now), result
 
         # If no pattern matched, apply default score (if mode is enabled)
         if self.apply_default_score_mode and self.default_score != 0:
             # Apply mild penalty to default score if applicable
-            adjusted_default_score = self._apply_mild_penalty(self.default_score, datetime_now)
-            return adjusted_default_score, None
+            return self._apply_mild_penalty(self.default_score, datetime_now), NO_MATCH
 
         # No match and default score mode disabled or default score is 0
-        return 0, None
+        return 0, NO_MATCH
+
+    def score_batch(self, titles, timestamps, reset_score_every_30_minutes=False):
+        """Score a history of samples in one call.
+
+        Each distinct title is matched once; the mild penalty and the 30-minute
+        reset are then applied per sample (with NumPy array operations when NumPy
+        is installed). The results are identical to calling
+        calculate_score_delta / ScoreTracker.update once per sample, with the
+        tracker created at the first sample.
+
+        Args:
+            titles: Sequence of window titles, one per update tick
+            timestamps: Sequence of datetimes (or a NumPy datetime64 array), one per title
+            reset_score_every_30_minutes: Whether the cumulative score resets to 0
+                                          when a new 30-minute slot starts
+
+        Returns:
+            tuple: (deltas, pattern_ids, scores) - score delta per sample, index of the
+                   matched pattern (NO_MATCH_PATTERN_ID or SELF_WINDOW_PATTERN_ID if none),
+                   and cumulative score after each sample. NumPy arrays if NumPy is
+                   installed, otherwise lists.
+
+        Raises:
+            ValueError: If titles and timestamps differ in length
+        """
+        if len(titles) != len(timestamps):
+            raise ValueError(f"titles and timestamps differ in length: {len(titles)} != {len(timestamps)}")
+
+        # Match each distinct title once
+        unique_ids = {}
+        inverse = [unique_ids.setdefault(title, len(unique_ids)) for title in titles]
+        unique_deltas = []
+        unique_pattern_ids = []
+        for title in unique_ids:
+            delta, pattern_id = self._base_score_delta(title)
+            unique_deltas.append(delta)
+            unique_pattern_ids.append(pattern_id)
+
+        if np is None:
+            return self._score_batch_python(
+                inverse, unique_deltas, unique_pattern_ids, timestamps, reset_score_every_30_minutes
+            )
+        if not titles:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        inverse = np.asarray(inverse, dtype=np.intp)
+        deltas = np.asarray(unique_deltas)[inverse]
+        pattern_ids = np.asarray(unique_pattern_ids, dtype=np.int64)[inverse]
+
+        hours, minutes = _hours_and_minutes(timestamps)
+        if self.mild_penalty_mode:
+            if self.mild_penalty_start_hour <= self.mild_penalty_end_hour:
+                in_hours = (hours >= self.mild_penalty_start_hour) & (hours <= self.mild_penalty_end_hour)
+            else:
+                in_hours = (hours >= self.mild_penalty_start_hour) | (hours <= self.mild_penalty_end_hour)
+            deltas = np.where(in_hours & (deltas < 0), -1, deltas)
+
+        scores = np.cumsum(deltas)
+        if reset_score_every_30_minutes:
+            slots = hours * 2 + (minutes >= 30)
+            # Subtract the running total reached just before the latest reset
+            is_reset = np.zeros(len(slots), dtype=bool)
+            is_reset[1:] = slots[1:] != slots[:-1]
+            last_reset = np.maximum.accumulate(np.where(is_reset, np.arange(len(slots)), 0))
+            scores = scores - np.where(last_reset > 0, scores[last_reset - 1], 0)
+        return deltas, pattern_ids, scores
+
+    def _score_batch_python(self, inverse, unique_deltas, unique_pattern_ids, timestamps, reset_score_every_30_minutes):
+        """Apply time rules to a batch without NumPy (see score_batch).
+
+        Returns:
+            tuple: (deltas, pattern_ids, scores) lists
+        """
+        deltas = []
+        pattern_ids = []
+        scores = []
+        score = 0
+        previous_slot = None
+        for unique_id, timestamp in zip(inverse, timestamps):
+            delta = self._apply_mild_penalty(unique_deltas[unique_id], timestamp)
+            slot = (timestamp.hour, 0 if timestamp.minute < 30 else 1)
+            if reset_score_every_30_minutes and previous_slot is not None and slot != previous_slot:
+                score = 0
+            previous_slot = slot
+            score += delta
+            deltas.append(delta)
+            pattern_ids.append(unique_pattern_ids[unique_id])
+            scores.append(score)
+        return deltas, pattern_ids, scores
+
+    def _base_score_delta(self, window_title):
+        """Get the score delta of a title before time-dependent adjustments.
+
+        Args:
+            window_title: Window title
+
+        Returns:
+            tuple: (score_delta, pattern_id) where pattern_id is the index of the matched
+                   pattern, SELF_WINDOW_PATTERN_ID or NO_MATCH_PATTERN_ID
+        """
+        if self.self_window_title and window_title == self.self_window_title:
+            return self.self_window_score, SELF_WINDOW_PATTERN_ID
+        index = self.pattern_set.match_index(window_title)
+        if index is not None:
+            return self.pattern_set.results[index].score, index
+        if self.apply_default_score_mode and self.default_score != 0:
+            return self.default_score, NO_MATCH_PATTERN_ID
+        return 0, NO_MATCH_PATTERN_ID
+
+    def _match_pattern(self, window_title, process_name=""):
+        """Find the first pattern matching a window, using the match cache.
+
+        Args:
+            window_title: Window title to match
+            process_name: Process name of the window, or "" if unknown (default: "")
+
+        Returns:
+            MatchResult: Result of the matched pattern, or NO_MATCH if no pattern matches
+        """
+        if self.match_cache_size <= 0:
+            index = self.pattern_set.match_index(window_title, process_name)
+            return self._match_result(index)
+
+        # The process name only affects the result when there are process rules
+        key = (window_title, process_name) if self.pattern_set.needs_process_name else window_title
+        index = self._match_cache.get(key, _NOT_CACHED)
+        if index is not _NOT_CACHED:
+            self.match_cache_hits += 1
+            self._match_cache.move_to_end(key)
+        else:
+            self.match_cache_misses += 1
+            index = self.pattern_set.match_index(window_title, process_name)
+            self._match_cache[key] = index
+            if len(self._match_cache) > self.match_cache_size:
+                self._match_cache.popitem(last=False)
+        return self._match_result(index)
+
+    def _match_result(self, index):
+        """Get the match result of a pattern index, recording the hit when profiling.
+
+        Args:
+            index: Index of the matched pattern, or None
+
+        Returns:
+            MatchResult: Preallocated result of the pattern, or NO_MATCH
+        """
+        if index is None:
+            return NO_MATCH
+        if self.pattern_profiler is not None:
+            self.pattern_profiler.record_hit(self.pattern_set.patterns[index])
+        return self.pattern_set.results[index]
+
+    def get_match_cache_stats(self):
+        """Get match cache statistics.
+
+        Returns:
+            dict: hits, misses, size (current entries) and max_size
+        """
+        return {
+            "hits": self.match_cache_hits,
+            "misses": self.match_cache_misses,
+            "size": len(self._match_cache),
+            "max_size": self.match_cache_size,
+        }
+
+    def get_quarantined_patterns(self):
+        """Get window patterns quarantined for exceeding the safe mode time budget.
+
+        Returns:
+            list: (description, regex, reason) tuples (empty when safe mode is off)
+        """
+        if self.regex_guard is None:
+            return []
+        return self.regex_guard.get_quarantined()
 
     def _is_in_mild_penalty_hours(self, datetime_now=None):
         """Check if current time is within mild penalty hours.
@@ -142,15 +392,8 @@ class ScoreCalculator:
 
             datetime_now = datetime.now()
 
-        current_hour = datetime_now.hour
-
-        # Handle time range that wraps around midnight
-        if self.mild_penalty_start_hour <= self.mild_penalty_end_hour:
-            # Normal range (e.g., 22:00-23:59)
-            return self.mild_penalty_start_hour <= current_hour <= self.mild_penalty_end_hour
-        else:
-            # Wrapped range (e.g., 23:00-01:00)
-            return current_hour >= self.mild_penalty_start_hour or current_hour <= self.mild_penalty_end_hour
+        # Cached until the next hour boundary; wrapped ranges (e.g., 23:00-01:00) are handled by the rule
+        return self._time_schedule.get("mild_penalty", datetime_now)
 
     def _apply_mild_penalty(self, score_delta, datetime_now=None):
         """Apply mild penalty if conditions are met.
@@ -165,3 +408,23 @@ class ScoreCalculator:
         if self._is_in_mild_penalty_hours(datetime_now) and score_delta < 0:
             return -1
         return score_delta
+
+
+def _hours_and_minutes(timestamps):
+    """Get the wall-clock hour and minute of each timestamp as NumPy arrays.
+
+    Args:
+        timestamps: NumPy datetime64 array, or sequence of datetimes
+
+    Returns:
+        tuple: (hours, minutes) int64 arrays
+    """
+    if isinstance(timestamps, np.ndarray) and np.issubdtype(timestamps.dtype, np.datetime64):
+        hours = (timestamps.astype("datetime64[h]") - timestamps.astype("datetime64[D]")).astype(np.int64)
+        minutes = (timestamps.astype("datetime64[m]") - timestamps.astype("datetime64[h]")).astype(np.int64)
+        return hours, minutes
+    # Converting datetime objects to datetime64 is much slower than reading the fields
+    count = len(timestamps)
+    hours = np.fromiter((timestamp.hour for timestamp in timestamps), dtype=np.int64, count=count)
+    minutes = np.fromiter((timestamp.minute for timestamp in timestamps), dtype=np.int64, count=count)
+    return hours, minutes
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """Score tracking module for cat-window-watcher."""
 
+from collections import deque
 from datetime import datetime
 
 try:
     from .flow_state_manager import FlowStateManager
+    from .match_result import NO_MATCH
     from .score_calculator import ScoreCalculator
+    from .time_rule_schedule import SlotRule, TimeRuleSchedule
 except ImportError:
     from flow_state_manager import FlowStateManager
+    from match_result import NO_MATCH
     from score_calculator import ScoreCalculator
+    from time_rule_schedule import SlotRule, TimeRuleSchedule
 
 
 class ScoreTracker:
@@ -25,11 +30,14 @@ class ScoreTracker:
         reset_score_every_30_minutes=False,
         self_window_score=0,
         self_window_title="",
+        clock=None,
+        pattern_profiler=None,
+        regex_guard=None,
     ):
         """Initialize score tracker.
 
         Args:
-            window_patterns: List of pattern dictionaries with regex, score, and description
+            window_patterns: PatternSet, or list of pattern dictionaries with regex, score, and description
             default_score: Score to apply when no pattern matches (default: -1)
             apply_default_score_mode: Whether to apply default score when no pattern matches (default: True)
             mild_penalty_mode: Whether to apply mild penalty during specified hours (default: False)
@@ -38,7 +46,14 @@ class ScoreTracker:
             reset_score_every_30_minutes: Whether to reset score every 30 minutes (default: False)
             self_window_score: Score to apply when app's own window is active (default: 0)
             self_window_title: Title of app's own window (default: "")
+            clock: Callable returning the current datetime, or None to use datetime.now()
+                   (e.g. a virtual clock for replaying recorded sessions)
+            pattern_profiler: PatternProfiler recording per-pattern match cost and hits,
+                              or None to disable profiling (default)
+            regex_guard: RegexGuard for ReDoS-safe matching, or None (default)
         """
+        self.clock = clock
+
         # Initialize calculator and flow state manager
         self.calculator = ScoreCalculator(
             window_patterns,
@@ -49,6 +64,8 @@ class ScoreTracker:
             mild_penalty_end_hour,
             self_window_score,
             self_window_title,
+            pattern_profiler=pattern_profiler,
+            regex_guard=regex_guard,
         )
         self.flow_manager = FlowStateManager()
 
@@ -59,9 +76,13 @@ class ScoreTracker:
         # Score tracking state
         self.score = 0
         self.last_window_title = ""
-        self.current_match = None
+        self.current_match = NO_MATCH
+        self._time_schedule = TimeRuleSchedule({"reset_slot": SlotRule(30)})
         self._last_reset_time_slot = self._get_current_time_slot() if reset_score_every_30_minutes else None
-        self._current_window_start_time = datetime.now()  # Track when current window became active
+        self._current_window_start_time = self._now()  # Track when current window became active
+        self._pending_focus_events = deque()  # Timestamped focus events pushed from another thread
+        self._last_update_time = None  # Start of the interval covered by the next update()
+        self._score_remainder = 0.0  # Fraction of a point carried over from time-weighted updates
 
     def update_config(
         self,
@@ -78,7 +99,7 @@ class ScoreTracker:
         """Update configuration patterns and settings.
 
         Args:
-            window_patterns: List of pattern dictionaries with regex, score, and description
+            window_patterns: PatternSet, or list of pattern dictionaries with regex, score, and description
             default_score: Score to apply when no pattern matches
             apply_default_score_mode: Whether to apply default score when no pattern matches
             mild_penalty_mode: Whether to apply mild penalty during specified hours
@@ -108,57 +129,145 @@ class ScoreTracker:
         if reset_score_every_30_minutes and self._last_reset_time_slot is None:
             self._last_reset_time_slot = self._get_current_time_slot()
 
-    def _get_current_time_slot(self):
+    def _now(self):
+        """Get the current time from the injected clock or the system clock.
+
+        Returns:
+            datetime: Current time
+        """
+        if self.clock is not None:
+            return self.clock()
+        return datetime.now()
+
+    def _get_current_time_slot(self, now=None):
         """Get the current 30-minute time slot as a tuple (hour, half).
 
+        Args:
+            now: Current datetime, or None to read the clock
+
         Returns:
             tuple: (hour, half) where hour is 0-23 and half is 0 (for :00-:29) or 1 (for :30-:59)
         """
-        now = datetime.now()
-        hour = now.hour
-        half = 0 if now.minute < 30 else 1
-        return (hour, half)
+        if now is None:
+            now = self._now()
+        # Cached until the next :00/:30 boundary
+        return self._time_schedule.get("reset_slot", now)
+
+    def _check_and_reset_if_needed(self, now=None):
+        """Check if we've entered a new 30-minute time slot and reset score if needed.
 
-    def _check_and_reset_if_needed(self):
-        """Check if we've entered a new 30-minute time slot and reset score if needed."""
+        Args:
+            now: Current datetime, or None to read the clock
+        """
         if not self.reset_score_every_30_minutes:
             return
 
-        current_time_slot = self._get_current_time_slot()
+        current_time_slot = self._get_current_time_slot(now)
 
         # If time slot has changed, reset the score
         if self._last_reset_time_slot != current_time_slot:
             self.score = 0
+            self._score_remainder = 0.0
             self._last_reset_time_slot = current_time_slot
 
-    def update(self, window_title, is_screensaver=False):
+    def record_focus_event(self, window_title, timestamp):
+        """Record a focus change pushed by an event source.
+
+        This is safe to call from a background thread; events are applied in order
+        on the next update() call, so the window start time reflects the actual
+        moment of the focus change rather than the next polling tick, and each
+        window focused since the previous update is scored for its share of the
+        interval.
+
+        Args:
+            window_title: Title of the newly focused window
+            timestamp: datetime when the focus change happened
+        """
+        self._pending_focus_events.append((window_title, timestamp))
+
+    def _apply_pending_focus_events(self, now):
+        """Apply focus events recorded since the last update.
+
+        Args:
+            now: Time of this update
+
+        Returns:
+            list: (window title, share of the interval) for each window focused before
+                  the last focus change of the interval, in order; empty if there
+                  were no focus changes (the sampled window then covers the interval)
+        """
+        interval_start = self._last_update_time
+        self._last_update_time = now
+        segments = []
+        if interval_start is not None and now > interval_start:
+            interval = (now - interval_start).total_seconds()
+            since = interval_start
+        else:
+            # First update or a clock jump - the timestamps cannot be placed in the interval
+            interval = None
+        while self._pending_focus_events:
+            window_title, timestamp = self._pending_focus_events.popleft()
+            if window_title == self.last_window_title:
+                continue
+            if interval is not None:
+                changed_at = min(max(timestamp, since), now)
+                segments.append((self.last_window_title, (changed_at - since).total_seconds() / interval))
+                since = changed_at
+            self.last_window_title = window_title
+            self._current_window_start_time = timestamp
+        return segments
+
+    def update(self, window_title, is_screensaver=False, elapsed_ticks=1, process_name=""):
         """Update score based on current window title.
 
         Args:
             window_title: Current active window title
             is_screensaver: Whether screensaver is currently active (default: False)
+            elapsed_ticks: Number of base update ticks covered by this update (default: 1).
+                           The per-tick score delta of this window is applied this many
+                           times, so a window change during the interval is charged in
+                           full to the new window.
+            process_name: Process name of the active window for process rules,
+                          or "" if it was not acquired (default: "")
 
         Returns:
             tuple: (score_changed, current_match) where score_changed is bool
-                   and current_match is the matched pattern dict or None
+                   and current_match is the MatchResult (NO_MATCH if nothing matched)
         """
+        # Read the clock once per update
+        now = self._now()
+
         # Check if we need to reset score due to 30-minute time slot change
-        self._check_and_reset_if_needed()
+        self._check_and_reset_if_needed(now)
 
         score_changed = False
         previous_score = self.score
 
+        # Apply focus changes that happened between ticks
+        visited = self._apply_pending_focus_events(now)
+
         # Track window change - reset start time when window title changes
         if self.last_window_title != window_title:
-            self._current_window_start_time = datetime.now()
+            self._current_window_start_time = now
 
         # Update last window title
         self.last_window_title = window_title
 
         # Calculate score delta and get matched pattern
         score_delta, self.current_match = self.calculator.calculate_score_delta(
-            window_title, is_screensaver, datetime.now()
+            window_title, is_screensaver, now, process_name
         )
+        if visited:
+            # Weight each window focused during the interval by its share of the time;
+            # the sampled window covers the rest (fractions of a point carry over)
+            weighted = score_delta * (1.0 - sum(share for _, share in visited))
+            for title, share in visited:
+                weighted += self.calculator.calculate_score_delta(title, datetime_now=now)[0] * share
+            weighted = weighted * elapsed_ticks + self._score_remainder
+            score_delta = round(weighted)
+            self._score_remainder = weighted - score_delta
+        else:
+            score_delta *= elapsed_ticks
 
         # Apply score change
         if score_delta != 0:
@@ -166,17 +275,34 @@ class ScoreTracker:
             score_changed = True
 
         # Update flow state tracking
-        self.flow_manager.update_flow_state(self.score, previous_score, datetime.now())
+        self.flow_manager.update_flow_state(self.score, previous_score, now)
 
         return score_changed, self.current_match
 
+    def update_from_snapshot(self, snapshot, elapsed_ticks=1):
+        """Update score based on a window snapshot.
+
+        Args:
+            snapshot: WindowSnapshot acquired for the current tick
+            elapsed_ticks: Number of base update ticks covered by this update (default: 1)
+
+        Returns:
+            tuple: (score_changed, current_match) as returned by update()
+        """
+        return self.update(
+            snapshot.title,
+            is_screensaver=snapshot.is_idle,
+            elapsed_ticks=elapsed_ticks,
+            process_name=snapshot.process_name,
+        )
+
     def get_flow_state_duration(self):
         """Get duration in seconds that we've been in score-up state.
 
         Returns:
             float: Duration in seconds, or 0 if not in score-up state
         """
-        return self.flow_manager.get_flow_state_duration(datetime.now())
+        return self.flow_manager.get_flow_state_duration(self._now())
 
     def is_in_flow_state(self):
         """Check if currently in score-up state.
@@ -194,6 +320,22 @@ class ScoreTracker:
         """
         return self.flow_manager.is_score_decreasing()
 
+    def get_match_cache_stats(self):
+        """Get statistics of the title match cache.
+
+        Returns:
+            dict: hits, misses, size and max_size of the calculator's match cache
+        """
+        return self.calculator.get_match_cache_stats()
+
+    def get_quarantined_patterns(self):
+        """Get window patterns quarantined for exceeding the safe mode time budget.
+
+        Returns:
+            list: (description, regex, reason) tuples
+        """
+        return self.calculator.get_quarantined_patterns()
+
     def get_score(self):
         """Get current score.
 
@@ -207,10 +349,10 @@ class ScoreTracker:
         self.score = 0
 
     def get_current_match(self):
-        """Get current matched pattern.
+        """Get current match result.
 
         Returns:
-            dict: Current matched pattern or None
+            MatchResult: Result of the latest update (NO_MATCH if nothing matched)
         """
         return self.current_match
 
@@ -222,7 +364,7 @@ class ScoreTracker:
         """
         if self._current_window_start_time is None:
             return 0
-        elapsed = (datetime.now() - self._current_window_start_time).total_seconds()
+        elapsed = (self._now() - self._current_window_start_time).total_seconds()
         return int(elapsed)
 
     def get_flow_mode_elapsed_seconds(self):
@@ -231,4 +373,4 @@ class ScoreTracker:
         Returns:
             int: Elapsed seconds since flow mode started, or 0 if not in flow state
         """
-        return self.flow_manager.get_flow_mode_elapsed_seconds(datetime.now())
+        return self.flow_manager.get_flow_mode_elapsed_seconds(self._now())
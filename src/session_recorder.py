@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Session recorder module for cat-window-watcher.
+
+Records every sampled WindowSnapshot to a compact, append-only binary log so
+real focus traces can be replayed to tune rules and benchmark matching.
+
+Log format:
+    - File header: MAGIC
+    - Records, each starting with a one-byte tag:
+        - TAG_SESSION <varint epoch ms>: a new recording session starts; the string
+          dictionary is reset and following timestamps are relative to this one
+        - TAG_STRING <varint length> <UTF-8 bytes>: defines the next string id
+          (ids count up from 0 within a session)
+        - TAG_SAMPLE / TAG_SAMPLE_IDLE <varint ms since previous> <varint title id>
+          <varint process id>: one snapshot (the tag carries the idle flag)
+
+All integers are unsigned LEB128 varints, so a repeated title costs a few bytes.
+"""
+
+import atexit
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from .window_monitor import WindowMonitor
+    from .window_snapshot import WindowSnapshot
+except ImportError:
+    from window_monitor import WindowMonitor
+    from window_snapshot import WindowSnapshot
+
+MAGIC = b"CWWSLOG1"
+
+TAG_SESSION = 0x01
+TAG_STRING = 0x02
+TAG_SAMPLE = 0x03
+TAG_SAMPLE_IDLE = 0x04
+
+# Default seconds between buffer flushes
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def encode_varint(value, out):
+    """Append an unsigned LEB128 varint to a bytearray.
+
+    Args:
+        value: Non-negative integer
+        out: bytearray to append to
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(stream):
+    """Read an unsigned LEB128 varint.
+
+    Args:
+        stream: Binary input stream
+
+    Returns:
+        int: Decoded value, or None at end of stream (including a truncated varint)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            return None
+        value = byte[0]
+        result |= (value & 0x7F) << shift
+        if value < 0x80:
+            return result
+        shift += 7
+
+
+def _read_records(stream, path):
+    """Read the complete records of a session log, after the header.
+
+    Args:
+        stream: Binary input stream positioned after MAGIC
+        path: Log file path (for error messages)
+
+    Yields:
+        tuple: (tag, value) where value is (delta ms, title id, process id) for
+        samples, the decoded string for TAG_STRING and epoch ms for TAG_SESSION.
+        The stream is positioned right after the record. A truncated final record
+        ends the stream.
+
+    Raises:
+        ValueError: If the log contains an unknown record
+    """
+    while True:
+        tag = stream.read(1)
+        if not tag:
+            return
+        tag = tag[0]
+        if tag == TAG_SAMPLE or tag == TAG_SAMPLE_IDLE:
+            delta_ms = _read_varint(stream)
+            title_id = _read_varint(stream)
+            process_id = _read_varint(stream)
+            if process_id is None:
+                return
+            yield tag, (delta_ms, title_id, process_id)
+        elif tag == TAG_STRING:
+            length = _read_varint(stream)
+            if length is None:
+                return
+            data = stream.read(length)
+            if len(data) < length:
+                return
+            yield tag, data.decode("utf-8", "replace")
+        elif tag == TAG_SESSION:
+            session_ms = _read_varint(stream)
+            if session_ms is None:
+                return
+            yield tag, session_ms
+        else:
+            raise ValueError(f"Unknown record tag {tag:#x} in '{path}'")
+
+
+def _complete_length(path):
+    """Get the length of a session log up to the end of its last complete record.
+
+    Args:
+        path: Log file path
+
+    Returns:
+        int: Length in bytes (0 for an empty file)
+
+    Raises:
+        ValueError: If the file is not a session log or contains an unknown record
+    """
+    with open(path, "rb") as stream:
+        header = stream.read(len(MAGIC))
+        if not header:
+            return 0
+        if header != MAGIC:
+            raise ValueError(f"'{path}' is not a session log")
+        length = stream.tell()
+        for _ in _read_records(stream, path):
+            length = stream.tell()
+        return length
+
+
+class SessionRecorder:
+    """Append WindowSnapshots to a dictionary-encoded binary log.
+
+    Records are buffered and written every flush_interval seconds by a background
+    timer, so a quiet session still reaches the file.
+    """
+
+    def __init__(self, path, flush_interval=DEFAULT_FLUSH_INTERVAL, clock=time.monotonic):
+        """Initialize session recorder and start a new session in the log.
+
+        Args:
+            path: Log file path (created if missing, appended to otherwise; a
+                  truncated final record left by a crash is cut off first)
+            flush_interval: Seconds between buffer flushes (0 = flush only on record
+                            and close, without the background timer)
+            clock: Monotonic clock function (for testing)
+
+        Raises:
+            ValueError: If the file exists but is not a session log
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.clock = clock
+        length = _complete_length(path) if Path(path).exists() else 0
+        self._file = open(path, "ab")
+        # Appending after a partial record would misalign every following record
+        self._file.truncate(length)
+
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        if not length:
+            self._buffer += MAGIC
+        self._strings = {}
+        self._last_ms = int(time.time() * 1000)
+        self._buffer.append(TAG_SESSION)
+        encode_varint(self._last_ms, self._buffer)
+
+        self._next_flush = clock() + flush_interval
+        atexit.register(self.close)
+
+        self._closed = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(target=self._flush_loop, name="session-recorder-flush", daemon=True).start()
+
+    def _flush_loop(self):
+        """Flush the buffer every flush_interval seconds until the recorder is closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def _string_id(self, value):
+        """Get the id of a string, defining it in the log on first use.
+
+        Args:
+            value: String to encode
+
+        Returns:
+            int: String id
+        """
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+            data = value.encode("utf-8")
+            self._buffer.append(TAG_STRING)
+            encode_varint(len(data), self._buffer)
+            self._buffer += data
+        return string_id
+
+    def record(self, snapshot):
+        """Append a snapshot to the log buffer.
+
+        Args:
+            snapshot: WindowSnapshot to record
+        """
+        if self._file is None:
+            return
+        timestamp = snapshot.timestamp
+        now_ms = int(timestamp.timestamp() * 1000) if timestamp is not None else int(time.time() * 1000)
+        with self._lock:
+            if now_ms < self._last_ms:
+                # Clock went backwards - start a new session so deltas stay non-negative
+                self._strings.clear()
+                self._buffer.append(TAG_SESSION)
+                encode_varint(now_ms, self._buffer)
+                self._last_ms = now_ms
+
+            title_id = self._string_id(snapshot.title)
+            process_id = self._string_id(snapshot.process_name)
+            buffer = self._buffer
+            buffer.append(TAG_SAMPLE_IDLE if snapshot.is_idle else TAG_SAMPLE)
+            encode_varint(now_ms - self._last_ms, buffer)
+            encode_varint(title_id, buffer)
+            encode_varint(process_id, buffer)
+            self._last_ms = now_ms
+
+        if self.clock() >= self._next_flush:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the log file."""
+        with self._lock:
+            self._next_flush = self.clock() + self.flush_interval
+            if self._file is None or not self._buffer:
+                return
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+
+    def close(self):
+        """Flush and close the log file."""
+        if self._file is None:
+            return
+        self._closed.set()
+        self.flush()
+        with self._lock:
+            self._file.close()
+            self._file = None
+        atexit.unregister(self.close)
+
+
+def read_session_log(path):
+    """Stream the snapshots stored in a session log.
+
+    Records are decoded one at a time, so arbitrarily long logs can be read
+    without loading them into memory. A truncated final record (e.g. after a
+    crash) ends the stream.
+
+    Args:
+        path: Log file path
+
+    Yields:
+        WindowSnapshot: Recorded snapshots (pid is not recorded and is None)
+
+    Raises:
+        ValueError: If the file is not a session log or contains an unknown record
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a session log")
+
+        strings = []
+        last_ms = 0
+        for tag, value in _read_records(stream, path):
+            if tag == TAG_STRING:
+                strings.append(value)
+            elif tag == TAG_SESSION:
+                strings = []
+                last_ms = value
+            else:
+                delta_ms, title_id, process_id = value
+                last_ms += delta_ms
+                yield WindowSnapshot(
+                    strings[title_id],
+                    strings[process_id],
+                    None,
+                    tag == TAG_SAMPLE_IDLE,
+                    datetime.fromtimestamp(last_ms / 1000),
+                )
+
+
+class RecordingWindowMonitor(WindowMonitor):
+    """WindowMonitor that tees every sampled snapshot to a SessionRecorder."""
+
+    def __init__(self, recorder, idle_threshold_seconds=0):
+        """Initialize recording window monitor.
+
+        Args:
+            recorder: SessionRecorder receiving every snapshot
+            idle_threshold_seconds: See WindowMonitor
+        """
+        super().__init__(idle_threshold_seconds)
+        self.recorder = recorder
+
+    def sample(self, include_process=False, debug=False, window_title=None):
+        """Acquire a snapshot (see WindowMonitor.sample) and record it.
+
+        Returns:
+            WindowSnapshot: Snapshot of the active window
+        """
+        snapshot = super().sample(include_process=include_process, debug=debug, window_title=window_title)
+        self.recorder.record(snapshot)
+        return snapshot
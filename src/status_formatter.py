@@ -9,11 +9,11 @@ class StatusFormatter:
     """Formatter for status text display."""
 
     @staticmethod
-    def format_status_text(matched_pattern, window_title, default_score, elapsed_seconds=0, flow_mode_seconds=0):
+    def format_status_text(match_result, window_title, default_score, elapsed_seconds=0, flow_mode_seconds=0):
         """Generate status text based on pattern match and window title.
 
         Args:
-            matched_pattern: Matched pattern dict with 'description' and 'score', or None
+            match_result: MatchResult of the current tick (NO_MATCH or None if nothing matched)
             window_title: Current window title string
             default_score: Default score value when no pattern matches
             elapsed_seconds: Elapsed seconds since current window became active (default: 0)
@@ -30,11 +30,10 @@ class StatusFormatter:
         else:
             elapsed_text = ""
 
-        if matched_pattern:
-            description = matched_pattern.get("description", "")
-            score_delta = matched_pattern.get("score", 0)
+        if match_result:
+            score_delta = match_result.score
             score_sign = "+" if score_delta >= 0 else ""
-            return f"{description} ({score_sign}{score_delta}){elapsed_text}"
+            return f"{match_result.description} ({score_sign}{score_delta}){elapsed_text}"
         else:
             # No match - always show window title to help users configure patterns
             # Show truncated window title
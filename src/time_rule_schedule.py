@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Time rule schedule module for cat-window-watcher.
+
+Time-based rules (mild penalty hours, 30-minute score resets, ...) only change
+their value at a few wall-clock instants per day. TimeRuleSchedule compiles
+those boundary instants into a sorted list and caches the rule values until
+the next boundary, so checking the rules on every tick is a single comparison
+of the current time against the cached validity range.
+
+All times are naive local datetimes, like ``datetime.now()``. A timezone-aware
+time is evaluated by its wall-clock time in its own timezone, as the rules
+would read it directly (``moment.hour``). Values are
+recomputed whenever the current time leaves the cached range in either
+direction, so DST transitions and manual clock changes (forward or backward)
+always give the same result as evaluating the rules directly.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+# How many days of boundaries are compiled at once
+_COMPILE_DAYS = 2
+
+
+def _wall_clock(now):
+    """Get the naive wall-clock time of a datetime.
+
+    Args:
+        now: Naive or timezone-aware datetime
+
+    Returns:
+        datetime: now without its tzinfo (same hour and minute)
+    """
+    if now.tzinfo is None:
+        return now
+    return now.replace(tzinfo=None)
+
+
+class HourRangeRule:
+    """True during an inclusive range of wall-clock hours, optionally on given weekdays only.
+
+    A range whose start hour is after its end hour wraps around midnight
+    (e.g. 23-1 covers 23:00-01:59).
+    """
+
+    def __init__(self, start_hour, end_hour, weekdays=None):
+        """Initialize hour range rule.
+
+        Args:
+            start_hour: First hour of the range (0-23)
+            end_hour: Last hour of the range (0-23, inclusive)
+            weekdays: Collection of weekdays (0=Monday ... 6=Sunday) on which the rule
+                      applies, or None for every day. For wrapped ranges the weekday of
+                      each hour counts (e.g. Friday 23-1 covers Saturday 00:00-01:59 only
+                      if Saturday is included).
+        """
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+        self.weekdays = frozenset(weekdays) if weekdays is not None else None
+
+    def value(self, moment):
+        """Evaluate the rule at a point in time.
+
+        Args:
+            moment: datetime to evaluate
+
+        Returns:
+            bool: True if the moment is within the hour range
+        """
+        if self.weekdays is not None and moment.weekday() not in self.weekdays:
+            return False
+        hour = moment.hour
+        if self.start_hour <= self.end_hour:
+            return self.start_hour <= hour <= self.end_hour
+        return hour >= self.start_hour or hour <= self.end_hour
+
+    def boundaries(self, day):
+        """Get the instants of a day at which the rule value may change.
+
+        Args:
+            day: datetime at midnight of the day
+
+        Returns:
+            list: datetimes within the day
+        """
+        hours = {self.start_hour, (self.end_hour + 1) % 24}
+        if self.weekdays is not None:
+            hours.add(0)
+        return [day + timedelta(hours=hour) for hour in hours]
+
+
+class SlotRule:
+    """Identifies the current fixed-length slot of the hour, e.g. (hour, half) for 30 minutes."""
+
+    def __init__(self, minutes=30):
+        """Initialize slot rule.
+
+        Args:
+            minutes: Slot length in minutes (must divide 60)
+        """
+        self.minutes = minutes
+
+    def value(self, moment):
+        """Evaluate the rule at a point in time.
+
+        Args:
+            moment: datetime to evaluate
+
+        Returns:
+            tuple: (hour, slot index within the hour)
+        """
+        return (moment.hour, moment.minute // self.minutes)
+
+    def boundaries(self, day):
+        """Get the instants of a day at which the slot changes.
+
+        Args:
+            day: datetime at midnight of the day
+
+        Returns:
+            list: datetimes within the day
+        """
+        return [day + timedelta(minutes=minute) for minute in range(0, 24 * 60, self.minutes)]
+
+
+class TimeRuleSchedule:
+    """Cache of named time rule values, recomputed only when a boundary passes."""
+
+    def __init__(self, rules):
+        """Initialize schedule.
+
+        Args:
+            rules: Dictionary of rule name to rule (objects with value(moment) and
+                   boundaries(day) methods, such as HourRangeRule and SlotRule)
+        """
+        self.rules = dict(rules)
+        self._boundaries = []
+        self._values = {}
+        # Values are valid for valid_from <= now < valid_until
+        self._valid_from = datetime.max
+        self._valid_until = datetime.min
+        self.recompute_count = 0
+
+    def get(self, name, now):
+        """Get the value of a rule.
+
+        Args:
+            name: Rule name
+            now: Current datetime (naive local time or timezone-aware)
+
+        Returns:
+            object: Rule value at now
+        """
+        now = _wall_clock(now)
+        if not self._valid_from <= now < self._valid_until:
+            self._recompute(now)
+        return self._values[name]
+
+    def values(self, now):
+        """Get the values of all rules.
+
+        Args:
+            now: Current datetime (naive local time or timezone-aware)
+
+        Returns:
+            dict: Rule name to value at now
+        """
+        now = _wall_clock(now)
+        if not self._valid_from <= now < self._valid_until:
+            self._recompute(now)
+        return self._values
+
+    def _recompute(self, now):
+        """Evaluate all rules and find the surrounding boundaries.
+
+        Args:
+            now: Current datetime
+        """
+        self.recompute_count += 1
+        index = bisect_right(self._boundaries, now)
+        if index == 0 or index == len(self._boundaries):
+            # Outside the compiled days (first use, date change or a clock jump)
+            self._boundaries = self._compile(now)
+            index = bisect_right(self._boundaries, now)
+        self._valid_from = self._boundaries[index - 1]
+        self._valid_until = self._boundaries[index]
+        self._values = {name: rule.value(now) for name, rule in self.rules.items()}
+
+    def _compile(self, now):
+        """Build the sorted boundary list around a point in time.
+
+        Args:
+            now: Current datetime
+
+        Returns:
+            list: Sorted boundary datetimes, starting at midnight of the current day
+                  and ending at midnight after the compiled days
+        """
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        boundaries = set()
+        for offset in range(_COMPILE_DAYS):
+            day = today + timedelta(days=offset)
+            boundaries.add(day)
+            for rule in self.rules.values():
+                boundaries.update(rule.boundaries(day))
+        boundaries.add(today + timedelta(days=_COMPILE_DAYS))
+        return sorted(boundaries)
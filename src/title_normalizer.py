@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Window title normalization module for cat-window-watcher.
+
+Window patterns are normally searched with ``re.IGNORECASE`` in the raw
+title, so every regex folds case again on every search, and browser titles
+with full-width characters or a " - Google Chrome" suffix need patterns that
+allow for them. With title normalization enabled, a title is normalized once
+before matching (NFKC, casefold, configured suffixes stripped, length capped)
+and every rule of the PatternSet sees the same normalized text.
+
+Regexes are folded the same way when the PatternSet is compiled, so they can
+be searched case-sensitively. A regex that cannot be folded without changing
+its meaning (escapes such as ``\\x41`` or ``\\N{...}``, characters that fold
+to several characters or to regex syntax, class ranges such as ``[A-z]`` that
+span letters and other characters) keeps ``re.IGNORECASE``.
+"""
+
+import unicodedata
+from collections import OrderedDict
+
+# Escapes that denote a character by its code or name, which folding the text cannot see
+_CODED_ESCAPES = frozenset("0xuUN")
+
+# Characters with a meaning in regex syntax, which folding must not create or remove
+_SYNTAX = frozenset("\\.^$*+?{}[]()|-,:<>=!#&~")
+
+# Default maximum length of a normalized title
+DEFAULT_MAX_LENGTH = 1024
+
+# Default number of distinct raw titles whose normalized form is remembered
+DEFAULT_CACHE_SIZE = 256
+
+
+def fold_text(text):
+    """Apply NFKC normalization and case folding.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        str: Folded text
+    """
+    if text.isascii():
+        # ASCII is unchanged by NFKC
+        return text.lower()
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _is_foldable_range(low, high):
+    """Check whether lowercasing the endpoints of a class range keeps its meaning on folded text.
+
+    Args:
+        low: First character of the range
+        high: Last character of the range
+
+    Returns:
+        bool: True for ranges within A-Z, within a-z, or without any letter
+    """
+    if not (low.isascii() and high.isascii()):
+        return False
+    if ("A" <= low and high <= "Z") or ("a" <= low and high <= "z"):
+        return True
+    # e.g. [A-z] also contains [\]^_`, which lowercasing to [a-z] would drop
+    return high < "A" or low > "z" or ("Z" < low and high < "a")
+
+
+def _classes_are_foldable(regex):
+    """Check every range in the character classes of a regex with _is_foldable_range.
+
+    Args:
+        regex: Regular expression string
+
+    Returns:
+        bool: False if some class range would change its meaning when lowercased
+    """
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            index += 2
+            continue
+        index += 1
+        if char != "[":
+            continue
+        if regex[index : index + 1] == "^":
+            index += 1
+        items = []
+        first = True
+        while index < len(regex) and (regex[index] != "]" or first):
+            first = False
+            if regex[index] == "\\":
+                items.append(regex[index : index + 2])
+                index += 2
+            else:
+                items.append(regex[index])
+                index += 1
+        index += 1
+        for position in range(1, len(items) - 1):
+            # An escaped endpoint such as \] stands for the character after the backslash
+            if items[position] == "-" and not _is_foldable_range(items[position - 1][-1:], items[position + 1][-1:]):
+                return False
+    return True
+
+
+def fold_regex(regex):
+    """Fold the literal text of a regex so it can match folded titles case-sensitively.
+
+    Args:
+        regex: Regular expression string written for re.IGNORECASE matching
+
+    Returns:
+        str: Folded regex, or None if the regex cannot be folded safely
+    """
+    if "[" in regex and not _classes_are_foldable(regex):
+        return None
+    if regex.isascii() and "\\" not in regex:
+        return regex.lower()
+    parts = []
+    run_start = 0
+    index = 0
+    while index <= len(regex):
+        if index < len(regex) and regex[index] != "\\":
+            index += 1
+            continue
+        run = regex[run_start:index]
+        if not run.isascii():
+            for position, char in enumerate(run):
+                # "ß" folds to "ss", which is only the same inside a plain literal
+                if not char.isascii() and len(fold_text(char)) != 1:
+                    if "[" in regex or run[position + 1 : position + 2] in ("*", "+", "?", "{"):
+                        return None
+            folded = fold_text(run)
+            if [char for char in run if char in _SYNTAX] != [char for char in folded if char in _SYNTAX]:
+                return None
+            run = folded
+        else:
+            run = run.lower()
+        parts.append(run)
+        if index == len(regex):
+            break
+        escaped = regex[index + 1 : index + 2]
+        if escaped in _CODED_ESCAPES or not escaped.isascii():
+            return None
+        # Escapes are case-sensitive (\S is not \s), so they are kept as they are
+        parts.append(regex[index : index + 2])
+        index += 2
+        run_start = index
+    return "".join(parts)
+
+
+class TitleNormalizer:
+    """Normalizes window titles before they are matched against window patterns."""
+
+    __slots__ = ("strip_suffixes", "max_length", "cache_size", "_cache")
+
+    def __init__(self, strip_suffixes=(), max_length=DEFAULT_MAX_LENGTH, cache_size=DEFAULT_CACHE_SIZE):
+        """Initialize title normalizer.
+
+        Args:
+            strip_suffixes: Title suffixes to remove, e.g. " - Google Chrome" (compared
+                            after folding; the first one that matches is removed)
+            max_length: Maximum length of a normalized title (0 = unlimited, default: 1024)
+            cache_size: Maximum number of distinct raw titles whose normalized form is
+                        remembered, least recently used first out (0 = disabled, default: 256)
+        """
+        self.strip_suffixes = tuple(folded for folded in (fold_text(suffix) for suffix in strip_suffixes) if folded)
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # raw title -> normalized title
+
+    def normalize(self, window_title):
+        """Normalize a window title.
+
+        Results are remembered per distinct raw title, since the user switches
+        between a handful of windows.
+
+        Args:
+            window_title: Raw window title
+
+        Returns:
+            str: Folded title without the configured suffix, at most max_length characters
+        """
+        cached = self._cache.get(window_title)
+        if cached is not None:
+            self._cache.move_to_end(window_title)
+            return cached
+        text = fold_text(window_title)
+        for suffix in self.strip_suffixes:
+            if text.endswith(suffix):
+                text = text[: -len(suffix)]
+                break
+        if self.max_length and len(text) > self.max_length:
+            text = text[: self.max_length]
+        if self.cache_size > 0:
+            self._cache[window_title] = text
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return text
@@ -3,13 +3,491 @@
 
 import platform
 import subprocess
+import threading
+from datetime import datetime
+
+try:
+    from .backend_registry import AllBackendsFailedError, Backend, BackendRegistry, BackendUnavailableError
+    from .coprocess import Coprocess, CoprocessError
+    from .process_resolver import ProcessNameResolver
+    from .window_snapshot import WindowSnapshot
+    from .x11_connection import X11Connection, X11ConnectionError
+except ImportError:
+    from backend_registry import AllBackendsFailedError, Backend, BackendRegistry, BackendUnavailableError
+    from coprocess import Coprocess, CoprocessError
+    from process_resolver import ProcessNameResolver
+    from window_snapshot import WindowSnapshot
+    from x11_connection import X11Connection, X11ConnectionError
+
+# PowerShell helper answering "title" and "process" queries over the coprocess protocol.
+# Add-Type compiles the C# snippet once when the helper starts instead of on every query.
+WINDOWS_HELPER_SCRIPT = r"""
+Add-Type -TypeDefinition @"
+using System;
+using System.Runtime.InteropServices;
+using System.Text;
+public static class CatWindowWatcherNative {
+    [DllImport("user32.dll")]
+    public static extern IntPtr GetForegroundWindow();
+
+    [DllImport("user32.dll", CharSet = CharSet.Unicode)]
+    public static extern int GetWindowText(IntPtr hWnd, StringBuilder text, int count);
+
+    [DllImport("user32.dll")]
+    public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint lpdwProcessId);
+}
+"@
+
+$stdout = [Console]::OpenStandardOutput()
+function Send-Frame([string]$text) {
+    $payload = [Text.Encoding]::UTF8.GetBytes($text)
+    $header = [Text.Encoding]::ASCII.GetBytes("$($payload.Length)`n")
+    $stdout.Write($header, 0, $header.Length)
+    $stdout.Write($payload, 0, $payload.Length)
+    $stdout.Flush()
+}
+
+while ($null -ne ($query = [Console]::In.ReadLine())) {
+    $result = ""
+    try {
+        $hwnd = [CatWindowWatcherNative]::GetForegroundWindow()
+        if ($query -eq "title") {
+            $builder = New-Object System.Text.StringBuilder 512
+            [void][CatWindowWatcherNative]::GetWindowText($hwnd, $builder, 512)
+            $result = $builder.ToString()
+        } elseif ($query -eq "process") {
+            $procId = 0
+            [void][CatWindowWatcherNative]::GetWindowThreadProcessId($hwnd, [ref]$procId)
+            if ($procId -ne 0) {
+                $result = (Get-Process -Id $procId).ProcessName
+            }
+        }
+    } catch {
+        $result = ""
+    }
+    Send-Frame $result
+}
+"""
+
+# One-shot PowerShell scripts used when the long-lived helper is unavailable
+WINDOWS_TITLE_SCRIPT = 'Add-Type @"\nusing System;\nusing System.Runtime.InteropServices;\npublic class Window {\n[DllImport("user32.dll")]\npublic static extern IntPtr GetForegroundWindow();\n[DllImport("user32.dll")]\npublic static extern int GetWindowText(IntPtr hWnd, System.Text.StringBuilder text, int count);\n}\n"@\n$h = [Window]::GetForegroundWindow()\n$s = New-Object System.Text.StringBuilder 256\n[Window]::GetWindowText($h, $s, 256)\n$s.ToString()'
+
+WINDOWS_PROCESS_SCRIPT = r"""$signature = @"
+using System;
+using System.Runtime.InteropServices;
+public static class NativeMethods {
+    [DllImport("user32.dll")]
+    public static extern IntPtr GetForegroundWindow();
+
+    [DllImport("user32.dll")]
+    public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint lpdwProcessId);
+}
+"@
+
+Add-Type -TypeDefinition $signature -PassThru | Out-Null
+$hwnd = [NativeMethods]::GetForegroundWindow()
+if ($hwnd -ne [IntPtr]::Zero) {
+    $pid = 0
+    [NativeMethods]::GetWindowThreadProcessId($hwnd, [ref]$pid) | Out-Null
+    if ($pid -ne 0) {
+        (Get-Process -Id $pid).ProcessName
+    }
+}
+"""
+
+MACOS_FRONTMOST_SCRIPT = (
+    'tell application "System Events" to get name of first application process whose frontmost is true'
+)
+
+
+class FocusEventWatcher:
+    """Event-driven focus tracking using X11 PropertyNotify events.
+
+    Subscribes to _NET_ACTIVE_WINDOW on the root window and to _NET_WM_NAME/WM_NAME
+    on the currently focused window, re-subscribing when focus moves. Every title
+    change is pushed to the callback as a timestamped event from a background thread.
+    Subscriptions belong to one X connection, so they are made again whenever the
+    connection was reopened after the X server dropped it.
+    """
+
+    TITLE_ATOMS = ("_NET_WM_NAME", "WM_NAME")
+
+    def __init__(self, callback, connection=None, poll_timeout=0.5):
+        """Initialize focus event watcher.
+
+        Args:
+            callback: Callable invoked as callback(window_title, timestamp) on each change
+            connection: X11Connection dedicated to this watcher, or None to create one
+            poll_timeout: Seconds to wait for events before checking for stop requests
+        """
+        self.callback = callback
+        self.connection = connection if connection is not None else X11Connection()
+        self.poll_timeout = poll_timeout
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._root_id = None
+        self._focused_window_id = None
+        self._latest_title = None
+        # reconnect_count of the connection the subscriptions were made on
+        self._subscribed_reconnect_count = None
+
+    @staticmethod
+    def is_supported():
+        """Check if event-driven focus tracking can be used on this system.
+
+        Returns:
+            bool: True on Linux with python-xlib and a display available
+        """
+        return platform.system() == "Linux" and X11Connection.is_supported()
+
+    def start(self):
+        """Subscribe to focus events and start the background thread.
+
+        Raises:
+            X11ConnectionError: If the X server cannot be reached
+        """
+        self._subscribe()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FocusEventWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and close the connection."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout * 2)
+            self._thread = None
+        self.connection.close()
+
+    def is_running(self):
+        """Check if the watcher thread is alive.
+
+        Returns:
+            bool: True if events are being received, False if stopped or failed
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_latest_title(self):
+        """Get the most recent title pushed by the watcher.
+
+        Returns:
+            str: Latest active window title, or None if no event has been received yet
+        """
+        return self._latest_title
+
+    def _subscribe(self):
+        """Subscribe to the root window and the focused window on the current connection."""
+        self._subscribed_reconnect_count = self.connection.reconnect_count
+        self._root_id = self.connection.get_root_window_id()
+        self.connection.select_property_events(None)
+        # The previous focused window subscription (if any) was lost with its connection
+        self._focused_window_id = None
+        self._refocus()
+
+    def _run(self):
+        """Background loop dispatching PropertyNotify events."""
+        try:
+            while not self._stop_event.is_set():
+                self.process_events(self.connection.read_property_events(self.poll_timeout))
+                # Any query may have reopened the connection, which has no subscriptions yet
+                while self.connection.reconnect_count != self._subscribed_reconnect_count:
+                    self._subscribe()
+        except X11ConnectionError as e:
+            # Leave is_running() False so the caller falls back to polling
+            print(f"Warning: Focus event watcher stopped: {e}")
+
+    def process_events(self, events):
+        """Handle a batch of PropertyNotify events.
+
+        Args:
+            events: List of (window_id, atom_name) tuples
+        """
+        for window_id, atom_name in events:
+            if window_id == self._root_id and atom_name == "_NET_ACTIVE_WINDOW":
+                self._refocus()
+            elif window_id == self._focused_window_id and atom_name in self.TITLE_ATOMS:
+                self._emit(self.connection.get_window_title(window_id))
+
+    def _refocus(self):
+        """Move the title subscription to the newly focused window and emit its title."""
+        window_id = self.connection.get_active_window_id()
+        if window_id != self._focused_window_id:
+            if self._focused_window_id:
+                self.connection.unselect_property_events(self._focused_window_id)
+            if window_id:
+                self.connection.select_property_events(window_id)
+            self._focused_window_id = window_id
+        self._emit(self.connection.get_window_title(window_id))
+
+    def _emit(self, window_title):
+        """Push a title change to the callback.
+
+        Args:
+            window_title: New active window title
+        """
+        if window_title == self._latest_title:
+            return
+        self._latest_title = window_title
+        self.callback(window_title, datetime.now())
 
 
 class WindowMonitor:
     """Monitor active window titles across different platforms."""
 
+    # Shared persistent X11 connection (created lazily on Linux)
+    _x11_connection = None
+
+    # Shared pid-to-process-name resolver backed by /proc
+    _process_resolver = ProcessNameResolver()
+
+    # Shared long-lived PowerShell helper (created lazily on Windows without pywin32)
+    _windows_helper = None
+
+    def __init__(self, idle_threshold_seconds=0):
+        """Initialize window monitor.
+
+        Until probe_backends() is called, queries use the per-call platform
+        fallback chain (see get_active_window_title()).
+
+        Args:
+            idle_threshold_seconds: Seconds without user input after which the user is
+                                    considered idle (0 = use the empty-title heuristic only)
+        """
+        self.system = None
+        self.registry = None
+        self.idle_threshold_seconds = idle_threshold_seconds
+
+    def probe_backends(self, verbose=False):
+        """Probe available acquisition backends once and use the fastest working one.
+
+        Missing tools are remembered and never retried; backends that keep failing
+        are retried with exponential backoff.
+
+        Args:
+            verbose: If True, print the chosen backend and probe timings
+
+        Returns:
+            BackendRegistry: Registry used for subsequent queries
+        """
+        self.system = platform.system()
+        self.registry = BackendRegistry(self._create_backends(self.system))
+        self.registry.probe()
+
+        if verbose:
+            print(f"Window backend: {self.registry.get_active_backend_name() or '(none available)'}")
+            for line in self.registry.describe():
+                print(f"  {line}")
+        return self.registry
+
+    @staticmethod
+    def _create_backends(system):
+        """Create the candidate backends for a platform in preferred order.
+
+        Args:
+            system: Platform name as returned by platform.system()
+
+        Returns:
+            list: Backend objects
+        """
+
+        def with_unknown_pid(get_title):
+            return lambda: (get_title(), None)
+
+        if system == "Linux":
+            return [
+                Backend(
+                    "x11",
+                    {
+                        "title": WindowMonitor._query_x11_title,
+                        "title_and_pid": WindowMonitor._query_x11_title_and_pid,
+                        "process": WindowMonitor._query_x11_process_name,
+                        "idle": WindowMonitor._query_x11_idle_seconds,
+                    },
+                ),
+                Backend(
+                    "xdotool",
+                    {
+                        "title": WindowMonitor._query_xdotool_title,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_xdotool_title),
+                        "process": WindowMonitor._query_xdotool_process_name,
+                    },
+                ),
+                Backend(
+                    "xprop",
+                    {
+                        "title": WindowMonitor._query_xprop_title,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_xprop_title),
+                    },
+                ),
+            ]
+        elif system == "Darwin":
+            return [
+                Backend(
+                    "osascript",
+                    {
+                        "title": WindowMonitor._query_osascript,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_osascript),
+                        "process": WindowMonitor._query_osascript,
+                    },
+                ),
+            ]
+        elif system == "Windows":
+            return [
+                Backend(
+                    "win32gui",
+                    {
+                        "title": WindowMonitor._query_win32gui_title,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_win32gui_title),
+                    },
+                ),
+                Backend("win32process", {"process": WindowMonitor._query_win32_process_name}),
+                Backend(
+                    "powershell-helper",
+                    {
+                        "title": WindowMonitor._query_powershell_helper_title,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_powershell_helper_title),
+                        "process": WindowMonitor._query_powershell_helper_process_name,
+                    },
+                ),
+                Backend(
+                    "powershell",
+                    {
+                        "title": WindowMonitor._query_powershell_title,
+                        "title_and_pid": with_unknown_pid(WindowMonitor._query_powershell_title),
+                        "process": WindowMonitor._query_powershell_process_name,
+                    },
+                ),
+            ]
+        return []
+
+    def sample(self, include_process=False, debug=False, window_title=None):
+        """Acquire the active window state once for the current tick.
+
+        The title is queried a single time and reused for the screensaver check,
+        so every consumer of the snapshot sees the same moment.
+
+        Args:
+            include_process: If True, also acquire the process name (for game detection)
+            debug: If True, print debug information about screensaver detection
+            window_title: Title already pushed by an event source, or None to query it
+
+        Returns:
+            WindowSnapshot: Snapshot of the active window
+        """
+        pid = None
+        if window_title is None:
+            window_title, pid = self._get_active_window_title_and_pid()
+
+        process_name = ""
+        if include_process:
+            if pid:
+                process_name = self._get_process_name_from_pid(pid)
+            elif self.registry is not None:
+                process_name = self._call_registry("process", "")
+            else:
+                process_name = self.get_active_window_process_name()
+
+        is_idle = self.is_user_idle(debug=debug, window_title=window_title)
+        return WindowSnapshot(window_title, process_name, pid, is_idle, datetime.now())
+
+    def _call_registry(self, operation, default):
+        """Run an operation through the backend registry.
+
+        Args:
+            operation: Operation name
+            default: Value returned if every backend fails
+
+        Returns:
+            Result of the operation, or default
+        """
+        try:
+            return self.registry.call(operation)
+        except AllBackendsFailedError:
+            return default
+
+    def _get_active_window_title_and_pid(self):
+        """Get the active window title and, when cheaply available, its pid.
+
+        Returns:
+            tuple: (title, pid) where pid is None if unknown
+        """
+        if self.registry is not None:
+            return self._call_registry("title_and_pid", ("", None))
+        if platform.system() == "Linux":
+            try:
+                return WindowMonitor._query_x11_title_and_pid()
+            except (X11ConnectionError, BackendUnavailableError):
+                pass
+        return self.get_active_window_title(), None
+
     @staticmethod
-    def is_screensaver_active(debug=False):
+    def _get_process_name_from_pid(pid):
+        """Get the process name for a known pid.
+
+        Args:
+            pid: Process id
+
+        Returns:
+            str: Process name, or empty string if unable to get
+        """
+        resolver = WindowMonitor._process_resolver
+        if resolver.is_available():
+            return resolver.resolve(pid)
+        try:
+            result = subprocess.run(
+                ["ps", "-p", str(pid), "-o", "comm="],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=1,
+            )
+            return result.stdout.strip()
+        except Exception:
+            return ""
+
+    def is_user_idle(self, debug=False, window_title=None):
+        """Check if the user is idle (away from the keyboard or screensaver active).
+
+        With an idle threshold configured, the X server's input idle time
+        (MIT-SCREEN-SAVER) decides. When no idle source is available, the
+        empty-title heuristic of is_screensaver_active() is used.
+
+        Args:
+            debug: If True, print debug information about idle detection
+            window_title: Already acquired window title, or None to query it
+
+        Returns:
+            bool: True if the user is idle
+        """
+        if self.idle_threshold_seconds > 0:
+            idle_seconds = self._get_idle_seconds()
+            if idle_seconds is not None:
+                result = idle_seconds >= self.idle_threshold_seconds
+                if debug:
+                    print("[DEBUG] Idle detection (MIT-SCREEN-SAVER):")
+                    print(f"[DEBUG]   - Idle seconds: {idle_seconds:.1f} (threshold: {self.idle_threshold_seconds})")
+                    print(f"[DEBUG]   - Idle detected: {result}")
+                return result
+
+        return self.is_screensaver_active(debug=debug, window_title=window_title)
+
+    def _get_idle_seconds(self):
+        """Get the user's input idle time.
+
+        Returns:
+            float: Seconds since the last user input, or None if no idle source is available
+        """
+        if self.registry is not None:
+            return self._call_registry("idle", None)
+        if platform.system() == "Linux":
+            try:
+                return WindowMonitor._query_x11_idle_seconds()
+            except (X11ConnectionError, BackendUnavailableError):
+                pass
+        return None
+
+    @staticmethod
+    def is_screensaver_active(debug=False, window_title=None):
         """Check if screensaver is currently active.
 
         This uses a simplified approach: treats windows with empty titles as screensavers.
@@ -17,12 +495,14 @@ class WindowMonitor:
 
         Args:
             debug: If True, print debug information about screensaver detection
+            window_title: Already acquired window title, or None to query it
 
         Returns:
             bool: True if screensaver is active (empty window title), False otherwise
         """
         # Get the current window title
-        window_title = WindowMonitor.get_active_window_title()
+        if window_title is None:
+            window_title = WindowMonitor.get_active_window_title()
 
         # Simplified approach: empty window title indicates screensaver
         result = window_title == ""
@@ -59,48 +539,348 @@ class WindowMonitor:
             print(f"Warning: Failed to get active window title: {e}")
             return ""
 
+    @classmethod
+    def _get_x11_connection(cls):
+        """Get the shared persistent X11 connection.
+
+        Returns:
+            X11Connection: Shared connection, or None if python-xlib or a display is unavailable
+        """
+        if cls._x11_connection is None and X11Connection.is_supported():
+            cls._x11_connection = X11Connection()
+        return cls._x11_connection
+
+    @classmethod
+    def _get_windows_helper(cls):
+        """Get the shared long-lived PowerShell helper.
+
+        Returns:
+            Coprocess: Helper answering "title" and "process" queries
+        """
+        if cls._windows_helper is None:
+            cls._windows_helper = Coprocess(
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command", WINDOWS_HELPER_SCRIPT],
+                deadline=2,
+            )
+        return cls._windows_helper
+
     @staticmethod
-    def _get_active_window_linux():
-        """Get active window title on Linux using xdotool.
+    def _require_x11_connection():
+        """Get the shared X11 connection or report the backend as unavailable.
+
+        Returns:
+            X11Connection: Shared connection
+
+        Raises:
+            BackendUnavailableError: If python-xlib or a display is unavailable
+        """
+        connection = WindowMonitor._get_x11_connection()
+        if connection is None:
+            raise BackendUnavailableError("python-xlib or $DISPLAY not available")
+        return connection
+
+    @staticmethod
+    def _query_x11_title():
+        """Get active window title over the persistent X11 connection.
 
         Returns:
             str: Window title
 
         Raises:
-            OSError: If xdotool is not available
+            BackendUnavailableError: If python-xlib or a display is unavailable
+            X11ConnectionError: If the query fails
         """
-        try:
-            # Try xdotool first
+        return WindowMonitor._require_x11_connection().get_active_window_title()
+
+    @staticmethod
+    def _query_x11_title_and_pid():
+        """Get active window title and pid over the persistent X11 connection.
+
+        Returns:
+            tuple: (title, pid) where pid is None if the window does not publish it
+
+        Raises:
+            BackendUnavailableError: If python-xlib or a display is unavailable
+            X11ConnectionError: If the query fails
+        """
+        _, title, pid = WindowMonitor._require_x11_connection().get_active_window_info()
+        return title, pid
+
+    @staticmethod
+    def _query_x11_process_name():
+        """Get active window process name via X11 (_NET_WM_PID) and /proc.
+
+        _NET_WM_PID is read again whenever focus moves to a window, and the cached pid of
+        the focused window is dropped once its process is gone.
+
+        Returns:
+            str: Process name
+
+        Raises:
+            BackendUnavailableError: If python-xlib or a display is unavailable
+            X11ConnectionError: If the query fails
+        """
+        connection = WindowMonitor._require_x11_connection()
+        window_id = connection.get_active_window_id()
+        resolver = WindowMonitor._process_resolver
+        resolver.note_active_window(window_id)
+        pid = resolver.get_window_pid(window_id, lambda: connection.get_window_pid(window_id))
+        process_name = WindowMonitor._get_process_name_from_pid(pid) if pid else ""
+        if not process_name:
+            # The client re-executed or the window id was reused - read _NET_WM_PID again next time
+            resolver.forget_window(window_id)
+        return process_name
+
+    @staticmethod
+    def _query_x11_idle_seconds():
+        """Get the user's input idle time over the persistent X11 connection.
+
+        Returns:
+            float: Seconds since the last user input, or None if the X server lacks MIT-SCREEN-SAVER
+
+        Raises:
+            BackendUnavailableError: If python-xlib or a display is unavailable
+            X11ConnectionError: If the query fails
+        """
+        return WindowMonitor._require_x11_connection().get_idle_seconds()
+
+    @staticmethod
+    def _query_xdotool_title():
+        """Get active window title using xdotool.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            FileNotFoundError: If xdotool is not installed
+            subprocess.CalledProcessError: If xdotool fails
+            subprocess.TimeoutExpired: If xdotool does not answer in time
+        """
+        result = subprocess.run(
+            ["xdotool", "getactivewindow", "getwindowname"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=1,
+        )
+        return result.stdout.strip()
+
+    @staticmethod
+    def _query_xprop_title():
+        """Get active window title using xprop.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            FileNotFoundError: If xprop is not installed
+            subprocess.CalledProcessError: If xprop fails
+        """
+        result = subprocess.run(
+            ["xprop", "-root", "_NET_ACTIVE_WINDOW"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=1,
+        )
+        window_id = result.stdout.split()[-1]
+        result = subprocess.run(
+            ["xprop", "-id", window_id, "WM_NAME"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=1,
+        )
+        # Extract title from output like: WM_NAME(STRING) = "Title"
+        if "=" in result.stdout:
+            return result.stdout.split("=", 1)[1].strip().strip('"')
+        return ""
+
+    @staticmethod
+    def _query_xdotool_process_name():
+        """Get active window process name using xdotool and /proc (or ps).
+
+        The window-to-pid lookup is cached per window, so getwindowpid only
+        runs when the focused window changes.
+
+        Returns:
+            str: Process name
+
+        Raises:
+            FileNotFoundError: If xdotool is not installed
+            subprocess.CalledProcessError: If xdotool fails
+        """
+        # Get window ID
+        result = subprocess.run(
+            ["xdotool", "getactivewindow"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=1,
+        )
+        window_id = result.stdout.strip()
+
+        # Get PID from window ID (only queried when the focused window changes)
+        def lookup_pid():
             result = subprocess.run(
-                ["xdotool", "getactivewindow", "getwindowname"],
+                ["xdotool", "getwindowpid", window_id],
                 capture_output=True,
                 text=True,
                 check=True,
                 timeout=1,
             )
-            return result.stdout.strip()
+            return int(result.stdout.strip())
+
+        pid = WindowMonitor._process_resolver.get_window_pid(window_id, lookup_pid)
+
+        # Get process name from PID
+        process_name = WindowMonitor._get_process_name_from_pid(pid)
+        if not process_name:
+            # The process exited or the window id was reused - look the pid up again next time
+            WindowMonitor._process_resolver.forget_window(window_id)
+        return process_name
+
+    @staticmethod
+    def _query_osascript():
+        """Get the frontmost application name on macOS using AppleScript.
+
+        Returns:
+            str: Application name
+
+        Raises:
+            FileNotFoundError: If osascript is not available
+            subprocess.CalledProcessError: If the script fails
+        """
+        result = subprocess.run(
+            ["osascript", "-e", MACOS_FRONTMOST_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=1,
+        )
+        return result.stdout.strip()
+
+    @staticmethod
+    def _query_win32gui_title():
+        """Get active window title on Windows using win32gui.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            ImportError: If pywin32 is not installed
+        """
+        import win32gui
+
+        return win32gui.GetWindowText(win32gui.GetForegroundWindow())
+
+    @staticmethod
+    def _query_win32_process_name():
+        """Get active window process name on Windows using pywin32 and psutil.
+
+        Returns:
+            str: Process name
+
+        Raises:
+            ImportError: If pywin32 or psutil is not installed
+        """
+        import psutil
+        import win32gui
+        import win32process
+
+        hwnd = win32gui.GetForegroundWindow()
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        return psutil.Process(pid).name()
+
+    @staticmethod
+    def _query_powershell_helper_title():
+        """Get active window title from the long-lived PowerShell helper.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            CoprocessError: If the helper fails or misses its deadline
+        """
+        return WindowMonitor._get_windows_helper().request("title").strip()
+
+    @staticmethod
+    def _query_powershell_helper_process_name():
+        """Get active window process name from the long-lived PowerShell helper.
+
+        Returns:
+            str: Process name
+
+        Raises:
+            CoprocessError: If the helper fails or misses its deadline
+        """
+        return WindowMonitor._get_windows_helper().request("process").strip()
+
+    @staticmethod
+    def _query_powershell_title():
+        """Get active window title with a one-shot PowerShell process.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            FileNotFoundError: If PowerShell is not available
+            subprocess.CalledProcessError: If the script fails
+        """
+        result = subprocess.run(
+            ["powershell", "-Command", WINDOWS_TITLE_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=2,
+        )
+        return result.stdout.strip()
+
+    @staticmethod
+    def _query_powershell_process_name():
+        """Get active window process name with a one-shot PowerShell process.
+
+        Returns:
+            str: Process name
+
+        Raises:
+            FileNotFoundError: If PowerShell is not available
+            subprocess.CalledProcessError: If the script fails
+        """
+        result = subprocess.run(
+            ["powershell", "-Command", WINDOWS_PROCESS_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=2,
+        )
+        return result.stdout.strip()
+
+    @staticmethod
+    def _get_active_window_linux():
+        """Get active window title on Linux.
+
+        Uses the persistent X11 connection when available, falling back to
+        xdotool and then xprop subprocesses.
+
+        Returns:
+            str: Window title
+
+        Raises:
+            OSError: If xdotool is not available
+        """
+        try:
+            return WindowMonitor._query_x11_title()
+        except (X11ConnectionError, BackendUnavailableError):
+            pass
+
+        try:
+            # Try xdotool first
+            return WindowMonitor._query_xdotool_title()
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             # Fallback to xprop
             try:
-                result = subprocess.run(
-                    ["xprop", "-root", "_NET_ACTIVE_WINDOW"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=1,
-                )
-                window_id = result.stdout.split()[-1]
-                result = subprocess.run(
-                    ["xprop", "-id", window_id, "WM_NAME"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=1,
-                )
-                # Extract title from output like: WM_NAME(STRING) = "Title"
-                if "=" in result.stdout:
-                    title = result.stdout.split("=", 1)[1].strip().strip('"')
-                    return title
+                return WindowMonitor._query_xprop_title()
             except Exception:
                 pass
         return ""
@@ -113,15 +893,7 @@ class WindowMonitor:
             str: Window title
         """
         try:
-            script = 'tell application "System Events" to get name of first application process whose frontmost is true'
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=1,
-            )
-            return result.stdout.strip()
+            return WindowMonitor._query_osascript()
         except Exception:
             return ""
 
@@ -133,21 +905,16 @@ class WindowMonitor:
             str: Window title
         """
         try:
-            import win32gui
-
-            return win32gui.GetWindowText(win32gui.GetForegroundWindow())
+            return WindowMonitor._query_win32gui_title()
         except ImportError:
-            # Fallback: try using PowerShell
+            # Fallback: query the long-lived PowerShell helper
             try:
-                script = 'Add-Type @"\nusing System;\nusing System.Runtime.InteropServices;\npublic class Window {\n[DllImport("user32.dll")]\npublic static extern IntPtr GetForegroundWindow();\n[DllImport("user32.dll")]\npublic static extern int GetWindowText(IntPtr hWnd, System.Text.StringBuilder text, int count);\n}\n"@\n$h = [Window]::GetForegroundWindow()\n$s = New-Object System.Text.StringBuilder 256\n[Window]::GetWindowText($h, $s, 256)\n$s.ToString()'
-                result = subprocess.run(
-                    ["powershell", "-Command", script],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=2,
-                )
-                return result.stdout.strip()
+                return WindowMonitor._query_powershell_helper_title()
+            except CoprocessError:
+                pass
+            # Last resort: one-shot PowerShell
+            try:
+                return WindowMonitor._query_powershell_title()
             except Exception:
                 return ""
         except Exception:
@@ -182,39 +949,19 @@ class WindowMonitor:
     def _get_active_window_process_name_linux():
         """Get active window process name on Linux.
 
+        Uses the persistent X11 connection when available, otherwise xdotool.
+        The pid is resolved via /proc instead of spawning ps.
+
         Returns:
             str: Process name
         """
         try:
-            # Get window ID
-            result = subprocess.run(
-                ["xdotool", "getactivewindow"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=1,
-            )
-            window_id = result.stdout.strip()
+            return WindowMonitor._query_x11_process_name()
+        except (X11ConnectionError, BackendUnavailableError):
+            pass
 
-            # Get PID from window ID
-            result = subprocess.run(
-                ["xdotool", "getwindowpid", window_id],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=1,
-            )
-            pid = result.stdout.strip()
-
-            # Get process name from PID
-            result = subprocess.run(
-                ["ps", "-p", pid, "-o", "comm="],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=1,
-            )
-            return result.stdout.strip()
+        try:
+            return WindowMonitor._query_xdotool_process_name()
         except Exception:
             return ""
 
@@ -226,15 +973,7 @@ class WindowMonitor:
             str: Process name
         """
         try:
-            script = 'tell application "System Events" to get name of first application process whose frontmost is true'
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=1,
-            )
-            return result.stdout.strip()
+            return WindowMonitor._query_osascript()
         except Exception:
             return ""
 
@@ -246,48 +985,17 @@ class WindowMonitor:
             str: Process name
         """
         try:
-            import psutil
-            import win32gui
-            import win32process
-
-            hwnd = win32gui.GetForegroundWindow()
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-            return process.name()
+            return WindowMonitor._query_win32_process_name()
         except ImportError:
-            # Fallback: try using PowerShell
+            # Fallback: query the long-lived PowerShell helper
+            try:
+                return WindowMonitor._query_powershell_helper_process_name()
+            except CoprocessError:
+                pass
+            # Last resort: one-shot PowerShell
             # Use Windows API via Add-Type to get the foreground window process
             try:
-                script = r"""$signature = @"
-using System;
-using System.Runtime.InteropServices;
-public static class NativeMethods {
-    [DllImport("user32.dll")]
-    public static extern IntPtr GetForegroundWindow();
-
-    [DllImport("user32.dll")]
-    public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint lpdwProcessId);
-}
-"@
-
-Add-Type -TypeDefinition $signature -PassThru | Out-Null
-$hwnd = [NativeMethods]::GetForegroundWindow()
-if ($hwnd -ne [IntPtr]::Zero) {
-    $pid = 0
-    [NativeMethods]::GetWindowThreadProcessId($hwnd, [ref]$pid) | Out-Null
-    if ($pid -ne 0) {
-        (Get-Process -Id $pid).ProcessName
-    }
-}
-"""
-                result = subprocess.run(
-                    ["powershell", "-Command", script],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=2,
-                )
-                return result.stdout.strip()
+                return WindowMonitor._query_powershell_process_name()
             except Exception:
                 return ""
         except Exception:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Window snapshot module for cat-window-watcher."""
+
+
+class WindowSnapshot:
+    """Immutable result of a single active window acquisition.
+
+    All fields are taken from the same acquisition, so the title, process and
+    idle flag never describe two different moments.
+    """
+
+    __slots__ = ("title", "process_name", "pid", "is_idle", "timestamp")
+
+    def __init__(self, title, process_name="", pid=None, is_idle=False, timestamp=None):
+        """Initialize window snapshot.
+
+        Args:
+            title: Active window title (empty string if unavailable)
+            process_name: Active window process name (empty string if not acquired)
+            pid: Active window process id, or None if unknown
+            is_idle: Whether the user is considered idle (screensaver active)
+            timestamp: datetime of the acquisition, or None
+        """
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "process_name", process_name)
+        object.__setattr__(self, "pid", pid)
+        object.__setattr__(self, "is_idle", is_idle)
+        object.__setattr__(self, "timestamp", timestamp)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("WindowSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("WindowSnapshot is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, WindowSnapshot):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        return (
+            f"WindowSnapshot(title={self.title!r}, process_name={self.process_name!r}, "
+            f"pid={self.pid!r}, is_idle={self.is_idle!r}, timestamp={self.timestamp!r})"
+        )
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Persistent X11 connection module for cat-window-watcher.
+
+This module keeps a single connection to the X server open for the lifetime of
+the process, so querying the active window does not require spawning
+``xdotool``/``xprop`` on every tick. It depends on the optional ``python-xlib``
+package; when it is missing (or no display is available), callers fall back to
+the subprocess-based implementation in ``window_monitor.py``.
+"""
+
+import os
+import select
+
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    from Xlib import error as xerror
+except ImportError:
+    X = None
+    xdisplay = None
+    xerror = None
+
+
+class X11ConnectionError(Exception):
+    """Raised when the X server cannot be reached or a query fails."""
+
+
+class X11Connection:
+    """Long-lived connection to the X server for active window queries."""
+
+    def __init__(self, display_name=None):
+        """Initialize X11 connection.
+
+        The connection itself is opened lazily on the first query and reopened
+        transparently if the X server drops it.
+
+        Args:
+            display_name: X display name (e.g. ":0"), or None to use $DISPLAY
+        """
+        self.display_name = display_name
+        self._display = None
+        self._root = None
+        self._atoms = {}
+        self.reconnect_count = 0
+
+    @staticmethod
+    def is_supported(display_name=None):
+        """Check if an X11 connection can be attempted at all.
+
+        Args:
+            display_name: X display name, or None to use $DISPLAY
+
+        Returns:
+            bool: True if python-xlib is installed and a display name is available
+        """
+        return xdisplay is not None and bool(display_name or os.environ.get("DISPLAY"))
+
+    def _connect(self):
+        """Open the connection and intern the atoms used for queries.
+
+        Raises:
+            X11ConnectionError: If python-xlib is missing or the display cannot be opened
+        """
+        if xdisplay is None:
+            raise X11ConnectionError("python-xlib is not installed")
+        try:
+            self._display = xdisplay.Display(self.display_name)
+            self._root = self._display.screen().root
+            self._atoms = {
+                name: self._display.intern_atom(name)
+                for name in ("_NET_ACTIVE_WINDOW", "_NET_WM_NAME", "_NET_WM_PID", "UTF8_STRING")
+            }
+        except Exception as e:
+            self._display = None
+            self._root = None
+            raise X11ConnectionError(f"Failed to open X display: {e}") from e
+
+    def close(self):
+        """Close the connection if it is open."""
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception:
+                pass
+        self._display = None
+        self._root = None
+
+    def _query(self, func):
+        """Run a query, reconnecting once if the connection was lost.
+
+        Args:
+            func: Callable executed with the open connection
+
+        Returns:
+            Result of func
+
+        Raises:
+            X11ConnectionError: If the query fails even after reconnecting
+        """
+        for attempt in range(2):
+            if self._display is None:
+                self._connect()
+                if attempt > 0:
+                    self.reconnect_count += 1
+            try:
+                return func()
+            except xerror.ConnectionClosedError as e:
+                # The X server went away (e.g. session restart) - reconnect and retry once
+                self.close()
+                if attempt > 0:
+                    raise X11ConnectionError(f"X connection closed: {e}") from e
+            except (xerror.XError, OSError) as e:
+                raise X11ConnectionError(f"X query failed: {e}") from e
+        raise X11ConnectionError("X query failed")
+
+    def _get_active_window_id(self):
+        """Read _NET_ACTIVE_WINDOW from the root window.
+
+        Returns:
+            int: Active window id, or 0 if no window has focus
+        """
+        prop = self._root.get_full_property(self._atoms["_NET_ACTIVE_WINDOW"], X.AnyPropertyType)
+        if prop is None or not prop.value:
+            return 0
+        return int(prop.value[0])
+
+    def _get_window_title(self, window_id):
+        """Read _NET_WM_NAME (UTF-8) or WM_NAME of a window.
+
+        Args:
+            window_id: X window id
+
+        Returns:
+            str: Window title, or empty string if the window has no title
+        """
+        if not window_id:
+            return ""
+        window = self._display.create_resource_object("window", window_id)
+        prop = window.get_full_property(self._atoms["_NET_WM_NAME"], self._atoms["UTF8_STRING"])
+        if prop is not None and prop.value:
+            value = prop.value
+            return value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+        # Fallback to legacy WM_NAME (Latin-1 STRING or COMPOUND_TEXT)
+        name = window.get_wm_name()
+        if isinstance(name, bytes):
+            return name.decode("latin-1", "replace")
+        return name or ""
+
+    def _get_window_pid(self, window_id):
+        """Read _NET_WM_PID of a window.
+
+        Args:
+            window_id: X window id
+
+        Returns:
+            int: Process id, or None if the window does not publish it
+        """
+        if not window_id:
+            return None
+        window = self._display.create_resource_object("window", window_id)
+        prop = window.get_full_property(self._atoms["_NET_WM_PID"], X.AnyPropertyType)
+        if prop is None or not prop.value:
+            return None
+        return int(prop.value[0])
+
+    def get_window_pid(self, window_id):
+        """Get the pid published by a window via _NET_WM_PID.
+
+        Args:
+            window_id: X window id
+
+        Returns:
+            int: Process id, or None if the window does not publish it or is gone
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+        try:
+            return self._query(lambda: self._get_window_pid(window_id))
+        except X11ConnectionError as e:
+            if xerror is not None and isinstance(e.__cause__, xerror.BadWindow):
+                return None
+            raise
+
+    def get_active_window_info(self):
+        """Get id, title and pid of the active window in one round of queries.
+
+        Returns:
+            tuple: (window_id, title, pid) where pid is None if unknown
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+
+        def query():
+            window_id = self._get_active_window_id()
+            return window_id, self._get_window_title(window_id), self._get_window_pid(window_id)
+
+        try:
+            return self._query(query)
+        except X11ConnectionError as e:
+            if xerror is not None and isinstance(e.__cause__, xerror.BadWindow):
+                return 0, "", None
+            raise
+
+    def get_active_window_id(self):
+        """Get the id of the currently active window.
+
+        Returns:
+            int: Active window id, or 0 if no window has focus
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+        return self._query(self._get_active_window_id)
+
+    def get_active_window_title(self):
+        """Get the title of the currently active window.
+
+        Returns:
+            str: Title of active window, or empty string if no window has focus
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+        return self._query_title(lambda: self._get_window_title(self._get_active_window_id()))
+
+    def get_window_title(self, window_id):
+        """Get the title of a specific window.
+
+        Args:
+            window_id: X window id
+
+        Returns:
+            str: Window title, or empty string if the window has no title or is gone
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+        return self._query_title(lambda: self._get_window_title(window_id))
+
+    def _query_title(self, func):
+        """Run a title query, treating a vanished window as an empty title.
+
+        Args:
+            func: Callable returning a window title
+
+        Returns:
+            str: Window title
+
+        Raises:
+            X11ConnectionError: If the query fails for any other reason
+        """
+        try:
+            return self._query(func)
+        except X11ConnectionError as e:
+            # BadWindow is expected when the window closes between the two reads
+            if xerror is not None and isinstance(e.__cause__, xerror.BadWindow):
+                return ""
+            raise
+
+    def get_idle_seconds(self):
+        """Get the user's idle time from the MIT-SCREEN-SAVER extension.
+
+        The X server tracks the time since the last keyboard or mouse input, so this
+        is a single round trip on the existing connection.
+
+        Returns:
+            float: Seconds since the last user input, or None if the extension is unavailable
+
+        Raises:
+            X11ConnectionError: If the query fails
+        """
+
+        def query():
+            if not self._display.has_extension("MIT-SCREEN-SAVER"):
+                return None
+            return self._root.screensaver_query_info().idle / 1000.0
+
+        return self._query(query)
+
+    def get_root_window_id(self):
+        """Get the id of the root window.
+
+        Returns:
+            int: Root window id
+
+        Raises:
+            X11ConnectionError: If the connection cannot be opened
+        """
+        return self._query(lambda: self._root.id)
+
+    def select_property_events(self, window_id):
+        """Subscribe to PropertyNotify events on a window.
+
+        Event masks are per client, so this does not affect other applications.
+
+        Args:
+            window_id: X window id, or None for the root window
+
+        Raises:
+            X11ConnectionError: If the subscription fails
+        """
+        self._set_event_mask(window_id, X.PropertyChangeMask if X is not None else 0)
+
+    def unselect_property_events(self, window_id):
+        """Unsubscribe from PropertyNotify events on a window.
+
+        Args:
+            window_id: X window id
+        """
+        try:
+            self._set_event_mask(window_id, 0)
+        except X11ConnectionError:
+            # The window may already be destroyed
+            pass
+
+    def _set_event_mask(self, window_id, event_mask):
+        """Change this client's event mask on a window.
+
+        Args:
+            window_id: X window id, or None for the root window
+            event_mask: X event mask
+        """
+
+        def change():
+            window = self._root if window_id is None else self._display.create_resource_object("window", window_id)
+            window.change_attributes(event_mask=event_mask)
+            self._display.sync()
+
+        self._query(change)
+
+    def read_property_events(self, timeout):
+        """Wait for PropertyNotify events.
+
+        Args:
+            timeout: Maximum seconds to wait for the first event
+
+        Returns:
+            list: (window_id, atom_name) tuples for received PropertyNotify events,
+                  empty if the timeout expired
+
+        Raises:
+            X11ConnectionError: If the connection is lost
+        """
+        if self._display is None:
+            # Subscriptions made on a previous connection are gone
+            self._connect()
+            self.reconnect_count += 1
+        try:
+            if not self._display.pending_events():
+                readable, _, _ = select.select([self._display.fileno()], [], [], timeout)
+                if not readable:
+                    return []
+            events = []
+            # pending_events() also reads whatever arrived on the socket
+            while self._display.pending_events():
+                event = self._display.next_event()
+                if event.type == X.PropertyNotify:
+                    events.append((event.window.id, self._display.get_atom_name(event.atom)))
+            return events
+        except (xerror.ConnectionClosedError, xerror.XError, OSError) as e:
+            self.close()
+            raise X11ConnectionError(f"X event read failed: {e}") from e
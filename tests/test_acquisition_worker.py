@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for background window acquisition."""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+
+try:
+    from src.acquisition_worker import AcquisitionWorker, SnapshotMailbox, StallMeter
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from acquisition_worker import AcquisitionWorker, SnapshotMailbox, StallMeter
+    from window_snapshot import WindowSnapshot
+
+
+class SlowMonitor:
+    """Stand-in WindowMonitor whose sample() blocks like a slow subprocess."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.sampled = threading.Event()
+
+    def sample(self, include_process=False, debug=False, window_title=None):
+        time.sleep(self.delay)
+        self.calls.append((include_process, window_title))
+        self.sampled.set()
+        title = window_title if window_title is not None else f"Window {len(self.calls)}"
+        return WindowSnapshot(title, "game.exe" if include_process else "")
+
+
+class TestSnapshotMailbox(unittest.TestCase):
+    """Test cases for SnapshotMailbox."""
+
+    def test_empty(self):
+        """Test that an empty mailbox returns None."""
+        self.assertEqual(SnapshotMailbox().get(), (None, 0))
+
+    def test_latest_value_wins(self):
+        """Test that put overwrites the previous snapshot."""
+        mailbox = SnapshotMailbox()
+        mailbox.put(WindowSnapshot("first"))
+        mailbox.put(WindowSnapshot("second"))
+        snapshot, sequence = mailbox.get()
+        self.assertEqual(snapshot.title, "second")
+        self.assertEqual(sequence, 2)
+
+    def test_get_does_not_consume(self):
+        """Test that reading leaves the snapshot in place."""
+        mailbox = SnapshotMailbox()
+        mailbox.put(WindowSnapshot("only"))
+        self.assertEqual(mailbox.get(), mailbox.get())
+
+
+class TestAcquisitionWorker(unittest.TestCase):
+    """Test cases for AcquisitionWorker."""
+
+    def test_acquire_once_publishes(self):
+        """Test that a single acquisition is published to the mailbox."""
+        worker = AcquisitionWorker(SlowMonitor())
+        self.assertIsNone(worker.get_latest())
+        worker.acquire_once()
+        self.assertEqual(worker.get_latest().title, "Window 1")
+
+    def test_title_source_and_process_flag(self):
+        """Test that the pushed title and process flag reach the monitor."""
+        monitor = SlowMonitor()
+        worker = AcquisitionWorker(monitor, title_source=lambda: "Pushed")
+        worker.configure(1.0, include_process=True)
+        snapshot = worker.acquire_once()
+        self.assertEqual(monitor.calls, [(True, "Pushed")])
+        self.assertEqual(snapshot.process_name, "game.exe")
+
+    def test_reading_never_waits_for_slow_acquisition(self):
+        """Test that get_latest returns immediately while the worker is blocked."""
+        monitor = SlowMonitor(delay=0.5)
+        worker = AcquisitionWorker(monitor, interval_seconds=0.01)
+        worker.start()
+        try:
+            start = time.perf_counter()
+            for _ in range(10):
+                worker.get_latest()
+            self.assertLess(time.perf_counter() - start, 0.1)
+        finally:
+            worker.stop()
+
+    def test_shorter_interval_wakes_worker(self):
+        """Test that shortening the interval does not wait out the old one."""
+        monitor = SlowMonitor()
+        worker = AcquisitionWorker(monitor, interval_seconds=60)
+        worker.start()
+        try:
+            self.assertTrue(monitor.sampled.wait(2))
+            monitor.sampled.clear()
+            worker.configure(0.01, include_process=False)
+            self.assertTrue(monitor.sampled.wait(2))
+        finally:
+            worker.stop()
+        self.assertFalse(worker.is_running())
+
+    def test_failed_acquisition_keeps_running(self):
+        """Test that an exception in sample() does not kill the worker."""
+
+        class FailingMonitor(SlowMonitor):
+            def sample(self, **kwargs):
+                self.sampled.set()
+                raise RuntimeError("boom")
+
+        monitor = FailingMonitor()
+        worker = AcquisitionWorker(monitor, interval_seconds=0.01)
+        worker.start()
+        try:
+            self.assertTrue(monitor.sampled.wait(2))
+            self.assertTrue(worker.is_running())
+        finally:
+            worker.stop()
+
+
+class TestStallMeter(unittest.TestCase):
+    """Test cases for StallMeter."""
+
+    def test_records_worst_and_mean(self):
+        """Test that the worst and mean tick durations are tracked."""
+        meter = StallMeter()
+        for seconds in (0.001, 0.250, 0.002):
+            meter.record(seconds)
+        self.assertEqual(meter.count, 3)
+        self.assertEqual(meter.max_seconds, 0.250)
+        self.assertIn("worst 250.0ms", meter.format_summary())
+
+    def test_empty_summary(self):
+        """Test the summary before any tick."""
+        self.assertIn("over 0 ticks", StallMeter().format_summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Tests for window query backend registry."""
+
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src.backend_registry import AllBackendsFailedError, Backend, BackendRegistry, BackendUnavailableError
+    from src.window_monitor import WindowMonitor
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from backend_registry import AllBackendsFailedError, Backend, BackendRegistry, BackendUnavailableError
+    from window_monitor import WindowMonitor
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingOperation:
+    """Operation that counts calls and returns or raises a configured outcome."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestBackendRegistry(unittest.TestCase):
+    """Test cases for BackendRegistry."""
+
+    def setUp(self):
+        """Set up a fake clock."""
+        self.clock = FakeClock()
+
+    def _registry(self, *backends):
+        return BackendRegistry(
+            backends, failure_threshold=2, initial_retry_seconds=5.0, max_retry_seconds=20.0, clock=self.clock
+        )
+
+    def test_missing_tool_never_retried(self):
+        """Test that a missing tool is probed once and then skipped."""
+        missing = CountingOperation(error=FileNotFoundError("xdotool"))
+        working = CountingOperation(result="Title")
+        registry = self._registry(Backend("xdotool", {"title": missing}), Backend("xprop", {"title": working}))
+
+        registry.probe()
+        for _ in range(10):
+            self.assertEqual(registry.call("title"), "Title")
+
+        self.assertEqual(missing.calls, 1)
+        self.assertEqual(registry.get_active_backend_name(), "xprop")
+
+    def test_probe_orders_working_backends_first(self):
+        """Test that failing and missing backends are moved behind working ones."""
+        registry = self._registry(
+            Backend("missing", {"title": CountingOperation(error=BackendUnavailableError("no display"))}),
+            Backend("failing", {"title": CountingOperation(error=RuntimeError("boom"))}),
+            Backend("working", {"title": CountingOperation(result="ok")}),
+        )
+        registry.probe()
+        self.assertEqual([backend.name for backend in registry.backends], ["working", "failing", "missing"])
+
+    def test_missing_error_detected_through_cause(self):
+        """Test that a wrapped missing-tool error is still treated as missing."""
+
+        def wrapped():
+            try:
+                raise ImportError("win32gui")
+            except ImportError as e:
+                raise RuntimeError("wrapper") from e
+
+        registry = self._registry(Backend("win32gui", {"title": wrapped}))
+        registry.probe()
+        self.assertTrue(registry.backends[0].missing)
+
+    def test_circuit_opens_and_backs_off(self):
+        """Test that a repeatedly failing backend is skipped with exponential retry."""
+        flaky = CountingOperation(error=RuntimeError("boom"))
+        fallback = CountingOperation(result="fallback")
+        registry = self._registry(Backend("flaky", {"title": flaky}), Backend("fallback", {"title": fallback}))
+
+        with redirect_stdout(io.StringIO()):
+            registry.call("title")
+            registry.call("title")
+        self.assertEqual(flaky.calls, 2)
+
+        # Circuit is open: flaky is skipped until the retry delay passes
+        registry.call("title")
+        self.assertEqual(flaky.calls, 2)
+
+        self.clock.now += 5.0
+        with redirect_stdout(io.StringIO()):
+            registry.call("title")
+        self.assertEqual(flaky.calls, 3)
+        self.assertEqual(registry.backends[0].retry_delay, 10.0)
+
+        # Delay is capped at max_retry_seconds
+        for _ in range(5):
+            self.clock.now += registry.backends[0].retry_delay
+            with redirect_stdout(io.StringIO()):
+                registry.call("title")
+        self.assertEqual(registry.backends[0].retry_delay, 20.0)
+
+    def test_recovered_backend_resets(self):
+        """Test that a success closes the circuit and resets the delay."""
+        flaky = CountingOperation(error=RuntimeError("boom"))
+        registry = self._registry(Backend("flaky", {"title": flaky}))
+
+        with redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                with self.assertRaises(AllBackendsFailedError):
+                    registry.call("title")
+
+        flaky.error = None
+        flaky.result = "back"
+        self.clock.now += 5.0
+        self.assertEqual(registry.call("title"), "back")
+        self.assertEqual(registry.backends[0].consecutive_failures, 0)
+        self.assertIsNone(registry.backends[0].retry_delay)
+
+    def test_all_failed_warns_once(self):
+        """Test that the all-backends-failed warning is printed once per streak."""
+        registry = self._registry(Backend("missing", {"title": CountingOperation(error=FileNotFoundError("x"))}))
+        registry.probe()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for _ in range(5):
+                with self.assertRaises(AllBackendsFailedError):
+                    registry.call("title")
+        self.assertEqual(output.getvalue().count("No window backend"), 1)
+
+    def test_operation_not_supported_is_skipped(self):
+        """Test that backends without an operation are skipped for it."""
+        title_only = CountingOperation(result="Title")
+        process_only = CountingOperation(result="firefox")
+        registry = self._registry(
+            Backend("title_only", {"title": title_only}), Backend("process_only", {"process": process_only})
+        )
+        self.assertEqual(registry.call("process"), "firefox")
+        self.assertEqual(title_only.calls, 0)
+
+    def test_describe(self):
+        """Test verbose description lines."""
+        registry = self._registry(
+            Backend("ok", {"title": CountingOperation(result="t")}),
+            Backend("gone", {"title": CountingOperation(error=FileNotFoundError("gone"))}),
+        )
+        registry.probe()
+        lines = registry.describe()
+        self.assertTrue(lines[0].startswith("ok: ok, probe "))
+        self.assertTrue(lines[1].startswith("gone: missing, probe "))
+
+
+class TestWindowMonitorProbe(unittest.TestCase):
+    """Test cases for WindowMonitor backend probing."""
+
+    def test_probe_skips_missing_linux_tools(self):
+        """Test that missing tools on Linux are never invoked again after probing."""
+        calls = []
+
+        def fake_run(command, **kwargs):
+            calls.append(command[0])
+            raise FileNotFoundError(command[0])
+
+        monitor = WindowMonitor()
+        with (
+            patch("platform.system", return_value="Linux"),
+            patch.object(WindowMonitor, "_get_x11_connection", return_value=None),
+            patch("subprocess.run", side_effect=fake_run),
+            redirect_stdout(io.StringIO()),
+        ):
+            monitor.probe_backends()
+            probe_calls = len(calls)
+            for _ in range(5):
+                snapshot = monitor.sample()
+
+        self.assertEqual(len(calls), probe_calls)
+        self.assertEqual(snapshot.title, "")
+        self.assertTrue(snapshot.is_idle)
+        self.assertIsNone(monitor.registry.get_active_backend_name())
+
+    def test_probe_verbose_output(self):
+        """Test that verbose probing prints the chosen backend."""
+        monitor = WindowMonitor()
+        output = io.StringIO()
+        with (
+            patch("platform.system", return_value="Linux"),
+            patch.object(WindowMonitor, "_get_x11_connection", return_value=None),
+            patch.object(WindowMonitor, "_query_xdotool_title", return_value="Editor"),
+            patch("subprocess.run", side_effect=FileNotFoundError("xprop")),
+            redirect_stdout(output),
+        ):
+            monitor.probe_backends(verbose=True)
+            self.assertEqual(monitor.sample().title, "Editor")
+
+        self.assertIn("Window backend: xdotool", output.getvalue())
+        self.assertIn("x11: missing", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 try:
     from src.config import Config
@@ -47,6 +48,186 @@ description = "Twitter"
         self.assertEqual(patterns[1]["regex"], "twitter")
         self.assertEqual(patterns[1]["score"], -5)
 
+        pattern_set = config.get_pattern_set()
+        self.assertEqual(len(pattern_set), 2)
+        self.assertIs(pattern_set.match("GitHub - Issues"), patterns[0])
+
+    def test_exact_match_rules(self):
+        """Test loading process, title and domain rules and rejecting patterns with two rules."""
+        config_content = """
+[[window_patterns]]
+process = "Code.exe"
+score = 5
+description = "VS Code"
+
+[[window_patterns]]
+domain = "youtube.com"
+score = -5
+description = "YouTube"
+"""
+        self.config_path.write_text(config_content)
+        config = Config(str(self.config_path), verbose=False)
+        patterns = config.get_window_patterns()
+        self.assertEqual(patterns[0]["process"], "Code.exe")
+        pattern_set = config.get_pattern_set()
+        self.assertTrue(pattern_set.needs_process_name)
+        self.assertIs(pattern_set.match("main.py", "code.exe"), patterns[0])
+        self.assertIs(pattern_set.match("www.youtube.com"), patterns[1])
+
+        self.config_path.write_text('[[window_patterns]]\nregex = "a"\ntitle = "a"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_domain_list(self):
+        """Test that a domain_list file is loaded relative to the config file."""
+        (self.config_path.parent / "distractions.txt").write_text("0.0.0.0 reddit.com\n", encoding="utf-8")
+        self.config_path.write_text('[[window_patterns]]\ndomain_list = "distractions.txt"\nscore = -3\n')
+        config = Config(str(self.config_path), verbose=False)
+        self.assertEqual(config.get_pattern_set().match("www.reddit.com")["score"], -3)
+
+        self.config_path.write_text('[[window_patterns]]\ndomain_list = "missing.txt"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_reload_reuses_unchanged_patterns(self):
+        """Test that a reload reuses compiled regexes and unchanged domain lists."""
+        (self.config_path.parent / "distractions.txt").write_text("reddit.com\n", encoding="utf-8")
+        body = '[[window_patterns]]\nregex = "github"\nscore = {}\n\n[[window_patterns]]\ndomain_list = "distractions.txt"\n'
+        self.config_path.write_text(body.format(1))
+        config = Config(str(self.config_path), verbose=False)
+        previous = config.get_pattern_set()
+
+        self.config_path.write_text(body.format(2))
+        config.load_config(exit_on_error=False)
+        pattern_set = config.get_pattern_set()
+        self.assertEqual(pattern_set.match("GitHub")["score"], 2)
+        self.assertIs(next(iter(pattern_set)).compiled, next(iter(previous)).compiled)
+        self.assertEqual(pattern_set.unchanged_prefix(previous), 2)
+
+    def test_shadowed_pattern_mode(self):
+        """Test that shadowed patterns are reported in warn mode and dropped in drop mode."""
+        patterns = """
+[[window_patterns]]
+regex = "terminal|bash"
+description = "Shell"
+
+[[window_patterns]]
+regex = "bash - deploy"
+description = "Deploy"
+"""
+        self.config_path.write_text('shadowed_pattern_mode = "warn"\n' + patterns)
+        with patch("builtins.print") as mock_print:
+            config = Config(str(self.config_path), verbose=False)
+        self.assertEqual(len(config.get_pattern_set()), 2)
+        warnings = [call.args[0] for call in mock_print.call_args_list if "can never win" in str(call.args[0])]
+        self.assertEqual(len(warnings), 1)
+
+        self.config_path.write_text('shadowed_pattern_mode = "drop"\n' + patterns)
+        with patch("builtins.print"):
+            config = Config(str(self.config_path), verbose=False)
+        self.assertEqual(config.get_shadowed_pattern_mode(), "drop")
+        self.assertEqual(len(config.get_window_patterns()), 2)
+        self.assertEqual(len(config.get_pattern_set()), 1)
+        self.assertEqual(config.get_pattern_set().match("bash - deploy")["description"], "Shell")
+
+        self.config_path.write_text('shadowed_pattern_mode = "always"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_shadow_probe_corpus_relative_to_config(self):
+        """Test that a relative shadow_probe_corpus is read next to the config file."""
+        (Path(self.temp_dir) / "titles.txt").write_text("bash - deploy\n", encoding="utf-8")
+        self.config_path.write_text(
+            """
+shadowed_pattern_mode = "warn"
+shadow_probe_corpus = "titles.txt"
+
+[[window_patterns]]
+regex = "bash"
+description = "Shell"
+
+[[window_patterns]]
+regex = "deploy"
+description = "Deploy"
+"""
+        )
+        with patch("builtins.print") as mock_print:
+            Config(str(self.config_path), verbose=False)
+        messages = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+        self.assertFalse([message for message in messages if "could not read" in message])
+        self.assertTrue([message for message in messages if "never won" in message])
+
+    def test_shadowed_pattern_mode_with_title_normalization(self):
+        """Test that shadow analysis matches normalized titles, as the compiled patterns do."""
+        self.config_path.write_text(
+            """
+shadowed_pattern_mode = "drop"
+
+[title_normalization]
+enabled = true
+strip_suffixes = [" - Google Chrome"]
+
+[[window_patterns]]
+regex = "chrome"
+score = -5
+description = "Chrome"
+
+[[window_patterns]]
+title = "Inbox - Google Chrome"
+score = 10
+description = "Inbox"
+"""
+        )
+        with patch("builtins.print"):
+            config = Config(str(self.config_path), verbose=False)
+        self.assertEqual(len(config.get_pattern_set()), 2)
+        self.assertEqual(config.get_pattern_set().match("Inbox - Google Chrome")["description"], "Inbox")
+
+    def test_invalid_pattern_regex(self):
+        """Test that a broken window pattern regex is rejected at load time."""
+        config_content = """
+[[window_patterns]]
+regex = "github("
+score = 10
+description = "GitHub"
+"""
+        self.config_path.write_text(config_content)
+
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_pattern_match_engine(self):
+        """Test loading pattern_match_engine and rejecting unknown engines."""
+        self.config_path.write_text('pattern_match_engine = "combined"\n')
+        config = Config(str(self.config_path), verbose=False)
+        self.assertEqual(config.get_pattern_match_engine(), "combined")
+        self.assertEqual(config.get_pattern_set().engine, "combined")
+
+        self.config_path.write_text('pattern_match_engine = "dfa"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_profile_patterns(self):
+        """Test loading profile_patterns and rejecting non-boolean values."""
+        self.config_path.write_text("profile_patterns = true\n")
+        config = Config(str(self.config_path), verbose=False)
+        self.assertTrue(config.get_profile_patterns())
+
+        self.config_path.write_text('profile_patterns = "yes"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
+    def test_regex_safe_mode(self):
+        """Test loading the ReDoS-safe matching settings."""
+        self.config_path.write_text("regex_safe_mode = true\nregex_time_budget_ms = 50\n")
+        config = Config(str(self.config_path), verbose=False)
+        self.assertTrue(config.get_regex_safe_mode())
+        self.assertEqual(config.get_regex_time_budget_ms(), 50)
+
+        self.config_path.write_text("regex_time_budget_ms = 0\n")
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path), verbose=False)
+
     def test_load_empty_patterns(self):
         """Test loading config with no patterns."""
         config_content = """
@@ -439,6 +620,118 @@ regex = "twitter"
         self.assertEqual(len(config.get_window_patterns()), 1)
         self.assertEqual(config.get_window_patterns()[0]["regex"], "github")
 
+    def test_focus_tracking_mode_default(self):
+        """Test that focus_tracking_mode defaults to polling."""
+        self.config_path.write_text("")
+        config = Config(str(self.config_path))
+        self.assertEqual(config.get_focus_tracking_mode(), "poll")
+
+    def test_focus_tracking_mode_event(self):
+        """Test enabling event-driven focus tracking."""
+        self.config_path.write_text('focus_tracking_mode = "event"\n')
+        config = Config(str(self.config_path))
+        self.assertEqual(config.get_focus_tracking_mode(), "event")
+
+    def test_focus_tracking_mode_invalid(self):
+        """Test that an unknown focus_tracking_mode is rejected."""
+        self.config_path.write_text('focus_tracking_mode = "push"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path))
+
+    def test_acquisition_mode_default(self):
+        """Test that acquisition_mode defaults to synchronous acquisition."""
+        self.config_path.write_text("")
+        config = Config(str(self.config_path))
+        self.assertEqual(config.get_acquisition_mode(), "sync")
+
+    def test_acquisition_mode_thread(self):
+        """Test selecting the background acquisition thread."""
+        self.config_path.write_text('acquisition_mode = "thread"\n')
+        config = Config(str(self.config_path))
+        self.assertEqual(config.get_acquisition_mode(), "thread")
+
+    def test_acquisition_mode_invalid(self):
+        """Test that an unknown acquisition_mode is rejected."""
+        self.config_path.write_text('acquisition_mode = "async"\n')
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path))
+
+    def test_idle_threshold_seconds(self):
+        """Test idle_threshold_seconds default and custom value."""
+        self.config_path.write_text("")
+        self.assertEqual(Config(str(self.config_path)).get_idle_threshold_seconds(), 0)
+        self.config_path.write_text("idle_threshold_seconds = 300\n")
+        self.assertEqual(Config(str(self.config_path)).get_idle_threshold_seconds(), 300)
+
+    def test_idle_threshold_seconds_invalid(self):
+        """Test that a negative idle threshold is rejected."""
+        self.config_path.write_text("idle_threshold_seconds = -1\n")
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path))
+
+    def test_session_log_path(self):
+        """Test session_log_path default and validation."""
+        self.config_path.write_text("")
+        self.assertEqual(Config(str(self.config_path)).get_session_log_path(), "")
+        self.config_path.write_text('session_log_path = "trace.cwwlog"\n')
+        self.assertEqual(Config(str(self.config_path)).get_session_log_path(), "trace.cwwlog")
+        self.config_path.write_text("session_log_path = 1\n")
+        with self.assertRaises(SystemExit):
+            Config(str(self.config_path))
+
+    def test_adaptive_polling_default(self):
+        """Test that adaptive polling is disabled by default."""
+        self.config_path.write_text("")
+        config = Config(str(self.config_path))
+        adaptive_polling = config.get_adaptive_polling()
+        self.assertFalse(adaptive_polling["enabled"])
+        self.assertEqual(adaptive_polling["min_interval_seconds"], 1)
+        self.assertEqual(adaptive_polling["max_interval_seconds"], 60)
+        self.assertEqual(adaptive_polling["backoff_factor"], 2.0)
+
+    def test_adaptive_polling_custom(self):
+        """Test custom adaptive polling settings."""
+        self.config_path.write_text(
+            "[adaptive_polling]\nenabled = true\nmin_interval_seconds = 2\nmax_interval_seconds = 30\nbackoff_factor = 1.5\n"
+        )
+        config = Config(str(self.config_path))
+        self.assertEqual(
+            config.get_adaptive_polling(),
+            {"enabled": True, "min_interval_seconds": 2, "max_interval_seconds": 30, "backoff_factor": 1.5},
+        )
+
+    def test_adaptive_polling_invalid(self):
+        """Test that inconsistent adaptive polling settings are rejected."""
+        for body in (
+            "max_interval_seconds = 1\nmin_interval_seconds = 5\n",
+            "min_interval_seconds = 0\n",
+            "backoff_factor = 1\n",
+            'backoff_factor = "fast"\n',
+        ):
+            with self.subTest(body=body):
+                self.config_path.write_text("[adaptive_polling]\n" + body)
+                with self.assertRaises(SystemExit):
+                    Config(str(self.config_path))
+
+    def test_title_normalization(self):
+        """Test that title normalization is off by default and applied to the pattern set."""
+        self.config_path.write_text("")
+        self.assertEqual(
+            Config(str(self.config_path)).get_title_normalization(),
+            {"enabled": False, "strip_suffixes": [], "max_length": 1024},
+        )
+        self.config_path.write_text(
+            '[title_normalization]\nenabled = true\nstrip_suffixes = [" - Google Chrome"]\n\n'
+            '[[window_patterns]]\ntitle = "Inbox"\nscore = 2\n'
+        )
+        config = Config(str(self.config_path))
+        self.assertEqual(config.get_pattern_set().match("ＩＮＢＯＸ - Google Chrome")["score"], 2)
+        for body in ("enabled = 1\n", "strip_suffixes = 1\n", "max_length = -1\n"):
+            with self.subTest(body=body):
+                self.config_path.write_text("[title_normalization]\n" + body)
+                with self.assertRaises(SystemExit):
+                    Config(str(self.config_path))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Tests for long-lived helper coprocess module."""
+
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from src.coprocess import Coprocess, CoprocessError, CoprocessTimeout, read_frame, write_frame
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from coprocess import Coprocess, CoprocessError, CoprocessTimeout, read_frame, write_frame
+
+# Stand-in helper speaking the coprocess protocol
+HELPER_SCRIPT = """
+import os
+import sys
+import time
+
+out = sys.stdout.buffer
+for line in sys.stdin.buffer:
+    query = line.decode("utf-8").rstrip("\\n")
+    if query == "exit":
+        sys.exit(0)
+    if query.startswith("sleep "):
+        time.sleep(float(query.split()[1]))
+        reply = "slept"
+    elif query == "pid":
+        reply = str(os.getpid())
+    elif query == "multiline":
+        reply = "line1\\nline2 日本語"
+    elif query == "chunked":
+        # Header and first half now, second half after a pause
+        out.write(b"10\\nfirst")
+        out.flush()
+        time.sleep(0.1)
+        out.write(b"-half")
+        out.flush()
+        continue
+    else:
+        reply = query.upper()
+    data = reply.encode("utf-8")
+    out.write(str(len(data)).encode("ascii") + b"\\n" + data)
+    out.flush()
+"""
+
+
+class TestFraming(unittest.TestCase):
+    """Test cases for the frame helpers."""
+
+    def test_round_trip(self):
+        """Test that a written frame can be read back."""
+        stream = io.BytesIO()
+        write_frame(stream, "hello\nworld 猫")
+        write_frame(stream, "")
+        stream.seek(0)
+        self.assertEqual(read_frame(stream), "hello\nworld 猫")
+        self.assertEqual(read_frame(stream), "")
+        self.assertIsNone(read_frame(stream))
+
+    def test_short_reads(self):
+        """Test that a payload arriving in several reads of a raw stream is read whole."""
+
+        class ChunkedStream(io.RawIOBase):
+            def __init__(self, data):
+                self.data = data
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                # At most 3 bytes per read, like a pipe delivering a reply in pieces
+                chunk = self.data[:3]
+                self.data = self.data[3:]
+                buffer[: len(chunk)] = chunk
+                return len(chunk)
+
+        self.assertEqual(read_frame(ChunkedStream(b"11\nhello world")), "hello world")
+        self.assertIsNone(read_frame(ChunkedStream(b"11\nhello")))
+
+    def test_malformed_header(self):
+        """Test that a malformed header raises CoprocessError."""
+        with self.assertRaises(CoprocessError):
+            read_frame(io.BytesIO(b"abc\n"))
+
+
+class TestCoprocess(unittest.TestCase):
+    """Test cases for Coprocess with a stand-in helper."""
+
+    def setUp(self):
+        """Write the stand-in helper script."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.helper_path = Path(self.temp_dir) / "helper.py"
+        self.helper_path.write_text(HELPER_SCRIPT)
+        self.coprocess = Coprocess([sys.executable, str(self.helper_path)], deadline=2.0)
+
+    def tearDown(self):
+        """Stop the helper and remove the script."""
+        self.coprocess.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_request_reply(self):
+        """Test a basic query."""
+        self.assertEqual(self.coprocess.request("title"), "TITLE")
+
+    def test_multiline_unicode_reply(self):
+        """Test that framing preserves newlines and non-ASCII text."""
+        self.assertEqual(self.coprocess.request("multiline"), "line1\nline2 日本語")
+
+    def test_reply_in_two_chunks(self):
+        """Test that a reply flushed in two chunks is received whole without a restart."""
+        self.assertEqual(self.coprocess.request("chunked"), "first-half")
+        self.assertEqual(self.coprocess.request("title"), "TITLE")
+        self.assertEqual(self.coprocess.get_health()["starts"], 1)
+
+    def test_helper_started_once(self):
+        """Test that repeated queries reuse the same helper process."""
+        pids = {self.coprocess.request("pid") for _ in range(5)}
+        self.assertEqual(len(pids), 1)
+        health = self.coprocess.get_health()
+        self.assertEqual(health["starts"], 1)
+        self.assertEqual(health["successes"], 5)
+        self.assertTrue(health["running"])
+
+    def test_deadline_exceeded_restarts_helper(self):
+        """Test that a missed deadline kills the helper and the next query restarts it."""
+        self.coprocess.deadline = 0.2
+        first_pid = self.coprocess.request("pid")
+        with self.assertRaises(CoprocessTimeout):
+            self.coprocess.request("sleep 5")
+        self.assertFalse(self.coprocess.is_running())
+
+        self.coprocess.deadline = 2.0
+        second_pid = self.coprocess.request("pid")
+        self.assertNotEqual(first_pid, second_pid)
+        health = self.coprocess.get_health()
+        self.assertEqual(health["timeouts"], 1)
+        self.assertEqual(health["restarts"], 1)
+
+    def test_helper_death_restarts(self):
+        """Test that a helper that exits is restarted on the next query."""
+        with self.assertRaises(CoprocessError):
+            self.coprocess.request("exit")
+        self.assertEqual(self.coprocess.request("again"), "AGAIN")
+        health = self.coprocess.get_health()
+        self.assertEqual(health["failures"], 1)
+        self.assertEqual(health["restarts"], 1)
+
+    def test_handshake_before_first_request(self):
+        """Test that startup is awaited with the handshake, outside the request deadline."""
+        coprocess = Coprocess([sys.executable, str(self.helper_path)], deadline=0.05, handshake="ready")
+        self.addCleanup(coprocess.close)
+        coprocess.start()
+        self.assertTrue(coprocess.is_running())
+        self.assertEqual(coprocess.request("title"), "TITLE")
+        self.assertEqual(coprocess.get_health()["starts"], 1)
+
+    def test_startup_timeout(self):
+        """Test that a helper missing the handshake fails to start without counting as a timeout."""
+        coprocess = Coprocess(
+            [sys.executable, "-c", "import time; time.sleep(5)"], handshake="ready", startup_timeout=0.2
+        )
+        self.addCleanup(coprocess.close)
+        with self.assertRaises(CoprocessError) as context:
+            coprocess.start()
+        self.assertNotIsInstance(context.exception, CoprocessTimeout)
+        self.assertFalse(coprocess.is_running())
+
+    def test_missing_helper_raises(self):
+        """Test that a helper that cannot be started raises CoprocessError."""
+        coprocess = Coprocess([str(Path(self.temp_dir) / "does-not-exist")])
+        with self.assertRaises(CoprocessError):
+            coprocess.request("title")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for domain trie module."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from src.domain_trie import DomainTrie, find_host_names, parse_domain_list
+    from src.pattern_set import PatternSet
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from domain_trie import DomainTrie, find_host_names, parse_domain_list
+    from pattern_set import PatternSet
+
+
+class TestParseDomainList(unittest.TestCase):
+    """Test cases for parse_domain_list."""
+
+    def test_formats(self):
+        """Test hosts-file lines, plain domains, comments and local names."""
+        lines = [
+            "# Distraction list",
+            "127.0.0.1 localhost",
+            "0.0.0.0 example.com www.example.org  # inline comment",
+            ":: ipv6.example.net",
+            "News.Example.COM.",
+            "*.video.example",
+            "",
+            "0.0.0.0",
+        ]
+        self.assertEqual(
+            list(parse_domain_list(lines)),
+            ["example.com", "www.example.org", "ipv6.example.net", "news.example.com", "video.example"],
+        )
+
+
+class TestDomainTrie(unittest.TestCase):
+    """Test cases for DomainTrie."""
+
+    def test_domain_and_subdomains(self):
+        """Test that a listed domain covers itself and its subdomains only."""
+        trie = DomainTrie(["example.com", "news.site.org"])
+        self.assertIn("example.com", trie)
+        self.assertIn("a.b.example.com", trie)
+        self.assertNotIn("notexample.com", trie)
+        self.assertNotIn("com", trie)
+        self.assertNotIn("site.org", trie)
+        self.assertIn("m.news.site.org", trie)
+
+    def test_parent_domain_collapses_subdomains(self):
+        """Test that adding a parent domain replaces its listed subdomains."""
+        trie = DomainTrie(["a.example.com", "b.example.com", "c.other.com"])
+        self.assertEqual(len(trie), 3)
+        trie.add("example.com")
+        self.assertEqual(len(trie), 2)
+        trie.add("x.example.com")
+        self.assertEqual(len(trie), 2)
+        self.assertIn("z.example.com", trie)
+
+    def test_match_hosts_from_title(self):
+        """Test probing the host names found in a window title."""
+        trie = DomainTrie(["youtube.com"])
+        self.assertEqual(find_host_names("Video - https://www.YouTube.com/watch - Firefox"), ["www.youtube.com"])
+        self.assertTrue(trie.match_hosts(find_host_names("Video - www.YouTube.com - Firefox")))
+        self.assertFalse(trie.match_hosts(find_host_names("README.md - Editor")))
+
+    def test_from_file(self):
+        """Test loading a list file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hosts"
+            path.write_text("0.0.0.0 example.com\nsite.org\n", encoding="utf-8")
+            trie = DomainTrie.from_file(path)
+        self.assertEqual(len(trie), 2)
+        self.assertIn("www.site.org", trie)
+
+
+class TestDomainListPatterns(unittest.TestCase):
+    """Test cases for domain_list patterns in PatternSet."""
+
+    def setUp(self):
+        """Set up patterns with a domain list between regexes."""
+        self.patterns = [
+            {"regex": "youtube music", "score": 1, "description": "Music"},
+            {"domain_list": "list.txt", "domain_trie": DomainTrie(["youtube.com", "reddit.com"]), "score": -3},
+            {"regex": "reddit", "score": 5, "description": "Reddit"},
+            {"domain_list": "other.txt", "domain_trie": DomainTrie(["reddit.com", "news.com"]), "score": -1},
+        ]
+
+    def test_priority_order(self):
+        """Test that a domain list keeps its place in the configuration order."""
+        pattern_set = PatternSet(self.patterns)
+        self.assertEqual(pattern_set.match_index("YouTube Music - music.youtube.com"), 0)
+        self.assertEqual(pattern_set.match_index("r/python - www.reddit.com"), 1)
+        self.assertEqual(pattern_set.match_index("reddit - app"), 2)
+        self.assertEqual(pattern_set.match_index("news.com"), 3)
+        self.assertIsNone(pattern_set.match_index("Editor"))
+        self.assertEqual(pattern_set.match_all("www.reddit.com"), [1, 2, 3])
+
+    def test_engines_agree(self):
+        """Test that every engine gives the same result with domain lists."""
+        titles = ["youtube music.youtube.com", "reddit.com", "reddit", "news.com", "x"]
+        expected = [PatternSet(self.patterns).match_index(title) for title in titles]
+        for engine in ("combined", "prefilter"):
+            pattern_set = PatternSet(self.patterns, engine)
+            self.assertEqual([pattern_set.match_index(title) for title in titles], expected, engine)
+
+    def test_load_from_path(self):
+        """Test that a pattern without a preloaded trie loads the file, and errors are reported."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "list.txt"
+            path.write_text("example.com\n", encoding="utf-8")
+            pattern_set = PatternSet([{"domain_list": str(path)}])
+            self.assertEqual(pattern_set.match_index("www.example.com"), 0)
+            with self.assertRaisesRegex(ValueError, r"window_patterns\[0\]"):
+                PatternSet([{"domain_list": str(Path(temp_dir) / "missing.txt")}])
+        with self.assertRaises(ValueError):
+            PatternSet([{"domain_list": "list.txt", "regex": "x"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Tests for event-driven focus tracking."""
+
+import shutil
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    from src.score_tracker import ScoreTracker
+    from src.window_monitor import FocusEventWatcher
+    from src.x11_connection import X11Connection
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from score_tracker import ScoreTracker
+    from window_monitor import FocusEventWatcher
+    from x11_connection import X11Connection
+
+try:
+    from tests.xvfb_helper import start_xvfb
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from xvfb_helper import start_xvfb
+
+try:
+    from Xlib import Xatom
+    from Xlib import display as xdisplay
+except ImportError:
+    Xatom = None
+    xdisplay = None
+
+ROOT_ID = 1
+
+
+class FakeConnection:
+    """Minimal stand-in for X11Connection used by FocusEventWatcher."""
+
+    def __init__(self):
+        self.active_window_id = 0
+        self.titles = {}
+        self.selected = set()
+        self.reconnect_count = 0
+
+    def get_root_window_id(self):
+        return ROOT_ID
+
+    def get_active_window_id(self):
+        return self.active_window_id
+
+    def get_window_title(self, window_id):
+        return self.titles.get(window_id, "")
+
+    def select_property_events(self, window_id):
+        self.selected.add(ROOT_ID if window_id is None else window_id)
+
+    def unselect_property_events(self, window_id):
+        self.selected.discard(window_id)
+
+    def read_property_events(self, timeout):
+        time.sleep(timeout)
+        return []
+
+    def close(self):
+        pass
+
+
+class TestFocusEventWatcher(unittest.TestCase):
+    """Test cases for FocusEventWatcher event handling."""
+
+    def setUp(self):
+        """Set up a watcher on a fake connection."""
+        self.connection = FakeConnection()
+        self.connection.active_window_id = 10
+        self.connection.titles = {10: "Editor", 20: "Browser"}
+        self.events = []
+        self.watcher = FocusEventWatcher(
+            lambda title, timestamp: self.events.append(title), connection=self.connection, poll_timeout=0.01
+        )
+
+    def tearDown(self):
+        """Stop the watcher thread."""
+        self.watcher.stop()
+
+    def test_start_emits_current_title_and_subscribes(self):
+        """Test that starting emits the focused title and subscribes root and window."""
+        self.watcher.start()
+        self.assertEqual(self.events, ["Editor"])
+        self.assertEqual(self.connection.selected, {ROOT_ID, 10})
+        self.assertTrue(self.watcher.is_running())
+
+    def test_focus_change_resubscribes(self):
+        """Test that a _NET_ACTIVE_WINDOW change moves the title subscription."""
+        self.watcher.start()
+        self.connection.active_window_id = 20
+        self.watcher.process_events([(ROOT_ID, "_NET_ACTIVE_WINDOW")])
+        self.assertEqual(self.events, ["Editor", "Browser"])
+        self.assertEqual(self.connection.selected, {ROOT_ID, 20})
+        self.assertEqual(self.watcher.get_latest_title(), "Browser")
+
+    def test_title_change_on_focused_window(self):
+        """Test that a title change on the focused window is emitted."""
+        self.watcher.start()
+        self.connection.titles[10] = "Editor - modified"
+        self.watcher.process_events([(10, "_NET_WM_NAME")])
+        self.assertEqual(self.events, ["Editor", "Editor - modified"])
+
+    def test_ignores_unfocused_windows_and_duplicates(self):
+        """Test that events from other windows and unchanged titles are ignored."""
+        self.watcher.start()
+        self.watcher.process_events([(20, "_NET_WM_NAME"), (10, "_NET_WM_NAME"), (ROOT_ID, "_NET_CLIENT_LIST")])
+        self.assertEqual(self.events, ["Editor"])
+
+    def test_resubscribes_after_reconnect(self):
+        """Test that subscriptions are made again on a reopened connection."""
+        self.watcher.start()
+        # A reconnect (e.g. inside a title query) opens a connection without subscriptions
+        self.connection.selected = set()
+        self.connection.active_window_id = 20
+        self.connection.reconnect_count += 1
+
+        deadline = time.monotonic() + 2.0
+        while self.connection.selected != {ROOT_ID, 20} and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.connection.selected, {ROOT_ID, 20})
+        self.assertEqual(self.watcher.get_latest_title(), "Browser")
+        self.assertTrue(self.watcher.is_running())
+
+
+class TestScoreTrackerFocusEvents(unittest.TestCase):
+    """Test cases for timestamped focus events in ScoreTracker."""
+
+    def test_focus_event_sets_window_start_time(self):
+        """Test that the event timestamp becomes the window start time."""
+        tracker = ScoreTracker([], default_score=0)
+        event_time = datetime(2024, 1, 1, 10, 0, 0)
+        tracker.record_focus_event("Editor", event_time)
+        tracker.update("Editor")
+        self.assertEqual(tracker._current_window_start_time, event_time)
+
+    def test_short_focus_switch_between_ticks(self):
+        """Test that a switch away and back between ticks restarts the window timer."""
+        tracker = ScoreTracker([], default_score=0)
+        tracker.update("Editor")
+        return_time = datetime(2024, 1, 1, 10, 0, 2)
+        tracker.record_focus_event("Chat", datetime(2024, 1, 1, 10, 0, 1))
+        tracker.record_focus_event("Editor", return_time)
+        tracker.update("Editor")
+        self.assertEqual(tracker._current_window_start_time, return_time)
+
+    def test_windows_between_ticks_are_scored(self):
+        """Test that each window focused between ticks is scored for its share of the interval."""
+        start = datetime(2024, 1, 1, 10, 0, 0)
+        now = [start]
+        patterns = [{"regex": "Editor", "score": 2}, {"regex": "Chat", "score": -10}]
+        tracker = ScoreTracker(patterns, default_score=0, clock=lambda: now[0])
+        tracker.update("Editor")
+        self.assertEqual(tracker.get_score(), 2)
+
+        # Editor -> Chat -> Editor within one second: half of it spent in Chat
+        tracker.record_focus_event("Chat", start + timedelta(seconds=0.25))
+        tracker.record_focus_event("Editor", start + timedelta(seconds=0.75))
+        now[0] = start + timedelta(seconds=1)
+        tracker.update("Editor")
+        self.assertEqual(tracker.get_score(), 2 + 2 * 0.5 - 10 * 0.5)
+
+        # Without focus changes the sampled window covers the whole interval
+        now[0] = start + timedelta(seconds=2)
+        tracker.update("Editor")
+        self.assertEqual(tracker.get_score(), 0)
+
+
+@unittest.skipUnless(shutil.which("Xvfb") and xdisplay is not None, "requires Xvfb and python-xlib")
+class TestFocusEventLatencyXvfb(unittest.TestCase):
+    """Measure latency from focus change to tracker update against a real X server."""
+
+    def setUp(self):
+        """Start Xvfb and create two titled windows."""
+        self.xvfb, self.display_name = start_xvfb()
+        self.addCleanup(self.xvfb.kill)
+        self.display = xdisplay.Display(self.display_name)
+        self.addCleanup(self.display.close)
+        self.root = self.display.screen().root
+        self.net_active_window = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self.net_wm_name = self.display.intern_atom("_NET_WM_NAME")
+        self.utf8_string = self.display.intern_atom("UTF8_STRING")
+        self.windows = []
+        for title in ("Editor", "Browser"):
+            window = self.root.create_window(0, 0, 100, 100, 0, self.display.screen().root_depth)
+            window.change_property(self.net_wm_name, self.utf8_string, 8, title.encode())
+            self.windows.append(window)
+        self._activate(self.windows[0])
+
+    def _activate(self, window):
+        """Act as the window manager and publish _NET_ACTIVE_WINDOW."""
+        self.root.change_property(self.net_active_window, Xatom.WINDOW, 32, [window.id])
+        self.display.sync()
+
+    def test_focus_change_latency(self):
+        """Test that focus changes reach the tracker well within one polling tick."""
+        tracker = ScoreTracker([], default_score=0)
+        received = threading.Event()
+        arrival = {}
+
+        def on_focus(title, timestamp):
+            tracker.record_focus_event(title, timestamp)
+            arrival[title] = time.perf_counter()
+            received.set()
+
+        watcher = FocusEventWatcher(on_focus, connection=X11Connection(self.display_name), poll_timeout=0.1)
+        watcher.start()
+        self.addCleanup(watcher.stop)
+
+        latencies = []
+        for i in range(10):
+            target = self.windows[(i + 1) % 2]
+            expected = "Browser" if target is self.windows[1] else "Editor"
+            received.clear()
+            sent = time.perf_counter()
+            self._activate(target)
+            self.assertTrue(received.wait(1.0))
+            latencies.append(arrival[expected] - sent)
+
+        tracker.update(watcher.get_latest_title())
+        self.assertEqual(tracker.last_window_title, "Browser" if len(latencies) % 2 else "Editor")
+        self.assertLess(max(latencies), 0.5, f"Focus event latency: max={max(latencies) * 1000:.2f}ms")
+
+    def test_title_change_latency(self):
+        """Test that title changes on the focused window are pushed."""
+        received = threading.Event()
+        titles = []
+
+        def on_focus(title, timestamp):
+            titles.append(title)
+            received.set()
+
+        watcher = FocusEventWatcher(on_focus, connection=X11Connection(self.display_name), poll_timeout=0.1)
+        watcher.start()
+        self.addCleanup(watcher.stop)
+
+        received.clear()
+        self.windows[0].change_property(self.net_wm_name, self.utf8_string, 8, b"Editor - changed")
+        self.display.sync()
+        self.assertTrue(received.wait(1.0))
+        self.assertEqual(titles[-1], "Editor - changed")
+
+
+if __name__ == "__main__":
+    unittest.main()
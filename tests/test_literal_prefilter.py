@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Tests for literal prefilter module."""
+
+import random
+import re
+import unittest
+from pathlib import Path
+
+try:
+    from src.literal_prefilter import (
+        AhoCorasick,
+        LiteralPrefilter,
+        extract_required_literals,
+        fold_title,
+        literal_alternatives,
+    )
+    from src.pattern_set import PatternSet
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from literal_prefilter import (
+        AhoCorasick,
+        LiteralPrefilter,
+        extract_required_literals,
+        fold_title,
+        literal_alternatives,
+    )
+    from pattern_set import PatternSet
+
+
+class TestExtractRequiredLiterals(unittest.TestCase):
+    """Test cases for extract_required_literals."""
+
+    def test_keywords(self):
+        """Test that plain and escaped keywords are extracted lowercased."""
+        self.assertEqual(extract_required_literals("GitHub"), ["github"])
+        self.assertEqual(extract_required_literals("x\\.com"), ["x.com"])
+        self.assertEqual(extract_required_literals("^doc"), ["doc"])
+
+    def test_alternation(self):
+        """Test that each top-level branch contributes one literal."""
+        self.assertEqual(extract_required_literals("twitter|x\\.com"), ["twitter", "x.com"])
+        self.assertIsNone(extract_required_literals("git|\\d+"))
+
+    def test_optional_characters_are_dropped(self):
+        """Test that characters followed by ?, * or {m,n} are not required."""
+        self.assertEqual(extract_required_literals("colou?r"), ["colo"])
+        self.assertEqual(extract_required_literals("ab*cde"), ["cde"])
+        self.assertEqual(extract_required_literals("ab{0,2}cd"), ["cd"])
+        self.assertEqual(extract_required_literals("ab+"), ["ab"])
+
+    def test_groups_and_classes_end_literals(self):
+        """Test that groups, classes and escape classes are skipped."""
+        self.assertEqual(extract_required_literals("youtube(?!music)"), ["youtube"])
+        self.assertEqual(extract_required_literals("(a|b)xyz[0-9]"), ["xyz"])
+        self.assertEqual(extract_required_literals("news\\d+"), ["news"])
+        self.assertIsNone(extract_required_literals("(ab)+"))
+        self.assertIsNone(extract_required_literals("[a-z]+"))
+
+    def test_code_escapes_are_skipped(self):
+        """Test that the digits of code and octal escapes are not taken as literal text."""
+        self.assertEqual(extract_required_literals("\\x59outube"), ["outube"])
+        self.assertEqual(extract_required_literals("\\u00e9cole|\\N{EM DASH}news"), ["cole", "news"])
+
+    def test_inline_flags(self):
+        """Test that inline global flags disable extraction."""
+        self.assertIsNone(extract_required_literals("(?x) git hub"))
+
+    def test_fold_title(self):
+        """Test the extra case-insensitive equivalences of re.IGNORECASE."""
+        self.assertEqual(fold_title("Kİſ"), "kis")
+        for char in "Kİıſ":
+            literal = fold_title(char)
+            self.assertTrue(re.fullmatch(literal, char, re.IGNORECASE), char)
+
+
+class TestLiteralAlternatives(unittest.TestCase):
+    """Test cases for literal_alternatives."""
+
+    def test_plain_alternation(self):
+        """Test that alternations of plain and escaped literals are recognized."""
+        self.assertEqual(literal_alternatives("GitHub|gitlab"), ["github", "gitlab"])
+        self.assertEqual(literal_alternatives("x\\.com"), ["x.com"])
+
+    def test_other_syntax(self):
+        """Test that anything beyond literals is rejected."""
+        for regex in ("git(hub)?", "^doc", "a+", "[ab]", "\\d", "日本"):
+            self.assertIsNone(literal_alternatives(regex), regex)
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Test cases for AhoCorasick."""
+
+    def test_overlapping_keywords(self):
+        """Test the classic he/she/his/hers example."""
+        automaton = AhoCorasick([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+        self.assertEqual(automaton.find("ushers"), {1, 2, 4})
+        self.assertEqual(automaton.find("history"), {3})
+        self.assertEqual(automaton.find("xyz"), set())
+
+    def test_shared_keyword(self):
+        """Test that a keyword registered twice reports both values."""
+        automaton = AhoCorasick([("git", 1), ("git", 2)])
+        self.assertEqual(automaton.find("gitk"), {1, 2})
+
+
+class TestLiteralPrefilter(unittest.TestCase):
+    """Test cases for LiteralPrefilter and the prefilter engine."""
+
+    def test_candidates_in_priority_order(self):
+        """Test that candidates include literal hits and literal-less patterns in order."""
+        prefilter = LiteralPrefilter(["youtube", "[0-9]+", "github|gitlab", "news"])
+        self.assertEqual(prefilter.always_candidates, frozenset({1}))
+        self.assertEqual(prefilter.candidates("GitLab - YouTube"), [0, 1, 2])
+        self.assertEqual(prefilter.candidates("Editor"), [1])
+
+    def test_matches_plain_loop_randomized(self):
+        """Test that the prefilter engine gives exactly the same results as the plain loop."""
+        rng = random.Random(14)
+        atoms = [
+            "git",
+            "hub",
+            "x\\.com",
+            "tu?be",
+            "ne+ws",
+            "a.c",
+            "^doc",
+            "tab$",
+            "(x|y)z",
+            "[0-9]+",
+            "\\d{2}",
+            "(?:ab)+",
+            "\\bweb",
+            "k{0,2}s",
+            "|",
+            "\\s",
+        ]
+        regexes = []
+        while len(regexes) < 300:
+            regex = "".join(rng.choice(atoms) for _ in range(rng.randint(1, 3)))
+            try:
+                re.compile(regex)
+            except re.error:
+                continue
+            regexes.append(regex)
+        patterns = [{"regex": regex} for regex in regexes]
+        prefiltered = PatternSet(patterns, "prefilter")
+
+        alphabet = "githubnewsacdoctabxyz.kKſİı web2"
+        titles = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(3000)]
+        for title in titles:
+            expected = None
+            for pattern in patterns:
+                if re.search(pattern["regex"], title, re.IGNORECASE):
+                    expected = pattern
+                    break
+            self.assertIs(prefiltered.match(title), expected, title)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for match result module."""
+
+import tracemalloc
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from src.match_result import NO_MATCH, SCREENSAVER_MATCH, MatchResult
+    from src.pattern_set import PatternSet
+    from src.score_tracker import ScoreTracker
+    from src.status_formatter import StatusFormatter
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from match_result import NO_MATCH, SCREENSAVER_MATCH, MatchResult
+    from pattern_set import PatternSet
+    from score_tracker import ScoreTracker
+    from status_formatter import StatusFormatter
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+class TestMatchResult(unittest.TestCase):
+    """Test cases for MatchResult."""
+
+    def test_immutable(self):
+        """Test that fields cannot be changed or added."""
+        result = MatchResult(0, 10, "GitHub", "github")
+        with self.assertRaises(AttributeError):
+            result.score = 5
+        with self.assertRaises(AttributeError):
+            result.extra = 1
+
+    def test_dict_compatibility(self):
+        """Test pattern dictionary style access."""
+        result = MatchResult.from_pattern(3, {"regex": "github", "score": 10, "description": "GitHub"})
+        self.assertEqual((result.pattern_id, result["score"], result.get("description")), (3, 10, "GitHub"))
+        self.assertEqual(result.get("regex"), "github")
+        self.assertIsNone(result.get("pattern_id"))
+        self.assertEqual(result.get("missing", 0), 0)
+        with self.assertRaises(KeyError):
+            result["missing"]
+
+    def test_truthiness(self):
+        """Test that only NO_MATCH is falsy."""
+        self.assertFalse(NO_MATCH)
+        self.assertTrue(SCREENSAVER_MATCH)
+        self.assertTrue(MatchResult(0, 0, "Zero score"))
+
+    def test_pattern_set_results(self):
+        """Test that a PatternSet creates one result per pattern up front."""
+        patterns = [{"regex": "github", "score": 10, "description": "GitHub"}, {"regex": ""}]
+        pattern_set = PatternSet(patterns)
+        self.assertEqual([result.pattern_id for result in pattern_set.results], [0, 1])
+        self.assertEqual(pattern_set.results[0].score, 10)
+
+    def test_status_formatter(self):
+        """Test that the status text reads the result fields."""
+        self.assertEqual(StatusFormatter.format_status_text(MatchResult(0, -5, "Twitter"), "x", -1), "Twitter (-5)")
+        self.assertEqual(StatusFormatter.format_status_text(NO_MATCH, "Editor", 0), "Editor")
+
+
+class TestAllocationFreeTicks(unittest.TestCase):
+    """Test cases for allocation-free scoring in steady state."""
+
+    def test_results_are_shared(self):
+        """Test that repeated ticks return the same result objects."""
+        tracker = ScoreTracker(
+            [{"regex": "github", "score": 10, "description": "GitHub"}],
+            self_window_title="Cat Window Watcher",
+        )
+        for title, is_screensaver in (("GitHub", False), ("Unknown", False), ("Cat Window Watcher", False), ("", True)):
+            first = tracker.update(title, is_screensaver)[1]
+            self.assertIs(tracker.update(title, is_screensaver)[1], first, title)
+        self.assertIs(tracker.update("Unknown")[1], NO_MATCH)
+        self.assertIs(tracker.update("", is_screensaver=True)[1], SCREENSAVER_MATCH)
+
+    def test_no_allocations_per_tick(self):
+        """Test with tracemalloc that ticks leave no objects allocated by the app behind."""
+        now = datetime(2024, 1, 1, 12)
+        tracker = ScoreTracker(
+            [{"regex": "github", "score": 10, "description": "GitHub"}],
+            mild_penalty_mode=True,
+            self_window_title="Cat Window Watcher",
+            clock=lambda: now,
+        )
+        ticks = [("GitHub", False), ("Unknown", False), ("Cat Window Watcher", False), ("", True)]
+        for title, is_screensaver in ticks:
+            tracker.update(title, is_screensaver)
+
+        # Keep every result alive, so a result allocated per tick would show up as growth
+        results = [None] * 4000
+        source_filter = [tracemalloc.Filter(True, str(SRC_DIR / "*"))]
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot().filter_traces(source_filter)
+            for tick in range(len(results)):
+                title, is_screensaver = ticks[tick % len(ticks)]
+                results[tick] = tracker.update(title, is_screensaver)[1]
+            after = tracemalloc.take_snapshot().filter_traces(source_filter)
+        finally:
+            tracemalloc.stop()
+
+        # Only counters (score, cache hits) may hold a new int; a per-tick allocation would add thousands
+        growth = sum(stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0)
+        self.assertLess(growth, len(ticks))
+        self.assertEqual(len({id(result) for result in results}), len(ticks))
+
+
+if __name__ == "__main__":
+    unittest.main()
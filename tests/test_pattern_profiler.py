@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for pattern profiler module."""
+
+import io
+import re
+import signal
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src.pattern_profiler import PatternProfiler
+    from src.pattern_set import PatternSet
+    from src.score_tracker import ScoreTracker
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from pattern_profiler import PatternProfiler
+    from pattern_set import PatternSet
+    from score_tracker import ScoreTracker
+
+
+class FakeTimer:
+    """Timer advancing by a fixed step on every call."""
+
+    def __init__(self, step=0.001):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestPatternProfiler(unittest.TestCase):
+    """Test cases for PatternProfiler."""
+
+    def setUp(self):
+        """Set up patterns and a profiler with a fake timer."""
+        self.patterns = [
+            {"regex": "github", "score": 10, "description": "GitHub"},
+            {"regex": "never-seen", "score": -5, "description": "Dead"},
+        ]
+        self.profiler = PatternProfiler(timer=FakeTimer())
+
+    def _stats(self, index):
+        return self.profiler.stats_for(self.patterns[index])
+
+    def test_evaluations_and_hits(self):
+        """Test that every evaluation and every matching tick is recorded."""
+        tracker = ScoreTracker(self.patterns, pattern_profiler=self.profiler)
+        for title in ("GitHub", "GitHub", "Editor"):
+            tracker.update(title)
+
+        # "GitHub" is evaluated once (then cached), "Editor" runs both patterns
+        self.assertEqual(self._stats(0).evaluations, 2)
+        self.assertEqual(self._stats(1).evaluations, 1)
+        self.assertEqual(self._stats(0).hits, 2)
+        self.assertEqual(self._stats(1).hits, 0)
+        self.assertAlmostEqual(self._stats(0).total_seconds, 0.002)
+        self.assertAlmostEqual(self._stats(0).max_seconds, 0.001)
+
+    def test_disabled_is_not_instrumented(self):
+        """Test that without a profiler the plain compiled regexes are used."""
+        tracker = ScoreTracker(self.patterns)
+        for entry in tracker.calculator.pattern_set:
+            self.assertIsInstance(entry.compiled, re.Pattern)
+
+    def test_shared_pattern_set_is_not_modified(self):
+        """Test that instrumenting copies the PatternSet loaded from the config."""
+        pattern_set = PatternSet(self.patterns)
+        ScoreTracker(pattern_set, pattern_profiler=self.profiler)
+        for entry in pattern_set:
+            self.assertIsInstance(entry.compiled, re.Pattern)
+
+    def test_engines_are_instrumented(self):
+        """Test that the combined and prefilter engines record evaluations too."""
+        for engine in ("combined", "prefilter"):
+            profiler = PatternProfiler(timer=FakeTimer())
+            pattern_set = PatternSet(self.patterns, engine).instrumented(profiler)
+            self.assertIs(pattern_set.match("GitHub"), self.patterns[0])
+            evaluations = sum(stats.evaluations for stats in profiler._stats.values())
+            self.assertGreater(evaluations, 0, engine)
+
+    def test_format_table(self):
+        """Test that the table lists the most expensive pattern first."""
+        tracker = ScoreTracker(self.patterns, pattern_profiler=self.profiler)
+        tracker.update("Editor")
+        tracker.update("Terminal")
+        self.profiler.stats_for(self.patterns[1]).total_seconds += 1.0
+
+        lines = self.profiler.format_table().splitlines()
+        self.assertIn("evals", lines[0])
+        self.assertIn("Dead: never-seen", lines[1])
+        self.assertIn("GitHub: github", lines[2])
+
+        output = io.StringIO()
+        self.profiler.dump(output)
+        self.assertIn("Pattern Profile", output.getvalue())
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "SIGUSR1 is not available")
+    def test_install(self):
+        """Test that install registers the exit and SIGUSR1 dumps."""
+        previous = signal.getsignal(signal.SIGUSR1)
+        self.addCleanup(signal.signal, signal.SIGUSR1, previous)
+        with patch("atexit.register") as register, patch.object(self.profiler, "dump") as dump:
+            self.profiler.install()
+            register.assert_called_once_with(self.profiler.dump)
+            signal.getsignal(signal.SIGUSR1)(signal.SIGUSR1, None)
+            dump.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
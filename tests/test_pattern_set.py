@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Tests for pattern set module."""
+
+import random
+import unittest
+from pathlib import Path
+
+try:
+    from src.pattern_set import PatternSet
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from pattern_set import PatternSet
+
+
+class TestPatternSet(unittest.TestCase):
+    """Test cases for PatternSet."""
+
+    def setUp(self):
+        """Set up test patterns."""
+        self.patterns = [
+            {"regex": "github", "score": 10, "description": "GitHub"},
+            {"regex": "", "score": 99, "description": "Disabled"},
+            {"regex": "git", "score": 5, "description": "Git"},
+            {"regex": "twitter|x\\.com", "score": -5, "description": "Social"},
+        ]
+        self.pattern_set = PatternSet(self.patterns)
+
+    def test_first_match_wins(self):
+        """Test that patterns are tried in configuration order."""
+        self.assertIs(self.pattern_set.match("GitHub - Issues"), self.patterns[0])
+        self.assertIs(self.pattern_set.match("gitk"), self.patterns[2])
+
+    def test_case_insensitive(self):
+        """Test that matching ignores case like re.IGNORECASE."""
+        self.assertIs(self.pattern_set.match("TWITTER"), self.patterns[3])
+
+    def test_no_match(self):
+        """Test that an unmatched title returns None."""
+        self.assertIsNone(self.pattern_set.match("Unknown"))
+        self.assertIsNone(PatternSet().match("GitHub"))
+
+    def test_empty_regex_is_skipped(self):
+        """Test that empty regexes never match but are kept as patterns."""
+        self.assertEqual(len(self.pattern_set), 3)
+        self.assertEqual(self.pattern_set.patterns, tuple(self.patterns))
+
+    def test_invalid_regex(self):
+        """Test that a broken regex raises ValueError naming the pattern."""
+        with self.assertRaisesRegex(ValueError, r"window_patterns\[1\].*Broken"):
+            PatternSet([{"regex": "ok"}, {"regex": "[unclosed", "description": "Broken"}])
+
+    def test_non_string_regex(self):
+        """Test that a non-string regex raises ValueError."""
+        with self.assertRaises(ValueError):
+            PatternSet([{"regex": 42}])
+
+    def test_from_patterns_reuses_instance(self):
+        """Test that from_patterns does not recompile an existing PatternSet."""
+        self.assertIs(PatternSet.from_patterns(self.pattern_set), self.pattern_set)
+        self.assertIsInstance(PatternSet.from_patterns(self.patterns), PatternSet)
+
+
+class TestCombinedEngine(unittest.TestCase):
+    """Test cases for the combined match engine."""
+
+    def assert_same_as_sequential(self, patterns, titles):
+        """Assert that both engines pick the same pattern for every title."""
+        sequential = PatternSet(patterns, "sequential")
+        combined = PatternSet(patterns, "combined")
+        for title in titles:
+            self.assertIs(combined.match(title), sequential.match(title), title)
+
+    def test_first_match_wins_over_leftmost_match(self):
+        """Test that file order wins even when a later pattern matches earlier in the title."""
+        patterns = [
+            {"regex": "issues", "score": 1, "description": "Issues"},
+            {"regex": "github", "score": 2, "description": "GitHub"},
+        ]
+        self.assertIs(PatternSet(patterns, "combined").match("GitHub - Issues"), patterns[0])
+
+    def test_unmergeable_patterns(self):
+        """Test that backreferences, inline flags and duplicate group names keep working."""
+        patterns = [
+            {"regex": "(a)(b)c"},
+            {"regex": "(x)\\1"},
+            {"regex": "(?s)start.end"},
+            {"regex": "(?P<name>foo)"},
+            {"regex": "(?P<name>bar)"},
+            {"regex": "(?i:zz)|^head"},
+            {"regex": "(?P<w>w)(?P=w)"},
+            {"regex": "\\bword$"},
+        ]
+        titles = ["abc", "xx", "start\nend", "startend", "foobar", "bar", "ZZ", "head", "ww", "a word", "nothing"]
+        self.assert_same_as_sequential(patterns, titles)
+
+    def test_matches_sequential_randomized(self):
+        """Test that the combined engine agrees with the sequential engine on random input."""
+        rng = random.Random(13)
+        atoms = ["git", "hub", "news", "a.c", "^doc", "tab$", "(x|y)z", "[0-9]+", "\\d{2}", "(?:ab)+", "\\bweb"]
+        patterns = [{"regex": "".join(rng.sample(atoms, rng.randint(1, 2)))} for _ in range(200)]
+        patterns.insert(50, {"regex": "(q)\\1"})
+        alphabet = "githubnewsacdoctabxyz web2"
+        titles = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(2000)]
+        self.assert_same_as_sequential(patterns, titles)
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine name raises ValueError."""
+        with self.assertRaises(ValueError):
+            PatternSet([], "dfa")
+
+
+class TestExactRules(unittest.TestCase):
+    """Test cases for process, title and domain rules."""
+
+    def setUp(self):
+        """Set up mixed regex and exact-match patterns."""
+        self.patterns = [
+            {"regex": "review", "score": 3, "description": "Review"},
+            {"process": "Code.exe", "score": 5, "description": "VS Code"},
+            {"title": "Inbox - Mail", "score": -1, "description": "Mail"},
+            {"domain": "youtube.com", "score": -5, "description": "YouTube"},
+            {"regex": "code", "score": 1, "description": "Code"},
+            {"process": "code.exe", "score": 99, "description": "Duplicate"},
+        ]
+
+    def test_process_rule(self):
+        """Test that process rules match the process name case-insensitively."""
+        pattern_set = PatternSet(self.patterns)
+        self.assertIs(pattern_set.match("main.py", "code.EXE"), self.patterns[1])
+        self.assertIsNone(pattern_set.match("main.py"))
+        self.assertTrue(pattern_set.needs_process_name)
+        self.assertFalse(PatternSet([{"regex": "x"}]).needs_process_name)
+
+    def test_title_rule(self):
+        """Test that title rules match the whole title only."""
+        pattern_set = PatternSet(self.patterns)
+        self.assertIs(pattern_set.match("inbox - mail"), self.patterns[2])
+        self.assertIsNone(pattern_set.match("Inbox - Mail (3)"))
+
+    def test_domain_rule(self):
+        """Test that domain rules match the domain and its subdomains, not lookalikes."""
+        pattern_set = PatternSet(self.patterns)
+        self.assertIs(pattern_set.match("youtube.com - Firefox"), self.patterns[3])
+        self.assertIs(pattern_set.match("Video - https://www.YouTube.com/watch?v=1"), self.patterns[3])
+        self.assertIsNone(pattern_set.match("notyoutube.com - Firefox"))
+        self.assertIsNone(pattern_set.match("youtube.com.evil.org"))
+        self.assertIs(PatternSet([{"domain": "*.example.org."}]).match_index("docs.example.org"), 0)
+
+    def test_configuration_order_across_kinds(self):
+        """Test that an earlier pattern wins regardless of its kind."""
+        pattern_set = PatternSet(self.patterns)
+        # The regex listed before the process rule wins
+        self.assertIs(pattern_set.match("code review", "Code.exe"), self.patterns[0])
+        # The process rule wins over the later regex
+        self.assertIs(pattern_set.match("code", "Code.exe"), self.patterns[1])
+        self.assertIs(pattern_set.match("code"), self.patterns[4])
+        # The title rule wins over the later domain rule
+        patterns = [{"title": "youtube.com"}, {"domain": "youtube.com"}]
+        self.assertEqual(PatternSet(patterns).match_index("YouTube.com"), 0)
+
+    def test_engines_agree(self):
+        """Test that every engine keeps the configuration order with exact-match rules."""
+        cases = [("code review", "Code.exe"), ("code", "code.exe"), ("code", ""), ("m.youtube.com code", ""), ("x", "")]
+        expected = [PatternSet(self.patterns).match_index(*case) for case in cases]
+        for engine in ("combined", "prefilter"):
+            pattern_set = PatternSet(self.patterns, engine)
+            self.assertEqual([pattern_set.match_index(*case) for case in cases], expected, engine)
+
+    def test_match_all(self):
+        """Test that match_all returns every matching pattern in configuration order."""
+        pattern_set = PatternSet(self.patterns)
+        self.assertEqual(pattern_set.match_all("code review", "Code.exe"), [0, 1, 4])
+        self.assertEqual(pattern_set.match_all("nothing"), [])
+
+    def test_len_counts_distinct_rules(self):
+        """Test that duplicate exact-match rules are counted once."""
+        self.assertEqual(len(PatternSet(self.patterns)), 5)
+
+    def test_invalid_rules(self):
+        """Test that several rules in one pattern or a non-string value raise ValueError."""
+        with self.assertRaisesRegex(ValueError, r"window_patterns\[0\]"):
+            PatternSet([{"regex": "a", "process": "a.exe"}])
+        with self.assertRaisesRegex(ValueError, r"window_patterns\[0\]"):
+            PatternSet([{"title": "a", "domain": "a.com"}])
+        with self.assertRaises(ValueError):
+            PatternSet([{"domain": 42}])
+
+    def test_many_rules(self):
+        """Test lookups among many exact-match rules."""
+        patterns = [{"process": f"app{i}.exe"} for i in range(10000)]
+        patterns += [{"domain": f"site{i}.com"} for i in range(10000)]
+        pattern_set = PatternSet(patterns)
+        self.assertEqual(pattern_set.match_index("", "APP9999.exe"), 9999)
+        self.assertEqual(pattern_set.match_index("www.site42.com - Browser"), 10042)
+
+
+class TestIncrementalRebuild(unittest.TestCase):
+    """Test cases for building a PatternSet from the previous configuration."""
+
+    def setUp(self):
+        """Set up a large pattern list and a copy with one changed pattern."""
+        self.patterns = [{"regex": f"site{i}\\.example|repo{i}", "score": 1} for i in range(1000)]
+        self.changed = list(self.patterns)
+        self.changed[500] = {"regex": "changed", "score": 2}
+
+    def test_compiled_regexes_are_reused(self):
+        """Test that only the changed regex and its merged run are compiled again."""
+        for engine in ("sequential", "combined", "prefilter"):
+            with self.subTest(engine=engine):
+                previous = PatternSet(self.patterns, engine)
+                rebuilt = PatternSet(self.changed, engine, previous=previous)
+                reused = [new.compiled is old.compiled for new, old in zip(rebuilt, previous)]
+                self.assertEqual(reused.count(False), 1)
+                self.assertEqual(rebuilt.match_index("x changed"), 500)
+                self.assertEqual(rebuilt.match_index("site999.example"), 999)
+
+        previous = PatternSet(self.patterns, "combined")
+        rebuilt = PatternSet(self.changed, "combined", previous=previous)
+        self.assertGreater(len(previous._merged), 2)
+        self.assertEqual(len(set(rebuilt._merged.values()) - set(previous._merged.values())), 1)
+
+    def test_instrumented_reuses_compiled(self):
+        """Test that instrumenting a set does not compile its regexes again."""
+        pattern_set = PatternSet(self.patterns[:10], "prefilter")
+        instrumented = pattern_set.instrumented()
+        self.assertTrue(all(new.compiled is old.compiled for new, old in zip(instrumented, pattern_set)))
+
+    def test_unchanged_prefix(self):
+        """Test counting the leading patterns whose rules did not change."""
+        previous = PatternSet(self.patterns)
+        self.assertEqual(PatternSet(self.changed).unchanged_prefix(previous), 500)
+        rescored = [dict(pattern, score=5) for pattern in self.patterns]
+        self.assertEqual(PatternSet(rescored).unchanged_prefix(previous), 1000)
+        self.assertEqual(PatternSet(self.patterns + [{"title": "x"}]).unchanged_prefix(previous), 1000)
+        self.assertEqual(PatternSet([{"process": "x"}] + self.patterns).unchanged_prefix(previous), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for shadowed pattern analysis module."""
+
+import random
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from src.pattern_set import PatternSet
+    from src.pattern_shadowing import find_shadowed_patterns, format_finding, read_title_corpus
+    from src.session_recorder import SessionRecorder
+    from src.title_normalizer import TitleNormalizer
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from pattern_set import PatternSet
+    from pattern_shadowing import find_shadowed_patterns, format_finding, read_title_corpus
+    from session_recorder import SessionRecorder
+    from title_normalizer import TitleNormalizer
+    from window_snapshot import WindowSnapshot
+
+
+class TestStaticAnalysis(unittest.TestCase):
+    """Test cases for proven shadowing."""
+
+    def findings(self, patterns):
+        """Get {shadowed index: shadowing index} for proven findings."""
+        return {finding.index: finding.shadowed_by for finding in find_shadowed_patterns(patterns) if finding.proven}
+
+    def test_literal_subsumption(self):
+        """Test that a broad literal alternation shadows more specific later patterns."""
+        patterns = [
+            {"regex": "terminal|bash", "description": "Shell"},
+            {"regex": "bash - deploy", "description": "Deploy"},
+            {"regex": "^Terminal \\d+|xbash"},
+            {"regex": "deploy"},
+            {"regex": "bash|zsh"},
+        ]
+        self.assertEqual(self.findings(patterns), {1: 0, 2: 0})
+
+    def test_overlapping_patterns(self):
+        """Test that overlapping patterns are only reported when fully covered."""
+        patterns = [
+            {"regex": "github"},
+            {"regex": "git"},
+            {"regex": "git(hub)?"},
+            {"regex": "^github$"},
+            {"regex": "g.thub"},
+        ]
+        # Every "git(hub)?" match contains "git", and every "^github$" match contains "github"
+        self.assertEqual(self.findings(patterns), {2: 1, 3: 0})
+
+    def test_exact_rules(self):
+        """Test duplicate process rules, subdomains and matched title rules."""
+        patterns = [
+            {"process": "Code.exe"},
+            {"domain": "youtube.com"},
+            {"regex": "inbox"},
+            {"process": "code.EXE"},
+            {"domain": "m.YouTube.com"},
+            {"title": "Inbox - Mail"},
+            {"domain": "tube.com"},
+            {"title": "Calendar"},
+        ]
+        self.assertEqual(self.findings(patterns), {3: 0, 4: 1, 5: 2})
+
+    def test_regex_after_domain_rule(self):
+        """Test that a literal regex shadows a later domain rule containing the literal."""
+        patterns = [{"regex": "youtube"}, {"domain": "youtube.com"}]
+        self.assertEqual(self.findings(patterns), {1: 0})
+
+    def test_normalized_titles(self):
+        """Test that title rules are checked against the normalized title."""
+        normalizer = TitleNormalizer([" - Google Chrome"])
+        patterns = [
+            {"regex": "chrome"},
+            {"regex": "mail"},
+            {"title": "Inbox - Google Chrome"},
+            {"title": "Mail - Google Chrome"},
+            {"title": "INBOX"},
+        ]
+        findings = find_shadowed_patterns(patterns, normalizer=normalizer)
+        self.assertEqual({finding.index: finding.shadowed_by for finding in findings}, {3: 1, 4: 2})
+
+    def test_inline_flags_are_not_proven(self):
+        """Test that an earlier regex with scoped flags does not prove a title rule shadowed."""
+        patterns = [{"regex": "(?-i:Inbox)"}, {"title": "Inbox - Mail"}]
+        self.assertEqual(self.findings(patterns), {})
+        self.assertEqual(PatternSet(patterns).match_index("INBOX - MAIL"), 1)
+
+        findings = find_shadowed_patterns(patterns, [("Inbox - Mail", "")])
+        self.assertEqual([(finding.index, finding.proven) for finding in findings], [(1, False)])
+
+    def test_proven_findings_never_win(self):
+        """Test that dropping proven findings never changes the winning pattern."""
+        rng = random.Random(21)
+        atoms = ["git", "hub", "bash", "term", "a.c", "^doc", "x|y", "[0-9]+", "news"]
+        patterns = [{"regex": "".join(rng.sample(atoms, rng.randint(1, 2)))} for _ in range(150)]
+        dropped = {finding.index for finding in find_shadowed_patterns(patterns) if finding.proven}
+        self.assertTrue(dropped)
+        full = PatternSet(patterns)
+        kept_indexes = [index for index in range(len(patterns)) if index not in dropped]
+        kept = PatternSet([patterns[index] for index in kept_indexes])
+        alphabet = "githubashtermacdocxynews0123 "
+        for _ in range(3000):
+            title = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25)))
+            expected = full.match_index(title)
+            actual = kept.match_index(title)
+            self.assertEqual(kept_indexes[actual] if actual is not None else None, expected, title)
+
+    def test_format_finding(self):
+        """Test the warning text names both patterns."""
+        patterns = [{"regex": "bash", "description": "Shell"}, {"regex": "bash -", "description": "Deploy"}]
+        text = format_finding(find_shadowed_patterns(patterns)[0], patterns)
+        self.assertIn("#2 'Deploy'", text)
+        self.assertIn("#1 'Shell'", text)
+        self.assertIn("can never win", text)
+
+
+class TestCorpusProbing(unittest.TestCase):
+    """Test cases for shadowing found with a title corpus."""
+
+    def test_never_won_in_corpus(self):
+        """Test that patterns that matched but never won are reported as unproven."""
+        patterns = [
+            {"regex": "[a-z]+ - visual studio code"},
+            {"regex": "\\.py\\b"},
+            {"regex": "firefox"},
+        ]
+        corpus = [("main.py - Visual Studio Code", ""), ("util.py - Visual Studio Code", ""), ("Firefox", "")]
+        findings = find_shadowed_patterns(patterns, corpus)
+        self.assertEqual([(f.index, f.shadowed_by, f.proven) for f in findings], [(1, 0, False)])
+        self.assertIn("2 corpus title(s)", findings[0].reason)
+
+    def test_won_once_is_not_reported(self):
+        """Test that a pattern that won for any corpus title is not reported."""
+        patterns = [{"regex": "\\.py - code"}, {"regex": "\\.py\\b"}]
+        corpus = [("a.py - Code", ""), ("b.py - vim", "")]
+        self.assertEqual(find_shadowed_patterns(patterns, corpus), [])
+
+    def test_read_title_corpus(self):
+        """Test reading a text title list and a session log."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            text_path = Path(temp_dir) / "titles.txt"
+            text_path.write_text("GitHub\n\nmain.py - vim\n", encoding="utf-8")
+            self.assertEqual(read_title_corpus(text_path), [("GitHub", ""), ("main.py - vim", "")])
+
+            log_path = Path(temp_dir) / "session.cwwlog"
+            recorder = SessionRecorder(str(log_path))
+            recorder.record(WindowSnapshot("GitHub", "firefox", None, False, datetime(2024, 1, 1, 12)))
+            recorder.close()
+            self.assertEqual(read_title_corpus(log_path), [("GitHub", "firefox")])
+
+
+if __name__ == "__main__":
+    unittest.main()
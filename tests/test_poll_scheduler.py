@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Tests for adaptive polling scheduler."""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+try:
+    from src.poll_scheduler import GameModePolicy, PollScheduler, StabilityBackoffPolicy
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from poll_scheduler import GameModePolicy, PollScheduler, StabilityBackoffPolicy
+    from window_snapshot import WindowSnapshot
+
+
+class TestStabilityBackoffPolicy(unittest.TestCase):
+    """Test cases for StabilityBackoffPolicy."""
+
+    def setUp(self):
+        """Set up a policy between 1 and 8 seconds."""
+        self.policy = StabilityBackoffPolicy(1000, 8000, backoff_factor=2)
+
+    def test_backs_off_while_stable(self):
+        """Test that the interval doubles up to the maximum while the title is unchanged."""
+        intervals = [self.policy.propose(WindowSnapshot("Editor")) for _ in range(6)]
+        self.assertEqual(intervals, [1000, 2000, 4000, 8000, 8000, 8000])
+
+    def test_snaps_back_on_change(self):
+        """Test that a title change returns to the minimum interval."""
+        for _ in range(4):
+            self.policy.propose(WindowSnapshot("Editor"))
+        self.assertEqual(self.policy.propose(WindowSnapshot("Browser")), 1000)
+
+    def test_idle_change_counts_as_change(self):
+        """Test that entering idle state snaps back even with the same title."""
+        for _ in range(4):
+            self.policy.propose(WindowSnapshot(""))
+        self.assertEqual(self.policy.propose(WindowSnapshot("", is_idle=True)), 1000)
+
+
+class TestGameModePolicy(unittest.TestCase):
+    """Test cases for GameModePolicy."""
+
+    def test_game_interval_and_messages(self):
+        """Test the game interval while playing and the transition messages."""
+        policy = GameModePolicy(["SF6.exe"], 60000, 1000)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertIsNone(policy.propose(WindowSnapshot("Editor", "code")))
+            self.assertEqual(policy.propose(WindowSnapshot("Street Fighter 6", "SF6.exe")), 60000)
+            self.assertTrue(policy.is_game_playing)
+            self.assertIsNone(policy.propose(WindowSnapshot("Editor", "code")))
+
+        self.assertIn("Game detected (SF6.exe), switching to 60 second check interval", output.getvalue())
+        self.assertIn("Game ended, switching back to 1 second check interval", output.getvalue())
+
+
+class TestPollScheduler(unittest.TestCase):
+    """Test cases for PollScheduler."""
+
+    def test_base_interval_without_policies(self):
+        """Test that the base interval is used when no policy proposes one."""
+        scheduler = PollScheduler(1000)
+        self.assertEqual(scheduler.next_interval(WindowSnapshot("Editor")), 1000)
+
+    def test_longest_proposal_wins_within_bounds(self):
+        """Test that the longest proposal is used and clamped to the maximum."""
+        scheduler = PollScheduler(
+            1000,
+            [StabilityBackoffPolicy(1000, 30000), GameModePolicy(["game"], 60000, 1000)],
+            min_interval_ms=1000,
+            max_interval_ms=30000,
+        )
+        self.assertEqual(scheduler.next_interval(WindowSnapshot("Editor", "code")), 1000)
+        for _ in range(6):
+            interval = scheduler.next_interval(WindowSnapshot("Editor", "code"))
+        self.assertEqual(interval, 30000)
+
+    def test_game_interval_is_fixed(self):
+        """Test that game mode keeps its own interval outside the bounds and counts one tick."""
+        scheduler = PollScheduler(
+            1000,
+            [StabilityBackoffPolicy(1000, 30000), GameModePolicy(["game"], 60000, 1000)],
+            min_interval_ms=1000,
+            max_interval_ms=30000,
+        )
+        with redirect_stdout(io.StringIO()):
+            interval = scheduler.next_interval(WindowSnapshot("Game", "game"))
+            self.assertEqual(interval, 60000)
+            self.assertEqual(scheduler.elapsed_ticks(interval), 1)
+            scheduler.next_interval(WindowSnapshot("Editor", "code"))
+        self.assertEqual(scheduler.elapsed_ticks(8000), 8)
+
+    def test_elapsed_ticks(self):
+        """Test conversion of intervals into base ticks."""
+        scheduler = PollScheduler(1000)
+        self.assertEqual(scheduler.elapsed_ticks(1000), 1)
+        self.assertEqual(scheduler.elapsed_ticks(8000), 8)
+        self.assertEqual(scheduler.elapsed_ticks(10), 1)
+
+    def test_scaled_score_matches_fixed_polling(self):
+        """Test that scaling by elapsed ticks keeps the total score of a stable session."""
+        scheduler = PollScheduler(1000, [StabilityBackoffPolicy(1000, 16000)], 1000, 16000)
+        scores = {"Editor": 2, "Browser": -1}
+        timeline = ["Editor"] * 100 + ["Browser"] * 100
+
+        second = 0
+        interval = 1000
+        total = 0
+        wakeups = 0
+        while second < len(timeline):
+            ticks = scheduler.elapsed_ticks(interval) if wakeups else 1
+            total += scores[timeline[second]] * ticks
+            wakeups += 1
+            interval = scheduler.next_interval(WindowSnapshot(timeline[second]))
+            second += interval // 1000
+
+        fixed_total = sum(scores[title] for title in timeline)
+        self.assertLess(wakeups, 40)
+        self.assertLessEqual(abs(total - fixed_total), 16 * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
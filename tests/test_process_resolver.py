@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for /proc-based process name resolver."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from src.process_resolver import ProcessNameResolver
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from process_resolver import ProcessNameResolver
+
+
+def _stat_line(pid, comm, start_time):
+    """Build a /proc/<pid>/stat line with the given start time (field 22)."""
+    # Fields 3..21 are filled with zeros, field 22 is the start time
+    fields = ["S"] + ["0"] * 18 + [str(start_time)] + ["0"] * 10
+    return f"{pid} ({comm}) " + " ".join(fields) + "\n"
+
+
+class TestProcessNameResolver(unittest.TestCase):
+    """Test cases for ProcessNameResolver."""
+
+    def setUp(self):
+        """Create a fake proc filesystem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.proc_root = Path(self.temp_dir)
+        (self.proc_root / "self").mkdir()
+        (self.proc_root / "self" / "stat").write_text(_stat_line(1, "python", 1))
+        self.resolver = ProcessNameResolver(proc_root=self.proc_root, max_entries=2)
+
+    def tearDown(self):
+        """Remove the fake proc filesystem."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _add_process(self, pid, comm, start_time):
+        process_dir = self.proc_root / str(pid)
+        process_dir.mkdir(exist_ok=True)
+        (process_dir / "stat").write_text(_stat_line(pid, comm, start_time))
+        (process_dir / "comm").write_text(comm + "\n")
+
+    def test_resolve(self):
+        """Test resolving a pid to its process name."""
+        self._add_process(100, "firefox", 5000)
+        self.assertTrue(self.resolver.is_available())
+        self.assertEqual(self.resolver.resolve(100), "firefox")
+
+    def test_comm_with_spaces_and_parentheses(self):
+        """Test that stat parsing handles unusual process names."""
+        self._add_process(101, "Web Content (x)", 5001)
+        self.assertEqual(self.resolver.resolve(101), "Web Content (x)")
+
+    def test_missing_process(self):
+        """Test that a missing pid resolves to empty string."""
+        self.assertEqual(self.resolver.resolve(424242), "")
+
+    def test_cached_by_pid_and_start_time(self):
+        """Test that comm is read once per (pid, start time)."""
+        self._add_process(100, "firefox", 5000)
+        self.resolver.resolve(100)
+        (self.proc_root / "100" / "comm").write_text("changed\n")
+        self.assertEqual(self.resolver.resolve(100), "firefox")
+
+    def test_pid_reuse_detected(self):
+        """Test that a reused pid with a new start time is resolved again."""
+        self._add_process(100, "firefox", 5000)
+        self.assertEqual(self.resolver.resolve(100), "firefox")
+        self._add_process(100, "bash", 9000)
+        self.assertEqual(self.resolver.resolve(100), "bash")
+
+    def test_cache_is_bounded(self):
+        """Test that the name cache does not grow beyond max_entries."""
+        for pid in range(200, 210):
+            self._add_process(pid, f"proc{pid}", pid)
+            self.resolver.resolve(pid)
+        self.assertEqual(len(self.resolver._name_cache), 2)
+
+    def test_window_pid_lookup_cached(self):
+        """Test that the window pid lookup runs only on cache misses."""
+        calls = []
+
+        def lookup():
+            calls.append(1)
+            return 100
+
+        for _ in range(3):
+            self.assertEqual(self.resolver.get_window_pid("0x1", lookup), 100)
+        self.assertEqual(len(calls), 1)
+
+        self.resolver.forget_window("0x1")
+        self.resolver.get_window_pid("0x1", lookup)
+        self.assertEqual(len(calls), 2)
+
+        # Focus moving away and back looks the pid up again
+        self.resolver.note_active_window("0x1")
+        self.resolver.get_window_pid("0x1", lookup)
+        self.resolver.note_active_window("0x1")
+        self.resolver.get_window_pid("0x1", lookup)
+        self.assertEqual(len(calls), 3)
+        self.resolver.note_active_window("0x2")
+        self.resolver.note_active_window("0x1")
+        self.resolver.get_window_pid("0x1", lookup)
+        self.assertEqual(len(calls), 4)
+
+    def test_unavailable_without_proc(self):
+        """Test that is_available is False without a proc filesystem."""
+        resolver = ProcessNameResolver(proc_root=self.proc_root / "missing")
+        self.assertFalse(resolver.is_available())
+
+
+@unittest.skipUnless(Path("/proc/self/comm").exists(), "requires /proc")
+class TestProcessNameResolverRealProc(unittest.TestCase):
+    """Test cases against the real /proc filesystem."""
+
+    def test_resolve_own_process(self):
+        """Test resolving the current process."""
+        expected = Path("/proc/self/comm").read_text().strip()
+        self.assertEqual(ProcessNameResolver().resolve(os.getpid()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Tests for ReDoS-safe matching module."""
+
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src.coprocess import CoprocessError
+    from src.pattern_set import PatternSet
+    from src.regex_safety import GuardedRegex, RegexGuard, find_redos_risks
+    from src.score_tracker import ScoreTracker
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from coprocess import CoprocessError
+    from pattern_set import PatternSet
+    from regex_safety import GuardedRegex, RegexGuard, find_redos_risks
+    from score_tracker import ScoreTracker
+
+CATASTROPHIC = {"regex": "^(a+)+$", "score": 5, "description": "Catastrophic"}
+
+
+class TestFindRedosRisks(unittest.TestCase):
+    """Test cases for the static check."""
+
+    def test_safe_patterns(self):
+        """Test that ordinary patterns have no risks."""
+        for regex in ("github", "twitter|x\\.com", "^Editor \\d+ - ", "(foo)?bar+", "a{2,3}", "[(+*)]+", "\\(a+\\)+"):
+            self.assertEqual(find_redos_risks(regex), [], regex)
+
+    def test_nested_quantifier(self):
+        """Test that quantified groups containing quantifiers are reported."""
+        for regex in ("(a+)+", "(\\w+\\s?)*$", "((ab)*)+", "(?:x*y){2,}", "(a{1,5})*"):
+            self.assertTrue(any("nested quantifier" in risk for risk in find_redos_risks(regex)), regex)
+
+    def test_quantified_alternation(self):
+        """Test that quantified alternations are reported."""
+        self.assertIn("quantified alternation", find_redos_risks("(a|ab)*c")[0])
+        self.assertEqual(find_redos_risks("(a|ab)?c"), [])
+
+    def test_unbounded_wildcards(self):
+        """Test that several unbounded wildcards are reported."""
+        self.assertTrue(find_redos_risks(".*a.*b.*c"))
+        self.assertEqual(find_redos_risks(".*a.*b"), [])
+
+
+class TestRegexGuard(unittest.TestCase):
+    """Test cases for RegexGuard with the real worker process."""
+
+    def setUp(self):
+        """Create a guard with a short budget."""
+        self.guard = RegexGuard(time_budget=0.5)
+        self.addCleanup(self.guard.close)
+
+    def test_worker_matches(self):
+        """Test that risky patterns are evaluated correctly in the worker."""
+        self.assertTrue(self.guard.search(CATASTROPHIC, "AAAA"))
+        self.assertFalse(self.guard.search(CATASTROPHIC, "aab"))
+        self.assertTrue(self.guard.search({"regex": "日本(語)+"}, "日本語\nタイトル"))
+
+    def test_quarantine_after_budget(self):
+        """Test that a pattern exceeding the budget is quarantined and stays bounded."""
+        title = "a" * 40 + "!"
+        with patch("builtins.print"):
+            start = time.monotonic()
+            self.assertFalse(self.guard.search(CATASTROPHIC, title))
+            self.assertLess(time.monotonic() - start, 3.0)
+
+        self.assertEqual(self.guard.get_quarantined()[0][:2], ("Catastrophic", "^(a+)+$"))
+        start = time.monotonic()
+        self.assertFalse(self.guard.search(CATASTROPHIC, "aaaa"))
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_first_evaluation_within_tight_budget(self):
+        """Test that worker startup does not count against the budget of the first evaluation."""
+        guard = RegexGuard(time_budget=0.03)
+        self.addCleanup(guard.close)
+        self.assertTrue(guard.search({"regex": "(a+)+$", "description": "Benign"}, "aaa"))
+        self.assertEqual(guard.get_quarantined(), [])
+
+    def test_worker_failure_fails_open(self):
+        """Test that a crashed worker is reported once and quarantines nothing."""
+
+        class CrashingWorker:
+            def start(self):
+                pass
+
+            def request(self, query):
+                raise CoprocessError("Helper exited unexpectedly")
+
+            def close(self):
+                pass
+
+        guard = RegexGuard(coprocess=CrashingWorker())
+        with patch("builtins.print") as mock_print:
+            self.assertFalse(guard.search(CATASTROPHIC, "aaaa"))
+            self.assertFalse(guard.search(CATASTROPHIC, "aaaa"))
+        self.assertEqual(mock_print.call_count, 1)
+        self.assertEqual(guard.get_quarantined(), [])
+
+    def test_safe_mode_in_score_tracker(self):
+        """Test that only risky patterns are guarded, for every match engine."""
+        patterns = [{"regex": "github", "score": 10, "description": "GitHub"}, CATASTROPHIC]
+        for engine in ("sequential", "combined", "prefilter"):
+            with patch("builtins.print"):
+                tracker = ScoreTracker(PatternSet(patterns, engine), regex_guard=self.guard)
+            entries = list(tracker.calculator.pattern_set)
+            self.assertNotIsInstance(entries[0].compiled, GuardedRegex, engine)
+            self.assertIsInstance(entries[1].compiled, GuardedRegex, engine)
+
+            _, matched = tracker.update("aaaa")
+            self.assertEqual(matched.pattern_id, 1, engine)
+            _, matched = tracker.update("GitHub")
+            self.assertEqual(matched["description"], "GitHub", engine)
+        self.assertEqual(tracker.get_quarantined_patterns(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Tests for session replay module."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src.config import Config
+    from src.replay import HeadlessRoot, VirtualClock, create_score_tracker, read_trace, replay_session
+    from src.session_recorder import SessionRecorder
+    from src.window_behavior import WindowBehaviorManager
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from config import Config
+    from replay import HeadlessRoot, VirtualClock, create_score_tracker, read_trace, replay_session
+    from session_recorder import SessionRecorder
+    from window_behavior import WindowBehaviorManager
+    from window_snapshot import WindowSnapshot
+
+START = datetime(2024, 1, 1, 21, 50, 0)
+
+CONFIG = """
+default_score = -1
+mild_penalty_mode = true
+mild_penalty_start_hour = 22
+mild_penalty_end_hour = 23
+reset_score_every_30_minutes = true
+
+[[window_patterns]]
+description = "GitHub"
+regex = "github"
+score = 10
+
+[[window_patterns]]
+description = "News"
+regex = "news"
+score = -5
+"""
+
+
+def _trace():
+    """Build a per-second trace crossing the mild penalty and 30-minute reset boundaries."""
+    titles = ["GitHub - Issues"] * 300 + ["News - Home"] * 600 + [""] * 120 + ["Unknown"] * 900 + ["GitHub"] * 300
+    return [
+        WindowSnapshot(title, "", None, title == "", START + timedelta(seconds=i)) for i, title in enumerate(titles)
+    ]
+
+
+class TestReplay(unittest.TestCase):
+    """Test cases for replay_session and trace readers."""
+
+    def setUp(self):
+        """Write the configuration file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = Path(self.temp_dir) / "config.toml"
+        self.config_path.write_text(CONFIG)
+        self.config = Config(str(self.config_path))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _live_timeline(self, snapshots):
+        """Score snapshots the way the live GUI does, with datetime.now() patched per tick."""
+        module = create_score_tracker.__module__.replace("replay", "score_tracker")
+        with patch(f"{module}.datetime") as mock_datetime:
+            mock_datetime.now.return_value = snapshots[0].timestamp
+            tracker = create_score_tracker(self.config, None)
+            behavior_manager = WindowBehaviorManager(HeadlessRoot(), self.config, tracker)
+            timeline = []
+            for snapshot in snapshots:
+                mock_datetime.now.return_value = snapshot.timestamp
+                tracker.update_from_snapshot(snapshot)
+                if not behavior_manager.update_score_decreasing_topmost():
+                    behavior_manager.update_proximity_based_topmost()
+                behavior_manager.update_window_transparency(1000)
+                timeline.append((snapshot.timestamp, tracker.get_score()))
+        return timeline
+
+    def test_matches_live_timeline(self):
+        """Test that replay produces the same score timeline as live operation."""
+        snapshots = _trace()
+        self.assertEqual(replay_session(snapshots, self.config), self._live_timeline(snapshots))
+
+    def test_fill_ticks_from_focus_changes(self):
+        """Test that a focus-change-only trace expands to one update per tick."""
+        changes = [
+            WindowSnapshot("GitHub", "", None, False, START),
+            WindowSnapshot("News", "", None, False, START + timedelta(seconds=3)),
+            WindowSnapshot("News", "", None, False, START + timedelta(seconds=5)),
+        ]
+        timeline = replay_session(changes, self.config, tick_seconds=1)
+        self.assertEqual([score for _, score in timeline], [10, 20, 30, 25, 20, 15])
+
+    def test_empty_trace(self):
+        """Test that an empty trace yields an empty timeline."""
+        self.assertEqual(replay_session([], self.config), [])
+
+    def test_read_jsonl(self):
+        """Test reading a JSONL trace."""
+        path = Path(self.temp_dir) / "trace.jsonl"
+        records = [
+            {"timestamp": "2024-01-01T10:00:00", "title": "GitHub", "process": "firefox"},
+            {"timestamp": START.timestamp() + 1, "title": ""},
+            {"timestamp": "2024-01-01T10:00:02", "title": "Untitled", "idle": True},
+        ]
+        path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+        snapshots = list(read_trace(path))
+        self.assertEqual(snapshots[0], WindowSnapshot("GitHub", "firefox", None, False, datetime(2024, 1, 1, 10)))
+        self.assertEqual(snapshots[1].timestamp, START + timedelta(seconds=1))
+        self.assertTrue(snapshots[1].is_idle)
+        self.assertTrue(snapshots[2].is_idle)
+
+    def test_read_csv(self):
+        """Test reading a CSV trace with a header row."""
+        path = Path(self.temp_dir) / "trace.csv"
+        path.write_text(
+            'timestamp,title,process\n2024-01-01T10:00:00,"GitHub, Issues",firefox\n2024-01-01T10:00:01,News\n'
+        )
+        snapshots = list(read_trace(path))
+        self.assertEqual([snapshot.title for snapshot in snapshots], ["GitHub, Issues", "News"])
+        self.assertEqual(snapshots[0].process_name, "firefox")
+
+    def test_read_session_log(self):
+        """Test that binary session logs are detected and replayed."""
+        path = Path(self.temp_dir) / "trace.log"
+        recorder = SessionRecorder(path)
+        snapshots = _trace()[:50]
+        for snapshot in snapshots:
+            recorder.record(snapshot)
+        recorder.close()
+
+        self.assertEqual(replay_session(read_trace(path), self.config), replay_session(snapshots, self.config))
+
+    def test_invalid_record(self):
+        """Test that a malformed record raises ValueError with its line number."""
+        path = Path(self.temp_dir) / "trace.jsonl"
+        path.write_text('{"title": "no timestamp"}\n')
+        with self.assertRaisesRegex(ValueError, "trace.jsonl:1"):
+            list(read_trace(path))
+
+
+class TestVirtualClock(unittest.TestCase):
+    """Test cases for VirtualClock."""
+
+    def test_set_and_advance(self):
+        """Test that the clock only moves when told to."""
+        clock = VirtualClock(START)
+        self.assertEqual(clock(), START)
+        clock.advance(1.5)
+        self.assertEqual(clock(), START + timedelta(seconds=1.5))
+        clock.set(START)
+        self.assertEqual(clock(), START)
+
+
+if __name__ == "__main__":
+    unittest.main()
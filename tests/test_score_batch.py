@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for batch scoring in the score calculator module."""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src import score_calculator
+    from src.score_calculator import NO_MATCH_PATTERN_ID, SELF_WINDOW_PATTERN_ID
+    from src.score_tracker import ScoreTracker
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    import score_calculator
+    from score_calculator import NO_MATCH_PATTERN_ID, SELF_WINDOW_PATTERN_ID
+    from score_tracker import ScoreTracker
+
+PATTERNS = [
+    {"regex": "github", "score": 10, "description": "GitHub"},
+    {"regex": "news", "score": -5, "description": "News"},
+    {"regex": "chat", "score": 0, "description": "Chat"},
+]
+
+TRACKER_ARGS = {
+    "default_score": -1,
+    "mild_penalty_mode": True,
+    "mild_penalty_start_hour": 23,
+    "mild_penalty_end_hour": 0,
+    "reset_score_every_30_minutes": True,
+    "self_window_score": 2,
+    "self_window_title": "Cat Window Watcher",
+}
+
+
+def _history(count=5000):
+    """Build a random per-minute history crossing midnight and many 30-minute slots."""
+    rng = random.Random(16)
+    titles = ["GitHub - Issues", "News - Home", "Team chat", "Unknown", "Cat Window Watcher", ""]
+    start = datetime(2024, 1, 1, 21, 0)
+    timestamps = [start + timedelta(minutes=i, seconds=rng.randint(0, 59)) for i in range(count)]
+    return [rng.choice(titles) for _ in range(count)], timestamps
+
+
+class TestScoreBatch(unittest.TestCase):
+    """Test cases for ScoreCalculator.score_batch."""
+
+    def _per_tick(self, titles, timestamps):
+        """Score samples one at a time through ScoreTracker.update."""
+        now = [timestamps[0]]
+        tracker = ScoreTracker(PATTERNS, clock=lambda: now[0], **TRACKER_ARGS)
+        deltas, scores = [], []
+        for title, timestamp in zip(titles, timestamps):
+            now[0] = timestamp
+            slot_before = tracker._last_reset_time_slot
+            previous = tracker.get_score()
+            tracker.update(title)
+            # A 30-minute reset sets the score to 0 before the delta is added
+            base = 0 if tracker._last_reset_time_slot != slot_before else previous
+            deltas.append(tracker.get_score() - base)
+            scores.append(tracker.get_score())
+        return deltas, scores
+
+    def _batch(self, titles, timestamps):
+        """Score samples with score_batch."""
+        calculator = ScoreTracker(PATTERNS, **TRACKER_ARGS).calculator
+        deltas, pattern_ids, scores = calculator.score_batch(titles, timestamps, reset_score_every_30_minutes=True)
+        return list(deltas), list(pattern_ids), list(scores)
+
+    def _assert_matches_per_tick(self):
+        """Assert that batch and per-tick scoring agree on a random history."""
+        titles, timestamps = _history()
+        deltas, pattern_ids, scores = self._batch(titles, timestamps)
+        expected_deltas, expected_scores = self._per_tick(titles, timestamps)
+        self.assertEqual(scores, expected_scores)
+        self.assertEqual(deltas, expected_deltas)
+
+        expected_ids = {
+            "GitHub - Issues": 0,
+            "News - Home": 1,
+            "Team chat": 2,
+            "Unknown": NO_MATCH_PATTERN_ID,
+            "": NO_MATCH_PATTERN_ID,
+            "Cat Window Watcher": SELF_WINDOW_PATTERN_ID,
+        }
+        self.assertEqual(pattern_ids, [expected_ids[title] for title in titles])
+
+    @unittest.skipUnless(score_calculator.np is not None, "NumPy is not installed")
+    def test_matches_per_tick_numpy(self):
+        """Test that the NumPy path gives exactly the per-tick results."""
+        self._assert_matches_per_tick()
+
+    @unittest.skipUnless(score_calculator.np is not None, "NumPy is not installed")
+    def test_datetime64_timestamps(self):
+        """Test that a datetime64 array gives the same results as datetime objects."""
+        titles, timestamps = _history()
+        times = score_calculator.np.array(timestamps, dtype="datetime64[s]")
+        self.assertEqual(self._batch(titles, times), self._batch(titles, timestamps))
+
+    def test_matches_per_tick_python(self):
+        """Test that the pure Python fallback gives exactly the per-tick results."""
+        with patch.object(score_calculator, "np", None):
+            self._assert_matches_per_tick()
+
+    def test_empty(self):
+        """Test that an empty history gives empty results."""
+        self.assertEqual(self._batch([], []), ([], [], []))
+
+    def test_length_mismatch(self):
+        """Test that mismatched inputs raise ValueError."""
+        with self.assertRaises(ValueError):
+            self._batch(["GitHub"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,13 @@ import unittest
 from pathlib import Path
 
 try:
+    from src.match_result import NO_MATCH
     from src.score_tracker import ScoreTracker
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from match_result import NO_MATCH
     from score_tracker import ScoreTracker
 
 
@@ -68,7 +70,7 @@ class TestScoreTracker(unittest.TestCase):
         """Test no score change when no pattern matches."""
         score_changed, matched = self.tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(self.tracker.get_score(), 0)
 
     def test_same_window_continuous_update(self):
@@ -93,6 +95,14 @@ class TestScoreTracker(unittest.TestCase):
         tracker.update("GitHub Repository")
         self.assertEqual(tracker.get_score(), 5)  # Matches "git" first
 
+    def test_elapsed_ticks_scale_delta(self):
+        """Test that an update covering several ticks applies the delta that many times."""
+        self.tracker.update("GitHub - Issues", elapsed_ticks=4)
+        self.assertEqual(self.tracker.get_score(), 40)
+
+        self.tracker.update("Twitter Feed", elapsed_ticks=3)
+        self.assertEqual(self.tracker.get_score(), 25)
+
     def test_reset_score(self):
         """Test score reset functionality."""
         self.tracker.update("GitHub")
@@ -146,7 +156,7 @@ class TestDefaultScore(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 0)
 
     def test_default_score_negative_no_match(self):
@@ -158,7 +168,7 @@ class TestDefaultScore(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)
 
     def test_default_score_positive_no_match(self):
@@ -170,7 +180,7 @@ class TestDefaultScore(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 5)
 
     def test_default_score_not_applied_when_pattern_matches(self):
@@ -252,7 +262,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)
 
     def test_apply_default_score_mode_disabled_does_not_apply_default_score(self):
@@ -264,7 +274,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 0)
 
     def test_apply_default_score_mode_disabled_no_score_accumulation(self):
@@ -348,7 +358,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 0)
 
     def test_apply_default_score_mode_disabled_with_zero_default_score(self):
@@ -360,7 +370,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
 
         score_changed, matched = tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 0)
 
     def test_apply_default_score_mode_update_config(self):
@@ -373,7 +383,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
         # Initially mode is enabled - default score applies
         score_changed, matched = tracker.update("Random Window")
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)
 
         # Update config to disable mode
@@ -382,7 +392,7 @@ class TestApplyDefaultScoreMode(unittest.TestCase):
         # Now default score should not apply - using same window title
         score_changed, matched = tracker.update("Random Window")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)  # Score unchanged
 
 
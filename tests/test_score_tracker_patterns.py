@@ -5,12 +5,16 @@ import unittest
 from pathlib import Path
 
 try:
+    from src.match_result import NO_MATCH
     from src.score_tracker import ScoreTracker
+    from src.window_snapshot import WindowSnapshot
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from match_result import NO_MATCH
     from score_tracker import ScoreTracker
+    from window_snapshot import WindowSnapshot
 
 # Use module path derived from the actual import so patch() works in all environments.
 _SCORE_TRACKER_DATETIME_PATH = f"{ScoreTracker.__module__}.datetime"
@@ -106,7 +110,7 @@ class TestGitHubWindowTitlePatterns(unittest.TestCase):
         """Test that non-GitHub pages are not matched."""
         score_changed, matched = self.tracker.update("Random Window Title")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(self.tracker.get_score(), 0)
 
     def test_non_github_ending_pattern(self):
@@ -114,7 +118,7 @@ class TestGitHubWindowTitlePatterns(unittest.TestCase):
         # This should NOT match because it doesn't end with "· GitHub"
         score_changed, matched = self.tracker.update("Some Page · Other Site")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(self.tracker.get_score(), 0)
 
     def test_multiple_github_pages_accumulate_score(self):
@@ -153,7 +157,7 @@ class TestConfigUpdate(unittest.TestCase):
         # Old pattern should no longer match
         score_changed, matched = tracker.update("GitHub - Profile")
         self.assertFalse(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), 10)  # Score unchanged
 
         # New pattern should match
@@ -475,5 +479,131 @@ class TestMildPenaltyMode(unittest.TestCase):
             self.assertEqual(tracker.get_score(), 15)  # 10 + 5
 
 
+class TestMatchCache(unittest.TestCase):
+    """Test cases for the title match cache in ScoreCalculator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.patterns = [
+            {"regex": "github", "score": 10, "description": "GitHub"},
+            {"regex": "twitter", "score": -5, "description": "Twitter"},
+        ]
+        self.tracker = ScoreTracker(self.patterns, default_score=-1)
+
+    def test_hits_and_misses(self):
+        """Test that repeated titles are served from the cache."""
+        for _ in range(3):
+            self.tracker.update("GitHub")
+        self.tracker.update("Unknown")
+        self.tracker.update("Unknown")
+
+        stats = self.tracker.get_match_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (3, 2, 2))
+        self.assertEqual(self.tracker.get_score(), 30 - 2)
+
+    def test_update_config_invalidates(self):
+        """Test that reloaded patterns are used for titles cached before the reload."""
+        self.tracker.update("GitHub")
+        self.tracker.update_config([{"regex": "git", "score": 1, "description": "Git (new)"}], default_score=-1)
+
+        _, matched = self.tracker.update("GitHub")
+        self.assertEqual(matched["description"], "Git (new)")
+        self.assertEqual(self.tracker.get_match_cache_stats()["hits"], 0)
+
+    def test_update_config_keeps_unaffected_matches(self):
+        """Test that cached matches survive a reload that only changes scores or later rules."""
+        for title in ("GitHub", "Twitter", "Unknown"):
+            self.tracker.update(title)
+        self.tracker.update_config(
+            [{"regex": "github", "score": 1, "description": "GitHub (new)"}] + self.patterns[1:], -1
+        )
+
+        _, matched = self.tracker.update("GitHub")
+        self.assertEqual((matched["description"], matched["score"]), ("GitHub (new)", 1))
+        self.tracker.update("Unknown")
+        self.assertEqual(self.tracker.get_match_cache_stats()["hits"], 2)
+
+        # A changed second rule keeps the match of the first one only
+        self.tracker.update_config(self.patterns[:1] + [{"regex": "unknown", "score": 3}], default_score=-1)
+        self.assertEqual(self.tracker.get_match_cache_stats()["size"], 1)
+        _, matched = self.tracker.update("Unknown")
+        self.assertEqual(matched["score"], 3)
+
+    def test_mild_penalty_applied_after_lookup(self):
+        """Test that a cached match still gets the time-dependent mild penalty."""
+        from datetime import datetime
+
+        calculator = ScoreTracker(self.patterns, mild_penalty_mode=True).calculator
+        self.assertEqual(calculator.calculate_score_delta("Twitter", datetime_now=datetime(2024, 1, 1, 12))[0], -5)
+        self.assertEqual(calculator.calculate_score_delta("Twitter", datetime_now=datetime(2024, 1, 1, 22))[0], -1)
+        self.assertEqual(calculator.get_match_cache_stats()["hits"], 1)
+
+    def test_timezone_aware_time(self):
+        """Test that time rules accept timezone-aware times (e.g. replayed "Z" timestamps)."""
+        from datetime import datetime, timezone
+
+        calculator = ScoreTracker([], mild_penalty_mode=True).calculator
+        late = datetime(2024, 1, 1, 22, tzinfo=timezone.utc)
+        self.assertEqual(calculator.calculate_score_delta("x", datetime_now=late)[0], -1)
+
+        now = [late]
+        tracker = ScoreTracker(self.patterns, reset_score_every_30_minutes=True, clock=lambda: now[0])
+        tracker.update("GitHub")
+        now[0] = late.replace(minute=30)
+        tracker.update("GitHub")
+        self.assertEqual(tracker.get_score(), 10)
+
+    def test_bounded_under_title_churn(self):
+        """Test that titles changing every tick (e.g. clocks) keep the cache bounded."""
+        calculator = self.tracker.calculator
+        for second in range(calculator.match_cache_size * 4):
+            calculator.calculate_score_delta(f"Terminal - 12:{second // 60:02d}:{second % 60:02d}")
+
+        self.assertEqual(calculator.get_match_cache_stats()["size"], calculator.match_cache_size)
+
+    def test_cache_disabled(self):
+        """Test that a cache size of 0 disables caching."""
+        calculator = ScoreTracker(self.patterns).calculator
+        calculator.match_cache_size = 0
+        calculator.calculate_score_delta("GitHub")
+        calculator.calculate_score_delta("GitHub")
+        self.assertEqual(calculator.get_match_cache_stats()["size"], 0)
+
+
+class TestProcessRules(unittest.TestCase):
+    """Test cases for process rules fed from window snapshots."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.patterns = [
+            {"process": "game.exe", "score": -10, "description": "Game"},
+            {"regex": "editor", "score": 5, "description": "Editor"},
+        ]
+        self.tracker = ScoreTracker(self.patterns, default_score=0)
+
+    def test_update_with_process_name(self):
+        """Test that the process name selects process rules."""
+        _, matched = self.tracker.update("Main Menu", process_name="Game.exe")
+        self.assertEqual(matched["description"], "Game")
+        _, matched = self.tracker.update("Main Menu")
+        self.assertIs(matched, NO_MATCH)
+
+    def test_update_from_snapshot(self):
+        """Test that the snapshot process name is used."""
+        from datetime import datetime
+
+        snapshot = WindowSnapshot("editor", "game.exe", None, False, datetime.now())
+        _, matched = self.tracker.update_from_snapshot(snapshot)
+        self.assertEqual(matched["description"], "Game")
+        self.assertEqual(self.tracker.get_score(), -10)
+
+    def test_cache_keyed_by_process(self):
+        """Test that cached results are not shared between processes with the same title."""
+        calculator = self.tracker.calculator
+        self.assertEqual(calculator.calculate_score_delta("editor", process_name="game.exe")[0], -10)
+        self.assertEqual(calculator.calculate_score_delta("editor", process_name="other.exe")[0], 5)
+        self.assertEqual(calculator.get_match_cache_stats()["misses"], 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,11 +5,13 @@ import unittest
 from pathlib import Path
 
 try:
+    from src.match_result import NO_MATCH
     from src.score_tracker import ScoreTracker
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from match_result import NO_MATCH
     from score_tracker import ScoreTracker
 
 # Use module path derived from the actual import so patch() works in all environments.
@@ -166,7 +168,7 @@ class TestSelfWindowScore(unittest.TestCase):
         # Should apply default_score since self window matching is disabled
         score_changed, matched = tracker.update(self.self_window_title)
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)
 
     def test_self_window_exact_match_only(self):
@@ -181,7 +183,7 @@ class TestSelfWindowScore(unittest.TestCase):
         # Partial match should not trigger self window
         score_changed, matched = tracker.update("Cat Window Watcher")
         self.assertTrue(score_changed)
-        self.assertIsNone(matched)
+        self.assertIs(matched, NO_MATCH)
         self.assertEqual(tracker.get_score(), -1)
 
     def test_self_window_update_config(self):
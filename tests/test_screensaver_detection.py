@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for screensaver detection functionality."""
 
+import shutil
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -8,12 +10,27 @@ from unittest.mock import patch
 try:
     from src.score_tracker import ScoreTracker
     from src.window_monitor import WindowMonitor
+    from src.x11_connection import X11Connection
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
     from score_tracker import ScoreTracker
     from window_monitor import WindowMonitor
+    from x11_connection import X11Connection
+
+try:
+    from tests.xvfb_helper import start_xvfb
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from xvfb_helper import start_xvfb
+
+try:
+    from Xlib import display as xdisplay
+except ImportError:
+    xdisplay = None
 
 
 class TestScreensaverDetection(unittest.TestCase):
@@ -117,5 +134,75 @@ class TestScreensaverDetection(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestIdleDetection(unittest.TestCase):
+    """Test cases for idle detection with an idle threshold."""
+
+    def test_idle_time_above_threshold(self):
+        """Test that a focused window counts as idle after the threshold."""
+        monitor = WindowMonitor(idle_threshold_seconds=300)
+        with patch.object(monitor, "_get_idle_seconds", return_value=600.0):
+            self.assertTrue(monitor.is_user_idle(window_title="Browser - News"))
+
+    def test_untitled_window_not_idle(self):
+        """Test that an untitled window is not idle while the user is active."""
+        monitor = WindowMonitor(idle_threshold_seconds=300)
+        with patch.object(monitor, "_get_idle_seconds", return_value=2.0):
+            self.assertFalse(monitor.is_user_idle(window_title=""))
+
+    def test_falls_back_to_empty_title(self):
+        """Test that the empty-title heuristic is used without an idle source."""
+        monitor = WindowMonitor(idle_threshold_seconds=300)
+        with patch.object(monitor, "_get_idle_seconds", return_value=None):
+            self.assertTrue(monitor.is_user_idle(window_title=""))
+            self.assertFalse(monitor.is_user_idle(window_title="Editor"))
+
+    def test_threshold_disabled(self):
+        """Test that the idle source is not queried when the threshold is 0."""
+        monitor = WindowMonitor()
+        with patch.object(monitor, "_get_idle_seconds") as mock_idle:
+            self.assertFalse(monitor.is_user_idle(window_title="Editor"))
+        mock_idle.assert_not_called()
+
+    def test_idle_freezes_score(self):
+        """Test that an idle snapshot leaves the score unchanged."""
+        monitor = WindowMonitor(idle_threshold_seconds=60)
+        tracker = ScoreTracker([{"regex": "news", "score": -5, "description": "News"}], default_score=0)
+        with (
+            patch.object(monitor, "_get_active_window_title_and_pid", return_value=("Browser - News", None)),
+            patch.object(monitor, "_get_idle_seconds", return_value=120.0),
+        ):
+            tracker.update_from_snapshot(monitor.sample())
+        self.assertEqual(tracker.get_score(), 0)
+
+
+@unittest.skipUnless(shutil.which("Xvfb") and xdisplay is not None, "requires Xvfb and python-xlib")
+class TestIdleDetectionXvfb(unittest.TestCase):
+    """Test idle detection against a real X server."""
+
+    def setUp(self):
+        """Start Xvfb."""
+        self.xvfb, self.display_name = start_xvfb()
+        self.addCleanup(self.xvfb.kill)
+        self.connection = X11Connection(self.display_name)
+        self.addCleanup(self.connection.close)
+
+    def test_idle_time_increases(self):
+        """Test that the server reports a growing idle time without input."""
+        first = self.connection.get_idle_seconds()
+        self.assertIsNotNone(first)
+        time.sleep(0.5)
+        self.assertGreaterEqual(self.connection.get_idle_seconds(), first + 0.3)
+
+    def test_monitor_uses_server_idle_time(self):
+        """Test that WindowMonitor reads idle time over the persistent connection."""
+        monitor = WindowMonitor(idle_threshold_seconds=1)
+        with (
+            patch.object(WindowMonitor, "_get_x11_connection", return_value=self.connection),
+            patch("platform.system", return_value="Linux"),
+        ):
+            time.sleep(1.2)
+            self.assertTrue(monitor.is_user_idle(window_title="Editor"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Tests for session recorder module."""
+
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from src.session_recorder import (
+        MAGIC,
+        RecordingWindowMonitor,
+        SessionRecorder,
+        encode_varint,
+        read_session_log,
+    )
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from session_recorder import MAGIC, RecordingWindowMonitor, SessionRecorder, encode_varint, read_session_log
+    from window_snapshot import WindowSnapshot
+
+START = datetime(2024, 1, 1, 10, 0, 0)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionRecorder(unittest.TestCase):
+    """Test cases for SessionRecorder and read_session_log."""
+
+    def setUp(self):
+        """Create a temporary log path."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "session.cwwlog"
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _recorder(self):
+        recorder = SessionRecorder(self.path, flush_interval=5.0, clock=self.clock)
+        self.addCleanup(recorder.close)
+        return recorder
+
+    def test_varint(self):
+        """Test LEB128 encoding of small and large values."""
+        out = bytearray()
+        encode_varint(1, out)
+        encode_varint(300, out)
+        self.assertEqual(bytes(out), b"\x01\xac\x02")
+
+    def test_round_trip(self):
+        """Test that recorded snapshots are read back in order."""
+        recorder = self._recorder()
+        snapshots = [
+            WindowSnapshot("Editor", "code", None, False, START),
+            WindowSnapshot("日本語 - Browser", "firefox", None, False, START + timedelta(seconds=1)),
+            WindowSnapshot("", "", None, True, START + timedelta(seconds=61.5)),
+        ]
+        for snapshot in snapshots:
+            recorder.record(snapshot)
+        recorder.close()
+
+        self.assertEqual(list(read_session_log(self.path)), snapshots)
+
+    def test_repeated_titles_are_compact(self):
+        """Test that a repeated title costs only a few bytes per sample."""
+        recorder = self._recorder()
+        title = "A very long window title - " * 4
+        for i in range(100):
+            recorder.record(WindowSnapshot(title, "code", None, False, START + timedelta(seconds=i)))
+        recorder.close()
+
+        size = self.path.stat().st_size
+        self.assertLess(size, len(title) + 100 * 6 + 32)
+
+    def test_flush_on_record(self):
+        """Test that records reach the file once the flush interval elapsed."""
+        recorder = self._recorder()
+        recorder.record(WindowSnapshot("Editor", "", None, False, START))
+        self.assertEqual(self.path.stat().st_size, 0)
+
+        self.clock.now += 5.0
+        recorder.record(WindowSnapshot("Editor", "", None, False, START + timedelta(seconds=5)))
+        self.assertEqual(len(list(read_session_log(self.path))), 2)
+
+    def test_quiet_session_is_flushed(self):
+        """Test that the background timer flushes records without further samples."""
+        recorder = SessionRecorder(self.path, flush_interval=0.02, clock=self.clock)
+        self.addCleanup(recorder.close)
+        recorder.record(WindowSnapshot("Editor", "", None, False, START))
+
+        deadline = time.monotonic() + 2.0
+        while self.path.stat().st_size == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([snapshot.title for snapshot in read_session_log(self.path)], ["Editor"])
+
+    def test_append_sessions(self):
+        """Test that a second recorder appends a new session to the same log."""
+        for offset in (0, 3600):
+            recorder = SessionRecorder(self.path, clock=self.clock)
+            recorder.record(WindowSnapshot("Editor", "code", None, False, START + timedelta(seconds=offset)))
+            recorder.record(WindowSnapshot("Chat", "slack", None, False, START + timedelta(seconds=offset + 1)))
+            recorder.close()
+
+        titles = [snapshot.title for snapshot in read_session_log(self.path)]
+        self.assertEqual(titles, ["Editor", "Chat", "Editor", "Chat"])
+        self.assertEqual(self.path.read_bytes().count(MAGIC), 1)
+
+    def test_clock_going_backwards(self):
+        """Test that a backwards clock jump keeps timestamps correct."""
+        recorder = self._recorder()
+        later = START + timedelta(hours=1)
+        recorder.record(WindowSnapshot("Editor", "", None, False, later))
+        recorder.record(WindowSnapshot("Editor", "", None, False, START))
+        recorder.close()
+
+        timestamps = [snapshot.timestamp for snapshot in read_session_log(self.path)]
+        self.assertEqual(timestamps, [later, START])
+
+    def test_truncated_tail_is_ignored(self):
+        """Test that a partially written final record ends the stream cleanly."""
+        recorder = self._recorder()
+        recorder.record(WindowSnapshot("Editor", "", None, False, START))
+        recorder.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x02\x10abc")
+
+        self.assertEqual([snapshot.title for snapshot in read_session_log(self.path)], ["Editor"])
+
+    def test_append_after_truncated_tail(self):
+        """Test that a partial final record is cut off before a new session is appended."""
+        recorder = self._recorder()
+        recorder.record(WindowSnapshot("Editor", "", None, False, START))
+        recorder.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x02\x10abc")
+
+        recorder = self._recorder()
+        recorder.record(WindowSnapshot("Chat", "slack", None, False, START + timedelta(seconds=1)))
+        recorder.close()
+
+        titles = [snapshot.title for snapshot in read_session_log(self.path)]
+        self.assertEqual(titles, ["Editor", "Chat"])
+
+    def test_not_a_session_log(self):
+        """Test that a foreign file is rejected."""
+        self.path.write_bytes(b"not a log")
+        with self.assertRaises(ValueError):
+            SessionRecorder(self.path)
+        with self.assertRaises(ValueError):
+            list(read_session_log(self.path))
+
+
+class TestRecordingWindowMonitor(unittest.TestCase):
+    """Test cases for RecordingWindowMonitor."""
+
+    def test_tees_sampled_snapshots(self):
+        """Test that every sampled snapshot is passed to the recorder."""
+
+        class ListRecorder:
+            def __init__(self):
+                self.snapshots = []
+
+            def record(self, snapshot):
+                self.snapshots.append(snapshot)
+
+        recorder = ListRecorder()
+        monitor = RecordingWindowMonitor(recorder)
+        with patch.object(monitor, "_get_active_window_title_and_pid", return_value=("Editor", None)):
+            snapshot = monitor.sample()
+
+        self.assertEqual(recorder.snapshots, [snapshot])
+        self.assertEqual(snapshot.title, "Editor")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for time rule schedule module."""
+
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+try:
+    from src.time_rule_schedule import HourRangeRule, SlotRule, TimeRuleSchedule
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from time_rule_schedule import HourRangeRule, SlotRule, TimeRuleSchedule
+
+START = datetime(2024, 3, 8, 21, 0, 0)  # Friday
+
+
+class TestTimeRuleSchedule(unittest.TestCase):
+    """Test cases for TimeRuleSchedule and its rules."""
+
+    def setUp(self):
+        """Set up a schedule with every rule kind."""
+        self.rules = {
+            "mild": HourRangeRule(22, 23),
+            "wrapped": HourRangeRule(23, 1),
+            "weekend_morning": HourRangeRule(8, 11, weekdays={5, 6}),
+            "slot": SlotRule(30),
+        }
+        self.schedule = TimeRuleSchedule(self.rules)
+
+    def assert_matches_direct(self, moment):
+        """Assert that cached values equal evaluating the rules directly."""
+        expected = {name: rule.value(moment) for name, rule in self.rules.items()}
+        self.assertEqual(self.schedule.values(moment), expected, moment)
+
+    def test_wrapped_range(self):
+        """Test that a range with start after end wraps around midnight."""
+        rule = HourRangeRule(23, 1)
+        self.assertTrue(rule.value(datetime(2024, 1, 1, 23, 30)))
+        self.assertTrue(rule.value(datetime(2024, 1, 2, 1, 59)))
+        self.assertFalse(rule.value(datetime(2024, 1, 2, 2, 0)))
+        self.assertFalse(rule.value(datetime(2024, 1, 1, 22, 59)))
+
+    def test_weekday_rule(self):
+        """Test that a weekday-restricted rule only applies on those days."""
+        rule = HourRangeRule(8, 11, weekdays={5, 6})
+        self.assertFalse(rule.value(datetime(2024, 3, 8, 9)))  # Friday
+        self.assertTrue(rule.value(datetime(2024, 3, 9, 9)))  # Saturday
+
+    def test_per_second_ticks_recompute_only_at_boundaries(self):
+        """Test that a day of per-second ticks recomputes about once per boundary."""
+        for second in range(0, 2 * 24 * 3600, 7):
+            moment = START + timedelta(seconds=second)
+            self.assert_matches_direct(moment)
+        # 48 slot boundaries per day plus a few hour-rule boundaries, over two days
+        self.assertLess(self.schedule.recompute_count, 2 * 60)
+
+    def test_clock_jumps(self):
+        """Test forward and backward clock jumps (e.g. DST changes or manual adjustments)."""
+        moments = [
+            datetime(2024, 3, 31, 1, 59, 59),
+            datetime(2024, 3, 31, 3, 0, 0),  # DST forward: 02:00 -> 03:00
+            datetime(2024, 10, 27, 2, 59, 59),
+            datetime(2024, 10, 27, 2, 0, 0),  # DST backward: 03:00 -> 02:00
+            datetime(2024, 10, 27, 22, 30),
+            datetime(2024, 10, 26, 23, 45),  # Manual change to the previous day
+            datetime(2025, 1, 1, 0, 15),  # Far jump forward
+        ]
+        for moment in moments:
+            self.assert_matches_direct(moment)
+
+    def test_timezone_aware_times(self):
+        """Test that aware times are evaluated by their own wall-clock time, mixed with naive ones."""
+        tokyo = timezone(timedelta(hours=9))
+        for moment in (START, START.replace(tzinfo=timezone.utc), START.replace(hour=22, tzinfo=tokyo), START):
+            self.assert_matches_direct(moment)
+
+    def test_random_times(self):
+        """Test that arbitrary time sequences agree with direct evaluation."""
+        rng = random.Random(17)
+        moment = START
+        for _ in range(3000):
+            moment += timedelta(seconds=rng.choice([1, 1, 1, 59, 1799, 3600, -1, -3600, 86400 * 3]))
+            self.assert_matches_direct(moment)
+
+
+if __name__ == "__main__":
+    unittest.main()
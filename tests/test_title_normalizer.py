@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for title normalizer module."""
+
+import re
+import unittest
+from pathlib import Path
+
+try:
+    from src.pattern_set import PatternSet
+    from src.title_normalizer import TitleNormalizer, fold_regex, fold_text
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from pattern_set import PatternSet
+    from title_normalizer import TitleNormalizer, fold_regex, fold_text
+
+
+class TestTitleNormalizer(unittest.TestCase):
+    """Test cases for TitleNormalizer."""
+
+    def test_normalize(self):
+        """Test NFKC, case folding, suffix stripping and the length cap."""
+        normalizer = TitleNormalizer([" - Google Chrome", " — Mozilla Firefox"], max_length=20)
+        self.assertEqual(normalizer.normalize("ＹｏｕＴｕｂｅ - Google Chrome"), "youtube")
+        self.assertEqual(normalizer.normalize("Straße — MOZILLA Firefox"), "strasse")
+        self.assertEqual(normalizer.normalize("x" * 100), "x" * 20)
+        self.assertEqual(TitleNormalizer(max_length=0).normalize("y" * 5000), "y" * 5000)
+
+    def test_titles_are_remembered(self):
+        """Test that normalized titles are remembered per raw title, up to the cache size."""
+        normalizer = TitleNormalizer(cache_size=2)
+        first = normalizer.normalize("GitHub – Ｅｄｉｔｏｒ")
+        normalizer.normalize("Chat")
+        self.assertIs(normalizer.normalize("GitHub – Ｅｄｉｔｏｒ"), first)
+        normalizer.normalize("Mail")
+        self.assertEqual(list(normalizer._cache), ["GitHub – Ｅｄｉｔｏｒ", "Mail"])
+        uncached = TitleNormalizer(cache_size=0)
+        uncached.normalize("Chat")
+        self.assertEqual(len(uncached._cache), 0)
+
+
+class TestFoldRegex(unittest.TestCase):
+    """Test cases for fold_regex."""
+
+    def test_fold(self):
+        """Test that literal text is folded and escapes are kept."""
+        self.assertEqual(fold_regex("GitHub|· GitHub$"), "github|· github$")
+        self.assertEqual(fold_regex(r"X\.com\S+\bＡＢ"), r"x\.com\S+\bab")
+        self.assertEqual(fold_regex("[A-Z]+Tube"), "[a-z]+tube")
+        self.assertEqual(fold_regex(r"[0-9A-F\-]"), r"[0-9a-f\-]")
+
+    def test_class_range_keeps_meaning(self):
+        """Test that a class range spanning letters and symbols still matches the symbols."""
+        pattern_set = PatternSet([{"regex": "^[A-z]+$", "score": 1}], normalizer=TitleNormalizer())
+        self.assertEqual(pattern_set.match_index("snake_case"), 0)
+
+    def test_unsafe_regexes(self):
+        """Test that regexes whose meaning folding would change are not folded."""
+        for regex in (
+            r"\x41bc",
+            r"\N{LATIN CAPITAL LETTER A}",
+            r"a\0",
+            "stra[ß]e",
+            "ß+",
+            "ａ（ｂ）",
+            "[A-z]",
+            r"[\]-a]",
+        ):
+            with self.subTest(regex=regex):
+                self.assertIsNone(fold_regex(regex))
+
+
+class TestNormalizedPatternSet(unittest.TestCase):
+    """Test cases for PatternSet with a TitleNormalizer."""
+
+    def setUp(self):
+        """Set up patterns of every kind."""
+        self.patterns = [
+            {"regex": "GitHub$", "score": 10},
+            {"regex": r"\x59outube", "score": -3},
+            {"title": "Inbox - Mail", "score": 1},
+            {"domain": "Reddit.com", "score": -5},
+            {"regex": "Straße", "score": 2},
+        ]
+        self.titles = [
+            "Pull requests · GitHub - Google Chrome",
+            "ＹｏｕＴｕｂｅ - Google Chrome",
+            "INBOX - MAIL - Google Chrome",
+            "r/python - www.REDDIT.com - Google Chrome",
+            "STRASSE",
+            "Editor",
+        ]
+
+    def test_matching(self):
+        """Test that every rule kind matches the normalized title with every engine."""
+        for engine in ("sequential", "combined", "prefilter"):
+            pattern_set = PatternSet(self.patterns, engine, normalizer=TitleNormalizer([" - Google Chrome"]))
+            with self.subTest(engine=engine):
+                self.assertEqual([pattern_set.match_index(title) for title in self.titles], [0, 1, 2, 3, 4, None])
+                self.assertEqual(pattern_set.match_all(self.titles[0]), [0])
+
+    def test_folded_regexes_are_case_sensitive(self):
+        """Test that foldable regexes are compiled without re.IGNORECASE."""
+        pattern_set = PatternSet(self.patterns, normalizer=TitleNormalizer())
+        flags = [bool(entry.compiled.flags & re.IGNORECASE) for entry in pattern_set]
+        self.assertEqual(flags, [False, True, False])
+        self.assertEqual(pattern_set.instrumented().match_index("github"), 0)
+
+    def test_title_rule_keeps_normalized_folding(self):
+        """Test that title rules are looked up with the same folding they were stored with."""
+        patterns = [{"title": "Yazılım", "score": 1}]
+        pattern_set = PatternSet(patterns, normalizer=TitleNormalizer([" - Google Chrome"]))
+        self.assertEqual(pattern_set.match_index("YAZılım - Google Chrome"), 0)
+        self.assertIsNone(pattern_set.match_index("Yazilim"))
+
+    def test_runs_do_not_mix_flags(self):
+        """Test that a folded regex is not searched case-insensitively next to an IGNORECASE one."""
+        patterns = [{"regex": r"\x41bc", "score": 1}, {"regex": "yazilim", "score": 2}]
+        for engine in ("sequential", "combined", "prefilter"):
+            pattern_set = PatternSet(patterns, engine, normalizer=TitleNormalizer())
+            with self.subTest(engine=engine):
+                self.assertIsNone(pattern_set.match_index("Yazılım"))
+                self.assertEqual(pattern_set.match_index("yazilim"), 1)
+                self.assertEqual(pattern_set.match_index("ABC"), 0)
+
+    def test_fold_text(self):
+        """Test that ASCII takes the lower() shortcut with the same result."""
+        self.assertEqual(fold_text("GitHub"), "github")
+        self.assertEqual(fold_text("Ｇｉｔ"), "git")
+
+
+if __name__ == "__main__":
+    unittest.main()
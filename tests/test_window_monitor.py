@@ -1,22 +1,40 @@
 #!/usr/bin/env python3
 """Tests for window monitor module."""
 
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 try:
+    from src.process_resolver import ProcessNameResolver
     from src.window_monitor import WindowMonitor
+    from src.x11_connection import X11ConnectionError
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from process_resolver import ProcessNameResolver
     from window_monitor import WindowMonitor
+    from x11_connection import X11ConnectionError
 
 
 class TestWindowMonitor(unittest.TestCase):
     """Test cases for WindowMonitor class."""
 
+    def setUp(self):
+        """Force the subprocess code paths regardless of the local X11 setup."""
+        patcher = patch.object(WindowMonitor, "_get_x11_connection", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Use an empty proc root so pid resolution goes through the mocked ps call
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        patcher = patch.object(WindowMonitor, "_process_resolver", ProcessNameResolver(proc_root=self.temp_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_get_active_window_returns_string(self):
         """Test that get_active_window_title returns a string."""
         title = WindowMonitor.get_active_window_title()
@@ -175,6 +193,78 @@ class TestWindowMonitor(unittest.TestCase):
         title = WindowMonitor.get_active_window_title()
         self.assertEqual(title, "")
 
+    @patch("subprocess.run")
+    @patch("platform.system")
+    def test_linux_uses_persistent_x11_connection(self, mock_system, mock_run):
+        """Test that the persistent X11 connection is used instead of spawning xdotool."""
+        mock_system.return_value = "Linux"
+        connection = MagicMock()
+        connection.get_active_window_title.return_value = "X11 Title"
+
+        with patch.object(WindowMonitor, "_get_x11_connection", return_value=connection):
+            title = WindowMonitor.get_active_window_title()
+
+        self.assertEqual(title, "X11 Title")
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    @patch("platform.system")
+    def test_linux_x11_failure_falls_back_to_xdotool(self, mock_system, mock_run):
+        """Test fallback to xdotool when the X11 connection fails."""
+        mock_system.return_value = "Linux"
+        connection = MagicMock()
+        connection.get_active_window_title.side_effect = X11ConnectionError("no display")
+        mock_result = MagicMock()
+        mock_result.stdout = "Fallback Title\n"
+        mock_run.return_value = mock_result
+
+        with patch.object(WindowMonitor, "_get_x11_connection", return_value=connection):
+            title = WindowMonitor.get_active_window_title()
+
+        self.assertEqual(title, "Fallback Title")
+
+    def test_x11_window_pid_rechecked_when_focus_returns(self):
+        """Test that _NET_WM_PID is read again when a reused window id is focused again."""
+        connection = MagicMock()
+        connection.get_active_window_id.side_effect = [1, 1, 2, 1]
+        window_pids = {1: [100, 200], 2: [300]}
+        connection.get_window_pid.side_effect = lambda window_id: window_pids[window_id].pop(0)
+        names = {100: "firefox", 200: "game", 300: "terminal"}
+
+        with (
+            patch.object(WindowMonitor, "_get_x11_connection", return_value=connection),
+            patch.object(WindowMonitor, "_get_process_name_from_pid", side_effect=names.get),
+        ):
+            process_names = [WindowMonitor._query_x11_process_name() for _ in range(4)]
+
+        self.assertEqual(process_names, ["firefox", "firefox", "terminal", "game"])
+        self.assertEqual(connection.get_window_pid.call_count, 3)
+
+    @patch("subprocess.run")
+    @patch("platform.system")
+    def test_linux_window_pid_lookup_cached(self, mock_system, mock_run):
+        """Test that xdotool getwindowpid runs only when the focused window changes."""
+        mock_system.return_value = "Linux"
+        calls = []
+
+        def run_side_effect(*args, **kwargs):
+            cmd = args[0]
+            calls.append(cmd[1] if cmd[0] == "xdotool" else cmd[0])
+            result = MagicMock()
+            if "getactivewindow" in cmd:
+                result.stdout = "12345678\n"
+            elif "getwindowpid" in cmd:
+                result.stdout = "9999\n"
+            elif "ps" in cmd:
+                result.stdout = "firefox\n"
+            return result
+
+        mock_run.side_effect = run_side_effect
+        for _ in range(3):
+            self.assertEqual(WindowMonitor.get_active_window_process_name(), "firefox")
+        self.assertEqual(calls.count("getwindowpid"), 1)
+        self.assertEqual(calls.count("getactivewindow"), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for window snapshot acquisition."""
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+try:
+    from src.score_tracker import ScoreTracker
+    from src.window_monitor import WindowMonitor
+    from src.window_snapshot import WindowSnapshot
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    from score_tracker import ScoreTracker
+    from window_monitor import WindowMonitor
+    from window_snapshot import WindowSnapshot
+
+
+class TestWindowSnapshot(unittest.TestCase):
+    """Test cases for WindowSnapshot value object."""
+
+    def test_fields(self):
+        """Test that snapshot fields are stored."""
+        snapshot = WindowSnapshot("Editor", "code", 42, False, None)
+        self.assertEqual(snapshot.title, "Editor")
+        self.assertEqual(snapshot.process_name, "code")
+        self.assertEqual(snapshot.pid, 42)
+        self.assertFalse(snapshot.is_idle)
+
+    def test_immutable(self):
+        """Test that snapshot attributes cannot be changed or added."""
+        snapshot = WindowSnapshot("Editor")
+        with self.assertRaises(AttributeError):
+            snapshot.title = "Other"
+        with self.assertRaises(AttributeError):
+            snapshot.extra = 1
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+
+    def test_equality(self):
+        """Test value equality."""
+        self.assertEqual(WindowSnapshot("A", "p"), WindowSnapshot("A", "p"))
+        self.assertNotEqual(WindowSnapshot("A"), WindowSnapshot("B"))
+
+
+class TestWindowMonitorSample(unittest.TestCase):
+    """Test cases for WindowMonitor.sample()."""
+
+    def setUp(self):
+        """Force the subprocess code paths regardless of the local X11 setup."""
+        patcher = patch.object(WindowMonitor, "_get_x11_connection", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.monitor = WindowMonitor()
+
+    def test_title_queried_once(self):
+        """Test that the title is acquired once and reused for the screensaver check."""
+        with patch.object(WindowMonitor, "get_active_window_title", return_value="Editor") as mock_title:
+            snapshot = self.monitor.sample()
+        self.assertEqual(mock_title.call_count, 1)
+        self.assertEqual(snapshot.title, "Editor")
+        self.assertFalse(snapshot.is_idle)
+
+    def test_empty_title_is_idle(self):
+        """Test that an empty title marks the snapshot as idle."""
+        with patch.object(WindowMonitor, "get_active_window_title", return_value=""):
+            snapshot = self.monitor.sample()
+        self.assertTrue(snapshot.is_idle)
+
+    def test_process_only_when_requested(self):
+        """Test that the process name is acquired only when requested."""
+        with (
+            patch.object(WindowMonitor, "get_active_window_title", return_value="Game"),
+            patch.object(WindowMonitor, "get_active_window_process_name", return_value="game.exe") as mock_process,
+        ):
+            self.assertEqual(self.monitor.sample().process_name, "")
+            mock_process.assert_not_called()
+            self.assertEqual(self.monitor.sample(include_process=True).process_name, "game.exe")
+            self.assertEqual(mock_process.call_count, 1)
+
+    def test_pushed_title_skips_query(self):
+        """Test that a title pushed by an event source is used without querying."""
+        with patch.object(WindowMonitor, "get_active_window_title") as mock_title:
+            snapshot = self.monitor.sample(window_title="Pushed")
+        mock_title.assert_not_called()
+        self.assertEqual(snapshot.title, "Pushed")
+
+    @patch("platform.system", return_value="Linux")
+    def test_x11_title_and_pid_from_one_query(self, mock_system):
+        """Test that the X11 path provides title and pid together."""
+        connection = MagicMock()
+        connection.get_active_window_info.return_value = (0x123, "Editor", 4242)
+        with (
+            patch.object(WindowMonitor, "_get_x11_connection", return_value=connection),
+            patch.object(WindowMonitor, "_get_process_name_from_pid", return_value="code") as mock_pid_name,
+            patch.object(WindowMonitor, "get_active_window_process_name") as mock_process,
+        ):
+            snapshot = self.monitor.sample(include_process=True)
+        self.assertEqual((snapshot.title, snapshot.pid, snapshot.process_name), ("Editor", 4242, "code"))
+        mock_pid_name.assert_called_once_with(4242)
+        mock_process.assert_not_called()
+
+
+class TestScoreTrackerSnapshot(unittest.TestCase):
+    """Test cases for ScoreTracker.update_from_snapshot()."""
+
+    def test_update_from_snapshot(self):
+        """Test that snapshot title and idle flag are used."""
+        tracker = ScoreTracker([{"regex": "github", "score": 10, "description": "GitHub"}], default_score=-1)
+        tracker.update_from_snapshot(WindowSnapshot("GitHub"))
+        self.assertEqual(tracker.get_score(), 10)
+        score_changed, matched = tracker.update_from_snapshot(WindowSnapshot("", is_idle=True))
+        self.assertFalse(score_changed)
+        self.assertEqual(matched["description"], "スクリーンセーバー")
+
+
+if __name__ == "__main__":
+    unittest.main()
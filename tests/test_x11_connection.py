@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Tests for persistent X11 connection module."""
+
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+try:
+    import src.x11_connection as x11_module
+except ImportError:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+    import x11_connection as x11_module
+
+X11Connection = x11_module.X11Connection
+X11ConnectionError = x11_module.X11ConnectionError
+
+
+class _FakeXError(Exception):
+    pass
+
+
+class _FakeBadWindow(_FakeXError):
+    pass
+
+
+class _FakeConnectionClosedError(Exception):
+    pass
+
+
+FAKE_XERROR = SimpleNamespace(
+    XError=_FakeXError,
+    BadWindow=_FakeBadWindow,
+    ConnectionClosedError=_FakeConnectionClosedError,
+)
+FAKE_X = SimpleNamespace(AnyPropertyType=0)
+
+
+def _make_fake_display(active_window_id=0x123, net_wm_name=b"Title", wm_name="Legacy"):
+    """Create a fake Xlib Display object."""
+    display = MagicMock()
+    display.intern_atom.side_effect = lambda name: name
+    root = display.screen.return_value.root
+    root.get_full_property.return_value = SimpleNamespace(value=[active_window_id])
+    window = display.create_resource_object.return_value
+    window.get_full_property.return_value = SimpleNamespace(value=net_wm_name) if net_wm_name is not None else None
+    window.get_wm_name.return_value = wm_name
+    return display
+
+
+class TestX11Connection(unittest.TestCase):
+    """Test cases for X11Connection using a fake Xlib."""
+
+    def setUp(self):
+        """Install fake Xlib modules."""
+        self.xdisplay = MagicMock()
+        for name, value in (("xdisplay", self.xdisplay), ("xerror", FAKE_XERROR), ("X", FAKE_X)):
+            patcher = patch.object(x11_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reads_net_wm_name(self):
+        """Test that _NET_WM_NAME is decoded as UTF-8."""
+        self.xdisplay.Display.return_value = _make_fake_display(net_wm_name="日本語 - Editor".encode())
+        connection = X11Connection()
+        self.assertEqual(connection.get_active_window_title(), "日本語 - Editor")
+
+    def test_falls_back_to_wm_name(self):
+        """Test fallback to WM_NAME when _NET_WM_NAME is missing."""
+        self.xdisplay.Display.return_value = _make_fake_display(net_wm_name=None, wm_name="Legacy Window")
+        connection = X11Connection()
+        self.assertEqual(connection.get_active_window_title(), "Legacy Window")
+
+    def test_no_active_window(self):
+        """Test that no active window returns empty string."""
+        self.xdisplay.Display.return_value = _make_fake_display(active_window_id=0)
+        connection = X11Connection()
+        self.assertEqual(connection.get_active_window_title(), "")
+
+    def test_connection_is_reused(self):
+        """Test that the display is opened only once across queries."""
+        self.xdisplay.Display.return_value = _make_fake_display()
+        connection = X11Connection()
+        for _ in range(5):
+            connection.get_active_window_title()
+        self.assertEqual(self.xdisplay.Display.call_count, 1)
+
+    def test_reconnects_after_connection_closed(self):
+        """Test transparent reconnection when the X server drops the connection."""
+        broken = _make_fake_display()
+        broken.screen.return_value.root.get_full_property.side_effect = _FakeConnectionClosedError("closed")
+        healthy = _make_fake_display(net_wm_name=b"After Reconnect")
+        self.xdisplay.Display.side_effect = [broken, healthy]
+
+        connection = X11Connection()
+        self.assertEqual(connection.get_active_window_title(), "After Reconnect")
+        self.assertEqual(connection.reconnect_count, 1)
+
+    def test_bad_window_returns_empty_string(self):
+        """Test that a window closing mid-query is reported as no title."""
+        display = _make_fake_display()
+        display.create_resource_object.return_value.get_full_property.side_effect = _FakeBadWindow()
+        self.xdisplay.Display.return_value = display
+        connection = X11Connection()
+        self.assertEqual(connection.get_active_window_title(), "")
+
+    def test_display_open_failure_raises(self):
+        """Test that failing to open the display raises X11ConnectionError."""
+        self.xdisplay.Display.side_effect = Exception("Can't open display")
+        connection = X11Connection()
+        with self.assertRaises(X11ConnectionError):
+            connection.get_active_window_title()
+
+    def test_is_supported_requires_display(self):
+        """Test that is_supported checks for a display name."""
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertFalse(X11Connection.is_supported())
+        self.assertTrue(X11Connection.is_supported(":0"))
+
+    def test_idle_seconds(self):
+        """Test that MIT-SCREEN-SAVER idle milliseconds are converted to seconds."""
+        display = _make_fake_display()
+        display.has_extension.return_value = True
+        display.screen.return_value.root.screensaver_query_info.return_value = SimpleNamespace(idle=12500)
+        self.xdisplay.Display.return_value = display
+        self.assertEqual(X11Connection().get_idle_seconds(), 12.5)
+
+    def test_idle_seconds_without_extension(self):
+        """Test that a server without MIT-SCREEN-SAVER reports no idle time."""
+        display = _make_fake_display()
+        display.has_extension.return_value = False
+        self.xdisplay.Display.return_value = display
+        self.assertIsNone(X11Connection().get_idle_seconds())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Shared Xvfb helper for tests that need a real X server."""
+
+import os
+import subprocess
+import time
+import unittest
+
+
+def start_xvfb():
+    """Start Xvfb on a free display number.
+
+    Returns:
+        tuple: (process, display_name)
+
+    Raises:
+        unittest.SkipTest: If Xvfb could not be started
+    """
+    for number in range(90, 100):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            continue
+        process = subprocess.Popen(
+            ["Xvfb", f":{number}", "-nolisten", "tcp"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        for _ in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                return process, f":{number}"
+            time.sleep(0.1)
+        process.kill()
+    raise unittest.SkipTest("Could not start Xvfb")